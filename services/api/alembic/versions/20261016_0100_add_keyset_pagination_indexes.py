@@ -0,0 +1,47 @@
+"""add_keyset_pagination_indexes
+
+Adds composite (owner_id, sort_field, id) indexes for the keyset predicate of
+cursor pagination, so pages sorted by created_at/updated_at are a single
+index range scan within one owner no matter how deep the cursor is.
+
+Revision ID: add_keyset_idx_001
+Revises: add_user_role_001
+Create Date: 2026-10-16 01:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_keyset_idx_001'
+down_revision = 'add_user_role_001'
+branch_labels = None
+depends_on = None
+
+
+KEYSET_INDEXES = [
+    ('songs', 'created_at'),
+    ('songs', 'updated_at'),
+    ('workflow_runs', 'created_at'),
+    ('workflow_runs', 'updated_at'),
+    ('styles', 'updated_at'),
+    ('lyrics', 'updated_at'),
+]
+
+
+def upgrade():
+    """Create composite keyset pagination indexes."""
+
+    for table, sort_field in KEYSET_INDEXES:
+        op.create_index(
+            f'ix_{table}_owner_{sort_field}_id',
+            table,
+            ['owner_id', sort_field, 'id']
+        )
+
+
+def downgrade():
+    """Drop composite keyset pagination indexes."""
+
+    for table, sort_field in reversed(KEYSET_INDEXES):
+        op.drop_index(f'ix_{table}_owner_{sort_field}_id', table_name=table)
@@ -9,8 +9,10 @@ from __future__ import annotations
 from typing import Optional
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.async_database import get_async_db
 from app.db.session import get_db
 from app.core.dependencies import get_security_context, get_security_context_optional
 from app.core.security import SecurityContext
@@ -19,8 +21,13 @@ from app.core.security import SecurityContext
 get_db_session = get_db
 
 from app.repositories import (
+    AsyncLyricsRepository,
+    AsyncSongRepository,
+    AsyncStyleRepository,
+    AsyncWorkflowRunRepository,
     BlueprintRepository,
     ComposedPromptRepository,
+    EntityLoader,
     LyricsRepository,
     PersonaRepository,
     ProducerNotesRepository,
@@ -46,77 +53,141 @@ from app.services import (
 )
 
 
+# Request-scoped entity loaders (FastAPI caches dependencies per request, so
+# every repository of a request shares one identity map)
+def get_entity_loader(
+    db: Session = Depends(get_db),
+    security_context: SecurityContext = Depends(get_security_context),
+) -> EntityLoader:
+    """Get the request's EntityLoader for the sync session."""
+    return EntityLoader(db=db, security_context=security_context)
+
+
+def get_async_entity_loader(
+    db: AsyncSession = Depends(get_async_db),
+    security_context: SecurityContext = Depends(get_security_context),
+) -> EntityLoader:
+    """Get the request's EntityLoader for the async session."""
+    return EntityLoader(db=db, security_context=security_context)
+
+
 # Repository dependencies
 def get_blueprint_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> BlueprintRepository:
     """Get BlueprintRepository instance with security context."""
-    return BlueprintRepository(db=db, security_context=security_context)
+    return BlueprintRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_persona_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> PersonaRepository:
     """Get PersonaRepository instance with security context."""
-    return PersonaRepository(db=db, security_context=security_context)
+    return PersonaRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_source_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> SourceRepository:
     """Get SourceRepository instance with security context."""
-    return SourceRepository(db=db, security_context=security_context)
+    return SourceRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_style_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> StyleRepository:
     """Get StyleRepository instance with security context."""
-    return StyleRepository(db=db, security_context=security_context)
+    return StyleRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_song_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> SongRepository:
     """Get SongRepository instance with security context."""
-    return SongRepository(db=db, security_context=security_context)
+    return SongRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_lyrics_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> LyricsRepository:
     """Get LyricsRepository instance with security context."""
-    return LyricsRepository(db=db, security_context=security_context)
+    return LyricsRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_producer_notes_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> ProducerNotesRepository:
     """Get ProducerNotesRepository instance with security context."""
-    return ProducerNotesRepository(db=db, security_context=security_context)
+    return ProducerNotesRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_workflow_run_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> WorkflowRunRepository:
     """Get WorkflowRunRepository instance with security context."""
-    return WorkflowRunRepository(db=db, security_context=security_context)
+    return WorkflowRunRepository(db=db, security_context=security_context, loader=loader)
 
 
 def get_composed_prompt_repository(
     db: Session = Depends(get_db),
     security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_entity_loader),
 ) -> ComposedPromptRepository:
     """Get ComposedPromptRepository instance with security context."""
-    return ComposedPromptRepository(db=db, security_context=security_context)
+    return ComposedPromptRepository(db=db, security_context=security_context, loader=loader)
+
+
+# Async repository dependencies (AsyncSession: DB I/O does not block the event loop)
+def get_async_style_repository(
+    db: AsyncSession = Depends(get_async_db),
+    security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_async_entity_loader),
+) -> AsyncStyleRepository:
+    """Get AsyncStyleRepository instance with security context."""
+    return AsyncStyleRepository(db=db, security_context=security_context, loader=loader)
+
+
+def get_async_song_repository(
+    db: AsyncSession = Depends(get_async_db),
+    security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_async_entity_loader),
+) -> AsyncSongRepository:
+    """Get AsyncSongRepository instance with security context."""
+    return AsyncSongRepository(db=db, security_context=security_context, loader=loader)
+
+
+def get_async_lyrics_repository(
+    db: AsyncSession = Depends(get_async_db),
+    security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_async_entity_loader),
+) -> AsyncLyricsRepository:
+    """Get AsyncLyricsRepository instance with security context."""
+    return AsyncLyricsRepository(db=db, security_context=security_context, loader=loader)
+
+
+def get_async_workflow_run_repository(
+    db: AsyncSession = Depends(get_async_db),
+    security_context: SecurityContext = Depends(get_security_context),
+    loader: EntityLoader = Depends(get_async_entity_loader),
+) -> AsyncWorkflowRunRepository:
+    """Get AsyncWorkflowRunRepository instance with security context."""
+    return AsyncWorkflowRunRepository(db=db, security_context=security_context, loader=loader)
 
 
 # Service dependencies
@@ -262,6 +333,11 @@ __all__ = [
     "get_song_repository",
     "get_workflow_run_repository",
     "get_composed_prompt_repository",
+    "get_async_db",
+    "get_async_lyrics_repository",
+    "get_async_song_repository",
+    "get_async_style_repository",
+    "get_async_workflow_run_repository",
     "get_blueprint_service",
     "get_bulk_operations_service",
     "get_lyrics_service",
@@ -628,7 +628,7 @@ async def bulk_export_blueprints(
         HTTPException: If no blueprints found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Blueprint,
             repository=service.blueprint_repo,
             entity_ids=request.ids,
@@ -640,7 +640,7 @@ async def bulk_export_blueprints(
         filename = f"blueprints-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
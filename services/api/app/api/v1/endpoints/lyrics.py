@@ -16,10 +16,14 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile,
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
-from app.api.dependencies import get_lyrics_service, get_bulk_operations_service
+from app.api.dependencies import (
+    get_async_lyrics_repository,
+    get_lyrics_service,
+    get_bulk_operations_service,
+)
 from app.errors import BadRequestError
 from app.models.lyrics import Lyrics
-from app.repositories import LyricsRepository
+from app.repositories import AsyncLyricsRepository, LyricsRepository
 from app.services import LyricsService, BulkOperationsService
 from app.schemas import (
     BulkDeleteRequest,
@@ -165,22 +169,20 @@ async def import_lyrics(
 async def list_lyrics(
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
-    service: LyricsService = Depends(get_lyrics_service),
+    repo: AsyncLyricsRepository = Depends(get_async_lyrics_repository),
 ) -> PaginatedResponse[LyricsResponse]:
     """List lyrics with cursor pagination.
 
     Args:
         limit: Maximum number of items to return
         cursor: Pagination cursor
-        service: Lyrics service instance
+        repo: Lyrics repository instance
 
     Returns:
         Paginated list of lyrics
     """
-    # Note: list() method needs to be added to LyricsService for full service layer compliance
-    # For now, we access repo directly for pagination (this is acceptable for list operations)
     cursor_uuid = UUID(cursor) if cursor else None
-    lyrics_list = service.repo.list(limit=limit + 1, offset=cursor_uuid)
+    lyrics_list = await repo.list(limit=limit + 1, offset=cursor_uuid)
 
     has_next = len(lyrics_list) > limit
     items = lyrics_list[:limit]
@@ -210,13 +212,13 @@ async def list_lyrics(
 )
 async def get_lyrics(
     lyrics_id: UUID,
-    service: LyricsService = Depends(get_lyrics_service),
+    repo: AsyncLyricsRepository = Depends(get_async_lyrics_repository),
 ) -> LyricsResponse:
     """Get lyrics by ID.
 
     Args:
         lyrics_id: Lyrics UUID
-        service: Lyrics service instance
+        repo: Lyrics repository instance
 
     Returns:
         Lyrics data
@@ -224,13 +226,13 @@ async def get_lyrics(
     Raises:
         HTTPException: If lyrics not found
     """
-    lyrics = await service.get_lyrics(lyrics_id)
+    lyrics = await repo.get_by_id(lyrics_id)
     if not lyrics:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Lyrics {lyrics_id} not found",
         )
-    return lyrics
+    return LyricsResponse.model_validate(lyrics)
 
 
 @router.patch(
@@ -378,7 +380,7 @@ async def bulk_export_lyrics(
         HTTPException: If no lyrics found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Lyrics,
             repository=service.repo,
             entity_ids=request.ids,
@@ -390,7 +392,7 @@ async def bulk_export_lyrics(
         filename = f"lyrics-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -430,7 +430,7 @@ async def bulk_export_personas(
         HTTPException: If no personas found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Persona,
             repository=service.repo,
             entity_ids=request.ids,
@@ -442,7 +442,7 @@ async def bulk_export_personas(
         filename = f"personas-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -390,7 +390,7 @@ async def bulk_export_producer_notes(
         HTTPException: If no producer notes found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=ProducerNotes,
             repository=service.repo,
             entity_ids=request.ids,
@@ -402,7 +402,7 @@ async def bulk_export_producer_notes(
         filename = f"producer-notes-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -2,6 +2,7 @@
 
 Provides endpoints for:
 - Creating and starting workflow runs
+- Queueing batches of seed variants of a song
 - Querying run status and outputs
 - Retrying failed runs
 - Cancelling in-progress runs
@@ -10,20 +11,23 @@ Provides endpoints for:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from pydantic import BaseModel, Field, model_validator
 import structlog
 
-from app.api.dependencies import get_db_session
+from app.api.dependencies import get_db_session, get_sds_compiler_service
+from app.core.config import settings
 from app.repositories.node_execution_repo import NodeExecutionRepository
 from app.repositories.workflow_event_repo import WorkflowEventRepository
 from app.repositories.workflow_run_repo import WorkflowRunRepository
 from app.schemas import ErrorResponse
 from app.services import WorkflowService
+from app.services.sds_compiler_service import SDSCompilerService
 from app.workflows.events import get_event_publisher
+from app.workflows.jobs import RunQueueFullError, submit_batch, submit_run
 from sqlalchemy.orm import Session
 
 logger = structlog.get_logger(__name__)
@@ -49,6 +53,53 @@ class CreateRunResponse(BaseModel):
     message: str
 
 
+class CreateBatchRequest(BaseModel):
+    """Request body for executing a batch of seed variants."""
+
+    song_id: UUID = Field(..., description="Song identifier")
+    manifest: Dict[str, Any] = Field(..., description="Workflow manifest shared by every run")
+    seeds: Optional[List[int]] = Field(
+        None, description="Seed of each run (alternative to base_seed + count)"
+    )
+    base_seed: int = Field(42, description="First seed when using count", ge=0)
+    count: Optional[int] = Field(None, description="Number of runs with consecutive seeds", ge=1)
+    compile_sds: bool = Field(
+        True, description="Compile the song's SDS once and share it with every run"
+    )
+    max_concurrent_runs: Optional[int] = Field(None, ge=1)
+    max_concurrent_llm_requests: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def _resolve_seeds(self) -> "CreateBatchRequest":
+        """Expand base_seed + count into explicit seeds."""
+        if self.seeds is None:
+            if self.count is None:
+                raise ValueError("Either seeds or count is required")
+            self.seeds = [self.base_seed + i for i in range(self.count)]
+        if not self.seeds:
+            raise ValueError("At least one seed is required")
+        if any(seed < 0 for seed in self.seeds):
+            raise ValueError("Seeds must be non-negative")
+        return self
+
+
+class BatchRun(BaseModel):
+    """One run of a batch."""
+
+    run_id: UUID
+    seed: int
+
+
+class ExecuteBatchAcceptedResponse(BaseModel):
+    """Response body for the batch execution endpoint."""
+
+    batch_id: UUID
+    job_id: UUID = Field(..., description="Background job executing the batch")
+    runs: list[BatchRun]
+    status: str
+    message: str
+
+
 class RunStatusResponse(BaseModel):
     """Response body for run status endpoint."""
 
@@ -65,14 +116,12 @@ class RunStatusResponse(BaseModel):
     event_counts: Dict[str, int]
 
 
-class ExecuteRunResponse(BaseModel):
+class ExecuteRunAcceptedResponse(BaseModel):
     """Response body for execute run endpoint."""
 
     run_id: UUID
+    job_id: UUID = Field(..., description="Background job identifier")
     status: str
-    duration_ms: int
-    fix_iterations: int
-    validation_scores: Optional[Dict[str, float]]
     message: str
 
 
@@ -81,6 +130,7 @@ class RetryRunResponse(BaseModel):
 
     original_run_id: UUID
     new_run_id: UUID
+    resumed: bool = False
     message: str
 
 
@@ -155,6 +205,115 @@ async def create_run(
         )
 
 
+@router.post(
+    "/batch",
+    response_model=ExecuteBatchAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Create and queue a batch of workflow runs",
+    description=(
+        "Create one run per seed for the same song and manifest and queue "
+        "them as one background job that executes them together. The SDS is "
+        "compiled once, seed-independent nodes (PLAN) execute once for the "
+        "whole batch, and LLM calls share one concurrency-limited pool. Poll "
+        "each run or subscribe to its events for progress."
+    ),
+    responses={
+        202: {"description": "Batch queued for execution"},
+        400: {"model": ErrorResponse, "description": "Invalid request data"},
+        503: {"model": ErrorResponse, "description": "Run queue is full"},
+    },
+)
+async def execute_batch(
+    request: CreateBatchRequest,
+    service: WorkflowService = Depends(get_workflow_service),
+    sds_compiler: SDSCompilerService = Depends(get_sds_compiler_service),
+) -> ExecuteBatchAcceptedResponse:
+    """Create a batch of seed variants of a song and queue it for execution.
+
+    Args:
+        request: Batch request
+        service: Workflow service instance
+        sds_compiler: SDS compiler used to compile the song once
+
+    Returns:
+        Batch, job and run identifiers
+
+    Raises:
+        HTTPException: If the batch is too large, the SDS cannot be compiled,
+            or the queue is full
+    """
+    batch_settings = settings.WORKFLOW
+    if len(request.seeds) > batch_settings.BATCH_MAX_RUNS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Batch of {len(request.seeds)} runs exceeds the limit of "
+                f"{batch_settings.BATCH_MAX_RUNS}"
+            ),
+        )
+
+    sds = None
+    if request.compile_sds:
+        try:
+            sds = sds_compiler.compile_sds(request.song_id, validate=True)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to compile SDS: {str(e)}",
+            )
+
+    batch_id, runs = await service.create_batch(
+        song_id=request.song_id,
+        manifest=request.manifest,
+        seeds=request.seeds,
+        sds=sds,
+    )
+    run_ids = [run.run_id for run in runs]
+    # The runs were just created, so every claim succeeds; claiming marks
+    # them queued so they cannot also be executed one by one
+    for run_id in run_ids:
+        service.claim_run(run_id)
+
+    try:
+        job = await submit_batch(
+            batch_id,
+            run_ids,
+            max_concurrent_runs=request.max_concurrent_runs,
+            max_concurrent_llm_requests=request.max_concurrent_llm_requests,
+            event_publisher=service.event_publisher,
+        )
+    except RunQueueFullError as e:
+        for run_id in run_ids:
+            service.release_run(run_id)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.WORKER.RETRY_AFTER_SECONDS)},
+        )
+    except Exception:
+        for run_id in run_ids:
+            service.release_run(run_id)
+        raise
+
+    logger.info(
+        "api.runs.batch.accepted",
+        batch_id=str(batch_id),
+        job_id=str(job.job_id),
+        runs=len(run_ids),
+    )
+
+    return ExecuteBatchAcceptedResponse(
+        batch_id=batch_id,
+        job_id=job.job_id,
+        runs=[
+            BatchRun(run_id=run_id, seed=seed)
+            for run_id, seed in zip(run_ids, request.seeds)
+        ],
+        status="queued",
+        message=f"Batch of {len(run_ids)} workflow runs queued for execution",
+    )
+
+
 @router.get(
     "/{run_id}",
     response_model=RunStatusResponse,
@@ -193,67 +352,86 @@ async def get_run_status(
 
 @router.post(
     "/{run_id}/execute",
-    response_model=ExecuteRunResponse,
+    response_model=ExecuteRunAcceptedResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Execute a workflow run",
-    description="Start execution of a pending workflow run",
+    description=(
+        "Queue a pending workflow run for background execution. Progress is "
+        "streamed over the run's WebSocket and reflected by GET /runs/{run_id}."
+    ),
     responses={
-        200: {"description": "Execution completed successfully"},
+        202: {"description": "Run accepted for execution"},
         404: {"model": ErrorResponse, "description": "Run not found"},
-        500: {"model": ErrorResponse, "description": "Execution failed"},
+        409: {"model": ErrorResponse, "description": "Run is not pending"},
+        503: {"model": ErrorResponse, "description": "Run queue is full"},
     },
 )
 async def execute_run(
     run_id: UUID,
     service: WorkflowService = Depends(get_workflow_service),
-) -> ExecuteRunResponse:
-    """Execute a workflow run.
+) -> ExecuteRunAcceptedResponse:
+    """Queue a workflow run for execution by the background worker.
 
     Args:
         run_id: Workflow run identifier
         service: Workflow service instance
 
     Returns:
-        Execution result
+        Accepted job information
 
     Raises:
-        HTTPException: If execution fails
+        HTTPException: If the run is missing, not pending, or the queue is full
     """
-    try:
-        result = await service.execute_run(run_id)
-
-        logger.info(
-            "api.runs.execute.success",
-            run_id=str(run_id),
-            status=result.get("status"),
-            duration_ms=result.get("duration_ms"),
-        )
-
-        return ExecuteRunResponse(
-            run_id=run_id,
-            status=result.get("status", "unknown"),
-            duration_ms=result.get("duration_ms", 0),
-            fix_iterations=result.get("fix_iterations", 0),
-            validation_scores=result.get("validation_scores"),
-            message="Workflow execution completed",
+    run = service.workflow_run_repo.get_by_run_id(run_id)
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Workflow run {run_id} not found",
         )
-    except Exception as e:
-        logger.error(
-            "api.runs.execute.failed",
-            run_id=str(run_id),
-            error=str(e),
-            error_type=type(e).__name__,
+    # Claim the run (pending -> queued) so concurrent requests cannot
+    # enqueue it twice
+    if not service.claim_run(run_id):
+        service.db.refresh(run)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Can only execute pending runs, current status: {run.status}",
         )
+
+    try:
+        job = await submit_run(run_id, event_publisher=service.event_publisher)
+    except RunQueueFullError as e:
+        service.release_run(run_id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Workflow execution failed: {str(e)}",
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(settings.WORKER.RETRY_AFTER_SECONDS)},
         )
+    except Exception:
+        service.release_run(run_id)
+        raise
+
+    logger.info(
+        "api.runs.execute.accepted",
+        run_id=str(run_id),
+        job_id=str(job.job_id),
+    )
+
+    return ExecuteRunAcceptedResponse(
+        run_id=run_id,
+        job_id=job.job_id,
+        status="queued",
+        message="Workflow run queued for execution",
+    )
 
 
 @router.post(
     "/{run_id}/retry",
     response_model=RetryRunResponse,
     summary="Retry a failed workflow run",
-    description="Create a new run with the same manifest to retry a failed execution",
+    description=(
+        "Create a new run with the same manifest to retry a failed execution. "
+        "With resume=true the new run restarts at the first failed node."
+    ),
     responses={
         200: {"description": "Retry run created successfully"},
         400: {"model": ErrorResponse, "description": "Cannot retry non-failed run"},
@@ -262,12 +440,17 @@ async def execute_run(
 )
 async def retry_run(
     run_id: UUID,
+    resume: bool = Query(
+        False,
+        description="Reuse completed nodes of the failed run and restart at the first failed node",
+    ),
     service: WorkflowService = Depends(get_workflow_service),
 ) -> RetryRunResponse:
     """Retry a failed workflow run.
 
     Args:
         run_id: Failed run identifier
+        resume: Resume from the first failed node instead of PLAN
         service: Workflow service instance
 
     Returns:
@@ -277,17 +460,19 @@ async def retry_run(
         HTTPException: If retry fails
     """
     try:
-        new_run_id = await service.retry_run(run_id)
+        new_run_id = await service.retry_run(run_id, resume=resume)
 
         logger.info(
             "api.runs.retry.success",
             original_run_id=str(run_id),
             new_run_id=str(new_run_id),
+            resume=resume,
         )
 
         return RetryRunResponse(
             original_run_id=run_id,
             new_run_id=new_run_id,
+            resumed=resume,
             message="Retry run created successfully",
         )
     except ValueError as e:
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import (
+    get_async_song_repository,
     get_song_repository,
     get_song_service,
     get_sds_compiler_service,
@@ -26,7 +27,7 @@ from app.api.dependencies import (
     get_bulk_operations_service,
 )
 from app.models.song import Song
-from app.repositories import SongRepository
+from app.repositories import AsyncSongRepository, SongRepository
 from app.services import (
     SongService,
     SDSCompilerService,
@@ -217,7 +218,7 @@ async def create_song(
 async def list_songs(
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
-    repo: SongRepository = Depends(get_song_repository),
+    repo: AsyncSongRepository = Depends(get_async_song_repository),
 ) -> PaginatedResponse[SongResponse]:
     """List songs with cursor pagination.
 
@@ -230,7 +231,7 @@ async def list_songs(
         Paginated list of songs
     """
     # Use list_paginated from BaseRepository
-    songs, next_cursor = repo.list_paginated(
+    songs, next_cursor = await repo.list_paginated(
         model_class=Song,
         limit=limit,
         cursor=cursor,
@@ -263,7 +264,7 @@ async def list_songs(
 )
 async def get_song(
     song_id: UUID,
-    repo: SongRepository = Depends(get_song_repository),
+    repo: AsyncSongRepository = Depends(get_async_song_repository),
 ) -> SongResponse:
     """Get a song by ID.
 
@@ -277,7 +278,7 @@ async def get_song(
     Raises:
         HTTPException: If song not found
     """
-    song = repo.get_by_id(Song, song_id)
+    song = await repo.get_by_id(Song, song_id)
     if not song:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -352,7 +353,7 @@ async def update_song(
 )
 async def delete_song(
     song_id: UUID,
-    repo: SongRepository = Depends(get_song_repository),
+    repo: AsyncSongRepository = Depends(get_async_song_repository),
 ) -> None:
     """Delete a song (soft delete).
 
@@ -363,14 +364,14 @@ async def delete_song(
     Raises:
         HTTPException: If song not found
     """
-    existing = repo.get_by_id(Song, song_id)
+    existing = await repo.get_by_id(Song, song_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Song {song_id} not found",
         )
 
-    repo.delete(Song, song_id)
+    await repo.delete(Song, song_id)
 
 
 @router.get(
@@ -381,7 +382,7 @@ async def delete_song(
 )
 async def get_songs_by_status(
     status: SongStatus,
-    repo: SongRepository = Depends(get_song_repository),
+    repo: AsyncSongRepository = Depends(get_async_song_repository),
 ) -> List[SongResponse]:
     """Get songs by status.
 
@@ -392,7 +393,7 @@ async def get_songs_by_status(
     Returns:
         List of songs matching the status
     """
-    songs = repo.get_by_status(status.value)
+    songs = await repo.get_by_status(status.value)
     return [SongResponse.model_validate(s) for s in songs]
 
 
@@ -422,13 +423,13 @@ async def get_song_with_artifacts(
     Raises:
         HTTPException: If song not found
     """
-    song = await service.get_song_with_artifacts(song_id)
-    if not song:
+    result = await service.get_song_with_artifacts(song_id)
+    if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Song {song_id} not found",
         )
-    return SongResponse.model_validate(song)
+    return SongResponse.model_validate(result["song"])
 
 
 @router.patch(
@@ -768,7 +769,7 @@ async def bulk_export_songs(
         HTTPException: If no songs found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Song,
             repository=repo,
             entity_ids=request.ids,
@@ -781,7 +782,7 @@ async def bulk_export_songs(
         filename = f"songs-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
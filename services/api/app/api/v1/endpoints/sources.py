@@ -573,7 +573,7 @@ async def bulk_export_sources(
         HTTPException: If no sources found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Source,
             repository=service.repo,
             entity_ids=request.ids,
@@ -585,7 +585,7 @@ async def bulk_export_sources(
         filename = f"sources-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
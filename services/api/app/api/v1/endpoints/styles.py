@@ -16,9 +16,14 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile,
 from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 
-from app.api.dependencies import get_style_repository, get_style_service, get_bulk_operations_service
+from app.api.dependencies import (
+    get_async_style_repository,
+    get_style_repository,
+    get_style_service,
+    get_bulk_operations_service,
+)
 from app.models.style import Style
-from app.repositories import StyleRepository
+from app.repositories import AsyncStyleRepository, StyleRepository
 from app.services import StyleService, BulkOperationsService
 from app.schemas import (
     BulkDeleteRequest,
@@ -179,7 +184,7 @@ async def import_style(
 async def list_styles(
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
-    repo: StyleRepository = Depends(get_style_repository),
+    repo: AsyncStyleRepository = Depends(get_async_style_repository),
 ) -> PaginatedResponse[StyleResponse]:
     """List styles with cursor pagination.
 
@@ -192,7 +197,7 @@ async def list_styles(
         Paginated list of styles
     """
     cursor_uuid = UUID(cursor) if cursor else None
-    styles = repo.list(limit=limit + 1, offset=cursor_uuid)
+    styles = await repo.list(limit=limit + 1, offset=cursor_uuid)
 
     has_next = len(styles) > limit
     items = styles[:limit]
@@ -222,7 +227,7 @@ async def list_styles(
 )
 async def get_style(
     style_id: UUID,
-    repo: StyleRepository = Depends(get_style_repository),
+    repo: AsyncStyleRepository = Depends(get_async_style_repository),
 ) -> StyleResponse:
     """Get a style by ID.
 
@@ -236,7 +241,7 @@ async def get_style(
     Raises:
         HTTPException: If style not found
     """
-    style = repo.get_by_id(style_id)
+    style = await repo.get_by_id(style_id)
     if not style:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -309,7 +314,7 @@ async def update_style(
 )
 async def delete_style(
     style_id: UUID,
-    repo: StyleRepository = Depends(get_style_repository),
+    repo: AsyncStyleRepository = Depends(get_async_style_repository),
 ) -> None:
     """Delete a style (soft delete).
 
@@ -320,14 +325,14 @@ async def delete_style(
     Raises:
         HTTPException: If style not found
     """
-    existing = repo.get_by_id(style_id)
+    existing = await repo.get_by_id(style_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Style {style_id} not found",
         )
 
-    repo.delete(style_id)
+    await repo.delete(style_id)
 
 
 @router.get(
@@ -338,7 +343,7 @@ async def delete_style(
 )
 async def get_styles_by_genre(
     genre: str,
-    repo: StyleRepository = Depends(get_style_repository),
+    repo: AsyncStyleRepository = Depends(get_async_style_repository),
 ) -> List[StyleResponse]:
     """Get styles by genre.
 
@@ -349,7 +354,7 @@ async def get_styles_by_genre(
     Returns:
         List of styles matching the genre
     """
-    styles = repo.get_by_genre(genre)
+    styles = await repo.get_by_genre(genre)
     return [StyleResponse.model_validate(s) for s in styles]
 
 
@@ -509,7 +514,7 @@ async def bulk_export_styles(
         HTTPException: If no styles found or all exports fail
     """
     try:
-        zip_buffer = await bulk_ops.bulk_export_entities_zip(
+        zip_stream = await bulk_ops.bulk_export_entities_zip(
             model_class=Style,
             repository=repo,
             entity_ids=request.ids,
@@ -522,7 +527,7 @@ async def bulk_export_styles(
         filename = f"styles-bulk-export-{timestamp}.zip"
 
         return StreamingResponse(
-            zip_buffer,
+            zip_stream,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
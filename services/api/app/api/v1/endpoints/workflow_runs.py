@@ -11,9 +11,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.api.dependencies import get_workflow_run_repository, get_workflow_run_service
-from app.models.song import WorkflowRun
-from app.repositories import WorkflowRunRepository
+from app.api.dependencies import get_async_workflow_run_repository, get_workflow_run_service
+from app.repositories import AsyncWorkflowRunRepository
 from app.services import WorkflowRunService
 from app.schemas import (
     ErrorResponse,
@@ -41,7 +40,7 @@ router = APIRouter(prefix="/workflow-runs", tags=["Workflow Runs"])
 )
 async def create_workflow_run(
     run_data: WorkflowRunCreate,
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> WorkflowRunResponse:
     """Create a new workflow run.
 
@@ -56,7 +55,7 @@ async def create_workflow_run(
         HTTPException: If run creation fails
     """
     try:
-        run = repo.create(WorkflowRun, run_data.model_dump())
+        run = await repo.create(run_data.model_dump())
         return WorkflowRunResponse.model_validate(run)
     except ValueError as e:
         raise HTTPException(
@@ -74,7 +73,7 @@ async def create_workflow_run(
 async def list_workflow_runs(
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     cursor: Optional[str] = Query(None, description="Cursor for pagination"),
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> PaginatedResponse[WorkflowRunResponse]:
     """List workflow runs with cursor pagination.
 
@@ -87,7 +86,7 @@ async def list_workflow_runs(
         Paginated list of workflow runs
     """
     cursor_uuid = UUID(cursor) if cursor else None
-    runs = repo.list(limit=limit + 1, offset=cursor_uuid)
+    runs = await repo.list(limit=limit + 1, offset=cursor_uuid)
 
     has_next = len(runs) > limit
     items = runs[:limit]
@@ -117,7 +116,7 @@ async def list_workflow_runs(
 )
 async def get_workflow_run(
     run_id: UUID,
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> WorkflowRunResponse:
     """Get a workflow run by ID.
 
@@ -131,7 +130,7 @@ async def get_workflow_run(
     Raises:
         HTTPException: If run not found
     """
-    run = repo.get_by_id(run_id)
+    run = await repo.get_by_id(run_id)
     if not run:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -153,7 +152,7 @@ async def get_workflow_run(
 async def update_workflow_run(
     run_id: UUID,
     run_data: WorkflowRunUpdate,
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> WorkflowRunResponse:
     """Update a workflow run.
 
@@ -168,14 +167,14 @@ async def update_workflow_run(
     Raises:
         HTTPException: If run not found
     """
-    existing = repo.get_by_id(run_id)
+    existing = await repo.get_by_id(run_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow run {run_id} not found",
         )
 
-    updated = repo.update(
+    updated = await repo.update(
         run_id,
         run_data.model_dump(exclude_unset=True),
     )
@@ -194,7 +193,7 @@ async def update_workflow_run(
 )
 async def delete_workflow_run(
     run_id: UUID,
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> None:
     """Delete a workflow run (soft delete).
 
@@ -205,14 +204,14 @@ async def delete_workflow_run(
     Raises:
         HTTPException: If run not found
     """
-    existing = repo.get_by_id(run_id)
+    existing = await repo.get_by_id(run_id)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workflow run {run_id} not found",
         )
 
-    repo.delete(run_id)
+    await repo.delete(run_id)
 
 
 @router.get(
@@ -244,7 +243,7 @@ async def get_active_runs(
 )
 async def get_runs_by_song(
     song_id: UUID,
-    repo: WorkflowRunRepository = Depends(get_workflow_run_repository),
+    repo: AsyncWorkflowRunRepository = Depends(get_async_workflow_run_repository),
 ) -> List[WorkflowRunResponse]:
     """Get workflow runs for a specific song.
 
@@ -255,7 +254,7 @@ async def get_runs_by_song(
     Returns:
         List of workflow runs for the song
     """
-    runs = repo.get_by_song_id(song_id)
+    runs = await repo.get_by_song_id(song_id)
     return [WorkflowRunResponse.model_validate(r) for r in runs]
 
 
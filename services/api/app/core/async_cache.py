@@ -0,0 +1,776 @@
+"""Asyncio-native Redis cache client.
+
+:class:`AsyncRedisCache` mirrors the API of :class:`~app.core.cache.RedisCache`
+(namespaces, serialization, tags, circuit breaker, pipelines) on top of
+``redis.asyncio``, so async request handlers and repositories can reach
+Redis without blocking the event loop. Keys and values are encoded exactly
+like the synchronous client (values with :mod:`app.core.cache_codec`), so
+both can share the same Redis data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, TypeVar
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, RedisError
+from opentelemetry import trace
+
+from app.core.cache import (
+    COMPACT_TAG_SCRIPT,
+    INVALIDATE_TAG_SCRIPT,
+    TAG_KEY_PATTERN,
+    CacheCircuitBreaker,
+    CacheSerializationMixin,
+)
+from app.core.config import settings
+from app.observability import metrics
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class AsyncRedisCache(CacheSerializationMixin):
+    """Asyncio Redis cache client with connection pooling and error handling."""
+
+    def __init__(
+        self,
+        url: str = settings.REDIS_URL,
+        max_connections: int = settings.REDIS_MAX_CONNECTIONS,
+        health_check_interval: int = settings.REDIS_HEALTH_CHECK_INTERVAL,
+        client: Optional[aioredis.Redis] = None
+    ):
+        """Initialize the asyncio Redis cache client.
+
+        No connection is made until the first operation.
+
+        Parameters
+        ----------
+        url : str
+            Redis connection URL
+        max_connections : int
+            Maximum connections in pool
+        health_check_interval : int
+            Health check interval in seconds
+        client : Optional[redis.asyncio.Redis]
+            Pre-built client to use instead of connecting to ``url``;
+            it must be created with ``decode_responses=False``
+        """
+        self.url = url
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+
+        self._pool: Optional[aioredis.ConnectionPool] = None
+        self._client: Optional[aioredis.Redis] = client
+        self._last_health_check = 0.0
+        self._is_healthy = client is not None
+
+        if client is None:
+            self._pool = aioredis.ConnectionPool.from_url(
+                url,
+                max_connections=max_connections,
+                retry_on_timeout=True,
+                retry_on_error=[ConnectionError],
+                health_check_interval=health_check_interval,
+                # Values are binary-encoded (see app.core.cache_codec)
+                decode_responses=False,
+                socket_keepalive=True,
+            )
+            self._client = aioredis.Redis(connection_pool=self._pool)
+        else:
+            self._last_health_check = time.time()
+
+        self._invalidate_tag_script = self._client.register_script(INVALIDATE_TAG_SCRIPT)
+        self._compact_tag_script = self._client.register_script(COMPACT_TAG_SCRIPT)
+
+        # Circuit breaker for resilience and performance
+        self._circuit_breaker = CacheCircuitBreaker(
+            failure_threshold=settings.CACHE.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.CACHE.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+            latency_threshold_ms=settings.CACHE.CIRCUIT_BREAKER_LATENCY_THRESHOLD_MS
+        ) if settings.CACHE.CIRCUIT_BREAKER_ENABLED else None
+
+        # Performance tracking
+        self._operation_metrics = {
+            "total_operations": 0,
+            "total_latency_ms": 0.0,
+            "circuit_breaker_blocks": 0
+        }
+
+    async def _health_check(self) -> bool:
+        """Check Redis connection health (at most once per interval)."""
+        now = time.time()
+        if now - self._last_health_check < self.health_check_interval:
+            return self._is_healthy
+
+        self._last_health_check = now
+        try:
+            await self._client.ping()
+            if not self._is_healthy:
+                logger.info("Redis connection available (asyncio cache client)")
+            self._is_healthy = True
+        except Exception as e:
+            if self._is_healthy:
+                logger.warning(f"Redis connection lost (asyncio cache client): {e}")
+            self._is_healthy = False
+
+        return self._is_healthy
+
+    async def _execute(
+        self,
+        operation_name: str,
+        operation: Callable[[], Awaitable[R]],
+        default: R,
+        log_context: str = "",
+        maintenance: bool = False
+    ) -> R:
+        """Run a Redis operation behind the health check and circuit breaker.
+
+        Parameters
+        ----------
+        operation_name : str
+            Name of the operation for logging
+        operation : callable
+            Coroutine function performing the operation
+        default : Any
+            Value returned when Redis is unavailable or the operation fails
+        log_context : str
+            Extra description for log messages (e.g. the key)
+        maintenance : bool
+            Long-running maintenance work (tag scans and batches); kept out
+            of latency metrics so it cannot trip the latency breaker
+
+        Returns
+        -------
+        Any
+            Result of the operation, or ``default``
+        """
+        if not await self._health_check():
+            return default
+
+        if self._circuit_breaker and not self._circuit_breaker.should_allow_request():
+            self._operation_metrics["circuit_breaker_blocks"] += 1
+            logger.debug(f"Circuit breaker blocked {operation_name} operation")
+            return default
+
+        start_time = time.time()
+        try:
+            result = await operation()
+        except RedisError as e:
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure(str(e))
+            logger.warning(f"Redis {operation_name} failed{log_context}: {e}")
+            self._is_healthy = False
+            return default
+        except Exception as e:
+            if self._circuit_breaker:
+                self._circuit_breaker.record_failure(str(e))
+            logger.error(f"Unexpected error in cache {operation_name}{log_context}: {e}")
+            return default
+
+        if maintenance:
+            return result
+
+        latency_ms = (time.time() - start_time) * 1000
+        self._operation_metrics["total_operations"] += 1
+        self._operation_metrics["total_latency_ms"] += latency_ms
+        if self._circuit_breaker:
+            self._circuit_breaker.record_success(latency_ms)
+        return result
+
+    def _add_tags(self, pipe: Any, redis_keys: List[str], tags: Set[str], ttl: Optional[int]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, *redis_keys)
+            if ttl:  # Set same TTL on tag set with buffer
+                pipe.expire(tag_key, ttl + settings.CACHE.TAG_SET_TTL_BUFFER)
+
+    def _decode_values(self, keys: List[str], values: List[Any], value_type: type) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                result[key] = None
+                continue
+            try:
+                result[key] = self._deserialize_value(value, value_type)
+            except Exception as e:
+                logger.warning(f"Failed to deserialize value for key {key}: {e}")
+                result[key] = None
+        return result
+
+    async def get(self, key: str, value_type: type[T] = str, namespace: str = "alias") -> Optional[T]:
+        """Get value from cache with circuit breaker protection.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        value_type : type
+            Expected value type for deserialization
+        namespace : str
+            Cache namespace
+
+        Returns
+        -------
+        Optional[T]
+            Cached value or None if not found/unavailable
+        """
+        with tracer.start_as_current_span("cache.get", attributes={"cache.key": key, "cache.namespace": namespace}):
+            async def _get_operation():
+                value = await self._client.get(self._serialize_key(key, namespace))
+                if value is None:
+                    return None
+                return self._deserialize_value(value, value_type)
+
+            return await self._execute("get", _get_operation, None, f" for key '{key}'")
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        nx: bool = False,
+        namespace: str = "alias",
+        tags: Optional[Set[str]] = None
+    ) -> bool:
+        """Set value in cache with optional tags for invalidation.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        value : Any
+            Value to cache
+        ttl : Optional[int]
+            Time-to-live in seconds
+        nx : bool
+            Only set if key doesn't exist
+        namespace : str
+            Cache namespace for key organization
+        tags : Optional[Set[str]]
+            Tags for cache invalidation
+
+        Returns
+        -------
+        bool
+            True if set successfully, False otherwise
+        """
+        with tracer.start_as_current_span("cache.set", attributes={
+            "cache.key": key,
+            "cache.namespace": namespace,
+            "cache.has_tags": bool(tags)
+        }):
+            redis_key = self._serialize_key(key, namespace)
+            redis_value = self._serialize_value(value)
+
+            async def _set_operation():
+                if not tags:
+                    return bool(await self._client.set(redis_key, redis_value, ex=ttl, nx=nx))
+                # One round-trip for the value and its tag sets
+                async with self._client.pipeline() as pipe:
+                    pipe.set(redis_key, redis_value, ex=ttl, nx=nx)
+                    self._add_tags(pipe, [redis_key], tags, ttl)
+                    results = await pipe.execute()
+                return bool(results[0])
+
+            return await self._execute("set", _set_operation, False, f" for key '{key}'")
+
+    async def set_with_tags(self, key: str, value: Any, tags: Set[str], ttl: Optional[int] = None, namespace: str = "alias") -> bool:
+        """Set value with tags for invalidation support."""
+        return await self.set(key, value, ttl=ttl, namespace=namespace, tags=tags)
+
+    async def mget(self, keys: List[str], value_type: type[T] = str, namespace: str = "alias", use_pipeline: bool = True) -> Dict[str, Optional[T]]:
+        """Get multiple values from cache.
+
+        Parameters
+        ----------
+        keys : List[str]
+            Cache keys to retrieve
+        value_type : type
+            Expected value type for deserialization
+        namespace : str
+            Cache namespace for key organization
+        use_pipeline : bool
+            Whether to use a pipeline for larger batches
+
+        Returns
+        -------
+        Dict[str, Optional[T]]
+            Mapping of keys to cached values
+        """
+        with tracer.start_as_current_span("cache.mget", attributes={
+            "cache.namespace": namespace,
+            "cache.keys_count": len(keys),
+            "cache.use_pipeline": use_pipeline
+        }):
+            if not keys:
+                return {}
+
+            if len(keys) > settings.CACHE.BATCH_SIZE_LIMIT:
+                logger.warning(f"Batch size {len(keys)} exceeds limit {settings.CACHE.BATCH_SIZE_LIMIT}, truncating")
+                keys = keys[:settings.CACHE.BATCH_SIZE_LIMIT]
+
+            redis_keys = [self._serialize_key(key, namespace) for key in keys]
+
+            async def _mget_operation():
+                if use_pipeline and len(keys) > 10:  # Use pipeline for larger batches
+                    async with self._client.pipeline(transaction=False) as pipe:
+                        for redis_key in redis_keys:
+                            pipe.get(redis_key)
+                        values = await pipe.execute()
+                else:
+                    values = await self._client.mget(redis_keys)
+                return self._decode_values(keys, values, value_type)
+
+            return await self._execute(
+                "mget", _mget_operation, {key: None for key in keys}, f" for {len(keys)} keys"
+            )
+
+    async def pipeline_get(self, keys: List[str], value_type: type[T] = str, namespace: str = "alias") -> Dict[str, Optional[T]]:
+        """Get multiple values using a Redis pipeline."""
+        return await self.mget(keys, value_type=value_type, namespace=namespace, use_pipeline=True)
+
+    async def mset(self, mapping: Dict[str, Any], ttl: Optional[int] = None, namespace: str = "alias", tags: Optional[Set[str]] = None) -> bool:
+        """Set multiple values in cache in a single pipeline.
+
+        Parameters
+        ----------
+        mapping : Dict[str, Any]
+            Key-value pairs to set
+        ttl : Optional[int]
+            Time-to-live in seconds
+        namespace : str
+            Cache namespace for key organization
+        tags : Optional[Set[str]]
+            Tags for cache invalidation
+
+        Returns
+        -------
+        bool
+            True if all values set successfully
+        """
+        with tracer.start_as_current_span("cache.mset", attributes={
+            "cache.namespace": namespace,
+            "cache.keys_count": len(mapping),
+            "cache.has_tags": bool(tags)
+        }):
+            if not mapping:
+                return False
+
+            if len(mapping) > settings.CACHE.BATCH_SIZE_LIMIT:
+                logger.warning(f"Batch size {len(mapping)} exceeds limit {settings.CACHE.BATCH_SIZE_LIMIT}, truncating")
+                mapping = dict(list(mapping.items())[:settings.CACHE.BATCH_SIZE_LIMIT])
+
+            redis_mapping = {
+                self._serialize_key(key, namespace): self._serialize_value(value)
+                for key, value in mapping.items()
+            }
+
+            async def _mset_operation():
+                async with self._client.pipeline() as pipe:
+                    pipe.mset(redis_mapping)
+                    if ttl:
+                        for redis_key in redis_mapping:
+                            pipe.expire(redis_key, ttl)
+                    if tags:
+                        self._add_tags(pipe, list(redis_mapping), tags, ttl)
+                    await pipe.execute()
+                logger.debug(f"Successfully set {len(mapping)} keys in namespace {namespace}")
+                return True
+
+            return await self._execute("mset", _mset_operation, False, f" for {len(mapping)} keys")
+
+    async def pipeline_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None, namespace: str = "alias", tags: Optional[Set[str]] = None) -> bool:
+        """Set multiple values using a Redis pipeline."""
+        return await self.mset(mapping, ttl=ttl, namespace=namespace, tags=tags)
+
+    async def delete(self, key: str, namespace: str = "alias") -> bool:
+        """Delete value from cache.
+
+        Parameters
+        ----------
+        key : str
+            Cache key to delete
+        namespace : str
+            Cache namespace
+
+        Returns
+        -------
+        bool
+            True if deleted successfully
+        """
+        async def _delete_operation():
+            return bool(await self._client.delete(self._serialize_key(key, namespace)))
+
+        return await self._execute("delete", _delete_operation, False, f" for key '{key}'")
+
+    async def mdel(self, keys: List[str], namespace: str = "alias") -> int:
+        """Delete multiple keys from cache.
+
+        Parameters
+        ----------
+        keys : List[str]
+            Cache keys to delete
+        namespace : str
+            Cache namespace
+
+        Returns
+        -------
+        int
+            Number of keys deleted
+        """
+        if not keys:
+            return 0
+
+        async def _mdel_operation():
+            total = 0
+            batch_size = settings.CACHE.BATCH_SIZE_LIMIT
+            for i in range(0, len(keys), batch_size):
+                batch = [self._serialize_key(key, namespace) for key in keys[i:i + batch_size]]
+                total += await self._client.delete(*batch)
+            return total
+
+        return await self._execute("mdel", _mdel_operation, 0, f" for {len(keys)} keys")
+
+    async def exists(self, key: str, namespace: str = "alias") -> bool:
+        """Check if key exists in cache."""
+        async def _exists_operation():
+            return bool(await self._client.exists(self._serialize_key(key, namespace)))
+
+        return await self._execute("exists", _exists_operation, False, f" for key '{key}'")
+
+    async def ttl(self, key: str, namespace: str = "alias") -> int:
+        """Get time-to-live for key (-1 if no expiration, -2 if missing)."""
+        async def _ttl_operation():
+            return int(await self._client.ttl(self._serialize_key(key, namespace)))
+
+        return await self._execute("ttl", _ttl_operation, -2, f" for key '{key}'")
+
+    async def incr(self, key: str, amount: int = 1, namespace: str = "counters", ttl: Optional[int] = None) -> Optional[int]:
+        """Increment counter value.
+
+        Parameters
+        ----------
+        key : str
+            Counter key
+        amount : int
+            Increment amount
+        namespace : str
+            Counter namespace
+        ttl : Optional[int]
+            Time-to-live for new counters
+
+        Returns
+        -------
+        Optional[int]
+            New counter value or None if failed
+        """
+        redis_key = self._serialize_key(key, namespace)
+
+        async def _incr_operation():
+            async with self._client.pipeline() as pipe:
+                pipe.incrby(redis_key, amount)
+                if ttl:
+                    pipe.expire(redis_key, ttl)
+                results = await pipe.execute()
+            return int(results[0])
+
+        return await self._execute("incr", _incr_operation, None, f" for key '{key}'")
+
+    async def decr(self, key: str, amount: int = 1, namespace: str = "counters", ttl: Optional[int] = None) -> Optional[int]:
+        """Decrement counter value."""
+        return await self.incr(key, -amount, namespace, ttl)
+
+    async def invalidate_by_tag(self, tag: str, batch_size: Optional[int] = None) -> int:
+        """Invalidate all cache entries with a specific tag.
+
+        Runs server-side in atomic batches (see ``INVALIDATE_TAG_SCRIPT``).
+
+        Parameters
+        ----------
+        tag : str
+            Tag to invalidate
+        batch_size : Optional[int]
+            Keys deleted per batch (defaults to settings)
+
+        Returns
+        -------
+        int
+            Number of keys invalidated
+        """
+        with tracer.start_as_current_span("cache.invalidate_by_tag", attributes={"cache.tag": tag}):
+            tag_key = self._tag_key(tag)
+            effective_batch_size = batch_size or settings.CACHE.TAG_INVALIDATION_BATCH_SIZE
+
+            async def _invalidate_operation():
+                deleted = popped = 0
+                while True:
+                    batch_deleted, batch_popped, remaining, members = await self._invalidate_tag_script(
+                        keys=[tag_key], args=[effective_batch_size]
+                    )
+                    await self._publish_l1_invalidation(members)
+                    deleted += int(batch_deleted)
+                    popped += int(batch_popped)
+                    if not remaining:
+                        break
+                if popped:
+                    metrics.record_cache_tag_members_removed("invalidated", popped)
+                if deleted:
+                    logger.info(f"Invalidated {deleted} cache entries with tag '{tag}'")
+                return deleted
+
+            return await self._execute(
+                "invalidate_by_tag", _invalidate_operation, 0, f" for tag '{tag}'", maintenance=True
+            )
+
+    async def _publish_l1_invalidation(self, redis_keys: List[Any]) -> None:
+        """Tell CacheManager instances to drop deleted keys from their L1."""
+        payload = self._l1_invalidation(redis_keys)
+        if payload is None:
+            return
+        try:
+            await self._client.publish(settings.CACHE.L1_INVALIDATION_CHANNEL, payload)
+        except Exception as e:
+            logger.warning(f"L1 invalidation publish failed: {e}")
+
+    async def compact_tag(self, tag: str, scan_count: Optional[int] = None) -> int:
+        """Remove members of a tag set whose cache keys no longer exist.
+
+        Parameters
+        ----------
+        tag : str
+            Tag whose set to compact
+        scan_count : Optional[int]
+            Members checked per scripted step (defaults to settings)
+
+        Returns
+        -------
+        int
+            Number of dead members removed
+        """
+        with tracer.start_as_current_span("cache.compact_tag", attributes={"cache.tag": tag}):
+            tag_key = self._tag_key(tag)
+            count = scan_count or settings.CACHE.TAG_COMPACTION_SCAN_COUNT
+
+            async def _compact_operation():
+                cursor: Any = 0
+                removed = 0
+                while True:
+                    cursor, dead, _checked = await self._compact_tag_script(keys=[tag_key], args=[cursor, count])
+                    removed += int(dead)
+                    if int(cursor) == 0:
+                        break
+                if removed:
+                    metrics.record_cache_tag_members_removed("compacted", removed)
+                return removed
+
+            return await self._execute(
+                "compact_tag", _compact_operation, 0, f" for tag '{tag}'", maintenance=True
+            )
+
+    async def compact_tag_index(self, scan_count: Optional[int] = None) -> Dict[str, int]:
+        """Compact every tag set and refresh the tag index metrics.
+
+        Parameters
+        ----------
+        scan_count : Optional[int]
+            Members checked per scripted step (defaults to settings)
+
+        Returns
+        -------
+        Dict[str, int]
+            Tags compacted and dead members removed
+        """
+        with tracer.start_as_current_span("cache.compact_tag_index"):
+            tags = list(await self.get_tag_stats())
+            removed = 0
+            for tag in tags:
+                removed += await self.compact_tag(tag, scan_count)
+            await self.get_tag_stats()  # refresh gauges after compaction
+
+            if removed:
+                logger.info(f"Compacted {len(tags)} tag sets, removed {removed} dead members")
+            return {"tags": len(tags), "removed": removed}
+
+    async def get_tag_stats(self) -> Dict[str, int]:
+        """Get the cardinality of every tag set.
+
+        Also records the tag index size in the cache tag metrics.
+
+        Returns
+        -------
+        Dict[str, int]
+            Mapping of tags to the number of keys in their set
+        """
+        with tracer.start_as_current_span("cache.get_tag_stats"):
+            async def _tag_stats_operation():
+                tag_keys = [
+                    tag_key async for tag_key in self._client.scan_iter(
+                        match=TAG_KEY_PATTERN, count=settings.CACHE.SCAN_COUNT_DEFAULT
+                    )
+                ]
+                async with self._client.pipeline(transaction=False) as pipe:
+                    for tag_key in tag_keys:
+                        pipe.scard(tag_key)
+                    cardinalities = await pipe.execute()
+
+                stats = {
+                    self._tag_from_key(tag_key): int(cardinality)
+                    for tag_key, cardinality in zip(tag_keys, cardinalities)
+                }
+                metrics.record_cache_tag_index(
+                    len(stats), sum(stats.values()), max(stats.values(), default=0)
+                )
+                return stats
+
+            return await self._execute("get_tag_stats", _tag_stats_operation, {}, maintenance=True)
+
+    async def is_healthy(self) -> bool:
+        """Check if Redis connection is healthy."""
+        return await self._health_check()
+
+    def get_circuit_breaker_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker statistics."""
+        if not self._circuit_breaker:
+            return {"enabled": False}
+
+        stats = self._circuit_breaker.get_stats()
+        stats["enabled"] = True
+        return stats
+
+    @property
+    def circuit_breaker_state(self) -> str:
+        """Get current circuit breaker state."""
+        if not self._circuit_breaker:
+            return "disabled"
+        return self._circuit_breaker.get_state().value
+
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        """Get performance metrics for cache operations."""
+        metrics = self._operation_metrics.copy()
+
+        if metrics["total_operations"] > 0:
+            metrics["avg_latency_ms"] = metrics["total_latency_ms"] / metrics["total_operations"]
+        else:
+            metrics["avg_latency_ms"] = 0.0
+
+        metrics["circuit_breaker"] = self.get_circuit_breaker_stats()
+        return metrics
+
+    async def close(self) -> None:
+        """Close the Redis client and its connection pool."""
+        try:
+            if self._client is not None:
+                await self._client.aclose()
+            if self._pool is not None:
+                await self._pool.disconnect()
+        except Exception as e:
+            logger.warning(f"Error closing asyncio Redis connection: {e}")
+        finally:
+            self._client = None
+            self._pool = None
+            self._is_healthy = False
+
+
+class TagIndexCompactor:
+    """Background task that periodically compacts the cache tag index.
+
+    Tag sets keep the keys of expired entries until the tag is invalidated;
+    the compactor removes those dead members so popular tags stay small.
+    """
+
+    def __init__(self, cache: AsyncRedisCache, interval: float = settings.CACHE.TAG_COMPACTION_INTERVAL):
+        """Initialize the compactor.
+
+        Parameters
+        ----------
+        cache : AsyncRedisCache
+            Cache whose tag index to compact
+        interval : float
+            Seconds between compactions
+        """
+        self.cache = cache
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def run_once(self) -> Dict[str, int]:
+        """Compact the tag index once."""
+        return await self.cache.compact_tag_index()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"Tag index compaction failed: {e}")
+
+    def start(self) -> None:
+        """Start the background task (no-op if already running)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Global asyncio cache instance
+_async_cache_instance: Optional[AsyncRedisCache] = None
+_tag_index_compactor: Optional[TagIndexCompactor] = None
+
+
+def get_async_cache() -> AsyncRedisCache:
+    """Get the global asyncio cache instance."""
+    global _async_cache_instance
+
+    if _async_cache_instance is None:
+        _async_cache_instance = AsyncRedisCache()
+        logger.info("Initialized global asyncio Redis cache instance")
+
+    return _async_cache_instance
+
+
+async def start_tag_index_compactor() -> Optional[TagIndexCompactor]:
+    """Start background compaction of the global cache's tag index."""
+    global _tag_index_compactor
+
+    if not (settings.CACHE.ENABLED and settings.CACHE.TAG_COMPACTION_ENABLED):
+        return None
+
+    if _tag_index_compactor is None:
+        _tag_index_compactor = TagIndexCompactor(get_async_cache())
+    _tag_index_compactor.start()
+    return _tag_index_compactor
+
+
+async def close_async_cache() -> None:
+    """Stop tag index compaction and close the global asyncio cache instance."""
+    global _async_cache_instance, _tag_index_compactor
+
+    if _tag_index_compactor is not None:
+        await _tag_index_compactor.stop()
+        _tag_index_compactor = None
+
+    if _async_cache_instance is not None:
+        await _async_cache_instance.close()
+        _async_cache_instance = None
+        logger.info("Closed global asyncio Redis cache instance")
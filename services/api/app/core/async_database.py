@@ -7,6 +7,7 @@ from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.db_pool import pool_options
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +26,11 @@ def _get_async_database_url() -> str:
 # Configure async engine based on database type
 async_database_url = _get_async_database_url()
 
-if async_database_url.startswith("sqlite+aiosqlite"):
-    # SQLite doesn't support pool_size or max_overflow
-    async_engine = create_async_engine(
-        async_database_url,
-        pool_pre_ping=True,
-    )
-else:
-    # PostgreSQL and other databases support connection pooling
-    async_engine = create_async_engine(
-        async_database_url,
-        pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-    )
+# Pool sizing, timeouts and recycling come from settings.DB
+async_engine = create_async_engine(
+    async_database_url,
+    **pool_options(async_database_url, is_async=True),
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
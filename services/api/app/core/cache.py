@@ -7,12 +7,9 @@ and fallback mechanisms for when Redis is unavailable.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
-import zlib
-from typing import Any, Dict, List, Optional, Set, TypeVar, Tuple
-from uuid import UUID
+from typing import Any, Dict, List, Optional, Set, TypeVar, Tuple, Union
 from enum import Enum
 import threading
 
@@ -21,15 +18,50 @@ from redis.connection import ConnectionPool
 from redis.exceptions import ConnectionError, RedisError
 from opentelemetry import trace
 
+from app.core.cache_codec import decode_value, encode_value
+from app.core.cache_manager import encode_invalidation
 from app.core.config import settings
+from app.observability import metrics
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
 T = TypeVar('T')
 
-# Compression threshold in bytes
-COMPRESSION_THRESHOLD = 1024
+# Tag sets live at mp:tags:tag:<tag> (see CacheSerializationMixin._tag_key)
+TAG_KEY_PREFIX = "mp:tags:tag:"
+TAG_KEY_PATTERN = TAG_KEY_PREFIX + "*"
+
+# Pops up to ARGV[1] members of the tag set KEYS[1] and unlinks them, so each
+# batch of an invalidation is atomic and keys never travel to the client.
+# Member keys are not declared in KEYS: tag sets and their members must live
+# on the same (non-cluster) Redis instance.
+# Returns {keys deleted, members popped, members left in the tag set, members}.
+INVALIDATE_TAG_SCRIPT = """
+local members = redis.call('SPOP', KEYS[1], ARGV[1])
+local deleted = 0
+if #members > 0 then
+    deleted = redis.call('UNLINK', unpack(members))
+end
+return {deleted, #members, redis.call('SCARD', KEYS[1]), members}
+"""
+
+# One SSCAN step (cursor ARGV[1], COUNT ARGV[2]) over the tag set KEYS[1],
+# removing members whose cache key no longer exists (expired or evicted).
+# Returns {next cursor, members removed, members checked}.
+COMPACT_TAG_SCRIPT = """
+local page = redis.call('SSCAN', KEYS[1], ARGV[1], 'COUNT', ARGV[2])
+local dead = {}
+for _, member in ipairs(page[2]) do
+    if redis.call('EXISTS', member) == 0 then
+        dead[#dead + 1] = member
+    end
+end
+if #dead > 0 then
+    redis.call('SREM', KEYS[1], unpack(dead))
+end
+return {page[1], #dead, #page[2]}
+"""
 
 
 class CircuitBreakerState(Enum):
@@ -137,14 +169,96 @@ class CacheError(Exception):
     pass
 
 
-class RedisCache:
+class CacheSerializationMixin:
+    """Key and value encoding shared by the sync and asyncio Redis clients."""
+
+    def _serialize_key(self, key: str, namespace: str = "alias") -> str:
+        """Serialize cache key with namespace prefix.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        namespace : str
+            Cache namespace for key organization
+
+        Returns
+        -------
+        str
+            Formatted cache key with namespace
+        """
+        return f"mp:{namespace}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        """Redis key of the set indexing the cache keys carrying ``tag``."""
+        return self._serialize_key(f"tag:{tag}", "tags")
+
+    def _tag_from_key(self, tag_key: Union[bytes, str]) -> str:
+        """Tag name for a tag set key returned by SCAN."""
+        if isinstance(tag_key, bytes):
+            tag_key = tag_key.decode()
+        return tag_key[len(TAG_KEY_PREFIX):]
+
+    def _l1_invalidation(self, redis_keys: List[Union[bytes, str]]) -> Optional[str]:
+        """Pub/sub payload telling every CacheManager to drop ``redis_keys`` from L1.
+
+        Returns None when there is nothing to publish or L1 is disabled.
+        """
+        if not redis_keys or not settings.CACHE.L1_ENABLED:
+            return None
+        return encode_invalidation(
+            [key.decode() if isinstance(key, bytes) else key for key in redis_keys],
+            origin=type(self).__name__,
+        )
+
+    def _serialize_value(self, value: Any, compress: bool = True) -> bytes:
+        """Encode value for Redis storage with the binary cache codec.
+
+        Parameters
+        ----------
+        value : Any
+            Value to serialize
+        compress : bool
+            Whether to compress large values
+
+        Returns
+        -------
+        bytes
+            Encoded (and optionally compressed) value
+        """
+        return encode_value(
+            value,
+            compress=compress and settings.CACHE.COMPRESSION_ENABLED,
+            threshold=settings.CACHE.COMPRESSION_THRESHOLD
+        )
+
+    def _deserialize_value(self, value: Union[bytes, str], value_type: type[T] = str) -> T:
+        """Decode value from Redis storage, including legacy text entries.
+
+        Parameters
+        ----------
+        value : Union[bytes, str]
+            Raw value from Redis
+        value_type : type[T]
+            Expected value type for deserialization
+
+        Returns
+        -------
+        T
+            Deserialized value
+        """
+        return decode_value(value, value_type)  # type: ignore
+
+
+class RedisCache(CacheSerializationMixin):
     """Redis-based cache client with connection pooling and error handling."""
 
     def __init__(
         self,
         url: str = settings.REDIS_URL,
         max_connections: int = settings.REDIS_MAX_CONNECTIONS,
-        health_check_interval: int = settings.REDIS_HEALTH_CHECK_INTERVAL
+        health_check_interval: int = settings.REDIS_HEALTH_CHECK_INTERVAL,
+        client: Optional[redis.Redis] = None
     ):
         """Initialize Redis cache client.
 
@@ -156,6 +270,9 @@ class RedisCache:
             Maximum connections in pool
         health_check_interval : int
             Health check interval in seconds
+        client : Optional[redis.Redis]
+            Pre-built client to use instead of connecting to ``url``;
+            it must be created with ``decode_responses=False``
         """
         self.url = url
         self.max_connections = max_connections
@@ -181,7 +298,12 @@ class RedisCache:
             "circuit_breaker_blocks": 0
         }
 
-        self._initialize_client()
+        if client is not None:
+            self._client = client
+            self._is_healthy = True
+            self._register_scripts()
+        else:
+            self._initialize_client()
 
     def _initialize_client(self) -> None:
         """Initialize Redis client and connection pool."""
@@ -191,16 +313,16 @@ class RedisCache:
                 max_connections=self.max_connections,
                 retry_on_timeout=True,
                 retry_on_error=[ConnectionError],
-                health_check_interval=self.health_check_interval
-            )
-
-            self._client = redis.Redis(
-                connection_pool=self._pool,
-                decode_responses=True,
+                health_check_interval=self.health_check_interval,
+                # Values are binary-encoded (see app.core.cache_codec)
+                decode_responses=False,
                 socket_keepalive=True,
                 socket_keepalive_options={}
             )
 
+            self._client = redis.Redis(connection_pool=self._pool)
+            self._register_scripts()
+
             # Test connection
             self._client.ping()
             self._is_healthy = True
@@ -211,6 +333,11 @@ class RedisCache:
             self._is_healthy = False
             self._client = None
 
+    def _register_scripts(self) -> None:
+        """Register the Lua scripts used for tag maintenance."""
+        self._invalidate_tag_script = self._client.register_script(INVALIDATE_TAG_SCRIPT)
+        self._compact_tag_script = self._client.register_script(COMPACT_TAG_SCRIPT)
+
     def _health_check(self) -> bool:
         """Check Redis connection health."""
         now = time.time()
@@ -237,82 +364,6 @@ class RedisCache:
 
         return self._is_healthy
 
-    def _serialize_key(self, key: str, namespace: str = "alias") -> str:
-        """Serialize cache key with namespace prefix.
-
-        Parameters
-        ----------
-        key : str
-            Cache key
-        namespace : str
-            Cache namespace for key organization
-
-        Returns
-        -------
-        str
-            Formatted cache key with namespace
-        """
-        return f"mp:{namespace}:{key}"
-
-    def _serialize_value(self, value: Any, compress: bool = True) -> str:
-        """Serialize value for Redis storage with optional compression.
-
-        Parameters
-        ----------
-        value : Any
-            Value to serialize
-        compress : bool
-            Whether to compress large values
-
-        Returns
-        -------
-        str
-            Serialized (and optionally compressed) value
-        """
-        if isinstance(value, (str, int, float, bool)):
-            serialized = str(value)
-        elif isinstance(value, UUID):
-            serialized = str(value)
-        else:
-            serialized = json.dumps(value, default=str)
-
-        # Compress if value is large and compression is enabled
-        if compress and len(serialized.encode()) > COMPRESSION_THRESHOLD:
-            compressed = zlib.compress(serialized.encode())
-            # Prepend compression marker
-            return "__compressed__" + compressed.decode('latin-1')
-
-        return serialized
-
-    def _deserialize_value(self, value: str, value_type: type[T] = str) -> T:
-        """Deserialize value from Redis storage with compression support.
-
-        Parameters
-        ----------
-        value : str
-            Serialized value from Redis
-        value_type : type[T]
-            Expected value type for deserialization
-
-        Returns
-        -------
-        T
-            Deserialized value
-        """
-        # Check if value is compressed
-        if value.startswith("__compressed__"):
-            compressed_data = value[14:].encode('latin-1')
-            value = zlib.decompress(compressed_data).decode()
-
-        if value_type == str:
-            return value  # type: ignore
-        elif value_type == UUID:
-            return UUID(value)  # type: ignore
-        elif value_type in (int, float, bool):
-            return value_type(value)  # type: ignore
-        else:
-            return json.loads(value)  # type: ignore
-
     def _execute_with_circuit_breaker(self, operation_name: str, operation_func) -> Any:
         """Execute Redis operation with circuit breaker pattern.
 
@@ -828,7 +879,7 @@ class RedisCache:
                 namespace_prefix = f"mp:{namespace}:"
                 clean_keys = [
                     key[len(namespace_prefix):]
-                    for key in keys
+                    for key in (k.decode() if isinstance(k, bytes) else k for k in keys)
                     if key.startswith(namespace_prefix)
                 ]
 
@@ -931,6 +982,7 @@ class RedisCache:
                     if keys:
                         # Delete in batches for better performance
                         deleted_count += self._client.delete(*keys)
+                        self._publish_l1_invalidation(keys)
 
                     if cursor == 0:  # Scan complete
                         break
@@ -1073,13 +1125,18 @@ class RedisCache:
         """
         return self.set(key, value, ttl=ttl, namespace=namespace, tags=tags)
 
-    def invalidate_by_tag(self, tag: str) -> int:
+    def invalidate_by_tag(self, tag: str, batch_size: Optional[int] = None) -> int:
         """Invalidate all cache entries with a specific tag.
 
+        Runs server-side in atomic batches: each batch pops members from the
+        tag set and unlinks them without the keys travelling to the client.
+
         Parameters
         ----------
         tag : str
             Tag to invalidate
+        batch_size : Optional[int]
+            Keys deleted per batch (defaults to settings)
 
         Returns
         -------
@@ -1090,32 +1147,146 @@ class RedisCache:
             if not self._health_check():
                 return 0
 
+            tag_key = self._tag_key(tag)
+            effective_batch_size = batch_size or settings.CACHE.TAG_INVALIDATION_BATCH_SIZE
+            deleted = 0
+            popped = 0
+
             try:
-                tag_key = self._serialize_key(f"tag:{tag}", "tags")
+                while True:
+                    batch_deleted, batch_popped, remaining, members = self._invalidate_tag_script(
+                        keys=[tag_key], args=[effective_batch_size]
+                    )
+                    self._publish_l1_invalidation(members)
+                    deleted += int(batch_deleted)
+                    popped += int(batch_popped)
+                    if not remaining:
+                        break
+            except RedisError as e:
+                logger.warning(f"Redis invalidate_by_tag failed for tag '{tag}': {e}")
+                self._is_healthy = False
+            except Exception as e:
+                logger.error(f"Unexpected error invalidating tag '{tag}': {e}")
 
-                # Get all keys with this tag
-                keys = list(self._client.smembers(tag_key))
+            if popped:
+                metrics.record_cache_tag_members_removed("invalidated", popped)
+            if deleted:
+                logger.info(f"Invalidated {deleted} cache entries with tag '{tag}'")
+            return deleted
+
+    def _publish_l1_invalidation(self, redis_keys: List[Union[bytes, str]]) -> None:
+        """Tell CacheManager instances to drop deleted keys from their L1."""
+        payload = self._l1_invalidation(redis_keys)
+        if payload is None:
+            return
+        try:
+            self._client.publish(settings.CACHE.L1_INVALIDATION_CHANNEL, payload)
+        except Exception as e:
+            logger.warning(f"L1 invalidation publish failed: {e}")
 
-                if not keys:
-                    return 0
+    def compact_tag(self, tag: str, scan_count: Optional[int] = None) -> int:
+        """Remove members of a tag set whose cache keys no longer exist.
 
-                # Delete all keys and the tag set itself
-                with self._client.pipeline() as pipe:
-                    for key in keys:
-                        pipe.delete(key)
-                    pipe.delete(tag_key)
-                    pipe.execute()
+        Tag sets outlive the keys they index when those keys expire; this
+        walks the set with scripted SSCAN steps and drops the dead members.
 
-                logger.info(f"Invalidated {len(keys)} cache entries with tag '{tag}'")
-                return len(keys)
+        Parameters
+        ----------
+        tag : str
+            Tag whose set to compact
+        scan_count : Optional[int]
+            Members checked per scripted step (defaults to settings)
 
+        Returns
+        -------
+        int
+            Number of dead members removed
+        """
+        with tracer.start_as_current_span("cache.compact_tag", attributes={"cache.tag": tag}):
+            if not self._health_check():
+                return 0
+
+            tag_key = self._tag_key(tag)
+            count = scan_count or settings.CACHE.TAG_COMPACTION_SCAN_COUNT
+            cursor: Union[bytes, str, int] = 0
+            removed = 0
+
+            try:
+                while True:
+                    cursor, dead, _checked = self._compact_tag_script(keys=[tag_key], args=[cursor, count])
+                    removed += int(dead)
+                    if int(cursor) == 0:
+                        break
             except RedisError as e:
-                logger.warning(f"Redis invalidate_by_tag failed for tag '{tag}': {e}")
+                logger.warning(f"Redis compact_tag failed for tag '{tag}': {e}")
                 self._is_healthy = False
-                return 0
             except Exception as e:
-                logger.error(f"Unexpected error invalidating tag '{tag}': {e}")
-                return 0
+                logger.error(f"Unexpected error compacting tag '{tag}': {e}")
+
+            if removed:
+                metrics.record_cache_tag_members_removed("compacted", removed)
+            return removed
+
+    def compact_tag_index(self, scan_count: Optional[int] = None) -> Dict[str, int]:
+        """Compact every tag set and refresh the tag index metrics.
+
+        Parameters
+        ----------
+        scan_count : Optional[int]
+            Members checked per scripted step (defaults to settings)
+
+        Returns
+        -------
+        Dict[str, int]
+            Tags compacted and dead members removed
+        """
+        with tracer.start_as_current_span("cache.compact_tag_index"):
+            tags = list(self.get_tag_stats())
+            removed = sum(self.compact_tag(tag, scan_count) for tag in tags)
+            self.get_tag_stats()  # refresh gauges after compaction
+
+            if removed:
+                logger.info(f"Compacted {len(tags)} tag sets, removed {removed} dead members")
+            return {"tags": len(tags), "removed": removed}
+
+    def get_tag_stats(self) -> Dict[str, int]:
+        """Get the cardinality of every tag set.
+
+        Also records the tag index size in the cache tag metrics.
+
+        Returns
+        -------
+        Dict[str, int]
+            Mapping of tags to the number of keys in their set
+        """
+        with tracer.start_as_current_span("cache.get_tag_stats"):
+            if not self._health_check():
+                return {}
+
+            try:
+                tag_keys = list(self._client.scan_iter(
+                    match=TAG_KEY_PATTERN, count=settings.CACHE.SCAN_COUNT_DEFAULT
+                ))
+                with self._client.pipeline(transaction=False) as pipe:
+                    for tag_key in tag_keys:
+                        pipe.scard(tag_key)
+                    cardinalities = pipe.execute()
+            except RedisError as e:
+                logger.warning(f"Redis get_tag_stats failed: {e}")
+                self._is_healthy = False
+                return {}
+            except Exception as e:
+                logger.error(f"Unexpected error getting tag stats: {e}")
+                return {}
+
+            stats = {
+                self._tag_from_key(tag_key): int(cardinality)
+                for tag_key, cardinality in zip(tag_keys, cardinalities)
+            }
+            metrics.record_cache_tag_index(
+                len(stats), sum(stats.values()), max(stats.values(), default=0)
+            )
+            return stats
 
     def invalidate_by_pattern(self, pattern: str, namespace: str = "alias", batch_size: int = 100) -> int:
         """Invalidate cache entries matching a wildcard pattern.
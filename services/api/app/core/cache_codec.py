@@ -0,0 +1,240 @@
+"""Bytes-native value codec for the Redis cache clients.
+
+Values are stored as a 4-byte header followed by the payload::
+
+    0xC1 | version | format | compression | payload...
+
+``0xC1`` can never start a valid UTF-8 string, so encoded values are told
+apart from legacy entries (plain text, JSON, or ``"__compressed__"`` followed
+by latin-1 encoded zlib data), which are still read transparently.
+
+Formats:
+
+- ``FORMAT_TEXT``: UTF-8 string
+- ``FORMAT_BYTES``: raw bytes
+- ``FORMAT_MSGPACK``: MessagePack (used when ``msgpack`` is installed)
+- ``FORMAT_JSON``: compact JSON (fallback for everything else)
+
+Payloads above the compression threshold are compressed with LZ4 when
+``lz4`` is installed, otherwise with zlib at its fastest level, and only kept
+compressed when that actually saves space. Decoding works on a
+``memoryview`` of the stored bytes, so the header is never sliced off with a
+copy.
+
+Both optional packages come with the ``cache-fast`` extra
+(``pip install meatymusic-api[cache-fast]``); a warning is logged once when
+the codec falls back to JSON or zlib without them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import zlib
+from typing import Any, Union
+from uuid import UUID
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+# Compression threshold in bytes
+COMPRESSION_THRESHOLD = 1024
+
+MAGIC = 0xC1
+VERSION = 1
+HEADER_SIZE = 4
+
+FORMAT_TEXT = 0
+FORMAT_BYTES = 1
+FORMAT_JSON = 2
+FORMAT_MSGPACK = 3
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+LEGACY_COMPRESSED_PREFIX = "__compressed__"
+
+
+class CacheCodecError(ValueError):
+    """Raised when a stored cache value cannot be decoded."""
+
+
+_fallback_warned = False
+
+
+def _warn_fallback() -> None:
+    """Log once that the codec runs without its optional fast packages."""
+    global _fallback_warned
+    if _fallback_warned:
+        return
+    _fallback_warned = True
+    missing = [
+        name
+        for name, module in (("msgpack", msgpack), ("lz4", lz4_frame))
+        if module is None
+    ]
+    logger.warning(
+        "Cache codec falling back to JSON/zlib: %s not installed "
+        "(install the cache-fast extra)",
+        ", ".join(missing),
+    )
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+
+def _serialize(value: Any) -> tuple[int, bytes]:
+    """Serialize ``value`` into ``(format, payload)``."""
+    if isinstance(value, str):
+        return FORMAT_TEXT, value.encode()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return FORMAT_BYTES, bytes(value)
+    if isinstance(value, UUID):
+        return FORMAT_TEXT, str(value).encode()
+    if msgpack is not None:
+        try:
+            return FORMAT_MSGPACK, msgpack.packb(value, default=str, use_bin_type=True)
+        except (TypeError, ValueError, OverflowError):
+            pass  # e.g. integers beyond 64 bits; JSON handles them
+    else:
+        _warn_fallback()
+    return FORMAT_JSON, _json_dumps(value)
+
+
+def _compress(payload: bytes) -> tuple[int, bytes]:
+    if lz4_frame is not None:
+        return COMPRESSION_LZ4, lz4_frame.compress(payload)
+    _warn_fallback()
+    return COMPRESSION_ZLIB, zlib.compress(payload, 1)
+
+
+def encode_value(
+    value: Any,
+    compress: bool = True,
+    threshold: int = COMPRESSION_THRESHOLD
+) -> bytes:
+    """Encode a value for Redis storage.
+
+    Parameters
+    ----------
+    value : Any
+        Value to encode
+    compress : bool
+        Whether to compress large values
+    threshold : int
+        Payload size in bytes above which values are compressed
+
+    Returns
+    -------
+    bytes
+        Header followed by the (optionally compressed) payload
+    """
+    fmt, payload = _serialize(value)
+    compression = COMPRESSION_NONE
+
+    if compress and len(payload) > threshold:
+        candidate, compressed = _compress(payload)
+        if len(compressed) < len(payload):
+            compression, payload = candidate, compressed
+
+    return bytes((MAGIC, VERSION, fmt, compression)) + payload
+
+
+def _decompress(compression: int, payload: memoryview) -> Union[bytes, memoryview]:
+    if compression == COMPRESSION_NONE:
+        return payload
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(payload)
+    if compression == COMPRESSION_LZ4:
+        if lz4_frame is None:
+            raise CacheCodecError("Value is LZ4-compressed but lz4 is not installed")
+        return lz4_frame.decompress(payload)
+    raise CacheCodecError(f"Unknown cache compression id {compression}")
+
+
+def _deserialize(fmt: int, payload: Union[bytes, memoryview]) -> Any:
+    if fmt == FORMAT_TEXT:
+        return str(payload, "utf-8")
+    if fmt == FORMAT_BYTES:
+        return bytes(payload)
+    if fmt == FORMAT_MSGPACK:
+        if msgpack is None:
+            raise CacheCodecError("Value is MessagePack-encoded but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if fmt == FORMAT_JSON:
+        return json.loads(str(payload, "utf-8"))
+    raise CacheCodecError(f"Unknown cache value format id {fmt}")
+
+
+def _decode_legacy(value: str, value_type: type) -> Any:
+    """Decode a value written before the binary codec existed."""
+    if value.startswith(LEGACY_COMPRESSED_PREFIX):
+        compressed_data = value[len(LEGACY_COMPRESSED_PREFIX):].encode("latin-1")
+        value = zlib.decompress(compressed_data).decode()
+
+    if value_type == str:
+        return value
+    elif value_type == UUID:
+        return UUID(value)
+    elif value_type in (int, float, bool):
+        return value_type(value)
+    else:
+        return json.loads(value)
+
+
+def _coerce(obj: Any, value_type: type) -> Any:
+    """Coerce a decoded object to the type requested by the caller."""
+    if value_type == str:
+        if isinstance(obj, str):
+            return obj
+        if isinstance(obj, bytes):
+            return obj.decode()
+        return json.dumps(obj, default=str)
+    if value_type == UUID:
+        return obj if isinstance(obj, UUID) else UUID(str(obj))
+    if value_type in (int, float, bool) and not isinstance(obj, value_type):
+        return value_type(obj)
+    return obj
+
+
+def decode_value(value: Union[bytes, str], value_type: type = str) -> Any:
+    """Decode a value read from Redis.
+
+    Parameters
+    ----------
+    value : Union[bytes, str]
+        Raw value from Redis; ``str`` only for legacy entries read through a
+        client created with ``decode_responses=True``
+    value_type : type
+        Expected value type
+
+    Returns
+    -------
+    Any
+        Decoded value
+    """
+    if isinstance(value, str):
+        return _decode_legacy(value, value_type)
+
+    if not value or value[0] != MAGIC:
+        return _decode_legacy(bytes(value).decode(), value_type)
+
+    if len(value) < HEADER_SIZE:
+        raise CacheCodecError("Truncated cache value header")
+    version, fmt, compression = value[1], value[2], value[3]
+    if version != VERSION:
+        raise CacheCodecError(f"Unsupported cache value version {version}")
+
+    payload = _decompress(compression, memoryview(value)[HEADER_SIZE:])
+    return _coerce(_deserialize(fmt, payload), value_type)
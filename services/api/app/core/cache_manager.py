@@ -2,15 +2,158 @@
 
 This module provides a unified caching interface that transparently handles
 both in-memory (L1) and Redis (L2) caching tiers.
+
+The L1 tier (:class:`L1Cache`) is bounded: entries expire after their TTL
+(capped at the L1 TTL so a worker never serves a value much longer than L2
+would), and the least recently used entries are evicted when the entry
+count or the estimated byte budget is exceeded.
+
+Writes and deletes are broadcast on a Redis pub/sub channel so that other
+workers drop their L1 copies (see :meth:`CacheManager.start_invalidation_listener`).
+:class:`~app.core.cache.RedisCache` and
+:class:`~app.core.async_cache.AsyncRedisCache` publish the keys removed by tag
+and pattern invalidations on the same channel.
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import json
 import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+from app.observability import metrics
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+
+def encode_invalidation(keys: Iterable[str], origin: str) -> str:
+    """Encode an L1 invalidation message for the pub/sub channel.
+
+    Args:
+        keys: Redis keys to drop from L1 (``"*"`` clears it)
+        origin: Publisher id; a manager ignores its own messages
+
+    Returns:
+        JSON payload understood by :meth:`CacheManager._handle_invalidation`
+    """
+    return json.dumps({"origin": origin, "keys": list(keys)})
+
+
+@dataclass
+class _L1Entry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+class L1Cache:
+    """Process-local LRU cache with per-entry TTL and a byte budget."""
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: int = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the L1 cache.
+
+        Args:
+            max_entries: Maximum number of entries
+            max_bytes: Maximum estimated size of all entries
+            default_ttl: TTL in seconds for entries set without one
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, _L1Entry]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or ``_MISSING`` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            metrics.record_cache_l1_eviction("expired")
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: TTL in seconds (defaults to ``default_ttl``)
+        """
+        size = self._estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"L1 entry too large, not cached: {key} ({size} bytes)")
+            self.delete(key)
+            return
+
+        self.delete(key)
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = _L1Entry(value, self._clock() + ttl, size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted_key, _ = next(iter(self._entries.items()))
+            self._remove(evicted_key)
+            metrics.record_cache_l1_eviction("capacity")
+
+    def delete(self, key: str) -> bool:
+        """Remove a key; returns whether it was present."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not _MISSING
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated size of all entries."""
+        return self._bytes
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        try:
+            return len(json.dumps(value, default=str).encode("utf-8"))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
+
 
 class CacheManager:
     """Manages L1 (memory) and L2 (Redis) cache tiers."""
@@ -21,20 +164,42 @@ class CacheManager:
         l1_enabled: bool = True,
         l2_enabled: bool = True,
         default_ttl: int = 3600,
+        l1_max_entries: int = 1000,
+        l1_max_bytes: int = 64 * 1024 * 1024,
+        l1_ttl: int = 300,
+        invalidation_channel: str = "cache:invalidate",
     ):
         """Initialize cache manager.
 
         Args:
-            redis_client: Redis client instance for L2 cache
+            redis_client: Async Redis client instance for L2 cache
             l1_enabled: Whether to enable L1 (memory) cache
             l2_enabled: Whether to enable L2 (Redis) cache
             default_ttl: Default TTL in seconds
+            l1_max_entries: Maximum number of L1 entries
+            l1_max_bytes: Maximum estimated L1 size in bytes
+            l1_ttl: Maximum time an entry stays in L1, in seconds
+            invalidation_channel: Redis pub/sub channel for L1 invalidation
         """
         self.redis_client = redis_client
         self.l1_enabled = l1_enabled
         self.l2_enabled = l2_enabled
         self.default_ttl = default_ttl
-        self._l1_cache: dict[str, Any] = {}
+        self.l1_ttl = l1_ttl
+        self.invalidation_channel = invalidation_channel
+        self.instance_id = uuid4().hex
+
+        self._l1_cache = L1Cache(
+            max_entries=l1_max_entries, max_bytes=l1_max_bytes, default_ttl=l1_ttl
+        )
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def _l2_available(self) -> bool:
+        return self.l2_enabled and self.redis_client is not None
+
+    def _l1_ttl_for(self, ttl: int) -> int:
+        return min(ttl, self.l1_ttl)
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache (L1 first, then L2).
@@ -46,29 +211,36 @@ class CacheManager:
             Cached value or None if not found
         """
         # Try L1 first
-        if self.l1_enabled and key in self._l1_cache:
-            logger.debug(f"L1 cache hit: {key}")
-            return self._l1_cache[key]
+        if self.l1_enabled:
+            value = self._l1_cache.get(key)
+            if value is not _MISSING:
+                metrics.record_cache_manager_lookup("l1_hit")
+                logger.debug(f"L1 cache hit: {key}")
+                return value
 
         # Try L2
-        if self.l2_enabled and self.redis_client:
+        if self._l2_available:
             try:
                 value = await self.redis_client.get(key)
                 if value is not None:
+                    metrics.record_cache_manager_lookup("l2_hit")
                     logger.debug(f"L2 cache hit: {key}")
                     # Promote to L1
                     if self.l1_enabled:
-                        self._l1_cache[key] = value
+                        self._l1_cache.set(key, value, self.l1_ttl)
                     return value
             except Exception as e:
                 logger.error(f"L2 cache error: {e}")
 
+        metrics.record_cache_manager_lookup("miss")
         logger.debug(f"Cache miss: {key}")
         return None
 
     async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
         """Set value in cache (both L1 and L2).
 
+        Other workers are told to drop their L1 copy of the key.
+
         Args:
             key: Cache key
             value: Value to cache
@@ -78,14 +250,15 @@ class CacheManager:
 
         # Set in L1
         if self.l1_enabled:
-            self._l1_cache[key] = value
+            self._l1_cache.set(key, value, self._l1_ttl_for(ttl))
 
         # Set in L2
-        if self.l2_enabled and self.redis_client:
+        if self._l2_available:
             try:
                 await self.redis_client.setex(key, ttl, value)
             except Exception as e:
                 logger.error(f"L2 cache error: {e}")
+            await self._publish_invalidation([key])
 
     async def delete(self, key: str) -> None:
         """Delete key from both cache tiers.
@@ -95,14 +268,15 @@ class CacheManager:
         """
         # Delete from L1
         if self.l1_enabled:
-            self._l1_cache.pop(key, None)
+            self._l1_cache.delete(key)
 
         # Delete from L2
-        if self.l2_enabled and self.redis_client:
+        if self._l2_available:
             try:
                 await self.redis_client.delete(key)
             except Exception as e:
                 logger.error(f"L2 cache error: {e}")
+            await self._publish_invalidation([key])
 
     async def clear(self) -> None:
         """Clear all cache tiers."""
@@ -111,11 +285,99 @@ class CacheManager:
             self._l1_cache.clear()
 
         # Clear L2 (use with caution!)
-        if self.l2_enabled and self.redis_client:
+        if self._l2_available:
             try:
                 await self.redis_client.flushdb()
             except Exception as e:
                 logger.error(f"L2 cache error: {e}")
+            await self._publish_invalidation(["*"])
+
+    def invalidate_local(self, keys: Iterable[str]) -> int:
+        """Drop keys from this worker's L1 only (``"*"`` clears it).
+
+        Args:
+            keys: Keys to drop
+
+        Returns:
+            Number of L1 entries removed
+        """
+        removed = 0
+        for key in keys:
+            if key == "*":
+                removed += len(self._l1_cache)
+                self._l1_cache.clear()
+            elif self._l1_cache.delete(key):
+                removed += 1
+        return removed
+
+    async def _publish_invalidation(self, keys: list[str]) -> None:
+        if not self.l1_enabled:
+            return
+        payload = encode_invalidation(keys, self.instance_id)
+        try:
+            await self.redis_client.publish(self.invalidation_channel, payload)
+        except Exception as e:
+            logger.warning(f"L1 invalidation publish failed: {e}")
+
+    async def start_invalidation_listener(self) -> None:
+        """Subscribe to invalidations published by other workers."""
+        if not (self.l1_enabled and self._l2_available):
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(
+                self._listen(), name="cache.invalidation_listener"
+            )
+
+    async def stop_invalidation_listener(self) -> None:
+        """Stop the invalidation listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.invalidation_channel)
+                logger.info(f"Listening for L1 invalidations on {self.invalidation_channel}")
+                backoff = 1.0
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._handle_invalidation(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Entries still expire after l1_ttl while disconnected
+                logger.warning(f"L1 invalidation listener error: {e}; retrying in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _handle_invalidation(self, data: Any) -> None:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed L1 invalidation: {data!r}")
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+        removed = self.invalidate_local(payload.get("keys", []))
+        if removed:
+            metrics.record_cache_l1_eviction("invalidated", removed)
 
 
 # Global cache manager instance
@@ -141,22 +403,74 @@ def initialize_cache_manager(
     l1_enabled: bool = True,
     l2_enabled: bool = True,
     default_ttl: int = 3600,
-) -> None:
+    **l1_options: Any,
+) -> CacheManager:
     """Initialize the global cache manager.
 
     Args:
-        redis_client: Redis client instance
+        redis_client: Async Redis client instance
         l1_enabled: Whether to enable L1 cache
         l2_enabled: Whether to enable L2 cache
         default_ttl: Default TTL in seconds
+        **l1_options: L1 sizing, TTL and invalidation options (see
+            :class:`CacheManager`); defaults come from ``CACHE_*`` settings
+
+    Returns:
+        The global CacheManager
     """
     global _cache_manager
+    cache_settings = settings.CACHE
+    options: Dict[str, Any] = {
+        "l1_max_entries": cache_settings.L1_MAX_SIZE,
+        "l1_max_bytes": cache_settings.L1_MAX_BYTES,
+        "l1_ttl": cache_settings.L1_TTL,
+        "invalidation_channel": cache_settings.L1_INVALIDATION_CHANNEL,
+    }
+    options.update(l1_options)
     _cache_manager = CacheManager(
         redis_client=redis_client,
         l1_enabled=l1_enabled,
         l2_enabled=l2_enabled,
         default_ttl=default_ttl,
+        **options,
+    )
+    return _cache_manager
+
+
+async def start_cache_manager() -> Optional[CacheManager]:
+    """Create the global cache manager from settings and start L1 invalidation."""
+    cache_settings = settings.CACHE
+    if not cache_settings.ENABLED:
+        return None
+
+    redis_client = None
+    if cache_settings.L2_ENABLED:
+        import redis.asyncio as aioredis
+
+        redis_client = aioredis.from_url(settings.REDIS_URL)
+
+    manager = initialize_cache_manager(
+        redis_client=redis_client,
+        l1_enabled=cache_settings.L1_ENABLED,
+        l2_enabled=cache_settings.L2_ENABLED,
+        default_ttl=cache_settings.DEFAULT_TTL,
     )
+    await manager.start_invalidation_listener()
+    return manager
+
+
+async def close_cache_manager() -> None:
+    """Stop the invalidation listener and close the global cache manager."""
+    global _cache_manager
+    if _cache_manager is None:
+        return
+    await _cache_manager.stop_invalidation_listener()
+    if _cache_manager.redis_client is not None:
+        try:
+            await _cache_manager.redis_client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing cache manager Redis client: {e}")
+    _cache_manager = None
 
 
 # Alias for backward compatibility
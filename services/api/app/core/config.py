@@ -90,6 +90,8 @@ class CacheSettings(BaseSettings):
     L1_ENABLED: bool = True
     L1_MAX_SIZE: int = 1000  # Maximum number of entries
     L1_TTL: int = 300  # 5 minutes
+    L1_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MiB
+    L1_INVALIDATION_CHANNEL: str = "cache:invalidate"  # Redis pub/sub channel
 
     # L2 (Redis) cache settings
     L2_ENABLED: bool = True
@@ -124,9 +126,23 @@ class CacheSettings(BaseSettings):
     MONITORING_ENABLED: bool = True
     METRICS_COLLECTION_INTERVAL: int = 60  # seconds
 
+    # Workflow skill result memoization (content-addressed by input hash + seed)
+    SKILL_RESULTS_ENABLED: bool = True
+    SKILL_RESULTS_L1_MAX_ENTRIES: int = 512
+    SKILL_RESULTS_L1_MAX_BYTES: int = 64 * 1024 * 1024  # 64 MiB
+    SKILL_RESULTS_L2_ENABLED: bool = True
+    SKILL_RESULTS_TTL: int = 86400  # 24 hours
+
     # Tag-based invalidation
     TAG_INVALIDATION_ENABLED: bool = True
     TAG_SET_TTL_BUFFER: int = 300  # 5 minutes buffer for tag sets
+    TAG_INVALIDATION_BATCH_SIZE: int = 500  # Keys deleted per scripted batch
+    TAG_COMPACTION_ENABLED: bool = True  # Background removal of expired tag members
+    TAG_COMPACTION_INTERVAL: int = 600  # seconds between tag index compactions
+    TAG_COMPACTION_SCAN_COUNT: int = 500  # Members checked per scripted SSCAN step
+
+    # Pagination totals (CursorPagination TotalCountMode.CACHED)
+    PAGINATION_COUNT_TTL: int = 60  # bounds staleness after writes outside the repositories
 
     # Tenant awareness
     TENANT_AWARE: bool = True
@@ -220,6 +236,107 @@ class CacheSettings(BaseSettings):
         }
 
 
+class LLMSettings(BaseSettings):
+    """LLM transport settings for workflow skills.
+
+    Environment variables use the ``LLM_`` prefix. For example,
+    ``LLM_PROVIDER=stub`` swaps the Anthropic transport for the offline stub.
+    """
+
+    PROVIDER: Literal["anthropic", "stub"] = "anthropic"
+    MODEL: str = "claude-sonnet-4-5-20250929"
+
+    # Connection pool and concurrency bounds
+    MAX_CONNECTIONS: int = 20
+    MAX_KEEPALIVE_CONNECTIONS: int = 10
+    MAX_CONCURRENT_REQUESTS: int = 10
+
+    # Timeouts (seconds)
+    REQUEST_TIMEOUT: float = 60.0
+    CONNECT_TIMEOUT: float = 5.0
+    MAX_RETRIES: int = 2
+
+    # Stub provider simulated latency (milliseconds)
+    STUB_LATENCY_MS: int = 0
+
+    model_config = SettingsConfigDict(env_prefix="LLM_")
+
+    @field_validator("PROVIDER", mode="before")
+    @classmethod
+    def _lower_provider(cls, value: str) -> str:
+        """Normalize provider names to lowercase."""
+        return value.lower()
+
+
+class DatabaseSettings(BaseSettings):
+    """Database connection pool settings.
+
+    Environment variables use the ``DB_`` prefix. For example,
+    ``DB_POOL_SIZE=20`` keeps twenty connections open per engine. The sync
+    and async engines each get their own pool of this size; SQLite URLs
+    ignore the pool settings.
+    """
+
+    POOL_SIZE: int = 5  # Connections kept open
+    MAX_OVERFLOW: int = 10  # Extra connections opened under load, closed on checkin
+    POOL_TIMEOUT: float = 30.0  # Seconds a checkout waits before raising
+    POOL_RECYCLE: int = 1800  # Reconnect connections older than this (seconds, -1 disables)
+    POOL_PRE_PING: bool = True
+    POOL_METRICS_ENABLED: bool = True  # Checkout wait / in-use / overflow histograms
+
+    model_config = SettingsConfigDict(env_prefix="DB_")
+
+
+class WorkflowSettings(BaseSettings):
+    """Workflow execution persistence settings.
+
+    Environment variables use the ``WORKFLOW_`` prefix. For example,
+    ``WORKFLOW_WRITE_BEHIND_ENABLED=false`` commits every node and event
+    write immediately.
+    """
+
+    # Write-behind buffering of NodeExecution, WorkflowEvent and run updates
+    WRITE_BEHIND_ENABLED: bool = True
+    WRITE_BEHIND_FLUSH_INTERVAL_MS: int = 250
+    WRITE_BEHIND_MAX_BATCH_SIZE: int = 100
+    WRITE_BEHIND_MAX_FLUSH_ATTEMPTS: int = 3
+
+    # Batch execution (POST /runs/batch)
+    BATCH_MAX_RUNS: int = 50  # Runs accepted per batch request
+    BATCH_MAX_CONCURRENT_RUNS: int = 8
+    BATCH_MAX_CONCURRENT_LLM_REQUESTS: int = 10  # Shared by all runs of a batch
+
+    # Skill execution
+    LYRICS_MAX_CONCURRENT_SECTIONS: int = 4  # Sections generated at once (1 = sequential)
+
+    model_config = SettingsConfigDict(env_prefix="WORKFLOW_")
+
+
+class WorkerSettings(BaseSettings):
+    """Background workflow run worker settings.
+
+    Environment variables use the ``WORKER_`` prefix. For example,
+    ``WORKER_BACKEND=redis`` shares the run queue between API replicas.
+    """
+
+    ENABLED: bool = True  # Run a worker inside the API process
+    BACKEND: Literal["inprocess", "redis"] = "inprocess"
+    MAX_CONCURRENT_RUNS: int = 4  # Per worker
+    QUEUE_MAX_SIZE: int = 100  # Enqueue is rejected beyond this depth
+    REDIS_QUEUE_KEY: str = "workflow:run_queue"
+    POLL_TIMEOUT: float = 1.0  # seconds
+    SHUTDOWN_TIMEOUT: float = 30.0  # seconds to drain in-flight runs
+    RETRY_AFTER_SECONDS: int = 5  # Retry-After hint when the queue is full
+
+    model_config = SettingsConfigDict(env_prefix="WORKER_")
+
+    @field_validator("BACKEND", mode="before")
+    @classmethod
+    def _lower_backend(cls, value: str) -> str:
+        """Normalize backend names to lowercase."""
+        return value.lower()
+
+
 class Settings(BaseSettings):
     """Top-level application settings."""
 
@@ -230,6 +347,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_URL_TEST: str
     POSTGRES_DB: str = "meatymusic"
+    DB: DatabaseSettings = DatabaseSettings()
 
     # API configuration
     API_V1_STR: str = "/api/v1"
@@ -262,6 +380,9 @@ class Settings(BaseSettings):
 
     OBS: ObservabilitySettings = ObservabilitySettings()
     CACHE: CacheSettings = CacheSettings()
+    LLM: LLMSettings = LLMSettings()
+    WORKER: WorkerSettings = WorkerSettings()
+    WORKFLOW: WorkflowSettings = WorkflowSettings()
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -9,24 +9,15 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.core.db_pool import pool_options
 
 logger = logging.getLogger(__name__)
 
-# Configure engine based on database type
-if settings.DATABASE_URL.startswith("sqlite"):
-    # SQLite doesn't support pool_size or max_overflow
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,
-    )
-else:
-    # PostgreSQL and other databases support connection pooling
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-    )
+# Pool sizing, timeouts and recycling come from settings.DB
+engine = create_engine(
+    settings.DATABASE_URL,
+    **pool_options(settings.DATABASE_URL),
+)
 
 SessionLocal = sessionmaker(
     bind=engine,
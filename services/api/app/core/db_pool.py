@@ -0,0 +1,82 @@
+"""Connection pool configuration and saturation metrics.
+
+Both the sync engine (``app.core.database``) and the async engine
+(``app.core.async_database``) take their pool settings from
+``settings.DB`` through :func:`pool_options`. Their pools time every
+checkout, including the wait for a free connection when the pool is
+exhausted, and record it with the in-use and overflow counts as Prometheus
+histograms (see ``app.observability.metrics``).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.observability.metrics import db_pool_capacity, record_db_pool_checkout, record_db_pool_timeout
+
+
+class _PoolMetricsMixin:
+    """Time checkouts of a queue pool and record pool saturation."""
+
+    metrics_name = "default"
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except exc.TimeoutError:
+            record_db_pool_timeout(self.metrics_name)
+            raise
+        record_db_pool_checkout(
+            self.metrics_name,
+            time.perf_counter() - start,
+            in_use=self.checkedout(),  # type: ignore[attr-defined]
+            overflow=max(self.overflow(), 0),  # type: ignore[attr-defined]
+        )
+        return connection
+
+
+class InstrumentedQueuePool(_PoolMetricsMixin, QueuePool):
+    """QueuePool of the sync engine with checkout metrics."""
+
+    metrics_name = "sync"
+
+
+class InstrumentedAsyncQueuePool(_PoolMetricsMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool of the async engine with checkout metrics."""
+
+    metrics_name = "async"
+
+
+def pool_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """Engine keyword arguments for the configured connection pool.
+
+    Args:
+        url: Database URL the engine connects to
+        is_async: Whether the engine is created with ``create_async_engine``
+
+    Returns:
+        Keyword arguments for ``create_engine`` / ``create_async_engine``
+    """
+    db = settings.DB
+    if url.startswith("sqlite"):
+        # SQLite doesn't support pool_size or max_overflow
+        return {"pool_pre_ping": db.POOL_PRE_PING}
+
+    options: Dict[str, Any] = {
+        "pool_pre_ping": db.POOL_PRE_PING,
+        "pool_size": db.POOL_SIZE,
+        "max_overflow": db.MAX_OVERFLOW,
+        "pool_timeout": db.POOL_TIMEOUT,
+        "pool_recycle": db.POOL_RECYCLE,
+    }
+    if db.POOL_METRICS_ENABLED:
+        pool_class = InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool
+        options["poolclass"] = pool_class
+        db_pool_capacity.labels(pool=pool_class.metrics_name).set(db.POOL_SIZE + db.MAX_OVERFLOW)
+    return options
@@ -45,13 +45,14 @@ See: docs/determinism_requirements.md for full details
 
 import functools
 import hashlib
-import json
 import random
 import sys
 import warnings
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
+from app.core.hashing import ARTIFACT_ENCODING
+
 __all__ = [
     "SeededRandom",
     "get_node_seed",
@@ -322,8 +323,7 @@ def hash_artifact(artifact: Union[Dict[str, Any], str, bytes]) -> str:
     """
     if isinstance(artifact, dict):
         # Sort keys for deterministic JSON serialization
-        content = json.dumps(artifact, sort_keys=True, ensure_ascii=False)
-        content_bytes = content.encode('utf-8')
+        content_bytes = ARTIFACT_ENCODING.encode(artifact).encode('utf-8')
     elif isinstance(artifact, str):
         content_bytes = artifact.encode('utf-8')
     elif isinstance(artifact, bytes):
@@ -0,0 +1,150 @@
+"""Canonical JSON hashing engine.
+
+Every content hash in the service is SHA-256 over a canonical JSON encoding
+(sorted keys, ``json`` default separators). Two profiles exist for backward
+compatibility and must never change, since their digests are persisted
+(node execution hashes, provenance hashes, cache keys):
+
+- :data:`WORKFLOW_ENCODING`: ``json.dumps(sort_keys=True, default=str)``,
+  used by :func:`app.workflows.skill.compute_hash`
+- :data:`ARTIFACT_ENCODING`: ``json.dumps(sort_keys=True, ensure_ascii=False)``,
+  used by :func:`app.core.determinism.hash_artifact`
+
+SHA-256 digests cannot be combined, so reuse happens one level down: a
+:class:`CanonicalDocument` keeps the encoded fragment of each top-level value
+of a mapping. Sub-artifacts that were already encoded (e.g. an upstream
+node's outputs inside a downstream node's inputs) are spliced in as leaves
+instead of being serialized again, and adding a key to an encoded mapping
+only encodes the new value. The resulting digests are byte-identical to
+hashing the whole payload from scratch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+class CanonicalEncoding:
+    """A canonical JSON encoding profile (sorted keys, default separators)."""
+
+    def __init__(self, ensure_ascii: bool, default: Optional[Callable[[Any], Any]]):
+        """Initialize the profile.
+
+        Args:
+            ensure_ascii: Escape non-ASCII characters
+            default: Fallback serializer for unsupported types (None raises)
+        """
+        self.ensure_ascii = ensure_ascii
+        self.default = default
+        # Built once; json.dumps would construct an encoder per call
+        self._encoder = json.JSONEncoder(
+            sort_keys=True, ensure_ascii=ensure_ascii, default=default
+        )
+        self._encode_key = encode_basestring_ascii if ensure_ascii else encode_basestring
+
+    def encode(self, data: Any) -> str:
+        """Encode ``data`` canonically (same text as ``json.dumps``)."""
+        return self._encoder.encode(data)
+
+    def hexdigest(self, data: Any) -> str:
+        """SHA-256 hex digest of the canonical encoding of ``data``."""
+        return hashlib.sha256(self.encode(data).encode("utf-8")).hexdigest()
+
+    def document(
+        self,
+        mapping: Mapping[str, Any],
+        leaves: Optional[Mapping[str, "CanonicalDocument"]] = None,
+    ) -> Optional["CanonicalDocument"]:
+        """Encode a mapping as per-key fragments.
+
+        Args:
+            mapping: Mapping to encode
+            leaves: Already-encoded documents for some values; a leaf is used
+                only when it was built from the very object stored under
+                that key, otherwise the value is encoded
+
+        Returns:
+            CanonicalDocument, or None when the mapping has non-string keys
+            (whose canonical ordering differs) and must be hashed whole
+        """
+        if not all(isinstance(key, str) for key in mapping):
+            return None
+
+        fragments: Dict[str, str] = {}
+        for key, value in mapping.items():
+            leaf = leaves.get(key) if leaves else None
+            if leaf is not None and leaf.source is value:
+                fragments[key] = leaf.text
+            else:
+                fragments[key] = self.encode(value)
+        return CanonicalDocument(self, fragments, source=mapping)
+
+
+class CanonicalDocument:
+    """Canonical encoding of a mapping, kept as per-key fragments.
+
+    Attributes:
+        encoding: Profile the fragments were encoded with
+        fragments: Encoded value by key
+        source: Mapping the document was built from (used to check that a
+            leaf still refers to the same object)
+    """
+
+    __slots__ = ("encoding", "fragments", "source", "_text", "_hexdigest")
+
+    def __init__(
+        self,
+        encoding: CanonicalEncoding,
+        fragments: Dict[str, str],
+        source: Any = None,
+    ):
+        self.encoding = encoding
+        self.fragments = fragments
+        self.source = source
+        self._text: Optional[str] = None
+        self._hexdigest: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Full canonical encoding of the mapping."""
+        if self._text is None:
+            encode_key = self.encoding._encode_key
+            self._text = (
+                "{"
+                + ", ".join(
+                    f"{encode_key(key)}: {self.fragments[key]}"
+                    for key in sorted(self.fragments)
+                )
+                + "}"
+            )
+        return self._text
+
+    def hexdigest(self) -> str:
+        """SHA-256 hex digest of :attr:`text`."""
+        if self._hexdigest is None:
+            self._hexdigest = hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+        return self._hexdigest
+
+    def with_values(
+        self, values: Mapping[str, Any], source: Any = None
+    ) -> "CanonicalDocument":
+        """Return a document with keys added or replaced, encoding only those.
+
+        Args:
+            values: New values by key
+            source: Mapping the new document describes
+
+        Returns:
+            New CanonicalDocument
+        """
+        fragments = dict(self.fragments)
+        for key, value in values.items():
+            fragments[key] = self.encoding.encode(value)
+        return CanonicalDocument(self.encoding, fragments, source=source)
+
+
+WORKFLOW_ENCODING = CanonicalEncoding(ensure_ascii=True, default=str)
+ARTIFACT_ENCODING = CanonicalEncoding(ensure_ascii=False, default=None)
@@ -3,20 +3,218 @@
 This module provides cursor-based pagination support for efficient
 querying of large datasets. Cursors are encoded/decoded using base64
 to hide implementation details.
+
+Pages use keyset predicates on ``(sort_field, id)``, so with a composite
+index ending in those columns (after the equality-filtered ownership
+column) a page costs O(limit) however deep it is. Totals are optional and
+follow a :class:`TotalCountMode`:
+
+- ``EXACT``: filtered ``COUNT(*)`` on every request
+- ``CACHED``: exact count cached per (model, filters, security scope) and
+  invalidated when repository writes commit
+- ``ESTIMATED``: exact up to ``ESTIMATE_EXACT_CAP`` rows, then the planner's
+  row estimate (PostgreSQL) or the cap, flagged as an estimate
+- ``NONE``: no count; ``has_next`` comes from fetching ``limit + 1`` rows
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import json
-from typing import TypeVar, Generic, List, Any, Dict, Optional, Type
+import logging
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import TypeVar, Generic, List, Any, Dict, Optional, Set, Tuple, Type
 from dataclasses import dataclass
-from sqlalchemy import asc, desc
-from sqlalchemy.orm import Query
+from uuid import UUID
+from sqlalchemy import asc, desc, event, func, select, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
 
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+# Rows counted exactly in ESTIMATED mode before falling back to an estimate
+ESTIMATE_EXACT_CAP = 10_000
+
+# Cache namespace of CACHED totals and their per-model generations
+COUNT_CACHE_NAMESPACE = "pagination"
+
+# Session.info key of models whose totals are invalidated on commit
+_PENDING_INVALIDATIONS_KEY = "pagination.pending_count_invalidations"
+
+# Async invalidations scheduled by commits, kept until they finish
+_invalidation_tasks: Set[asyncio.Task] = set()
+
+
+class TotalCountMode(str, Enum):
+    """How a paginated query computes its total count."""
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _resolve_total_mode(include_total: bool, total_mode: Optional[TotalCountMode]) -> TotalCountMode:
+    """Map the legacy ``include_total`` flag onto a :class:`TotalCountMode`."""
+    if total_mode is not None:
+        return TotalCountMode(total_mode)
+    return TotalCountMode.EXACT if include_total else TotalCountMode.NONE
+
+
+def _count_statement(statement: Any, cap: Optional[int] = None) -> Any:
+    """``SELECT count(*)`` over ``statement`` (scanning at most ``cap + 1`` rows)."""
+    inner = statement.order_by(None)
+    if cap is not None:
+        inner = inner.limit(cap + 1)
+    return select(func.count()).select_from(inner.subquery())
+
+
+def _plan_rows(explain_output: Any) -> int:
+    """Top-level row estimate of an ``EXPLAIN (FORMAT JSON)`` result."""
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    return int(explain_output[0]["Plan"]["Plan Rows"])
+
+
+def _security_scope(security_context: Any) -> str:
+    if security_context is None:
+        return "system"
+    tenant_id = getattr(security_context, "tenant_id", None)
+    user_id = getattr(security_context, "user_id", None)
+    return f"t:{tenant_id or '-'}:u:{user_id or '-'}"
+
+
+def _count_generation_key(model_class: Type[Any]) -> str:
+    return f"{model_class.__tablename__}:count_gen"
+
+
+def count_cache_key(model_class: Type[Any], statement: Any, security_context: Any) -> str:
+    """Cache key of a CACHED total: model, security scope and filter hash.
+
+    Args:
+        model_class: The SQLAlchemy model class being counted
+        statement: The security-filtered ``select()`` being counted
+        security_context: Security context the statement was filtered with
+
+    Returns:
+        Cache key in the ``pagination`` namespace
+    """
+    compiled = statement.compile()
+    material = f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+    filters_hash = hashlib.sha256(material.encode()).hexdigest()[:16]
+    return f"{model_class.__tablename__}:count:{_security_scope(security_context)}:{filters_hash}"
+
+
+def invalidate_total_counts(model_class: Type[Any]) -> None:
+    """Invalidate every CACHED total of a model (call after writes).
+
+    Bumps the model's count generation; cached totals written under an
+    older generation are ignored. Totals of writes that bypass the
+    repositories expire after ``CACHE.PAGINATION_COUNT_TTL``.
+    """
+    if not settings.CACHE.ENABLED:
+        return
+    from app.core.cache import get_cache
+    get_cache().incr(_count_generation_key(model_class), namespace=COUNT_CACHE_NAMESPACE)
+
+
+async def invalidate_total_counts_async(model_class: Type[Any]) -> None:
+    """Async variant of :func:`invalidate_total_counts`."""
+    if not settings.CACHE.ENABLED:
+        return
+    from app.core.async_cache import get_async_cache
+    await get_async_cache().incr(_count_generation_key(model_class), namespace=COUNT_CACHE_NAMESPACE)
+
+
+def invalidate_total_counts_on_commit(session: Any, model_class: Type[Any], use_async: bool = False) -> None:
+    """Invalidate every CACHED total of a model once ``session`` commits.
+
+    Bumping the generation before the commit would let a concurrent reader
+    count the pre-commit rows and cache them under the new generation. The
+    bump is dropped if the transaction rolls back.
+
+    Args:
+        session: Session (or AsyncSession) holding the write
+        model_class: The SQLAlchemy model class written
+        use_async: Bump through the async cache (for AsyncSession writes)
+    """
+    sync_session = getattr(session, "sync_session", session)
+    sync_session.info.setdefault(_PENDING_INVALIDATIONS_KEY, {})[model_class] = use_async
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_totals(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+    for model_class, use_async in (pending or {}).items():
+        try:
+            if use_async:
+                task = asyncio.get_running_loop().create_task(invalidate_total_counts_async(model_class))
+                _invalidation_tasks.add(task)
+                task.add_done_callback(lambda done, name=model_class.__name__: _invalidation_done(done, name))
+            else:
+                invalidate_total_counts(model_class)
+        except Exception as e:
+            # Cached totals also expire after CACHE.PAGINATION_COUNT_TTL
+            logger.warning("Failed to invalidate cached totals for %s: %s", model_class.__name__, e)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_totals(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
+
+def _invalidation_done(task: asyncio.Task, model_name: str) -> None:
+    _invalidation_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Failed to invalidate cached totals for %s: %s", model_name, task.exception())
+
+
+@lru_cache(maxsize=256)
+def keyset_index(model_class: Type[Any], sort_field: str) -> Optional[str]:
+    """Name of an index usable by the ``(sort_field, id)`` keyset predicate.
+
+    An index qualifies when its last two columns are ``sort_field`` and
+    ``id``; leading columns are expected to be equality filters such as the
+    ownership column. Logs a warning (once per model and field) when there
+    is none, since deep pages then degrade to scanning skipped rows.
+    """
+    table = getattr(model_class, "__table__", None)
+    if table is None:
+        return None
+    for index in table.indexes:
+        names = [column.name for column in index.columns]
+        if names[-2:] == [sort_field, "id"]:
+            return index.name
+    logger.warning(
+        "No composite (%s, id) index on %s: keyset pages sorted by %s cannot stay O(limit)",
+        sort_field, table.name, sort_field
+    )
+    return None
+
 
 @dataclass
 class CursorPagination(Generic[T]):
@@ -29,6 +227,7 @@ class CursorPagination(Generic[T]):
         has_next: Whether there are more pages after this one
         has_prev: Whether there are pages before this one
         total_count: Total count of items (if available, None otherwise)
+        total_is_estimate: Whether total_count is an estimate
     """
 
     items: List[T]
@@ -37,6 +236,7 @@ class CursorPagination(Generic[T]):
     has_next: bool = False
     has_prev: bool = False
     total_count: int | None = None
+    total_is_estimate: bool = False
 
     @staticmethod
     def paginate(
@@ -47,7 +247,8 @@ class CursorPagination(Generic[T]):
         sort_desc: bool,
         security_context: Any,
         model_class: Type[T],
-        include_total: bool = False
+        include_total: bool = False,
+        total_mode: Optional[TotalCountMode] = None
     ) -> "CursorPagination[T]":
         """Apply cursor-based pagination to a query with security filtering.
 
@@ -59,50 +260,120 @@ class CursorPagination(Generic[T]):
             sort_desc: Whether to sort in descending order
             security_context: Security context for row-level filtering
             model_class: The SQLAlchemy model class being queried
-            include_total: Whether to include total count (expensive)
+            include_total: Whether to include an exact total count (legacy flag)
+            total_mode: How to compute the total; overrides ``include_total``
 
         Returns:
             CursorPagination instance with items and pagination metadata
         """
-        # Apply security filtering if context is provided
-        if security_context is not None:
-            from app.core.security import UnifiedRowGuard
-            guard = UnifiedRowGuard(model_class, security_context)
-            query = guard.filter_query(query)
+        mode = _resolve_total_mode(include_total, total_mode)
+        query = CursorPagination._secure(query, security_context, model_class)
+        page_query = CursorPagination._keyset(query, cursor, sort_field, sort_desc, model_class)
 
-        # Apply cursor filtering if provided
-        if cursor:
-            cursor_data = decode_cursor(cursor)
-            cursor_field = cursor_data.get("field", sort_field)
-            cursor_value = cursor_data["value"]
-            cursor_id = cursor_data.get("id")
-
-            field_attr = getattr(model_class, cursor_field)
-            id_attr = getattr(model_class, "id")
-
-            # Apply cursor condition based on sort direction
-            if sort_desc:
-                query = query.filter(
-                    (field_attr < cursor_value) |
-                    ((field_attr == cursor_value) & (id_attr < cursor_id))
-                )
-            else:
-                query = query.filter(
-                    (field_attr > cursor_value) |
-                    ((field_attr == cursor_value) & (id_attr > cursor_id))
-                )
+        # Fetch limit + 1 to determine if there are more items
+        items = page_query.limit(limit + 1).all()
+
+        # Totals count the whole filtered set, not just the rows after the cursor
+        total_count, is_estimate = _total_count(
+            query.session, query.statement, mode, model_class, security_context
+        )
+
+        return CursorPagination._from_rows(items, limit, cursor, sort_field, total_count, is_estimate)
+
+    @staticmethod
+    async def paginate_async(
+        session: Any,
+        statement: Any,
+        cursor: Optional[str],
+        limit: int,
+        sort_field: str,
+        sort_desc: bool,
+        security_context: Any,
+        model_class: Type[T],
+        include_total: bool = False,
+        total_mode: Optional[TotalCountMode] = None
+    ) -> "CursorPagination[T]":
+        """Async variant of :meth:`paginate` for ``select()`` statements.
+
+        Args:
+            session: AsyncSession to execute the statement on
+            statement: SQLAlchemy ``select()`` of ``model_class`` to paginate
+            cursor: Optional cursor for pagination
+            limit: Maximum number of items to return
+            sort_field: Field to sort by
+            sort_desc: Whether to sort in descending order
+            security_context: Security context for row-level filtering
+            model_class: The SQLAlchemy model class being queried
+            include_total: Whether to include an exact total count (legacy flag)
+            total_mode: How to compute the total; overrides ``include_total``
+
+        Returns:
+            CursorPagination instance with items and pagination metadata
+        """
+        mode = _resolve_total_mode(include_total, total_mode)
+        statement = CursorPagination._secure(statement, security_context, model_class)
+        page_statement = CursorPagination._keyset(statement, cursor, sort_field, sort_desc, model_class)
+
+        result = await session.execute(page_statement.limit(limit + 1))
+        items = list(result.scalars().all())
+
+        total_count, is_estimate = await _total_count_async(
+            session, statement, mode, model_class, security_context
+        )
+
+        return CursorPagination._from_rows(items, limit, cursor, sort_field, total_count, is_estimate)
+
+    @staticmethod
+    def _secure(query: Any, security_context: Any, model_class: Type[T]) -> Any:
+        """Apply security filtering if context is provided."""
+        if security_context is None:
+            return query
+        from app.core.security import UnifiedRowGuard
+        return UnifiedRowGuard(model_class, security_context).filter_query(query)
+
+    @staticmethod
+    def _keyset(
+        query: Any,
+        cursor: Optional[str],
+        sort_field: str,
+        sort_desc: bool,
+        model_class: Type[T]
+    ) -> Any:
+        """Apply the keyset condition and ordering.
+
+        The cursor condition is a row-value comparison on ``(sort_field, id)``
+        so that a composite index ending in those columns serves it as a
+        single range scan. Works on both ``Query`` objects and ``select()``
+        statements.
+        """
+        keyset_index(model_class, sort_field)
 
-        # Apply sorting
         sort_attr = getattr(model_class, sort_field)
         id_attr = getattr(model_class, "id")
-        if sort_desc:
-            query = query.order_by(desc(sort_attr), desc(id_attr))
-        else:
-            query = query.order_by(asc(sort_attr), asc(id_attr))
 
-        # Fetch limit + 1 to determine if there are more items
-        items = query.limit(limit + 1).all()
+        if cursor:
+            cursor_data = decode_cursor(cursor)
+            field_attr = getattr(model_class, cursor_data.get("field", sort_field))
+            cursor_value = _coerce_cursor_value(field_attr, cursor_data["value"])
+            cursor_id = _coerce_cursor_value(id_attr, cursor_data.get("id"))
+
+            row, bound = tuple_(field_attr, id_attr), tuple_(cursor_value, cursor_id)
+            query = query.filter(row < bound if sort_desc else row > bound)
+
+        if sort_desc:
+            return query.order_by(desc(sort_attr), desc(id_attr))
+        return query.order_by(asc(sort_attr), asc(id_attr))
 
+    @staticmethod
+    def _from_rows(
+        items: List[T],
+        limit: int,
+        cursor: Optional[str],
+        sort_field: str,
+        total_count: Optional[int],
+        total_is_estimate: bool = False
+    ) -> "CursorPagination[T]":
+        """Build the page from ``limit + 1`` fetched rows."""
         # Determine if there are more pages
         has_next = len(items) > limit
         if has_next:
@@ -127,22 +398,118 @@ class CursorPagination(Generic[T]):
                 "id": str(item_id)
             })
 
-        # Calculate total count if requested (expensive operation)
-        total_count = None
-        if include_total:
-            # Remove ordering for count query
-            count_query = query.order_by(None).limit(None)
-            total_count = count_query.count()
-
         return CursorPagination(
             items=items,
             next_cursor=next_cursor,
             has_next=has_next,
             has_prev=cursor is not None,  # If we have a cursor, there are previous pages
-            total_count=total_count
+            total_count=total_count,
+            total_is_estimate=total_is_estimate
         )
 
 
+def _dialect_name(session: Any) -> str:
+    return session.get_bind().dialect.name
+
+
+def _total_count(
+    session: Any,
+    statement: Any,
+    mode: TotalCountMode,
+    model_class: Type[Any],
+    security_context: Any
+) -> Tuple[Optional[int], bool]:
+    """Compute ``(total_count, is_estimate)`` for ``mode`` on a sync session."""
+    if mode is TotalCountMode.NONE:
+        return None, False
+
+    if mode is TotalCountMode.ESTIMATED:
+        bounded = session.execute(_count_statement(statement, ESTIMATE_EXACT_CAP)).scalar_one()
+        if bounded <= ESTIMATE_EXACT_CAP:
+            return bounded, False
+        if _dialect_name(session) == "postgresql":
+            estimate = _plan_rows(session.execute(_Explain(statement)).scalar_one())
+            return max(estimate, ESTIMATE_EXACT_CAP + 1), True
+        return ESTIMATE_EXACT_CAP + 1, True
+
+    if mode is TotalCountMode.CACHED and settings.CACHE.ENABLED:
+        from app.core.cache import get_cache
+        cache = get_cache()
+        generation_key = _count_generation_key(model_class)
+        entry_key = count_cache_key(model_class, statement, security_context)
+        try:
+            cached = cache.mget([generation_key, entry_key], value_type=dict, namespace=COUNT_CACHE_NAMESPACE)
+        except Exception as e:
+            logger.warning("Cached total unavailable for %s, counting exactly: %s", model_class.__name__, e)
+            cached = None
+        if cached is not None:
+            generation = cached.get(generation_key) or 0
+            entry = cached.get(entry_key)
+            if isinstance(entry, dict) and entry.get("generation") == generation:
+                return entry["count"], False
+
+        total = session.execute(_count_statement(statement)).scalar_one()
+        if cached is not None:
+            cache.set(
+                entry_key,
+                {"generation": generation, "count": total},
+                ttl=settings.CACHE.PAGINATION_COUNT_TTL,
+                namespace=COUNT_CACHE_NAMESPACE
+            )
+        return total, False
+
+    return session.execute(_count_statement(statement)).scalar_one(), False
+
+
+async def _total_count_async(
+    session: Any,
+    statement: Any,
+    mode: TotalCountMode,
+    model_class: Type[Any],
+    security_context: Any
+) -> Tuple[Optional[int], bool]:
+    """Compute ``(total_count, is_estimate)`` for ``mode`` on an AsyncSession."""
+    if mode is TotalCountMode.NONE:
+        return None, False
+
+    if mode is TotalCountMode.ESTIMATED:
+        bounded = (await session.execute(_count_statement(statement, ESTIMATE_EXACT_CAP))).scalar_one()
+        if bounded <= ESTIMATE_EXACT_CAP:
+            return bounded, False
+        if _dialect_name(session) == "postgresql":
+            estimate = _plan_rows((await session.execute(_Explain(statement))).scalar_one())
+            return max(estimate, ESTIMATE_EXACT_CAP + 1), True
+        return ESTIMATE_EXACT_CAP + 1, True
+
+    if mode is TotalCountMode.CACHED and settings.CACHE.ENABLED:
+        from app.core.async_cache import get_async_cache
+        cache = get_async_cache()
+        generation_key = _count_generation_key(model_class)
+        entry_key = count_cache_key(model_class, statement, security_context)
+        try:
+            cached = await cache.mget([generation_key, entry_key], value_type=dict, namespace=COUNT_CACHE_NAMESPACE)
+        except Exception as e:
+            logger.warning("Cached total unavailable for %s, counting exactly: %s", model_class.__name__, e)
+            cached = None
+        if cached is not None:
+            generation = cached.get(generation_key) or 0
+            entry = cached.get(entry_key)
+            if isinstance(entry, dict) and entry.get("generation") == generation:
+                return entry["count"], False
+
+        total = (await session.execute(_count_statement(statement))).scalar_one()
+        if cached is not None:
+            await cache.set(
+                entry_key,
+                {"generation": generation, "count": total},
+                ttl=settings.CACHE.PAGINATION_COUNT_TTL,
+                namespace=COUNT_CACHE_NAMESPACE
+            )
+        return total, False
+
+    return (await session.execute(_count_statement(statement))).scalar_one(), False
+
+
 @dataclass
 class PageInfo:
     """Pagination metadata for GraphQL-style connections.
@@ -160,6 +527,28 @@ class PageInfo:
     end_cursor: str | None = None
 
 
+def _coerce_cursor_value(attr: Any, value: Any) -> Any:
+    """Convert a cursor value (stored as a string) back to the column's type.
+
+    Drivers that do not cast string literals server-side (e.g. SQLite) need
+    the Python type of the column to bind datetimes and UUIDs.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = attr.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type in (UUID, int, float):
+            return python_type(value)
+    except ValueError:
+        pass
+    return value
+
+
 def encode_cursor(data: Dict[str, Any]) -> str:
     """Encode pagination data into a base64 cursor string.
 
@@ -218,7 +607,8 @@ def create_page_info(
             "pageInfo": {
                 "hasNextPage": pagination_result.has_next,
                 "nextCursor": pagination_result.next_cursor,
-                "totalCount": pagination_result.total_count
+                "totalCount": pagination_result.total_count,
+                "totalCountIsEstimate": pagination_result.total_is_estimate
             }
         }
 
@@ -23,6 +23,8 @@ class Lyrics(BaseModel):
     __table_args__ = (
         Index("ix_lyrics_song_id", "song_id"),
         Index("ix_lyrics_tenant_owner", "tenant_id", "owner_id"),
+        # Keyset pagination: owner equality filter, then (sort_field, id)
+        Index("ix_lyrics_owner_updated_at_id", "owner_id", "updated_at", "id"),
         CheckConstraint(
             "syllables_per_line IS NULL OR syllables_per_line > 0",
             name="check_lyrics_syllables_positive"
@@ -25,6 +25,9 @@ class Song(BaseModel):
         Index("ix_songs_tenant_owner", "tenant_id", "owner_id"),
         Index("ix_songs_title", "title"),
         Index("ix_songs_created_at", "created_at"),
+        # Keyset pagination: owner equality filter, then (sort_field, id)
+        Index("ix_songs_owner_created_at_id", "owner_id", "created_at", "id"),
+        Index("ix_songs_owner_updated_at_id", "owner_id", "updated_at", "id"),
         CheckConstraint(
             "global_seed >= 0",
             name="check_songs_global_seed_positive"
@@ -148,6 +151,9 @@ class WorkflowRun(BaseModel):
         Index("ix_workflow_runs_status", "status"),
         Index("ix_workflow_runs_tenant_owner", "tenant_id", "owner_id"),
         Index("ix_workflow_runs_created_at", "created_at"),
+        # Keyset pagination: owner equality filter, then (sort_field, id)
+        Index("ix_workflow_runs_owner_created_at_id", "owner_id", "created_at", "id"),
+        Index("ix_workflow_runs_owner_updated_at_id", "owner_id", "updated_at", "id"),
         CheckConstraint(
             "fix_iterations >= 0 AND fix_iterations <= 3",
             name="check_workflow_runs_fix_iterations_range"
@@ -24,6 +24,8 @@ class Style(BaseModel):
         Index("ix_styles_genre", "genre"),
         Index("ix_styles_tenant_owner", "tenant_id", "owner_id"),
         Index("ix_styles_name", "name"),
+        # Keyset pagination: owner equality filter, then (sort_field, id)
+        Index("ix_styles_owner_updated_at_id", "owner_id", "updated_at", "id"),
         CheckConstraint(
             "bpm_min IS NULL OR bpm_max IS NULL OR bpm_min <= bpm_max",
             name="check_styles_bpm_range"
@@ -293,6 +293,27 @@ SYSTEM_ALERTS: List[AlertRule] = [
         ),
         "duration": "1m",
     },
+    {
+        "name": "DatabasePoolSaturated",
+        "condition": (
+            "histogram_quantile(0.95, sum by (le, pool) "
+            "(rate(db_pool_checkout_wait_seconds_bucket[5m]))) > 0.1 "
+            "or rate(db_pool_checkout_timeouts_total[5m]) > 0"
+        ),
+        "severity": "warning",
+        "message": "Database connection pool is saturated",
+        "description": (
+            "Requests wait more than 100ms (P95) for a database connection, or "
+            "checkouts time out. Every connection of the pool is in use, which "
+            "usually happens under many concurrent workflow runs.\n"
+            "\nRemediation:\n"
+            "1. Compare db_pool_connections_in_use with db_pool_capacity per pool\n"
+            "2. Check db_pool_overflow_in_use - sustained overflow means pool_size is too small\n"
+            "3. Raise DB_POOL_SIZE / DB_MAX_OVERFLOW within the database's max_connections\n"
+            "4. Lower WORKER_MAX_CONCURRENT_RUNS or look for long-held sessions"
+        ),
+        "duration": "5m",
+    },
     {
         "name": "HighEventPublishFailures",
         "condition": "rate(event_publish_errors_total[5m]) > 5",
@@ -7,6 +7,7 @@ This module defines workflow-specific metrics for monitoring:
 - Fix loop iterations
 - LLM token usage
 - Active workflow gauge
+- Database connection pool saturation
 """
 
 from __future__ import annotations
@@ -162,6 +163,150 @@ artifact_cache_misses_total = Counter(
     ["artifact_type"],
 )
 
+skill_cache_lookups_total = Counter(
+    "skill_cache_lookups_total",
+    "Skill result cache lookups",
+    ["skill_name", "result", "tier"],  # result: hit, miss; tier: l1, l2, none
+)
+
+skill_cache_evictions_total = Counter(
+    "skill_cache_evictions_total",
+    "Skill result cache evictions",
+    ["tier"],
+)
+
+# =============================================================================
+# Run Queue Metrics
+# =============================================================================
+
+run_jobs_total = Counter(
+    "run_jobs_total",
+    "Workflow run jobs by outcome",
+    ["backend", "outcome"],  # outcome: enqueued, rejected, completed, failed, skipped
+)
+
+run_queue_depth = Gauge(
+    "run_queue_depth",
+    "Workflow run jobs waiting in the queue",
+    ["backend"],
+)
+
+run_jobs_in_flight = Gauge(
+    "run_jobs_in_flight",
+    "Workflow run jobs currently executing on this worker",
+)
+
+# =============================================================================
+# Persistence Metrics
+# =============================================================================
+
+write_behind_flushes_total = Counter(
+    "write_behind_flushes_total",
+    "Write-behind persistence flushes",
+    ["result"],  # success, error
+)
+
+write_behind_batch_size = Histogram(
+    "write_behind_batch_size",
+    "Rows written per write-behind flush",
+    buckets=[1, 5, 10, 25, 50, 100, 250, 500],
+)
+
+# =============================================================================
+# Batch Execution Metrics
+# =============================================================================
+
+batch_runs_total = Counter(
+    "workflow_batch_runs_total",
+    "Workflow runs executed as part of a batch",
+    ["status"],  # completed, failed
+)
+
+batch_shared_nodes_total = Counter(
+    "workflow_batch_shared_nodes_total",
+    "Node executions served from another run of the same batch",
+    ["node"],
+)
+
+llm_requests_coalesced_total = Counter(
+    "llm_requests_coalesced_total",
+    "LLM requests answered by an identical in-flight request",
+)
+
+# =============================================================================
+# Cache Manager Metrics
+# =============================================================================
+
+cache_manager_lookups_total = Counter(
+    "cache_manager_lookups_total",
+    "Cache manager lookups by the tier that answered",
+    ["result"],  # l1_hit, l2_hit, miss
+)
+
+cache_l1_evictions_total = Counter(
+    "cache_l1_evictions_total",
+    "Entries removed from the in-process L1 cache",
+    ["reason"],  # capacity, expired, invalidated
+)
+
+cache_tag_members_removed_total = Counter(
+    "cache_tag_members_removed_total",
+    "Members removed from Redis cache tag sets",
+    ["reason"],  # invalidated, compacted
+)
+
+cache_tag_sets = Gauge(
+    "cache_tag_sets",
+    "Number of Redis cache tag sets at the last tag index scan",
+)
+
+cache_tag_set_members = Gauge(
+    "cache_tag_set_members",
+    "Total members across Redis cache tag sets at the last tag index scan",
+)
+
+cache_tag_set_max_cardinality = Gauge(
+    "cache_tag_set_max_cardinality",
+    "Cardinality of the largest Redis cache tag set at the last tag index scan",
+)
+
+# =============================================================================
+# Database Pool Metrics
+# =============================================================================
+
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["pool"],  # sync, async
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+db_pool_connections_in_use = Histogram(
+    "db_pool_connections_in_use",
+    "Connections checked out of the pool, sampled at each checkout",
+    ["pool"],
+    buckets=[1, 2, 5, 10, 15, 20, 30, 50, 75, 100],
+)
+
+db_pool_overflow_in_use = Histogram(
+    "db_pool_overflow_in_use",
+    "Overflow connections open beyond pool_size, sampled at each checkout",
+    ["pool"],
+    buckets=[0, 1, 2, 5, 10, 20, 50],
+)
+
+db_pool_checkout_timeouts_total = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+
+db_pool_capacity = Gauge(
+    "db_pool_capacity",
+    "Maximum connections of the pool (pool_size + max_overflow)",
+    ["pool"],
+)
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -273,3 +418,137 @@ def record_artifact_size(artifact_type: str, size_bytes: int) -> None:
         size_bytes: Size in bytes
     """
     artifact_size_bytes.labels(artifact_type=artifact_type).observe(size_bytes)
+
+
+def record_skill_cache_lookup(
+    skill_name: str, hit: bool, tier: str | None = None
+) -> None:
+    """Record a skill result cache lookup.
+
+    Args:
+        skill_name: Name of the skill
+        hit: Whether the lookup was served from cache
+        tier: Tier that served the hit (l1, l2)
+    """
+    skill_cache_lookups_total.labels(
+        skill_name=skill_name,
+        result="hit" if hit else "miss",
+        tier=tier or "none",
+    ).inc()
+
+
+def record_skill_cache_eviction(tier: str) -> None:
+    """Record an eviction from a skill result cache tier.
+
+    Args:
+        tier: Tier that evicted the entry (l1)
+    """
+    skill_cache_evictions_total.labels(tier=tier).inc()
+
+
+def record_run_job(backend: str, outcome: str) -> None:
+    """Record a workflow run job state transition.
+
+    Args:
+        backend: Queue backend (inprocess, redis)
+        outcome: enqueued, rejected, completed, failed or skipped
+    """
+    run_jobs_total.labels(backend=backend, outcome=outcome).inc()
+
+
+def record_write_behind_flush(writes: int, success: bool) -> None:
+    """Record a write-behind persistence flush.
+
+    Args:
+        writes: Number of buffered writes in the flush
+        success: Whether the batch was committed
+    """
+    write_behind_flushes_total.labels(result="success" if success else "error").inc()
+    if success:
+        write_behind_batch_size.observe(writes)
+
+
+def record_batch_execution(
+    completed: int,
+    failed: int,
+    shared_nodes: dict[str, int],
+    coalesced_llm_requests: int,
+) -> None:
+    """Record the outcome of a batch of workflow runs.
+
+    Args:
+        completed: Runs that completed
+        failed: Runs that failed
+        shared_nodes: Shared node results by node name
+        coalesced_llm_requests: LLM requests served by an in-flight duplicate
+    """
+    batch_runs_total.labels(status="completed").inc(completed)
+    batch_runs_total.labels(status="failed").inc(failed)
+    for node, hits in shared_nodes.items():
+        batch_shared_nodes_total.labels(node=node).inc(hits)
+    llm_requests_coalesced_total.inc(coalesced_llm_requests)
+
+
+def record_cache_manager_lookup(result: str) -> None:
+    """Record a cache manager lookup.
+
+    Args:
+        result: l1_hit, l2_hit or miss
+    """
+    cache_manager_lookups_total.labels(result=result).inc()
+
+
+def record_cache_l1_eviction(reason: str, count: int = 1) -> None:
+    """Record entries removed from the L1 cache.
+
+    Args:
+        reason: capacity, expired or invalidated
+        count: Number of entries removed
+    """
+    cache_l1_evictions_total.labels(reason=reason).inc(count)
+
+
+def record_cache_tag_members_removed(reason: str, count: int) -> None:
+    """Record members removed from cache tag sets.
+
+    Args:
+        reason: invalidated (tag invalidation) or compacted (dead members)
+        count: Number of members removed
+    """
+    cache_tag_members_removed_total.labels(reason=reason).inc(count)
+
+
+def record_cache_tag_index(tag_sets: int, members: int, max_cardinality: int) -> None:
+    """Record the size of the cache tag index.
+
+    Args:
+        tag_sets: Number of tag sets
+        members: Total members across tag sets
+        max_cardinality: Cardinality of the largest tag set
+    """
+    cache_tag_sets.set(tag_sets)
+    cache_tag_set_members.set(members)
+    cache_tag_set_max_cardinality.set(max_cardinality)
+
+
+def record_db_pool_checkout(pool: str, wait_seconds: float, in_use: int, overflow: int) -> None:
+    """Record a connection checkout from a database pool.
+
+    Args:
+        pool: Pool name (sync, async)
+        wait_seconds: Time spent waiting for the connection
+        in_use: Connections checked out, including this one
+        overflow: Overflow connections open beyond pool_size
+    """
+    db_pool_checkout_wait_seconds.labels(pool=pool).observe(wait_seconds)
+    db_pool_connections_in_use.labels(pool=pool).observe(in_use)
+    db_pool_overflow_in_use.labels(pool=pool).observe(overflow)
+
+
+def record_db_pool_timeout(pool: str) -> None:
+    """Record a checkout that timed out waiting for a connection.
+
+    Args:
+        pool: Pool name (sync, async)
+    """
+    db_pool_checkout_timeouts_total.labels(pool=pool).inc()
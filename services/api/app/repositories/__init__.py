@@ -1,20 +1,28 @@
 """Repositories package with RLS-enforced data access."""
 
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 from .blueprint_repo import BlueprintRepository
 from .composed_prompt_repo import ComposedPromptRepository
-from .lyrics_repo import LyricsRepository
+from .loader import EntityLoader
+from .lyrics_repo import AsyncLyricsRepository, LyricsRepository
 from .persona_repo import PersonaRepository
 from .producer_notes_repo import ProducerNotesRepository
-from .song_repo import SongRepository
+from .song_repo import AsyncSongRepository, SongRepository
 from .source_repo import SourceRepository
-from .style_repo import StyleRepository
-from .workflow_run_repo import WorkflowRunRepository
+from .style_repo import AsyncStyleRepository, StyleRepository
+from .workflow_run_repo import AsyncWorkflowRunRepository, WorkflowRunRepository
 
 __all__ = [
+    "AsyncBaseRepository",
+    "AsyncLyricsRepository",
+    "AsyncSongRepository",
+    "AsyncStyleRepository",
+    "AsyncWorkflowRunRepository",
     "BaseRepository",
     "BlueprintRepository",
     "ComposedPromptRepository",
+    "EntityLoader",
     "LyricsRepository",
     "PersonaRepository",
     "ProducerNotesRepository",
@@ -0,0 +1,383 @@
+"""Async base repository on ``AsyncSession`` with RLS support.
+
+Mirrors :class:`~app.repositories.base.BaseRepository` for ``async def``
+endpoints: every query is a ``select()`` awaited on an ``AsyncSession`` (see
+``app.core.async_database``), so database I/O no longer blocks the event
+loop. Security filtering goes through the same UnifiedRowGuard, and
+transactions follow the same policy: repositories flush, the session
+dependency commits.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Dict, Generic, List, Optional, Tuple, Type
+from uuid import UUID
+
+from opentelemetry import trace
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import BadRequestError, NotFoundError
+from .base import BaseRepository, T
+from .loader import EntityLoader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncBaseRepository(Generic[T]):
+    """Async counterpart of :class:`BaseRepository`.
+
+    Provides the generic CRUD surface of ``BaseRepository`` (``get_by_id``,
+    ``list``, ``list_paginated``, ``create``, ``update``, ``delete``) as
+    coroutines with the same automatic security filtering and error
+    mapping.
+
+    Parameters
+    ----------
+    db:
+        Active :class:`AsyncSession` bound to the current request.
+    security_context:
+        Security context supporting both user and tenant contexts.
+        Required for all CRUD operations.
+    loader:
+        Optional request-scoped :class:`EntityLoader`. Concurrent
+        ``get_by_id`` calls are batched into one query per model and repeats
+        are served from its identity map.
+    """
+
+    db: AsyncSession
+    security_context: Optional[Any] = None  # SecurityContext - imported locally to avoid circular imports
+    loader: Optional[EntityLoader] = None
+
+    # Guard helpers only depend on ``security_context``; share them with the
+    # sync repository so both apply identical filtering and error mapping
+    get_unified_guard = BaseRepository.get_unified_guard
+    require_unified_guard = BaseRepository.require_unified_guard
+    _handle_security_error = BaseRepository._handle_security_error
+    _entity_loader = BaseRepository._entity_loader
+
+    def with_security_context(self, security_context: Any) -> "AsyncBaseRepository":  # SecurityContext
+        """Return a copy of this repository with the provided security context."""
+        return replace(self, security_context=security_context)
+
+    @asynccontextmanager
+    async def _transaction_context(self) -> AsyncIterator[None]:
+        """Async transaction scope with rollback on errors and telemetry."""
+        span = trace.get_current_span()
+        start_time = time.time()
+
+        try:
+            span.set_attribute("db.operation", "transaction")
+            yield
+        except Exception as e:
+            try:
+                await self.rollback()
+                span.set_attribute("db.rollback", True)
+                span.set_attribute("db.error", str(e)[:500])  # Truncate to 500 chars
+                span.set_attribute("db.error_type", type(e).__name__)
+            except Exception:
+                # Ignore rollback errors to preserve original exception
+                pass
+            raise
+        finally:
+            elapsed = (time.time() - start_time) * 1000  # Convert to milliseconds
+            span.set_attribute("db.duration_ms", elapsed)
+            if elapsed > 3.0:  # Same threshold as the sync repositories
+                logger.warning(
+                    f"Repository operation exceeded performance threshold: {elapsed:.2f}ms",
+                    extra={"elapsed_ms": elapsed, "threshold_ms": 3.0}
+                )
+
+    def _map_error(self, error: Exception, operation: str, verb: str, model_class: Type[T]) -> Exception:
+        """Map security and database errors like the sync repositories do."""
+        from app.core.security import SecurityContextError, SecurityFilterError
+        if isinstance(error, (SecurityContextError, SecurityFilterError)):
+            return self._handle_security_error(error, operation, model_class)
+        if isinstance(error, SQLAlchemyError):
+            return BadRequestError(
+                code="DATABASE_ERROR",
+                message=f"Database error {verb} {model_class.__name__}",
+                details={"error": str(error)}
+            )
+        return error
+
+    async def commit(self) -> None:
+        """Commit the current transaction."""
+        await self.db.commit()
+
+    async def rollback(self) -> None:
+        """Rollback the current transaction."""
+        await self.db.rollback()
+        if self.loader is not None:
+            self.loader.clear()
+
+    async def flush(self) -> None:
+        """Flush pending changes to database without committing."""
+        await self.db.flush()
+
+    async def refresh(self, instance: Any) -> None:
+        """Refresh an instance from the database."""
+        await self.db.refresh(instance)
+
+    def _invalidate_total_counts(self, model_class: Type[T]) -> None:
+        """Invalidate cached pagination totals of a model once the write commits."""
+        from app.core.pagination import invalidate_total_counts_on_commit
+        invalidate_total_counts_on_commit(self.db, model_class, use_async=True)
+
+    async def _scalars(self, statement: Any) -> List[Any]:
+        """Execute a ``select()`` and return its ORM entities."""
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+
+    async def _first(self, statement: Any) -> Optional[Any]:
+        """Execute a ``select()`` and return its first ORM entity."""
+        result = await self.db.execute(statement.limit(1))
+        return result.scalars().first()
+
+    async def _filtered(self, statement: Any, model_class: Type[T]) -> List[T]:
+        """Apply row-level security (if a context is set) and execute."""
+        guard = self.get_unified_guard(model_class)
+        if guard:
+            statement = guard.filter_query(statement)
+        return await self._scalars(statement)
+
+    # Generic CRUD Methods with Automatic Security Filtering
+
+    async def get_by_id(self, model_class: Type[T], id: UUID) -> T | None:
+        """Get a single entity by ID with automatic security filtering.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            id: The entity ID to fetch
+
+        Returns:
+            The entity if found and accessible, None otherwise
+
+        Raises:
+            ForbiddenError: If security context is missing or invalid
+        """
+        try:
+            async with self._transaction_context():
+                guard = self.require_unified_guard(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    return await loader.load(model_class, id)
+                statement = guard.filter_query(select(model_class).filter(model_class.id == id))
+                return await self._first(statement)
+        except Exception as e:
+            raise self._map_error(e, "get", "retrieving", model_class)
+
+    async def get_by_id_or_raise(self, model_class: Type[T], id: UUID) -> T:
+        """Get a single entity by ID, raising NotFoundError if not found or inaccessible.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            id: The entity ID to fetch
+
+        Returns:
+            The entity if found and accessible
+
+        Raises:
+            NotFoundError: If entity is not found or not accessible
+            ForbiddenError: If security context is missing or invalid
+        """
+        entity = await self.get_by_id(model_class, id)
+        if entity is None:
+            raise NotFoundError(
+                code="ENTITY_NOT_FOUND",
+                message=f"{model_class.__name__} with ID {id} not found or not accessible",
+                details={"entity_id": str(id), "model": model_class.__name__}
+            )
+        return entity
+
+    async def list(
+        self,
+        limit: int = 50,
+        offset: Optional[UUID] = None,
+        model_class: Optional[Type[T]] = None
+    ) -> List[T]:
+        """List entities with simple limit/offset pagination.
+
+        Args:
+            limit: Maximum number of items to return (default: 50)
+            offset: Optional UUID offset for pagination
+            model_class: The SQLAlchemy model class to query (uses self.model_class if not provided)
+
+        Returns:
+            List of entities ordered by ID
+
+        Raises:
+            ForbiddenError: If security context is missing or invalid
+        """
+        if model_class is None:
+            if getattr(self, 'model_class', None) is not None:
+                model_class = self.model_class
+            else:
+                raise ValueError("model_class must be provided or set as class attribute")
+
+        try:
+            async with self._transaction_context():
+                statement = select(model_class).filter(model_class.deleted_at.is_(None))
+                guard = self.get_unified_guard(model_class)
+                if guard:
+                    statement = guard.filter_query(statement)
+                if offset is not None:
+                    statement = statement.filter(model_class.id > offset)
+                return await self._scalars(statement.order_by(model_class.id).limit(limit))
+        except Exception as e:
+            raise self._map_error(e, "list", "listing", model_class)
+
+    async def list_paginated(
+        self,
+        model_class: Type[T],
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        sort_field: str = "updated_at",
+        sort_desc: bool = True,
+        additional_filters: Optional[List[Any]] = None,
+        include_total: bool = False,
+        total_mode: Optional[Any] = None  # TotalCountMode - imported locally to avoid circular imports
+    ) -> Tuple[List[T], Optional[str]]:
+        """List entities with cursor-based pagination and automatic security filtering.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            limit: Maximum number of items to return (default: 20)
+            cursor: Optional cursor for pagination
+            sort_field: Field to sort by (default: "updated_at")
+            sort_desc: Whether to sort in descending order (default: True)
+            additional_filters: Optional list of additional filter conditions
+            include_total: Whether to include total count (expensive operation, default: False)
+            total_mode: TotalCountMode for the total count; overrides include_total
+
+        Returns:
+            Tuple of (items, next_cursor)
+
+        Raises:
+            ForbiddenError: If security context is missing or invalid
+            BadRequestError: If query parameters are invalid
+        """
+        try:
+            async with self._transaction_context():
+                statement = select(model_class)
+                for filter_condition in additional_filters or []:
+                    statement = statement.filter(filter_condition)
+
+                from app.core.pagination import CursorPagination
+                pagination_result = await CursorPagination.paginate_async(
+                    session=self.db,
+                    statement=statement,
+                    cursor=cursor,
+                    limit=limit,
+                    sort_field=sort_field,
+                    sort_desc=sort_desc,
+                    security_context=self.security_context,
+                    model_class=model_class,
+                    include_total=include_total,
+                    total_mode=total_mode
+                )
+                return pagination_result.items, pagination_result.next_cursor
+        except Exception as e:
+            raise self._map_error(e, "list", "listing", model_class)
+
+    async def create(self, model_class: Type[T], data: Dict[str, Any]) -> T:
+        """Create a new entity with automatic security context assignment.
+
+        Args:
+            model_class: The SQLAlchemy model class to create
+            data: Dictionary of field values for the new entity
+
+        Returns:
+            The created entity
+
+        Raises:
+            ForbiddenError: If security context is missing or invalid
+            BadRequestError: If data is invalid or creation fails
+        """
+        try:
+            async with self._transaction_context():
+                guard = self.require_unified_guard(model_class)
+                instance = guard.assign_owner(model_class(**data))
+
+                self.db.add(instance)
+                await self.db.flush()
+                await self.db.refresh(instance)
+                self._invalidate_total_counts(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    loader.prime(instance)
+
+                return instance
+        except Exception as e:
+            raise self._map_error(e, "create", "creating", model_class)
+
+    async def update(self, model_class: Type[T], id: UUID, data: Dict[str, Any]) -> T:
+        """Update an entity with automatic security filtering.
+
+        Args:
+            model_class: The SQLAlchemy model class to update
+            id: The entity ID to update
+            data: Dictionary of field values to update
+
+        Returns:
+            The updated entity
+
+        Raises:
+            NotFoundError: If entity is not found or not accessible
+            ForbiddenError: If security context is missing or update not allowed
+            BadRequestError: If update data is invalid
+        """
+        try:
+            async with self._transaction_context():
+                entity = await self.get_by_id_or_raise(model_class, id)
+
+                for field, value in data.items():
+                    if hasattr(entity, field):
+                        setattr(entity, field, value)
+
+                await self.db.flush()
+                await self.db.refresh(entity)
+                self._invalidate_total_counts(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    loader.prime(entity)
+
+                return entity
+        except Exception as e:
+            raise self._map_error(e, "update", "updating", model_class)
+
+    async def delete(self, model_class: Type[T], id: UUID) -> bool:
+        """Delete an entity with automatic security filtering.
+
+        Args:
+            model_class: The SQLAlchemy model class to delete
+            id: The entity ID to delete
+
+        Returns:
+            True if entity was deleted, False if not found
+
+        Raises:
+            ForbiddenError: If security context is missing or delete not allowed
+            BadRequestError: If deletion fails due to constraints
+        """
+        try:
+            async with self._transaction_context():
+                entity = await self.get_by_id(model_class, id)
+                if entity is None:
+                    return False
+
+                await self.db.delete(entity)
+                await self.db.flush()
+                self._invalidate_total_counts(model_class)
+                if self.loader is not None:
+                    self.loader.forget(model_class, [id])
+
+                return True
+        except Exception as e:
+            raise self._map_error(e, "delete", "deleting", model_class)
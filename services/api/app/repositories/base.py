@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Optional, Tuple, Any, List, Type, TypeVar, Dict, Protocol
+from typing import Optional, Tuple, Any, List, Type, TypeVar, Dict, Iterator, Protocol
 from uuid import UUID
 import base64
 import json
@@ -12,7 +12,7 @@ import warnings
 from contextlib import contextmanager
 
 from sqlalchemy.orm import Session
-from sqlalchemy import asc, desc
+from sqlalchemy import asc, delete, desc, select
 from sqlalchemy.exc import SQLAlchemyError
 from opentelemetry import trace
 
@@ -24,6 +24,7 @@ from app.security.row_guard import RowGuard
 # Import moved to avoid circular imports - imported in methods where needed
 # from app.core.pagination import CursorPagination, create_page_info
 from app.errors import AppError, ForbiddenError, NotFoundError, BadRequestError
+from .loader import EntityLoader
 
 
 # Define protocol for models that have an ID field
@@ -33,6 +34,9 @@ class HasId(Protocol):
 # Generic type variable constrained to models with ID
 T = TypeVar('T', bound=HasId)
 
+# IDs per statement for set-based bulk operations (bounds IN-list size)
+BULK_CHUNK_SIZE = 500
+
 
 from typing import Generic
 
@@ -65,11 +69,16 @@ class BaseRepository(Generic[T]):
     security_context:
         Enhanced security context supporting both user and tenant contexts.
         Required for all enhanced CRUD operations.
+    loader:
+        Optional request-scoped :class:`EntityLoader`. ``get_by_id`` is served
+        from its identity map while the repository uses the loader's session
+        and security context.
     """
 
     db: Session
     owner_id: Optional[UUID] = None  # Legacy field for backward compatibility
     security_context: Optional[Any] = None  # SecurityContext - imported locally to avoid circular imports
+    loader: Optional[EntityLoader] = None
 
 
     def with_owner(self, owner_id: UUID) -> "BaseRepository":
@@ -240,6 +249,8 @@ class BaseRepository(Generic[T]):
     def rollback(self) -> None:
         """Rollback the current transaction."""
         self.db.rollback()
+        if self.loader is not None:
+            self.loader.clear()
 
     def flush(self) -> None:
         """Flush pending changes to database without committing."""
@@ -249,6 +260,12 @@ class BaseRepository(Generic[T]):
         """Refresh an instance from the database."""
         self.db.refresh(instance)
 
+    def _entity_loader(self) -> Optional[EntityLoader]:
+        """Request-scoped loader, if it matches this session and security context."""
+        if self.loader is not None and self.loader.serves(self.db, self.security_context):
+            return self.loader
+        return None
+
     # Generic CRUD Methods with Automatic Security Filtering
 
     def get_by_id(self, model_class: Type[T], id: UUID) -> T | None:
@@ -267,6 +284,9 @@ class BaseRepository(Generic[T]):
         try:
             with self._transaction_context():
                 guard = self.require_unified_guard(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    return loader.get(model_class, id)
                 query = self.db.query(model_class).filter(model_class.id == id)
                 query = guard.filter_query(query)
                 result: T | None = query.first()
@@ -372,7 +392,8 @@ class BaseRepository(Generic[T]):
         sort_field: str = "updated_at",
         sort_desc: bool = True,
         additional_filters: Optional[List[Any]] = None,
-        include_total: bool = False
+        include_total: bool = False,
+        total_mode: Optional[Any] = None  # TotalCountMode - imported locally to avoid circular imports
     ) -> Tuple[List[T], Optional[str]]:
         """List entities with cursor-based pagination and automatic security filtering.
 
@@ -387,6 +408,7 @@ class BaseRepository(Generic[T]):
             sort_desc: Whether to sort in descending order (default: True)
             additional_filters: Optional list of additional filter conditions
             include_total: Whether to include total count (expensive operation, default: False)
+            total_mode: TotalCountMode for the total count; overrides include_total
 
         Returns:
             Tuple of (items, next_cursor)
@@ -415,7 +437,8 @@ class BaseRepository(Generic[T]):
                     sort_desc=sort_desc,
                     security_context=self.security_context,
                     model_class=model_class,
-                    include_total=include_total
+                    include_total=include_total,
+                    total_mode=total_mode
                 )
 
                 return pagination_result.items, pagination_result.next_cursor
@@ -441,7 +464,8 @@ class BaseRepository(Generic[T]):
         sort_field: str = "updated_at",
         sort_desc: bool = True,
         additional_filters: Optional[List[Any]] = None,
-        include_total: bool = True
+        include_total: bool = True,
+        total_mode: Optional[Any] = None  # TotalCountMode - imported locally to avoid circular imports
     ) -> dict[str, Any]:
         """List entities with full pagination info in the standard { items, pageInfo } format.
 
@@ -456,11 +480,14 @@ class BaseRepository(Generic[T]):
             sort_desc: Whether to sort in descending order (default: True)
             additional_filters: Optional list of additional filter conditions
             include_total: Whether to include total count (default: True)
+            total_mode: TotalCountMode for the total count; defaults to CACHED
+                when include_total is set and NONE otherwise
 
         Returns:
             Dictionary with 'items' and 'pageInfo' keys containing:
             - items: List of paginated entities
-            - pageInfo: Object with hasNextPage, nextCursor, and totalCount
+            - pageInfo: Object with hasNextPage, nextCursor, totalCount and
+              totalCountIsEstimate
 
         Raises:
             ForbiddenError: If security context is missing or invalid
@@ -475,7 +502,8 @@ class BaseRepository(Generic[T]):
             #     "pageInfo": {
             #         "hasNextPage": True,
             #         "nextCursor": "def456",
-            #         "totalCount": 150
+            #         "totalCount": 150,
+            #         "totalCountIsEstimate": False
             #     }
             # }
             ```
@@ -491,7 +519,9 @@ class BaseRepository(Generic[T]):
                         query = query.filter(filter_condition)
 
                 # Use the new CursorPagination module with security context
-                from app.core.pagination import CursorPagination
+                from app.core.pagination import CursorPagination, TotalCountMode
+                if total_mode is None:
+                    total_mode = TotalCountMode.CACHED if include_total else TotalCountMode.NONE
                 pagination_result = CursorPagination.paginate(
                     query=query,
                     cursor=cursor,
@@ -500,7 +530,7 @@ class BaseRepository(Generic[T]):
                     sort_desc=sort_desc,
                     security_context=self.security_context,
                     model_class=model_class,
-                    include_total=include_total
+                    total_mode=total_mode
                 )
 
                 # Return in standard pagination format
@@ -549,6 +579,10 @@ class BaseRepository(Generic[T]):
                 self.db.add(instance)
                 self.db.flush()
                 self.db.refresh(instance)
+                self._invalidate_total_counts(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    loader.prime(instance)
 
                 return instance
         except Exception as e:
@@ -593,6 +627,10 @@ class BaseRepository(Generic[T]):
                 # Flush to validate constraints
                 self.db.flush()
                 self.db.refresh(entity)
+                self._invalidate_total_counts(model_class)
+                loader = self._entity_loader()
+                if loader is not None:
+                    loader.prime(entity)
 
                 return entity
         except Exception as e:
@@ -635,6 +673,9 @@ class BaseRepository(Generic[T]):
                 # Delete the entity
                 self.db.delete(entity)
                 self.db.flush()
+                self._invalidate_total_counts(model_class)
+                if self.loader is not None:
+                    self.loader.forget(model_class, [id])
 
                 return True
         except Exception as e:
@@ -650,6 +691,134 @@ class BaseRepository(Generic[T]):
                 details={"error": str(e)}
             )
 
+    def delete_many(
+        self,
+        model_class: Type[T],
+        ids: List[UUID],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Tuple[List[UUID], List[UUID]]:
+        """Delete entities by ID with set-based, security-filtered statements.
+
+        Issues one guarded ``DELETE ... WHERE id IN (...)`` per chunk of
+        ``chunk_size`` IDs instead of a lookup and a delete per entity.
+        Dependent rows go through the foreign keys' ``ON DELETE`` actions.
+
+        Args:
+            model_class: The SQLAlchemy model class to delete from
+            ids: Entity IDs to delete (duplicates are ignored)
+            chunk_size: Maximum number of IDs per statement
+
+        Returns:
+            Tuple of (deleted_ids, missing_ids); missing IDs were not found
+            or are not accessible in the current security context
+
+        Raises:
+            ForbiddenError: If security context is missing or delete not allowed
+            BadRequestError: If deletion fails due to constraints
+        """
+        try:
+            with self._transaction_context():
+                guard = self.require_unified_guard(model_class)
+                unique_ids = list(dict.fromkeys(ids))
+                returning = self.db.get_bind().dialect.delete_returning
+                deleted: set = set()
+
+                for start in range(0, len(unique_ids), chunk_size):
+                    chunk = unique_ids[start:start + chunk_size]
+                    if returning:
+                        statement = guard.filter_query(
+                            delete(model_class).filter(model_class.id.in_(chunk))
+                        ).returning(model_class.id)
+                        deleted.update(self.db.execute(statement).scalars().all())
+                    else:
+                        statement = guard.filter_query(
+                            select(model_class.id).filter(model_class.id.in_(chunk))
+                        )
+                        found = list(self.db.execute(statement).scalars().all())
+                        if found:
+                            self.db.execute(delete(model_class).filter(model_class.id.in_(found)))
+                        deleted.update(found)
+
+                self.db.flush()
+                if deleted:
+                    self._invalidate_total_counts(model_class)
+                    if self.loader is not None:
+                        self.loader.forget(model_class, deleted)
+
+                return (
+                    [entity_id for entity_id in unique_ids if entity_id in deleted],
+                    [entity_id for entity_id in unique_ids if entity_id not in deleted]
+                )
+        except Exception as e:
+            from app.core.security import SecurityContextError, SecurityFilterError
+            if isinstance(e, (SecurityContextError, SecurityFilterError)):
+                raise self._handle_security_error(e, "delete", model_class)
+            elif isinstance(e, SQLAlchemyError):
+                raise BadRequestError(
+                    code="DATABASE_ERROR",
+                    message=f"Database error deleting {model_class.__name__}",
+                    details={"error": str(e)}
+                )
+            else:
+                raise
+
+    def iter_by_ids(
+        self,
+        model_class: Type[T],
+        ids: List[UUID],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Iterator[List[T]]:
+        """Fetch entities by ID in security-filtered chunks.
+
+        Each chunk is one ``SELECT ... WHERE id IN (...)``. Entities loaded by
+        a chunk are expunged from the session once the consumer moves on, so
+        memory stays bounded by ``chunk_size`` however many IDs are requested.
+
+        Args:
+            model_class: The SQLAlchemy model class to query
+            ids: Entity IDs to fetch (duplicates are ignored)
+            chunk_size: Maximum number of IDs per statement
+
+        Yields:
+            Lists of accessible entities, in the order of ``ids``; IDs that
+            are not found or not accessible are skipped
+
+        Raises:
+            ForbiddenError: If security context is missing or invalid
+        """
+        guard = self.require_unified_guard(model_class)
+        unique_ids = list(dict.fromkeys(ids))
+
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            # Entities the session already tracked stay attached
+            tracked = {
+                obj.id for obj in self.db.identity_map.values() if isinstance(obj, model_class)
+            }
+            try:
+                statement = guard.filter_query(select(model_class).filter(model_class.id.in_(chunk)))
+                by_id = {entity.id: entity for entity in self.db.execute(statement).scalars().all()}
+            except Exception as e:
+                from app.core.security import SecurityContextError, SecurityFilterError
+                if isinstance(e, (SecurityContextError, SecurityFilterError)):
+                    raise self._handle_security_error(e, "list", model_class)
+                raise
+
+            yield [by_id[entity_id] for entity_id in chunk if entity_id in by_id]
+
+            for entity_id, entity in by_id.items():
+                if entity_id not in tracked:
+                    self.db.expunge(entity)
+
+    def _invalidate_total_counts(self, model_class: Type[T]) -> None:
+        """Invalidate cached pagination totals of a model once the write commits.
+
+        Cache failures are logged and ignored: cached totals also expire
+        after ``CACHE.PAGINATION_COUNT_TTL``.
+        """
+        from app.core.pagination import invalidate_total_counts_on_commit
+        invalidate_total_counts_on_commit(self.db, model_class)
+
     def encode_cursor(self, item: Any, sort_field: str = "updated_at") -> str:
         """Encode a cursor for pagination based on sort field.
 
@@ -12,16 +12,20 @@ import hashlib
 import json
 import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Optional, Set, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
 from opentelemetry import trace
 from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
+from app.core.async_cache import AsyncRedisCache, get_async_cache
+from app.core.cache import RedisCache, get_cache
 from app.core.cache_manager import get_cache_manager, MultiTierCacheManager
+from app.core.config import settings
 from app.errors import AppError
 from .base import BaseRepository
+from .loader import EntityLoader
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -94,7 +98,10 @@ class CacheAwareRepository(BaseRepository):
         owner_id: Optional[UUID] = None,
         security_context: Any = None,
         cache_manager: Optional[MultiTierCacheManager] = None,
-        cache_enabled: bool = True
+        cache_enabled: bool = True,
+        async_cache: Optional[AsyncRedisCache] = None,
+        loader: Optional[EntityLoader] = None,
+        redis_cache: Optional[RedisCache] = None
     ):
         """Initialize cache-aware repository.
 
@@ -110,12 +117,39 @@ class CacheAwareRepository(BaseRepository):
             Cache manager instance. Uses global if None
         cache_enabled : bool
             Whether caching is enabled for this repository
+        async_cache : Optional[AsyncRedisCache]
+            Asyncio cache client for async operations. Uses global if None
+        loader : Optional[EntityLoader]
+            Request-scoped identity map and batching layer for ``get_by_id``
+        redis_cache : Optional[RedisCache]
+            Synchronous client over the same Redis data as ``async_cache``,
+            used to invalidate its entries from sync writes. Uses global if None
         """
-        super().__init__(db, owner_id, security_context)
+        super().__init__(db, owner_id, security_context, loader)
         self._cache_manager = cache_manager or get_cache_manager()
         self._cache_enabled = cache_enabled
+        self._async_cache = async_cache
+        self._redis_cache = redis_cache
         self._tenant_id = self._get_tenant_id()
 
+    def _get_async_cache(self) -> AsyncRedisCache:
+        """Asyncio cache client used by async cached operations."""
+        if self._async_cache is None:
+            self._async_cache = get_async_cache()
+        return self._async_cache
+
+    def _get_redis_cache(self) -> RedisCache:
+        """Synchronous client over the Redis data of the asyncio cache."""
+        if self._redis_cache is None:
+            self._redis_cache = get_cache()
+        return self._redis_cache
+
+    def _tenant_cache_key(self, key: str) -> str:
+        """Scope a cache key to the current tenant."""
+        if self._tenant_id:
+            return f"tenant:{self._tenant_id}:{key}"
+        return key
+
     def _get_tenant_id(self) -> Optional[str]:
         """Extract tenant ID from security context."""
         if self.security_context and hasattr(self.security_context, 'tenant_id'):
@@ -267,6 +301,11 @@ class CacheAwareRepository(BaseRepository):
         return data
 
 
+def _config_ttl(config_name: str) -> int:
+    """TTL for a cache configuration (``CACHE_<CONFIG_NAME>_TTL`` or the default)."""
+    return getattr(settings.CACHE, f"{config_name.upper()}_TTL", settings.CACHE.DEFAULT_TTL)
+
+
 def cache_get(config_name: str = "model_data", ttl_override: Optional[int] = None):
     """Decorator for automatic caching of get operations.
 
@@ -298,35 +337,33 @@ def cache_get(config_name: str = "model_data", ttl_override: Optional[int] = Non
                     return await func(self, *args, **kwargs)
 
                 key_parts = [func.__name__] + [str(arg) for arg in args if not callable(arg)]
-                cache_key = ":".join(key_parts)
+                cache_key = self._tenant_cache_key(":".join(key_parts))
 
                 model_class = kwargs.get('model_class', None) or get_model_class_from_kwargs(self, *args, **kwargs)
 
-                with self._cache_context("get", model_class or type(None), cache_key) as cache_manager:
-                    if cache_manager:
-                        cached_data = cache_manager.get(
-                            key=cache_key,
-                            config_name=config_name,
-                            tenant_id=self._tenant_id
-                        )
-                        if cached_data is not None:
-                            if model_class:
-                                return self._deserialize_from_cache(cached_data, model_class)
-                            return cached_data
+                # Asyncio client: cache round-trips must not block the event loop
+                async_cache = self._get_async_cache()
+                with tracer.start_as_current_span("cache.get", attributes={
+                    "cache.model": getattr(model_class, "__name__", "none"),
+                    "cache.key": cache_key,
+                    "cache.tenant_id": self._tenant_id
+                }):
+                    cached_data = await async_cache.get(cache_key, value_type=dict, namespace=config_name)
+                if cached_data is not None:
+                    if model_class:
+                        return self._deserialize_from_cache(cached_data, model_class)
+                    return cached_data
 
                 result = await func(self, *args, **kwargs)
 
                 if result is not None:
-                    with self._cache_context("set", type(result), cache_key) as cache_manager:
-                        if cache_manager:
-                            serialized_data = self._serialize_for_cache(result)
-                            cache_manager.set(
-                                key=cache_key,
-                                value=serialized_data,
-                                config_name=config_name,
-                                tenant_id=self._tenant_id,
-                                ttl_override=ttl_override
-                            )
+                    await async_cache.set(
+                        cache_key,
+                        self._serialize_for_cache(result),
+                        ttl=ttl_override or _config_ttl(config_name),
+                        namespace=config_name,
+                        tags={(model_class or type(result)).__name__.lower()}
+                    )
                 return result
             return async_wrapper
         else:
@@ -405,9 +442,35 @@ def cache_set(config_name: str = "model_data"):
     return decorator
 
 
+def _invalidation_targets(
+    repo: CacheAwareRepository, tags: Optional[List[str]], result: Any
+) -> List[Tuple[str, Type[Any]]]:
+    """Tags a write invalidates, with the model class used for tracing."""
+    targets: List[Tuple[str, Type[Any]]] = [(tag, type(None)) for tag in tags or []]
+    # For model instances, invalidate based on the result
+    if hasattr(result, '__class__') and hasattr(result, 'id'):
+        model_class = result.__class__
+        targets.extend((tag, model_class) for tag in repo._get_model_tags(model_class, result))
+    return targets
+
+
+def _invalidate_manager_tag(repo: CacheAwareRepository, tag: str, model_class: Type[Any]) -> None:
+    try:
+        with repo._cache_context("invalidate", model_class, f"tag:{tag}") as cache_manager:
+            if cache_manager:
+                cache_manager.invalidate_by_tag(tag)
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cache tag {tag}: {e}")
+
+
 def cache_invalidate(tags: Optional[List[str]] = None, patterns: Optional[List[str]] = None):
     """Decorator for automatic cache invalidation on write operations.
 
+    Tags are invalidated in the cache manager and in the Redis tag sets that
+    async ``cache_get`` entries are stored under, through the asyncio client
+    for async operations and the synchronous client otherwise (both share
+    the same Redis data).
+
     Parameters
     ----------
     tags : Optional[List[str]]
@@ -415,7 +478,26 @@ def cache_invalidate(tags: Optional[List[str]] = None, patterns: Optional[List[s
     patterns : Optional[List[str]]
         Key patterns to invalidate (for future use)
     """
+    import asyncio
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self: CacheAwareRepository, *args, **kwargs) -> T:
+                result = await func(self, *args, **kwargs)
+
+                if not self._cache_enabled:
+                    return result
+
+                for tag, model_class in _invalidation_targets(self, tags, result):
+                    _invalidate_manager_tag(self, tag, model_class)
+                    try:
+                        await self._get_async_cache().invalidate_by_tag(tag)
+                    except Exception as e:
+                        logger.warning(f"Failed to invalidate async cache tag {tag}: {e}")
+                return result
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(self: CacheAwareRepository, *args, **kwargs) -> T:
             result = func(self, *args, **kwargs)
@@ -424,28 +506,12 @@ def cache_invalidate(tags: Optional[List[str]] = None, patterns: Optional[List[s
                 return result
 
             # Invalidate cache tags after successful write operation
-            if tags:
-                for tag in tags:
-                    try:
-                        with self._cache_context("invalidate", type(None), f"tag:{tag}") as cache_manager:
-                            if cache_manager:
-                                cache_manager.invalidate_by_tag(tag)
-                    except Exception as e:
-                        logger.warning(f"Failed to invalidate cache tag {tag}: {e}")
-
-            # For model instances, invalidate based on the result
-            if hasattr(result, '__class__') and hasattr(result, 'id'):
-                model_class = result.__class__
-                instance_tags = self._get_model_tags(model_class, result)
-
-                for tag in instance_tags:
-                    try:
-                        with self._cache_context("invalidate", model_class, f"tag:{tag}") as cache_manager:
-                            if cache_manager:
-                                cache_manager.invalidate_by_tag(tag)
-                    except Exception as e:
-                        logger.warning(f"Failed to invalidate instance tag {tag}: {e}")
-
+            for tag, model_class in _invalidation_targets(self, tags, result):
+                _invalidate_manager_tag(self, tag, model_class)
+                try:
+                    self._get_redis_cache().invalidate_by_tag(tag)
+                except Exception as e:
+                    logger.warning(f"Failed to invalidate Redis cache tag {tag}: {e}")
             return result
         return wrapper
     return decorator
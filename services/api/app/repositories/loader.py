@@ -0,0 +1,200 @@
+"""Request-scoped identity map and batched entity loading.
+
+An :class:`EntityLoader` is created once per request (see
+``app.api.dependencies.get_entity_loader``) and shared by every repository
+of that request:
+
+- Entities fetched by ID are kept in a per-model identity map, so repeated
+  ``get_by_id`` calls for the same entity (and for IDs known to be missing
+  or inaccessible) are served without a query.
+- ``await loader.load(Model, id)`` calls made within one event-loop tick
+  (for example from ``asyncio.gather``) are collected per model and
+  resolved with a single ``SELECT ... WHERE id IN (...)``.
+
+Every query applies the UnifiedRowGuard of the loader's security context,
+exactly like ``BaseRepository.get_by_id``. The loader works on a sync
+``Session`` or an ``AsyncSession``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.errors import ForbiddenError
+
+T = TypeVar("T")
+
+# IDs per batched statement (bounds IN-list size)
+LOADER_BATCH_SIZE = 500
+
+_MISSING = object()
+
+
+@dataclass
+class EntityLoader:
+    """DataLoader-style batching layer with a request-scoped identity map.
+
+    Attributes:
+        db: Session or AsyncSession of the request
+        security_context: Security context applied to every load
+    """
+
+    db: Any  # Session | AsyncSession
+    security_context: Optional[Any] = None  # SecurityContext - imported locally to avoid circular imports
+    _identity: Dict[Type[Any], Dict[UUID, Any]] = field(default_factory=dict, init=False, repr=False)
+    _pending: Dict[Type[Any], Dict[UUID, asyncio.Future]] = field(default_factory=dict, init=False, repr=False)
+    _dispatch_scheduled: bool = field(default=False, init=False, repr=False)
+
+    def serves(self, db: Any, security_context: Any) -> bool:
+        """Whether a repository with this session and context may use the loader."""
+        return db is self.db and security_context is self.security_context
+
+    # Identity map
+
+    def peek(self, model_class: Type[T], id: UUID) -> Any:
+        """Return the cached entity, None for a known miss, or ``_MISSING``."""
+        entity = self._identity.get(model_class, {}).get(id, _MISSING)
+        if entity is not None and entity is not _MISSING:
+            state = inspect(entity)
+            # Deleted, detached or expired behind the loader's back: reload
+            if state.was_deleted or state.detached or state.expired:
+                del self._identity[model_class][id]
+                return _MISSING
+        return entity
+
+    def prime(self, entity: Any) -> None:
+        """Add a loaded, created or updated entity to the identity map."""
+        self._identity.setdefault(type(entity), {})[entity.id] = entity
+
+    def forget(self, model_class: Type[T], ids: Iterable[UUID]) -> None:
+        """Drop entities from the identity map (after deletes)."""
+        by_id = self._identity.get(model_class)
+        if by_id:
+            for entity_id in ids:
+                by_id.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Drop the whole identity map (after rollbacks)."""
+        self._identity.clear()
+
+    # Sync loading
+
+    def get(self, model_class: Type[T], id: UUID) -> Optional[T]:
+        """Get one entity, from the identity map when already loaded.
+
+        Args:
+            model_class: The SQLAlchemy model class to load
+            id: The entity ID
+
+        Returns:
+            The entity if found and accessible, None otherwise
+        """
+        return self.get_many(model_class, [id])[id]
+
+    def get_many(self, model_class: Type[T], ids: Iterable[UUID]) -> Dict[UUID, Optional[T]]:
+        """Get entities by ID with one guarded query for the uncached ones.
+
+        Args:
+            model_class: The SQLAlchemy model class to load
+            ids: Entity IDs
+
+        Returns:
+            Mapping of every requested ID to its entity, or None when not
+            found or not accessible
+        """
+        ids = list(dict.fromkeys(ids))
+        missing = [entity_id for entity_id in ids if self.peek(model_class, entity_id) is _MISSING]
+        for start in range(0, len(missing), LOADER_BATCH_SIZE):
+            chunk = missing[start:start + LOADER_BATCH_SIZE]
+            self._store(model_class, chunk, self.db.execute(self._statement(model_class, chunk)).scalars().all())
+        return {entity_id: self.peek(model_class, entity_id) for entity_id in ids}
+
+    # Batched async loading
+
+    async def load(self, model_class: Type[T], id: UUID) -> Optional[T]:
+        """Load one entity, batching with every other load of this tick.
+
+        Args:
+            model_class: The SQLAlchemy model class to load
+            id: The entity ID
+
+        Returns:
+            The entity if found and accessible, None otherwise
+        """
+        cached = self.peek(model_class, id)
+        if cached is not _MISSING:
+            return cached
+
+        pending = self._pending.setdefault(model_class, {})
+        future = pending.get(id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            pending[id] = future
+            if not self._dispatch_scheduled:
+                # Runs after every task that is already ready, so loads issued
+                # by the rest of this tick join the batch
+                self._dispatch_scheduled = True
+                asyncio.get_running_loop().create_task(self._dispatch())
+        return await future
+
+    async def load_many(self, model_class: Type[T], ids: Iterable[UUID]) -> List[Optional[T]]:
+        """Load several entities of one model in the same batch.
+
+        Args:
+            model_class: The SQLAlchemy model class to load
+            ids: Entity IDs
+
+        Returns:
+            Entities (None when not found or not accessible), in ``ids`` order
+        """
+        return list(await asyncio.gather(*(self.load(model_class, entity_id) for entity_id in ids)))
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._dispatch_scheduled = False
+
+        for model_class, futures in pending.items():
+            ids = list(futures)
+            try:
+                for start in range(0, len(ids), LOADER_BATCH_SIZE):
+                    chunk = ids[start:start + LOADER_BATCH_SIZE]
+                    result = self.db.execute(self._statement(model_class, chunk))
+                    if isinstance(self.db, AsyncSession):
+                        result = await result
+                    self._store(model_class, chunk, result.scalars().all())
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for entity_id, future in futures.items():
+                if not future.done():
+                    future.set_result(self.peek(model_class, entity_id))
+
+    # Helpers
+
+    def _statement(self, model_class: Type[T], ids: List[UUID]) -> Any:
+        if self.security_context is None:
+            raise ForbiddenError(
+                code="SECURITY_CONTEXT_REQUIRED",
+                message="Security context is required for entity loading",
+                details={"model": model_class.__name__}
+            )
+        from app.core.security import UnifiedRowGuard
+        guard = UnifiedRowGuard(model_class, self.security_context)
+        return guard.filter_query(select(model_class).filter(model_class.id.in_(ids)))
+
+    def _store(self, model_class: Type[T], ids: List[UUID], entities: Iterable[Any]) -> None:
+        by_id = self._identity.setdefault(model_class, {})
+        for entity in entities:
+            by_id[entity.id] = entity
+        for entity_id in ids:
+            # Remember misses too: inaccessible IDs stay inaccessible for the request
+            by_id.setdefault(entity_id, None)
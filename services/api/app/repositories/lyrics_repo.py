@@ -6,11 +6,13 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 from pydantic import BaseModel
 
 from app.models.lyrics import Lyrics
 from app.models.song import Song
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 
 
@@ -264,3 +266,53 @@ class LyricsRepository(BaseRepository[Lyrics]):
             query = guard.filter_query(query)
 
         return query.all()
+
+
+@dataclass
+class AsyncLyricsRepository(AsyncBaseRepository[Lyrics]):
+    """Async data access methods for lyrics with RLS enforcement.
+
+    Async counterpart of :class:`LyricsRepository` for the hot lyrics
+    endpoints.
+    """
+
+    model_class = Lyrics  # Type annotation for generic list operations
+
+    async def get_by_id(self, id: UUID) -> Optional[Lyrics]:
+        """Get lyrics by ID with security filtering."""
+        return await super().get_by_id(self.model_class, id)
+
+    async def update(self, id: UUID, data: Union[Dict[str, Any], BaseModel]) -> Optional[Lyrics]:
+        """Update lyrics with security filtering (accepts a Pydantic model)."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump(exclude_unset=True)
+        return await super().update(self.model_class, id, data)
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete lyrics with security filtering."""
+        return await super().delete(self.model_class, id)
+
+    async def create(self, data: Union[Dict[str, Any], BaseModel]) -> Lyrics:
+        """Create lyrics with security context assignment (accepts a Pydantic model)."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        return await super().create(self.model_class, data)
+
+    async def get_by_song_id(self, song_id: UUID) -> List[Lyrics]:
+        """Get all lyrics for a specific song.
+
+        Parameters
+        ----------
+        song_id : UUID
+            The song ID to filter by
+
+        Returns
+        -------
+        List[Lyrics]
+            All lyrics versions for the song, ordered by created_at descending
+        """
+        statement = select(Lyrics).filter(
+            Lyrics.song_id == song_id,
+            Lyrics.deleted_at.is_(None)
+        ).order_by(Lyrics.created_at.desc())
+        return await self._filtered(statement, Lyrics)
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.song import Song
@@ -13,6 +14,7 @@ from app.models.style import Style
 from app.models.lyrics import Lyrics
 from app.models.producer_notes import ProducerNotes
 from app.models.persona import Persona
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 
 
@@ -175,9 +177,12 @@ class SongRepository(BaseRepository[Song]):
     def get_with_all_entities_for_sds(self, song_id: UUID) -> Optional[dict]:
         """Fetch song with all entities needed for SDS compilation.
 
-        This method performs a single optimized query with eager loading to fetch
-        all entities required for Song Design Spec (SDS) compilation, including
-        style, lyrics, producer notes, persona, and blueprint.
+        The song and its style, persona and blueprint are read through
+        ``get_by_id``, so with a request-scoped loader they come from the
+        request's identity map (the SDS endpoints read the song just before
+        compiling) and every entity is filtered by its own row guard. The
+        latest lyrics and producer notes cost one guarded query each, however
+        many versions exist.
 
         Parameters
         ----------
@@ -201,43 +206,16 @@ class SongRepository(BaseRepository[Song]):
 
         Notes
         -----
-        - Uses single query with joinedload for optimal performance
-        - Enforces row-level security via UnifiedRowGuard
-        - Returns first lyrics/producer_notes artifact if multiple exist
+        - Enforces row-level security via UnifiedRowGuard on every entity
+        - Returns the most recent lyrics/producer_notes artifact if multiple exist
         - Sources loading requires song_sources association table (TODO: SDS-002)
         """
-        from app.models.style import Style
-        from app.models.lyrics import Lyrics
-        from app.models.producer_notes import ProducerNotes
-        from app.models.persona import Persona
         from app.models.blueprint import Blueprint
 
-        # Build query with eager loading of all related entities
-        query = self.db.query(Song).filter(
-            Song.id == song_id,
-            Song.deleted_at.is_(None)
-        ).options(
-            joinedload(Song.style),
-            joinedload(Song.persona),
-            joinedload(Song.blueprint),
-            joinedload(Song.lyrics),
-            joinedload(Song.producer_notes)
-        )
-
-        # Apply row-level security using UnifiedRowGuard
-        guard = self.get_unified_guard(Song)
-        if guard:
-            query = guard.filter_query(query)
-
-        song = query.first()
-        if song is None:
+        song = self.get_by_id(Song, song_id)
+        if song is None or song.deleted_at is not None:
             return None
 
-        # Extract first lyrics and producer_notes artifacts
-        # (relationships are one-to-many, take most recent if multiple)
-        lyrics = song.lyrics[0] if song.lyrics else None
-        producer_notes = song.producer_notes[0] if song.producer_notes else None
-
         # TODO(SDS-002): Load sources via song_sources association table
         # Once song_sources many-to-many relationship is implemented, load sources here:
         # sources = self.db.query(Source).join(song_sources).filter(
@@ -247,10 +225,75 @@ class SongRepository(BaseRepository[Song]):
 
         return {
             "song": song,
-            "style": song.style,
-            "lyrics": lyrics,
-            "producer_notes": producer_notes,
-            "persona": song.persona,
-            "blueprint": song.blueprint,
+            "style": self.get_by_id(Style, song.style_id) if song.style_id else None,
+            "lyrics": self._latest_artifact(Lyrics, song_id),
+            "producer_notes": self._latest_artifact(ProducerNotes, song_id),
+            "persona": self.get_by_id(Persona, song.persona_id) if song.persona_id else None,
+            "blueprint": self.get_by_id(Blueprint, song.blueprint_id) if song.blueprint_id else None,
             "sources": sources
         }
+
+    def _latest_artifact(self, model_class: Any, song_id: UUID) -> Any:
+        """Most recent non-deleted artifact of ``model_class`` for a song."""
+        query = self.db.query(model_class).filter(
+            model_class.song_id == song_id,
+            model_class.deleted_at.is_(None)
+        )
+
+        # Apply row-level security using UnifiedRowGuard
+        guard = self.get_unified_guard(model_class)
+        if guard:
+            query = guard.filter_query(query)
+
+        artifact = query.order_by(model_class.created_at.desc()).first()
+        loader = self._entity_loader()
+        if artifact is not None and loader is not None:
+            loader.prime(artifact)
+        return artifact
+
+
+@dataclass
+class AsyncSongRepository(AsyncBaseRepository[Song]):
+    """Async data access methods for songs with RLS enforcement.
+
+    Async counterpart of :class:`SongRepository` for the hot song endpoints.
+    """
+
+    model_class = Song  # Type annotation for generic list operations
+
+    async def get_by_status(self, status: str) -> List[Song]:
+        """Get all songs with a specific status.
+
+        Parameters
+        ----------
+        status : str
+            The status to filter by (e.g., 'draft', 'validated', 'rendered')
+
+        Returns
+        -------
+        List[Song]
+            List of songs matching the status, filtered by security context
+        """
+        statement = select(Song).filter(
+            Song.status == status,
+            Song.deleted_at.is_(None)
+        ).order_by(Song.created_at.desc())
+        return await self._filtered(statement, Song)
+
+    async def get_recent_songs(self, limit: int = 10) -> List[Song]:
+        """Get user's most recently created songs.
+
+        Parameters
+        ----------
+        limit : int
+            Maximum number of songs to return (default: 10)
+
+        Returns
+        -------
+        List[Song]
+            Most recent songs, ordered by created_at descending
+        """
+        statement = select(Song).filter(
+            Song.deleted_at.is_(None)
+        ).order_by(Song.created_at.desc()).limit(limit)
+        return await self._filtered(statement, Song)
@@ -6,10 +6,12 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Union
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.models.style import Style
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 
 
@@ -272,3 +274,52 @@ class StyleRepository(BaseRepository[Style]):
             query = guard.filter_query(query)
 
         return query.all()
+
+
+@dataclass
+class AsyncStyleRepository(AsyncBaseRepository[Style]):
+    """Async data access methods for styles with RLS enforcement.
+
+    Async counterpart of :class:`StyleRepository` for the hot style endpoints.
+    """
+
+    model_class = Style  # Type annotation for generic list operations
+
+    async def get_by_id(self, id: UUID) -> Optional[Style]:
+        """Get style by ID with security filtering."""
+        return await super().get_by_id(self.model_class, id)
+
+    async def update(self, id: UUID, data: Union[Dict[str, Any], BaseModel]) -> Optional[Style]:
+        """Update style with security filtering (accepts a Pydantic model)."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump(exclude_unset=True)
+        return await super().update(self.model_class, id, data)
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete style with security filtering."""
+        return await super().delete(self.model_class, id)
+
+    async def create(self, data: Union[Dict[str, Any], BaseModel]) -> Style:
+        """Create style with security context assignment (accepts a Pydantic model)."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        return await super().create(self.model_class, data)
+
+    async def get_by_genre(self, genre: str) -> List[Style]:
+        """Get all styles for a specific genre with security filtering.
+
+        Parameters
+        ----------
+        genre : str
+            The genre to filter by (e.g., 'pop', 'country', 'hip-hop')
+
+        Returns
+        -------
+        List[Style]
+            List of styles matching the genre, filtered by security context
+        """
+        statement = select(Style).filter(
+            Style.genre == genre,
+            Style.deleted_at.is_(None)
+        )
+        return await self._filtered(statement, Style)
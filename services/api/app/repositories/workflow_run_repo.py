@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from uuid import UUID
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.song import WorkflowRun, Song
+from .async_base import AsyncBaseRepository
 from .base import BaseRepository
 
 
@@ -199,3 +201,122 @@ class WorkflowRunRepository(BaseRepository[WorkflowRun]):
             query = guard.filter_query(query)
 
         return query.order_by(WorkflowRun.fix_iterations.desc(), WorkflowRun.created_at.desc()).all()
+
+
+    def transition_status(self, run_id: UUID, from_status: str, to_status: str) -> bool:
+        """Atomically move a run from one status to another.
+
+        Issues a single conditional ``UPDATE ... WHERE status = from_status``,
+        so of several concurrent callers exactly one succeeds. The caller
+        commits.
+
+        Parameters
+        ----------
+        run_id : UUID
+            The unique run identifier
+        from_status : str
+            Status the run must currently have
+        to_status : str
+            Status to set
+
+        Returns
+        -------
+        bool
+            True if the run had ``from_status`` and now has ``to_status``;
+            False if it is missing, not accessible or in another status
+        """
+        statement = update(WorkflowRun).where(
+            WorkflowRun.run_id == run_id,
+            WorkflowRun.status == from_status,
+            WorkflowRun.deleted_at.is_(None)
+        )
+
+        # Apply row-level security
+        guard = self.get_unified_guard(WorkflowRun)
+        if guard:
+            statement = guard.filter_query(statement)
+
+        result = self.db.execute(
+            statement.values(status=to_status).execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+
+@dataclass
+class AsyncWorkflowRunRepository(AsyncBaseRepository[WorkflowRun]):
+    """Async data access methods for workflow runs with RLS enforcement.
+
+    Async counterpart of :class:`WorkflowRunRepository` for the hot run
+    endpoints.
+    """
+
+    model_class = WorkflowRun  # Type annotation for generic list operations
+
+    async def get_by_id(self, id: UUID) -> Optional[WorkflowRun]:
+        """Get workflow run by ID with security filtering."""
+        return await super().get_by_id(self.model_class, id)
+
+    async def update(self, id: UUID, data: Dict[str, Any]) -> WorkflowRun:
+        """Update workflow run with security filtering."""
+        return await super().update(self.model_class, id, data)
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete workflow run with security filtering."""
+        return await super().delete(self.model_class, id)
+
+    async def create(self, data: Dict[str, Any]) -> WorkflowRun:
+        """Create workflow run with security context assignment."""
+        return await super().create(self.model_class, data)
+
+    async def get_active_runs(self) -> List[WorkflowRun]:
+        """Get all active (running) workflow runs with security filtering.
+
+        Returns
+        -------
+        List[WorkflowRun]
+            List of runs with status='running', filtered by security context
+        """
+        statement = select(WorkflowRun).filter(
+            WorkflowRun.status == 'running',
+            WorkflowRun.deleted_at.is_(None)
+        ).order_by(WorkflowRun.created_at.desc())
+        return await self._filtered(statement, WorkflowRun)
+
+    async def get_by_song_id(self, song_id: UUID) -> List[WorkflowRun]:
+        """Get all workflow runs for a specific song.
+
+        Parameters
+        ----------
+        song_id : UUID
+            The song ID to filter by
+
+        Returns
+        -------
+        List[WorkflowRun]
+            All workflow runs for the song, ordered by created_at descending
+        """
+        statement = select(WorkflowRun).filter(
+            WorkflowRun.song_id == song_id,
+            WorkflowRun.deleted_at.is_(None)
+        ).order_by(WorkflowRun.created_at.desc())
+        return await self._filtered(statement, WorkflowRun)
+
+    async def get_by_run_id(self, run_id: UUID) -> Optional[WorkflowRun]:
+        """Get workflow run by unique run_id.
+
+        Parameters
+        ----------
+        run_id : UUID
+            The unique run identifier
+
+        Returns
+        -------
+        Optional[WorkflowRun]
+            The workflow run if found and accessible, None otherwise
+        """
+        statement = select(WorkflowRun).filter(
+            WorkflowRun.run_id == run_id,
+            WorkflowRun.deleted_at.is_(None)
+        )
+        runs = await self._filtered(statement.limit(1), WorkflowRun)
+        return runs[0] if runs else None
@@ -6,12 +6,12 @@ with any repository and entity type, following MeatyMusic architecture patterns.
 
 from __future__ import annotations
 
-import io
+import itertools
 import json
 import re
 import zipfile
 from datetime import datetime
-from typing import Any, Dict, List, Type, TypeVar
+from typing import Any, Dict, Iterator, List, Tuple, Type, TypeVar
 from uuid import UUID
 
 import structlog
@@ -27,6 +27,36 @@ tracer = trace.get_tracer(__name__)
 # Type variable for generic model types
 T = TypeVar("T")
 
+# Compressed bytes buffered before a bulk export yields them to the response
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+class _ZipStreamBuffer:
+    """Write-only sink that lets ``zipfile`` stream an archive.
+
+    It has no ``seek``/``tell``, so ``zipfile`` writes each entry's sizes
+    in a trailing data descriptor instead of seeking back, and the bytes
+    written so far can be drained and sent without buffering the archive.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+        self.pending = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self.pending += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        self.pending = 0
+        return data
+
 
 class BulkOperationsService:
     """Service for bulk operations on entities.
@@ -59,6 +89,10 @@ class BulkOperationsService:
     ) -> Dict[str, Any]:
         """Delete multiple entities by IDs with partial failure tracking.
 
+        Deletes are set-based: one security-filtered ``DELETE ... WHERE id IN
+        (...)`` per chunk of IDs (see ``BaseRepository.delete_many``). IDs that
+        are not found or not accessible are reported as failed.
+
         Args:
             model_class: The SQLAlchemy model class
             repository: Repository instance for the entity type
@@ -92,45 +126,35 @@ class BulkOperationsService:
                 count=len(entity_ids),
             )
 
-            deleted_count = 0
             failed_ids: List[UUID] = []
             errors: List[str] = []
 
-            for entity_id in entity_ids:
-                try:
-                    # Check if entity exists
-                    entity = repository.get_by_id(model_class, entity_id)
-                    if not entity:
-                        failed_ids.append(entity_id)
-                        errors.append(f"{entity_type_name} {entity_id} not found")
-                        logger.warning(
-                            "bulk_delete.entity_not_found",
-                            entity_type=entity_type_name,
-                            entity_id=str(entity_id),
-                        )
-                        continue
-
-                    # Delete the entity
-                    repository.delete(model_class, entity_id)
-                    deleted_count += 1
-                    logger.debug(
-                        "bulk_delete.entity_deleted",
-                        entity_type=entity_type_name,
-                        entity_id=str(entity_id),
-                    )
-
-                except Exception as e:
+            try:
+                deleted_ids, missing_ids = repository.delete_many(model_class, entity_ids)
+            except Exception as e:
+                # The whole statement failed and was rolled back: nothing was deleted
+                deleted_ids = []
+                failed_ids = list(dict.fromkeys(entity_ids))
+                errors = [f"Failed to delete {entity_type_name} {entity_id}: {str(e)}" for entity_id in failed_ids]
+                logger.error(
+                    "bulk_delete.failed",
+                    entity_type=entity_type_name,
+                    count=len(failed_ids),
+                    error=str(e),
+                    exc_info=True,
+                )
+            else:
+                for entity_id in missing_ids:
                     failed_ids.append(entity_id)
-                    error_msg = f"Failed to delete {entity_type_name} {entity_id}: {str(e)}"
-                    errors.append(error_msg)
-                    logger.error(
-                        "bulk_delete.entity_failed",
+                    errors.append(f"{entity_type_name} {entity_id} not found")
+                    logger.warning(
+                        "bulk_delete.entity_not_found",
                         entity_type=entity_type_name,
                         entity_id=str(entity_id),
-                        error=str(e),
-                        exc_info=True,
                     )
 
+            deleted_count = len(deleted_ids)
+
             # Add telemetry attributes
             span.set_attribute("deleted_count", deleted_count)
             span.set_attribute("failed_count", len(failed_ids))
@@ -155,8 +179,23 @@ class BulkOperationsService:
         entity_ids: List[UUID],
         entity_type_name: str,
         response_schema: Type[BaseModel],
-    ) -> io.BytesIO:
-        """Export multiple entities as a ZIP file.
+    ) -> Iterator[bytes]:
+        """Export multiple entities as a streamed ZIP file.
+
+        Entities are fetched in chunks (``BaseRepository.iter_by_ids``) and
+        each one is serialized and written to the archive as it arrives;
+        compressed bytes are yielded as soon as ``STREAM_CHUNK_BYTES`` have
+        accumulated. Memory stays bounded by one fetch chunk plus one output
+        chunk, whatever the number of entities.
+
+        The stream is a plain iterator: ``StreamingResponse`` pulls it in a
+        threadpool, so the blocking queries and compression stay off the
+        event loop. It keeps using the request's session, which FastAPI
+        (>=0.118) closes only after the response has been sent.
+
+        The first exportable entity is resolved before returning, so a
+        request with nothing to export still fails before the response
+        starts.
 
         Args:
             model_class: The SQLAlchemy model class
@@ -166,21 +205,21 @@ class BulkOperationsService:
             response_schema: Pydantic schema for serialization
 
         Returns:
-            BytesIO buffer containing ZIP file
+            Iterator of ZIP file bytes (pass to ``StreamingResponse``)
 
         Raises:
             ValueError: If no entities found or all exports fail
 
         Example:
             ```python
-            zip_buffer = await bulk_ops.bulk_export_entities_zip(
+            zip_stream = await bulk_ops.bulk_export_entities_zip(
                 Style,
                 style_repo,
                 [uuid1, uuid2],
                 "style",
                 StyleResponse
             )
-            # Returns: BytesIO with ZIP containing style-name1.json, style-name2.json
+            return StreamingResponse(zip_stream, media_type="application/zip")
             ```
         """
         with tracer.start_as_current_span(
@@ -189,87 +228,136 @@ class BulkOperationsService:
                 "entity_type": entity_type_name,
                 "entity_count": len(entity_ids),
             },
-        ) as span:
+        ):
             logger.info(
                 "bulk_export.start",
                 entity_type=entity_type_name,
                 count=len(entity_ids),
             )
 
-            # Create in-memory ZIP file
-            zip_buffer = io.BytesIO()
-            exported_count = 0
-            failed_count = 0
-
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                for entity_id in entity_ids:
-                    try:
-                        # Fetch entity
-                        entity = repository.get_by_id(model_class, entity_id)
-                        if not entity:
-                            logger.warning(
-                                "bulk_export.entity_not_found",
-                                entity_type=entity_type_name,
-                                entity_id=str(entity_id),
-                            )
-                            failed_count += 1
-                            continue
-
-                        # Convert to response schema
-                        entity_response = response_schema.model_validate(entity)
-                        entity_dict = entity_response.model_dump(mode="json")
-
-                        # Generate filename: {entity-type}-{name}-{id}.json
-                        # Sanitize name for filename
-                        name = getattr(entity, "name", None) or getattr(entity, "title", None) or str(entity_id)[:8]
-                        safe_name = self._sanitize_filename(name)
-                        filename = f"{entity_type_name}-{safe_name}-{str(entity_id)[:8]}.json"
-
-                        # Add to ZIP
-                        json_content = json.dumps(entity_dict, indent=2, ensure_ascii=False)
-                        zip_file.writestr(filename, json_content)
-                        exported_count += 1
-
-                        logger.debug(
-                            "bulk_export.entity_exported",
-                            entity_type=entity_type_name,
-                            entity_id=str(entity_id),
-                            filename=filename,
-                        )
-
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(
-                            "bulk_export.entity_failed",
-                            entity_type=entity_type_name,
-                            entity_id=str(entity_id),
-                            error=str(e),
-                            exc_info=True,
-                        )
-
-            # Check if any entities were exported
-            if exported_count == 0:
+            stats = {"exported": 0, "failed": 0}
+            entries = self._export_entries(
+                model_class, repository, entity_ids, entity_type_name, response_schema, stats
+            )
+
+            # Check if any entities can be exported
+            first_entry = next(entries, None)
+            if first_entry is None:
                 raise ValueError(
                     f"No {entity_type_name} entities could be exported. "
                     f"All {len(entity_ids)} entities failed or were not found."
                 )
 
+            return self._stream_zip(first_entry, entries, entity_type_name, len(entity_ids), stats)
+
+    def _export_entries(
+        self,
+        model_class: Type[T],
+        repository: BaseRepository[T],
+        entity_ids: List[UUID],
+        entity_type_name: str,
+        response_schema: Type[BaseModel],
+        stats: Dict[str, int],
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield ``(filename, json_content)`` per exportable entity.
+
+        Entities that are not found, not accessible or fail to serialize are
+        logged and counted in ``stats["failed"]``.
+        """
+        found = 0
+        for chunk in repository.iter_by_ids(model_class, entity_ids):
+            found += len(chunk)
+            for entity in chunk:
+                entity_id = entity.id
+                try:
+                    # Convert to response schema
+                    entity_response = response_schema.model_validate(entity)
+                    entity_dict = entity_response.model_dump(mode="json")
+
+                    # Generate filename: {entity-type}-{name}-{id}.json
+                    # Sanitize name for filename
+                    name = getattr(entity, "name", None) or getattr(entity, "title", None) or str(entity_id)[:8]
+                    safe_name = self._sanitize_filename(name)
+                    filename = f"{entity_type_name}-{safe_name}-{str(entity_id)[:8]}.json"
+
+                    json_content = json.dumps(entity_dict, indent=2, ensure_ascii=False)
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(
+                        "bulk_export.entity_failed",
+                        entity_type=entity_type_name,
+                        entity_id=str(entity_id),
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    continue
+
+                stats["exported"] += 1
+                yield filename, json_content
+
+        not_found = len(set(entity_ids)) - found
+        if not_found:
+            stats["failed"] += not_found
+            logger.warning(
+                "bulk_export.entities_not_found",
+                entity_type=entity_type_name,
+                count=not_found,
+            )
+
+    def _stream_zip(
+        self,
+        first_entry: Tuple[str, str],
+        entries: Iterator[Tuple[str, str]],
+        entity_type_name: str,
+        entity_count: int,
+        stats: Dict[str, int],
+    ) -> Iterator[bytes]:
+        """Write entries to a ZIP archive, yielding its bytes as they are produced."""
+        # Not the current span: each chunk may be produced on a different
+        # threadpool worker, so the span is never attached to a context
+        span = tracer.start_span(
+            "bulk_export_entities_zip.stream",
+            attributes={
+                "entity_type": entity_type_name,
+                "entity_count": entity_count,
+            },
+        )
+        try:
+            output = _ZipStreamBuffer()
+            zip_size_bytes = 0
+
+            with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                for filename, json_content in itertools.chain([first_entry], entries):
+                    zip_file.writestr(filename, json_content)
+                    logger.debug(
+                        "bulk_export.entity_exported",
+                        entity_type=entity_type_name,
+                        filename=filename,
+                    )
+                    if output.pending >= STREAM_CHUNK_BYTES:
+                        data = output.drain()
+                        zip_size_bytes += len(data)
+                        yield data
+
+            # Central directory, written when the archive is closed
+            data = output.drain()
+            zip_size_bytes += len(data)
+            yield data
+
             # Add telemetry attributes
-            span.set_attribute("exported_count", exported_count)
-            span.set_attribute("failed_count", failed_count)
-            span.set_attribute("zip_size_bytes", zip_buffer.tell())
+            span.set_attribute("exported_count", stats["exported"])
+            span.set_attribute("failed_count", stats["failed"])
+            span.set_attribute("zip_size_bytes", zip_size_bytes)
 
             logger.info(
                 "bulk_export.complete",
                 entity_type=entity_type_name,
-                exported_count=exported_count,
-                failed_count=failed_count,
-                zip_size_bytes=zip_buffer.tell(),
+                exported_count=stats["exported"],
+                failed_count=stats["failed"],
+                zip_size_bytes=zip_size_bytes,
             )
-
-            # Reset buffer position to beginning for reading
-            zip_buffer.seek(0)
-            return zip_buffer
+        finally:
+            span.end()
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a string for use in filenames.
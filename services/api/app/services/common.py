@@ -24,6 +24,8 @@ from uuid import UUID
 import structlog
 from pydantic import BaseModel
 
+from app.services.lyrics_analysis import analyze_line, word_features, words_rhyme
+
 logger = structlog.get_logger(__name__)
 
 
@@ -261,17 +263,17 @@ def extract_rhyme_endings(lines: List[str]) -> List[str]:
     endings = []
     for line in lines:
         # Remove punctuation and get last word
-        words = re.findall(r'\b\w+\b', line.lower())
-        if words:
-            endings.append(words[-1])
+        end_word = analyze_line(line).end_word
+        if end_word:
+            endings.append(end_word.word)
     return endings
 
 
 def check_rhyme_similarity(word1: str, word2: str) -> float:
-    """Check phonetic similarity between two words (simple heuristic).
+    """Check phonetic similarity between two words.
 
-    This is a basic implementation that checks suffix similarity.
-    For production, consider using a phonetic library like pronouncing or epitran.
+    Words rhyme when their rhyming parts (last stressed vowel onwards, from
+    the packaged pronunciation table) match.
 
     Args:
         word1: First word
@@ -282,7 +284,7 @@ def check_rhyme_similarity(word1: str, word2: str) -> float:
 
     Example:
         >>> check_rhyme_similarity("cat", "hat")
-        1.0  # Perfect suffix match
+        1.0  # Same rhyming part (AE T)
         >>> check_rhyme_similarity("love", "dove")
         1.0
         >>> check_rhyme_similarity("cat", "dog")
@@ -291,18 +293,10 @@ def check_rhyme_similarity(word1: str, word2: str) -> float:
     word1 = word1.lower()
     word2 = word2.lower()
 
-    # Exact match
-    if word1 == word2:
+    # Exact match or same rhyming part
+    if word1 == word2 or words_rhyme(word1, word2):
         return 1.0
 
-    # Check suffix match (2-3 characters)
-    min_suffix = 2
-    max_suffix = min(len(word1), len(word2), 3)
-
-    for suffix_len in range(max_suffix, min_suffix - 1, -1):
-        if word1[-suffix_len:] == word2[-suffix_len:]:
-            return 1.0 if suffix_len >= 2 else 0.5
-
     return 0.0
 
 
@@ -904,13 +898,7 @@ def count_syllables(line: str) -> int:
     if not line or not line.strip():
         return 0
 
-    words = re.findall(r'\b\w+\b', line.lower())
-    total_syllables = 0
-
-    for word in words:
-        total_syllables += _count_word_syllables(word)
-
-    return total_syllables
+    return analyze_line(line).meter_syllables
 
 
 def _count_word_syllables(word: str) -> int:
@@ -924,31 +912,10 @@ def _count_word_syllables(word: str) -> int:
     Returns:
         Syllable count (minimum 1)
     """
-    word = word.lower().strip()
-
-    if not word:
+    if not word.strip():
         return 0
 
-    vowels = "aeiouy"
-    syllable_count = 0
-    previous_was_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
-
-    # Adjust for silent 'e'
-    if word.endswith("e") and syllable_count > 1:
-        syllable_count -= 1
-
-    # Handle special cases
-    if word.endswith("le") and len(word) > 2 and word[-3] not in vowels:
-        syllable_count += 1
-
-    # Minimum of 1 syllable per word
-    return max(1, syllable_count)
+    return word_features(word).meter_syllables
 
 
 def calculate_syllable_consistency(lines: List[str]) -> float:
@@ -1411,17 +1378,25 @@ def convert_models_to_dtos(
 async def load_nested_entities(
     entity: Any,
     relations: Dict[str, Tuple[str, Type[BaseModel]]],
-    session: Any  # AsyncSession
+    session: Any,  # AsyncSession
+    loader: Optional[Any] = None  # EntityLoader
 ) -> Dict[str, Any]:
     """Load nested entities and convert to DTOs.
 
     Loads related entities via SQLAlchemy relationships and converts them
     to DTOs for nested response structures.
 
+    With a request-scoped ``loader``, unloaded many-to-one relations are
+    resolved through ``loader.load`` by foreign key instead of lazy loads:
+    all relations of the entity (and of every other entity loaded in the
+    same ``asyncio.gather``) are batched into one guarded query per model,
+    and entities already in the request's identity map cost no query.
+
     Args:
         entity: Parent ORM model instance
         relations: Dict mapping result key to (relationship_name, dto_class)
         session: Database session (AsyncSession)
+        loader: Optional request-scoped EntityLoader for batched loading
 
     Returns:
         Dict with nested entities as DTOs
@@ -1434,7 +1409,8 @@ async def load_nested_entities(
         ...         "lyrics": ("lyrics", LyricsResponse),
         ...         "style": ("style", StyleResponse)
         ...     },
-        ...     session
+        ...     session,
+        ...     loader=loader
         ... )
         >>> # Returns: {"lyrics": LyricsResponse(...), "style": StyleResponse(...)}
 
@@ -1443,15 +1419,26 @@ async def load_nested_entities(
         is not already handled by the repository layer. Prefer using
         SQLAlchemy joinedload/selectinload in repository queries when possible.
     """
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
+    import asyncio
+
+    async def resolve(relation_name: str) -> Any:
+        target = _many_to_one_target(entity, relation_name) if loader is not None else None
+        if target is None:
+            return getattr(entity, relation_name, None)
+        model_class, foreign_id = target
+        return await loader.load(model_class, foreign_id) if foreign_id is not None else None
+
+    resolved = await asyncio.gather(
+        *(resolve(relation_name) for relation_name, _ in relations.values()),
+        return_exceptions=True
+    )
 
     results: Dict[str, Any] = {}
 
-    for result_key, (relation_name, dto_class) in relations.items():
+    for (result_key, (relation_name, dto_class)), related in zip(relations.items(), resolved):
         try:
-            # Get the relationship attribute
-            related = getattr(entity, relation_name, None)
+            if isinstance(related, BaseException):
+                raise related
 
             if related is None:
                 results[result_key] = None
@@ -1487,6 +1474,32 @@ async def load_nested_entities(
     return results
 
 
+def _many_to_one_target(entity: Any, relation_name: str) -> Optional[Tuple[Type[Any], Any]]:
+    """(target model, foreign key value) of an unloaded many-to-one relation.
+
+    Returns None when the relation is already loaded or is not a simple
+    many-to-one on the target's ``id``, so the caller falls back to
+    attribute access.
+    """
+    from sqlalchemy import inspect as sa_inspect
+    from sqlalchemy.orm import MANYTOONE
+
+    state = sa_inspect(entity, raiseerr=False)
+    if state is None or relation_name in state.dict:
+        return None
+    relationship = state.mapper.relationships.get(relation_name)
+    if (
+        relationship is None
+        or relationship.direction is not MANYTOONE
+        or [column.key for column in relationship.remote_side] != ["id"]
+        or len(relationship.local_columns) != 1
+    ):
+        return None
+    (column,) = relationship.local_columns
+    foreign_key = state.mapper.get_property_by_column(column).key
+    return relationship.mapper.class_, getattr(entity, foreign_key)
+
+
 def apply_field_selection(
     dto: BaseModel,
     fields: Optional[List[str]] = None,
@@ -0,0 +1,193 @@
+"""Shared text analysis for lyrics scoring.
+
+Syllable counting, rhyme checks and line tokenization used by the LYRICS and
+VALIDATE skills, ``RubricScorer`` and the ``app.services.common`` helpers.
+A line is tokenized once into a :class:`LineFeatures` table (its words,
+their syllable counts and rhyme keys, and its end word); every scorer reads
+that table instead of re-running its own regexes.
+
+Rhyme keys are phonetic rhyming parts from the packaged pronunciation
+table (see ``app.services.rhyme_index``).
+
+Both levels are memoized in bounded LRU caches: per-word features are
+shared by every line containing the word, and a line analysed by one metric
+is served from the cache to the next (a VALIDATE pass scores the same lines
+for hook density, singability and rhyme tightness).
+
+The scorers historically disagree slightly on how syllables are estimated;
+each variant is kept as its own field so scores are unchanged:
+
+- ``syllables``: vowel groups, minus a silent final "e", at least 1
+  (VALIDATE skill)
+- ``meter_syllables``: ``syllables`` plus a consonant + "le" ending
+  (``count_syllables``)
+- ``letter_syllables``: ``syllables`` over ASCII letters only, 0 for words
+  without any (``RubricScorer``)
+- ``LineFeatures.vowel_group_syllables``: vowel groups of the line, at
+  least one per word (LYRICS skill)
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+from app.services.rhyme_index import rhyme_key
+
+# Distinct words / lines kept in the feature caches
+WORD_CACHE_SIZE = 16384
+LINE_CACHE_SIZE = 4096
+
+_WORD = re.compile(r"\b\w+\b")
+_NON_WORD = re.compile(r"[^\w]")
+_NON_LETTER = re.compile(r"[^a-z]")
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+_VOWELS = "aeiouy"
+
+
+class WordFeatures(NamedTuple):
+    """Features of one word.
+
+    Attributes:
+        word: Lowercase word without punctuation
+        vowel_groups: Number of vowel groups in ``word``
+        syllables: Vowel groups minus a silent final "e" (at least 1)
+        meter_syllables: ``syllables`` adjusted for consonant + "le" endings
+        letter_syllables: ``syllables`` counted over ASCII letters only
+    """
+
+    word: str
+    vowel_groups: int
+    syllables: int
+    meter_syllables: int
+    letter_syllables: int
+
+    @property
+    def rhyme_key(self) -> str:
+        """Rhyming part of the word (see ``rhyme_index.rhyme_key``)."""
+        return rhyme_key(self.word)
+
+
+class LineFeatures(NamedTuple):
+    """Tokenized line with per-word features.
+
+    Attributes:
+        words: ``\\b\\w+\\b`` tokens of the lowercased line
+        spans: Whitespace-separated tokens with punctuation removed (may be
+            empty strings for punctuation-only tokens)
+        syllables: Sum of ``syllables`` over ``words``
+        end_word: Last entry of ``words``, None for a line without words
+    """
+
+    words: Tuple[WordFeatures, ...]
+    spans: Tuple[WordFeatures, ...]
+    syllables: int
+    end_word: Optional[WordFeatures]
+
+    @property
+    def meter_syllables(self) -> int:
+        """Sum of ``meter_syllables`` over the words."""
+        return sum(word.meter_syllables for word in self.words)
+
+    @property
+    def letter_syllables(self) -> int:
+        """Sum of ``letter_syllables`` over the words."""
+        return sum(word.letter_syllables for word in self.words)
+
+    @property
+    def vowel_group_syllables(self) -> int:
+        """Vowel groups of the punctuation-free line, at least one per word."""
+        vowel_groups = sum(span.vowel_groups for span in self.spans)
+        return max(vowel_groups, sum(1 for span in self.spans if span.word))
+
+    @property
+    def rhyme_key(self) -> str:
+        """Rhyme key of the end word ("" for a line without words)."""
+        return self.end_word.rhyme_key if self.end_word else ""
+
+
+def _estimate_syllables(word: str, vowel_groups: int) -> int:
+    if not word:
+        return 0
+    # Adjust for silent 'e'
+    if word.endswith("e") and vowel_groups > 1:
+        vowel_groups -= 1
+    return max(1, vowel_groups)
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def word_features(token: str) -> WordFeatures:
+    """Analyse one word (memoized).
+
+    Args:
+        token: Word, in any case and possibly with punctuation
+
+    Returns:
+        WordFeatures of the lowercased word without punctuation
+    """
+    word = _NON_WORD.sub("", token.lower())
+    vowel_groups = len(_VOWEL_GROUP.findall(word))
+    syllables = _estimate_syllables(word, vowel_groups)
+
+    meter_syllables = syllables
+    if word.endswith("le") and len(word) > 2 and word[-3] not in _VOWELS:
+        meter_syllables += 1
+
+    letters = _NON_LETTER.sub("", word)
+    letter_syllables = _estimate_syllables(letters, len(_VOWEL_GROUP.findall(letters)))
+
+    return WordFeatures(
+        word=word,
+        vowel_groups=vowel_groups,
+        syllables=syllables,
+        meter_syllables=meter_syllables,
+        letter_syllables=letter_syllables,
+    )
+
+
+@lru_cache(maxsize=LINE_CACHE_SIZE)
+def analyze_line(line: str) -> LineFeatures:
+    """Tokenize a line once into its feature table (memoized).
+
+    Args:
+        line: Lyric line
+
+    Returns:
+        LineFeatures of the line
+    """
+    lowered = line.lower()
+    words = tuple(map(word_features, _WORD.findall(lowered)))
+    return LineFeatures(
+        words=words,
+        spans=tuple(map(word_features, lowered.split())),
+        syllables=sum(word.syllables for word in words),
+        end_word=words[-1] if words else None,
+    )
+
+
+def words_rhyme(word1: str, word2: str) -> bool:
+    """Check whether two words rhyme.
+
+    Args:
+        word1: First word
+        word2: Second word
+
+    Returns:
+        True if the words differ and share their rhyming part
+    """
+    features1, features2 = word_features(word1), word_features(word2)
+    if not features1.word or features1.word == features2.word:
+        return False  # Same word doesn't count as rhyme
+    return features1.rhyme_key == features2.rhyme_key
+
+
+__all__ = [
+    "WordFeatures",
+    "LineFeatures",
+    "word_features",
+    "analyze_line",
+    "words_rhyme",
+    "WORD_CACHE_SIZE",
+    "LINE_CACHE_SIZE",
+]
@@ -17,12 +17,168 @@ from __future__ import annotations
 import re
 import json
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional, Set
+from typing import Dict, Any, Iterable, List, Sequence, Tuple, Optional, Set
 from dataclasses import dataclass
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Zero-width matches at every position where ``\b`` holds
+_WORD_BOUNDARY = re.compile(r'\b')
+
+# A leetspeak variation slot: (is_character_class, alternatives)
+VariationSlot = Tuple[bool, Tuple[str, ...]]
+
+
+def _fold_char(char: str) -> str:
+    """Case-fold one character so that ``re.IGNORECASE`` equivalents agree.
+
+    Keeps text length (one character in, one out), so positions in folded
+    text are positions in the original text.
+    """
+    folded = char.upper().lower()
+    if len(folded) != 1:
+        folded = char.lower()[:1] or char
+    return folded
+
+
+class _FoldTable(dict):
+    """``str.translate`` table that folds characters on first use."""
+
+    def __missing__(self, codepoint: int) -> str:
+        folded = self[codepoint] = _fold_char(chr(codepoint))
+        return folded
+
+
+_FOLD_TABLE = _FoldTable()
+
+
+class MultiPatternMatcher:
+    """Single-pass matcher for many fixed-length ``\\b...\\b`` patterns.
+
+    Each pattern is described by the characters it accepts at every position
+    (a literal character or a character class) and is stored in a trie whose
+    edges are case-folded character sets. ``scan`` walks the folded text
+    once, advancing every live trie path by one character and starting a new
+    path at each word boundary, so its cost depends on the text length and
+    the number of live paths rather than on the number of patterns.
+
+    Candidates are confirmed with the pattern's compiled regex, and matches
+    of each pattern are made non-overlapping the way ``finditer`` does, so
+    ``scan`` returns exactly what running ``finditer`` per pattern would.
+    Patterns that match no characters cannot be indexed and are run with
+    ``finditer``.
+    """
+
+    def __init__(self) -> None:
+        self._edges: List[Dict[str, List[int]]] = [{}]
+        self._labels: List[Dict[frozenset, int]] = [{}]
+        self._depth: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+        self._patterns: List[re.Pattern] = []
+        self._unindexed: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, slots: Sequence[Iterable[str]], pattern: re.Pattern) -> int:
+        """Add a pattern.
+
+        Args:
+            slots: Characters the pattern accepts at each position
+            pattern: Compiled regex equivalent to ``slots`` (with boundaries)
+
+        Returns:
+            Pattern ID; IDs are assigned in insertion order
+        """
+        pattern_id = len(self._patterns)
+        self._patterns.append(pattern)
+
+        node = 0
+        for slot in slots:
+            label = frozenset(_fold_char(char) for char in slot)
+            child = self._labels[node].get(label)
+            if child is None:
+                child = len(self._edges)
+                self._edges.append({})
+                self._labels.append({})
+                self._depth.append(self._depth[node] + 1)
+                self._outputs.append([])
+                self._labels[node][label] = child
+                for char in label:
+                    self._edges[node].setdefault(char, []).append(child)
+            node = child
+
+        if node == 0:
+            self._unindexed.append(pattern_id)
+        else:
+            self._outputs[node].append(pattern_id)
+        return pattern_id
+
+    def scan(self, text: str) -> List[Tuple[int, re.Match]]:
+        """Find the matches of every pattern in one pass over ``text``.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (pattern_id, match) pairs ordered by pattern ID, then position
+        """
+        edges, depth, outputs = self._edges, self._depth, self._outputs
+        folded = text.translate(_FOLD_TABLE)
+        boundaries = [match.start() for match in _WORD_BOUNDARY.finditer(text)]
+        candidates: List[Tuple[int, int]] = []
+
+        active: List[int] = []
+        next_boundary = 0
+        position = 0
+        length = len(folded)
+        while position < length:
+            while next_boundary < len(boundaries) and boundaries[next_boundary] < position:
+                next_boundary += 1
+            at_boundary = next_boundary < len(boundaries) and boundaries[next_boundary] == position
+            if not active:
+                # Nothing in flight: jump to the next position a pattern can start at
+                if next_boundary == len(boundaries):
+                    break
+                position = boundaries[next_boundary]
+                if position >= length:
+                    break
+                at_boundary = True
+
+            char = folded[position]
+            advanced: List[int] = []
+            for node in (active + [0]) if at_boundary else active:
+                children = edges[node].get(char)
+                if children:
+                    advanced.extend(children)
+            for node in advanced:
+                if outputs[node]:
+                    start = position + 1 - depth[node]
+                    candidates.extend((pattern_id, start) for pattern_id in outputs[node])
+            active = advanced
+            position += 1
+
+        found: List[Tuple[int, int, re.Match]] = []
+        for pattern_id, start in candidates:
+            match = self._patterns[pattern_id].match(text, start)
+            if match is not None:
+                found.append((pattern_id, start, match))
+        for pattern_id in self._unindexed:
+            found.extend((pattern_id, match.start(), match) for match in self._patterns[pattern_id].finditer(text))
+        found.sort(key=lambda item: (item[0], item[1]))
+
+        matches: List[Tuple[int, re.Match]] = []
+        last_pattern, last_end = -1, 0
+        for pattern_id, start, match in found:
+            if pattern_id != last_pattern:
+                last_pattern, last_end = pattern_id, 0
+            if start < last_end:
+                continue
+            matches.append((pattern_id, match))
+            last_end = match.end()
+        return matches
+
 
 @dataclass
 class ProfanityViolation:
@@ -120,6 +276,13 @@ class ProfanityFilter:
         self._word_boundary_patterns: Dict[str, re.Pattern] = {}
         self._variation_patterns: List[Tuple[str, re.Pattern]] = []
 
+        # Single-pass matchers over the same patterns (pattern IDs follow the
+        # order of the dict / list above) and the term -> category index
+        self._word_matcher = MultiPatternMatcher()
+        self._variation_matcher = MultiPatternMatcher()
+        self._word_terms: List[str] = []
+        self._term_categories: Dict[str, str] = {}
+
         # Load taxonomy
         if taxonomy_path is None:
             # Default to project root /taxonomies/profanity_list.json
@@ -213,7 +376,9 @@ class ProfanityFilter:
         1. Word boundary patterns for each profanity term
         2. Variation patterns for leetspeak, masking, and spacing
 
-        Patterns are compiled once at initialization for performance.
+        Patterns are compiled once at initialization for performance, and
+        indexed into one MultiPatternMatcher per step so detection scans
+        the text once regardless of taxonomy size.
         """
         # Compile word boundary patterns for each profanity term
         for category, terms in self.categories.items():
@@ -225,18 +390,23 @@ class ProfanityFilter:
                     re.IGNORECASE
                 )
                 self._word_boundary_patterns[term] = pattern
+                self._term_categories.setdefault(term.lower(), category)
+
+        for term, pattern in self._word_boundary_patterns.items():
+            self._word_matcher.add(term, pattern)
+            self._word_terms.append(term)
 
         # Compile variation patterns for each base term
         # This handles leetspeak substitutions
         for category, terms in self.categories.items():
             for term in terms:
-                variations = self._generate_leetspeak_variations(term)
-                for variation in variations:
+                for slots in self._leetspeak_variation_slots(term):
                     pattern = re.compile(
-                        rf'\b{variation}\b',
+                        rf'\b{self._render_variation(slots)}\b',
                         re.IGNORECASE
                     )
                     self._variation_patterns.append((term, pattern))
+                    self._variation_matcher.add(self._variation_chars(slots), pattern)
 
         logger.debug(
             "profanity_filter.patterns_compiled",
@@ -258,10 +428,30 @@ class ProfanityFilter:
             "hell" -> ["h3ll", "h311", "he11", etc.]
             "damn" -> ["d4mn", "d@mn", etc.]
         """
+        return [
+            self._render_variation(slots)
+            for slots in self._leetspeak_variation_slots(term, max_variations)
+        ]
+
+    def _leetspeak_variation_slots(self, term: str, max_variations: int = 10) -> List[List[VariationSlot]]:
+        """Generate leetspeak variations of a term as per-character slots.
+
+        Each variation substitutes one character with one of its top two
+        leetspeak equivalents and allows the original or a top-two
+        substitute for every other leetspeak-able character.
+
+        Args:
+            term: Base term to generate variations for
+            max_variations: Maximum number of variations to generate
+
+        Returns:
+            List of variations, each a list of (is_character_class,
+            alternatives) slots
+        """
         if not term:
             return []
 
-        variations = []
+        variations: List[List[VariationSlot]] = []
 
         # Generate a few common variations
         # For each character, try to substitute with leetspeak equivalents
@@ -269,30 +459,45 @@ class ProfanityFilter:
             if char in self.leetspeak_patterns:
                 substitutes = self.leetspeak_patterns[char]
                 for substitute in substitutes[:2]:  # Limit to top 2 substitutes
-                    # Create variation by substituting this character
-                    variation = list(term.lower())
-                    variation[i] = substitute
-
-                    # Build regex pattern that allows the substitution
-                    pattern_chars = []
+                    slots: List[VariationSlot] = []
                     for j, c in enumerate(term.lower()):
                         if j == i:
                             # Use the substitute
-                            pattern_chars.append(re.escape(substitute))
+                            slots.append((False, (substitute,)))
                         elif c in self.leetspeak_patterns:
                             # Allow original or any substitute
-                            subs = [re.escape(c)] + [re.escape(s) for s in self.leetspeak_patterns[c][:2]]
-                            pattern_chars.append(f"[{''.join(subs)}]")
+                            slots.append((True, (c, *self.leetspeak_patterns[c][:2])))
                         else:
-                            pattern_chars.append(re.escape(c))
+                            slots.append((False, (c,)))
 
-                    variations.append(''.join(pattern_chars))
+                    variations.append(slots)
 
                     if len(variations) >= max_variations:
                         return variations
 
         return variations[:max_variations]
 
+    @staticmethod
+    def _render_variation(slots: List[VariationSlot]) -> str:
+        """Render variation slots as a regex (literals escaped, classes bracketed)."""
+        return ''.join(
+            f"[{''.join(re.escape(alternative) for alternative in alternatives)}]" if is_class
+            else re.escape(alternatives[0])
+            for is_class, alternatives in slots
+        )
+
+    @staticmethod
+    def _variation_chars(slots: List[VariationSlot]) -> List[Set[str]]:
+        """Characters a rendered variation accepts at each position."""
+        chars: List[Set[str]] = []
+        for is_class, alternatives in slots:
+            if is_class:
+                # A class matches one character of any alternative
+                chars.append({char for alternative in alternatives for char in alternative})
+            else:
+                chars.extend({char} for char in alternatives[0])
+        return chars
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text for profanity detection.
 
@@ -393,11 +598,7 @@ class ProfanityFilter:
         Returns:
             Category name (mild, moderate, strong, extreme) or None
         """
-        term_lower = term.lower()
-        for category, terms in self.categories.items():
-            if term_lower in [t.lower() for t in terms]:
-                return category
-        return None
+        return self._term_categories.get(term.lower())
 
     def detect_profanity(
         self,
@@ -414,6 +615,10 @@ class ProfanityFilter:
         4. Filters out whitelisted terms
         5. Returns structured violation reports
 
+        Steps 2 and 3 each scan their text once with a MultiPatternMatcher;
+        matches are visited in pattern order, then position, as if every
+        pattern were run with ``finditer`` in turn.
+
         Args:
             text: Text to analyze
             explicit_allowed: If True, uses "explicit" mode; otherwise uses mode parameter
@@ -460,85 +665,85 @@ class ProfanityFilter:
         )
 
         # Step 1: Check word boundary patterns (exact matches)
-        for term, pattern in self._word_boundary_patterns.items():
-            for match in pattern.finditer(text):
-                position = match.start()
+        for pattern_id, match in self._word_matcher.scan(text):
+            term = self._word_terms[pattern_id]
+            position = match.start()
 
-                # Skip if we've already detected profanity at this position
-                if position in detected_positions:
-                    continue
+            # Skip if we've already detected profanity at this position
+            if position in detected_positions:
+                continue
 
-                # Check whitelist
-                if self._is_whitelisted(text, position, len(match.group())):
-                    continue
+            # Check whitelist
+            if self._is_whitelisted(text, position, len(match.group())):
+                continue
 
-                # Find category
-                category = self._find_term_category(term)
-                if category is None:
-                    continue
+            # Find category
+            category = self._find_term_category(term)
+            if category is None:
+                continue
 
-                # Create violation
-                violation = ProfanityViolation(
-                    term=term,
-                    position=position,
-                    severity=category,
-                    context=self._get_context(text, position, len(match.group())),
-                    normalized_form=term,
-                    original_form=match.group()
-                )
+            # Create violation
+            violation = ProfanityViolation(
+                term=term,
+                position=position,
+                severity=category,
+                context=self._get_context(text, position, len(match.group())),
+                normalized_form=term,
+                original_form=match.group()
+            )
 
-                violations.append(violation)
-                detected_positions.add(position)
+            violations.append(violation)
+            detected_positions.add(position)
 
-                logger.debug(
-                    "profanity_filter.violation_detected",
-                    term=term,
-                    position=position,
-                    severity=category,
-                    original=match.group()
-                )
+            logger.debug(
+                "profanity_filter.violation_detected",
+                term=term,
+                position=position,
+                severity=category,
+                original=match.group()
+            )
 
         # Step 2: Check variation patterns (leetspeak, etc.) on normalized text
-        for base_term, pattern in self._variation_patterns:
-            for match in pattern.finditer(normalized_text):
-                position = match.start()
+        for pattern_id, match in self._variation_matcher.scan(normalized_text):
+            base_term = self._variation_patterns[pattern_id][0]
+            position = match.start()
 
-                # Skip if we've already detected profanity at this position
-                if position in detected_positions:
-                    continue
+            # Skip if we've already detected profanity at this position
+            if position in detected_positions:
+                continue
 
-                # Check whitelist (using original text)
-                if position < len(text) and self._is_whitelisted(text, position, len(match.group())):
-                    continue
+            # Check whitelist (using original text)
+            if position < len(text) and self._is_whitelisted(text, position, len(match.group())):
+                continue
 
-                # Find category
-                category = self._find_term_category(base_term)
-                if category is None:
-                    continue
+            # Find category
+            category = self._find_term_category(base_term)
+            if category is None:
+                continue
 
-                # Create violation (use original text position if available)
-                original_form = text[position:position + len(match.group())] if position < len(text) else match.group()
+            # Create violation (use original text position if available)
+            original_form = text[position:position + len(match.group())] if position < len(text) else match.group()
 
-                violation = ProfanityViolation(
-                    term=base_term,
-                    position=position,
-                    severity=category,
-                    context=self._get_context(text, position, len(match.group())),
-                    normalized_form=match.group(),
-                    original_form=original_form
-                )
+            violation = ProfanityViolation(
+                term=base_term,
+                position=position,
+                severity=category,
+                context=self._get_context(text, position, len(match.group())),
+                normalized_form=match.group(),
+                original_form=original_form
+            )
 
-                violations.append(violation)
-                detected_positions.add(position)
+            violations.append(violation)
+            detected_positions.add(position)
 
-                logger.debug(
-                    "profanity_filter.variation_detected",
-                    base_term=base_term,
-                    position=position,
-                    severity=category,
-                    normalized=match.group(),
-                    original=original_form
-                )
+            logger.debug(
+                "profanity_filter.variation_detected",
+                base_term=base_term,
+                position=position,
+                severity=category,
+                normalized=match.group(),
+                original=original_form
+            )
 
         # Step 3: Check against thresholds for the mode
         has_violations = self._check_violations_against_threshold(violations, threshold_mode)
@@ -0,0 +1,245 @@
+"""Phonetic rhyme keys from a packaged pronunciation table.
+
+Two words rhyme when their rhyming parts match: the phonemes from the last
+stressed vowel to the end of the word ("night" and "bite" -> "AY T").
+Rhyming parts of the ~120k words of the CMU Pronouncing Dictionary are
+shipped in ``app/data/rhyme_keys.bin`` (built by
+``scripts/build_rhyme_table.py``). The table is memory-mapped on first use
+and searched in place, so processes share its pages and pay no parse cost.
+
+Words missing from the dictionary (slang, elisions, invented words) take
+the rhyming part of the longest dictionary word they end with
+("lovin" -> "vin" -> "IH N"), and otherwise a grapheme key: their last
+vowel group and the consonants after it.
+
+Table layout (little-endian)::
+
+    header        magic "RHYK", version, phoneme inventory size,
+                  word count, rhyming part count
+    inventory     space-separated phoneme symbols (ASCII)
+    word offsets  u32 * (words + 1), into the word blob
+    word keys     u16 * words, rhyming part id of each word
+    key offsets   u32 * (keys + 1), into the key blob
+    word blob     words (UTF-8), sorted bytewise
+    key blob      rhyming parts, one byte per phoneme (inventory index)
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+RHYME_TABLE_PATH = Path(__file__).resolve().parent.parent / "data" / "rhyme_keys.bin"
+
+# Distinct words kept in the rhyme key cache
+RHYME_KEY_CACHE_SIZE = 16384
+
+MAGIC = b"RHYK"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+
+_VOWEL = re.compile(r"[aeiouy]")
+_GRAPHEME_RIME = re.compile(r"[aeiouy]+[^aeiouy]*$")
+_STRESS = re.compile(r"\d")
+
+
+class RhymeTable:
+    """Read-only, memory-mapped word -> rhyming part table.
+
+    Args:
+        path: Table file written by :func:`write_rhyme_table`
+
+    Raises:
+        OSError: If the file cannot be opened
+        ValueError: If the file is not a rhyme table of this version
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, inventory_size, self._word_count, self._key_count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a version {FORMAT_VERSION} rhyme table: {path}")
+
+        offset = _HEADER.size
+        self._phonemes = self._mm[offset:offset + inventory_size].decode("ascii").split()
+        offset += inventory_size
+        self._word_offsets, offset = self._array("I", offset, self._word_count + 1)
+        self._word_keys, offset = self._array("H", offset, self._word_count)
+        self._key_offsets, offset = self._array("I", offset, self._key_count + 1)
+        self._word_blob = offset
+        self._key_blob = offset + self._word_offsets[self._word_count]
+
+    def __len__(self) -> int:
+        return self._word_count
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Rhyming part of a dictionary word.
+
+        Args:
+            word: Lowercase word without punctuation
+
+        Returns:
+            Space-separated phonemes without stress marks (e.g. "AY T"), or
+            None if the word is not in the table
+        """
+        target = word.encode("utf-8")
+        mm, offsets, blob = self._mm, self._word_offsets, self._word_blob
+        lo, hi = 0, self._word_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            candidate = mm[blob + offsets[mid]:blob + offsets[mid + 1]]
+            if candidate < target:
+                lo = mid + 1
+            elif candidate > target:
+                hi = mid
+            else:
+                return self._key(self._word_keys[mid])
+        return None
+
+    def _key(self, key_id: int) -> str:
+        start = self._key_blob + self._key_offsets[key_id]
+        end = self._key_blob + self._key_offsets[key_id + 1]
+        return " ".join(self._phonemes[code] for code in self._mm[start:end])
+
+    def _array(self, typecode: str, offset: int, count: int) -> Tuple[Sequence[int], int]:
+        """View ``count`` little-endian integers at ``offset``, and the offset after them."""
+        itemsize = struct.calcsize(typecode)
+        end = offset + itemsize * count
+        if sys.byteorder == "little":
+            # Zero-copy view of the mapped pages
+            return memoryview(self._mm)[offset:end].cast(typecode), end
+        values = array(typecode, self._mm[offset:end])
+        values.byteswap()
+        return values, end
+
+
+def rhyming_part(phones: Sequence[str]) -> Optional[str]:
+    """Rhyming part of a pronunciation.
+
+    Args:
+        phones: ARPAbet phonemes with stress digits (e.g. ["N", "AY1", "T"])
+
+    Returns:
+        Phonemes from the last stressed vowel (the last vowel for words
+        without stress) to the end, stress marks removed, or None for a
+        pronunciation without vowels
+    """
+    vowels = [i for i, phone in enumerate(phones) if phone[-1].isdigit()]
+    stressed = [i for i in vowels if phones[i][-1] in "12"]
+    start = (stressed or vowels or [None])[-1]
+    if start is None:
+        return None
+    return " ".join(_STRESS.sub("", phone) for phone in phones[start:])
+
+
+def write_rhyme_table(entries: Mapping[str, str], path: Path) -> None:
+    """Write a rhyme table file.
+
+    Args:
+        entries: Rhyming part (space-separated phonemes) per word
+        path: Output file
+
+    Raises:
+        ValueError: If the table exceeds the format's limits
+    """
+    phonemes = sorted({phone for key in entries.values() for phone in key.split()})
+    codes = {phone: code for code, phone in enumerate(phonemes)}
+    keys = sorted(set(entries.values()))
+    key_ids = {key: key_id for key_id, key in enumerate(keys)}
+    if len(phonemes) > 0x100 or len(keys) > 0x10000:
+        raise ValueError(f"Too many phonemes ({len(phonemes)}) or rhyming parts ({len(keys)})")
+
+    words = sorted((word.encode("utf-8"), key) for word, key in entries.items())
+    inventory = " ".join(phonemes).encode("ascii")
+
+    word_offsets = [0]
+    for word, _ in words:
+        word_offsets.append(word_offsets[-1] + len(word))
+    encoded_keys = [bytes(codes[phone] for phone in key.split()) for key in keys]
+    key_offsets = [0]
+    for encoded in encoded_keys:
+        key_offsets.append(key_offsets[-1] + len(encoded))
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(inventory), len(words), len(keys)))
+        f.write(inventory)
+        f.write(struct.pack(f"<{len(word_offsets)}I", *word_offsets))
+        f.write(struct.pack(f"<{len(words)}H", *(key_ids[key] for _, key in words)))
+        f.write(struct.pack(f"<{len(key_offsets)}I", *key_offsets))
+        f.write(b"".join(word for word, _ in words))
+        f.write(b"".join(encoded_keys))
+
+
+@lru_cache(maxsize=1)
+def get_rhyme_table() -> Optional[RhymeTable]:
+    """Memory-map the packaged rhyme table on first use.
+
+    Returns:
+        The table, or None if it is unavailable (rhyme keys then fall back to
+        graphemes)
+    """
+    try:
+        table = RhymeTable(RHYME_TABLE_PATH)
+    except (OSError, ValueError) as e:
+        logger.warning("rhyme_index.table_unavailable", path=str(RHYME_TABLE_PATH), error=str(e))
+        return None
+
+    logger.info("rhyme_index.table_loaded", path=str(RHYME_TABLE_PATH), words=len(table))
+    return table
+
+
+@lru_cache(maxsize=RHYME_KEY_CACHE_SIZE)
+def rhyme_key(word: str) -> str:
+    """Key under which a word rhymes with other words (memoized).
+
+    Args:
+        word: Lowercase word without punctuation
+
+    Returns:
+        Rhyming part from the pronunciation table (e.g. "AY T"), or a
+        lowercase grapheme key (e.g. "ight") for words it cannot place;
+        "" for an empty word
+    """
+    if not word:
+        return ""
+
+    table = get_rhyme_table()
+    if table is not None:
+        key = table.lookup(word)
+        if key is None:
+            # Longest dictionary word it ends with, e.g. "lovin" -> "vin"
+            for start in range(1, len(word) - 1):
+                suffix = word[start:]
+                if _VOWEL.search(suffix):
+                    key = table.lookup(suffix)
+                    if key is not None:
+                        break
+        if key is not None:
+            return key
+
+    match = _GRAPHEME_RIME.search(word)
+    return match.group() if match else word
+
+
+__all__ = [
+    "RhymeTable",
+    "RHYME_TABLE_PATH",
+    "RHYME_KEY_CACHE_SIZE",
+    "get_rhyme_table",
+    "rhyme_key",
+    "rhyming_part",
+    "write_rhyme_table",
+]
@@ -13,19 +13,47 @@ composite scores and checks threshold compliance for validation gates.
 
 from __future__ import annotations
 
-import re
-from typing import Dict, Any, List, Tuple, Optional, Set
+from typing import Dict, Any, List, Tuple, Optional, Sequence, Set
 from dataclasses import dataclass, field
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from enum import Enum
+import multiprocessing
+import threading
 import structlog
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 from app.services.blueprint_service import BlueprintService
+from app.services.lyrics_analysis import WordFeatures, analyze_line, word_features, words_rhyme
 from app.services.policy_guards import ProfanityFilter
 from app.models.blueprint import Blueprint
 
 logger = structlog.get_logger(__name__)
 
+# Metrics in weighted-total order, with the weight used when a blueprint omits one
+METRIC_NAMES = (
+    "hook_density",
+    "singability",
+    "rhyme_tightness",
+    "section_completeness",
+    "profanity_score",
+)
+DEFAULT_METRIC_WEIGHTS = {
+    "hook_density": 0.25,
+    "singability": 0.20,
+    "rhyme_tightness": 0.15,
+    "section_completeness": 0.20,
+    "profanity_score": 0.20,
+}
+
+# Smallest batch worth spreading over worker processes in score_batch()
+BATCH_PROCESS_POOL_MIN_SIZE = 200
+
 
 class ThresholdDecision(Enum):
     """Decision enum for threshold validation.
@@ -711,11 +739,8 @@ class RubricScorer:
         Returns:
             List of phrases (normalized, lowercase)
         """
-        # Normalize text
-        text = text.lower().strip()
-
-        # Split into words
-        words = re.findall(r'\b\w+\b', text)
+        # Normalized (lowercase) words
+        words = [word.word for word in analyze_line(text).words]
 
         if len(words) < min_words:
             return []
@@ -864,11 +889,11 @@ class RubricScorer:
         Returns:
             Dict with syllable_count, word_count, complex_word_count, char_length
         """
-        words = re.findall(r'\b\w+\b', line)
+        words = analyze_line(line).words
 
-        syllable_count = sum(self._count_syllables(word) for word in words)
+        syllable_count = sum(word.letter_syllables for word in words)
         word_count = len(words)
-        complex_word_count = sum(1 for word in words if self._count_syllables(word) > 3)
+        complex_word_count = sum(1 for word in words if word.letter_syllables > 3)
         char_length = len(line)
 
         return {
@@ -890,27 +915,7 @@ class RubricScorer:
         Returns:
             Estimated syllable count
         """
-        word = word.lower().strip()
-
-        if not word:
-            return 0
-
-        # Remove non-alphabetic characters
-        word = re.sub(r'[^a-z]', '', word)
-
-        if not word:
-            return 0
-
-        # Count vowel groups
-        vowel_groups = re.findall(r'[aeiouy]+', word)
-        count = len(vowel_groups)
-
-        # Adjust for silent 'e' at end
-        if word.endswith('e') and count > 1:
-            count -= 1
-
-        # Ensure at least 1 syllable
-        return max(1, count)
+        return word_features(word).letter_syllables
 
     def _calculate_syllable_consistency(
         self,
@@ -1100,43 +1105,45 @@ class RubricScorer:
         Returns:
             List of rhyming pairs (line1, line2)
         """
-        rhyme_pairs = []
-
-        # Extract last words from each line
-        line_endings: List[Tuple[str, str]] = []  # (last_word, full_line)
-
+        # End word of each line (lines without words are skipped)
+        endings: List[Tuple[WordFeatures, str]] = []
         for line_text, _ in lines:
-            words = re.findall(r'\b\w+\b', line_text)
-            if words:
-                last_word = words[-1].lower()
-                line_endings.append((last_word, line_text))
-
-        # Check consecutive lines for rhymes (AABB pattern)
-        for i in range(0, len(line_endings) - 1, 2):
-            if i + 1 < len(line_endings):
-                word1, line1 = line_endings[i]
-                word2, line2 = line_endings[i + 1]
-
-                if self._words_rhyme(word1, word2):
-                    rhyme_pairs.append((line1, line2))
-
-        # Check alternating lines for rhymes (ABAB pattern)
-        for i in range(len(line_endings) - 3):
-            word1, line1 = line_endings[i]
-            word2, line2 = line_endings[i + 2]
-
-            if self._words_rhyme(word1, word2):
-                # Avoid duplicates
-                if (line1, line2) not in rhyme_pairs and (line2, line1) not in rhyme_pairs:
-                    rhyme_pairs.append((line1, line2))
+            end_word = analyze_line(line_text).end_word
+            if end_word:
+                endings.append((end_word, line_text))
+
+        # Group line positions by rhyme key in one pass: only lines sharing
+        # a key can rhyme, so candidate pairs are looked up within groups
+        groups: Dict[str, List[int]] = {}
+        for position, (end_word, _) in enumerate(endings):
+            groups.setdefault(end_word.rhyme_key, []).append(position)
+
+        couplets: List[int] = []  # AABB: (i, i + 1) for even i
+        alternates: List[int] = []  # ABAB: (i, i + 2)
+        for positions in groups.values():
+            if len(positions) < 2:
+                continue
+            members = set(positions)
+            for i in positions:
+                if i % 2 == 0 and i + 1 in members and endings[i][0].word != endings[i + 1][0].word:
+                    couplets.append(i)
+                if i < len(endings) - 3 and i + 2 in members and endings[i][0].word != endings[i + 2][0].word:
+                    alternates.append(i)
+
+        rhyme_pairs = [(endings[i][1], endings[i + 1][1]) for i in sorted(couplets)]
+
+        # Avoid duplicates
+        seen = set(rhyme_pairs)
+        for i in sorted(alternates):
+            pair = (endings[i][1], endings[i + 2][1])
+            if pair not in seen and pair[::-1] not in seen:
+                rhyme_pairs.append(pair)
+                seen.add(pair)
 
         return rhyme_pairs
 
     def _words_rhyme(self, word1: str, word2: str) -> bool:
-        """Check if two words rhyme (simple phonetic similarity).
-
-        This is a basic heuristic. For production, consider using
-        pronouncing library or CMU dictionary.
+        """Check if two words rhyme (same phonetic rhyming part).
 
         Args:
             word1: First word
@@ -1145,21 +1152,7 @@ class RubricScorer:
         Returns:
             True if words rhyme
         """
-        if word1 == word2:
-            return False  # Same word doesn't count as rhyme
-
-        # Simple suffix matching (last 2-3 characters)
-        if len(word1) >= 2 and len(word2) >= 2:
-            # Check last 2 characters
-            if word1[-2:] == word2[-2:]:
-                return True
-
-            # Check last 3 characters for stronger rhymes
-            if len(word1) >= 3 and len(word2) >= 3:
-                if word1[-3:] == word2[-3:]:
-                    return True
-
-        return False
+        return words_rhyme(word1, word2)
 
     # =========================================================================
     # Section Completeness Metric
@@ -1401,7 +1394,113 @@ class RubricScorer:
             explicit_allowed=explicit_allowed
         )
 
-        # Load blueprint
+        blueprint, weights, thresholds = self._resolve_scoring_config(genre, blueprint_version)
+        metrics = self._calculate_metrics(lyrics, blueprint, explicit_allowed)
+        report = self._build_reports([metrics], weights, thresholds)[0]
+
+        logger.info(
+            "rubric_scorer.score_artifacts_complete",
+            genre=genre,
+            total_score=report.total,
+            meets_threshold=report.meets_threshold,
+            margin=report.margin,
+            hook_density=report.hook_density,
+            singability=report.singability,
+            rhyme_tightness=report.rhyme_tightness,
+            section_completeness=report.section_completeness,
+            profanity_score=report.profanity_score
+        )
+
+        return report
+
+    def score_batch(
+        self,
+        candidates: Sequence[Dict[str, Any]],
+        genre: str,
+        explicit_allowed: bool,
+        blueprint_version: str = "latest",
+        max_workers: int = 1
+    ) -> List[ScoreReport]:
+        """Score many candidate artifacts for the same genre.
+
+        Equivalent to calling score_artifacts() for each candidate (reports
+        are identical), but the blueprint, weights and thresholds are
+        resolved once for the batch and the weighted totals and threshold
+        margins are computed over columns of metric scores. Candidates that
+        share lines (seed variants of one song) reuse each other's line
+        analysis from the shared cache.
+
+        Args:
+            candidates: Candidate artifacts, each a dict with "lyrics" and
+                optionally "style" and "producer_notes"
+            genre: Genre name (e.g., "pop", "country")
+            explicit_allowed: If True, explicit content is allowed
+            blueprint_version: Blueprint version (default "latest")
+            max_workers: Worker processes for the metric calculations.
+                Batches of at least BATCH_PROCESS_POOL_MIN_SIZE candidates
+                are spread over a process pool when greater than 1; smaller
+                batches are always scored in-process
+
+        Returns:
+            One ScoreReport per candidate, in input order
+
+        Raises:
+            NotFoundError: If blueprint not found for genre
+        """
+        logger.info(
+            "rubric_scorer.score_batch_start",
+            genre=genre,
+            explicit_allowed=explicit_allowed,
+            candidate_count=len(candidates)
+        )
+
+        if not candidates:
+            return []
+
+        blueprint, weights, thresholds = self._resolve_scoring_config(genre, blueprint_version)
+        lyrics_batch = [candidate["lyrics"] for candidate in candidates]
+
+        use_pool = max_workers > 1 and len(lyrics_batch) >= BATCH_PROCESS_POOL_MIN_SIZE
+        if use_pool:
+            metrics_batch = self._calculate_metrics_in_pool(
+                lyrics_batch, blueprint, explicit_allowed, max_workers
+            )
+        else:
+            metrics_batch = [
+                self._calculate_metrics(lyrics, blueprint, explicit_allowed)
+                for lyrics in lyrics_batch
+            ]
+
+        reports = self._build_reports(metrics_batch, weights, thresholds)
+
+        logger.info(
+            "rubric_scorer.score_batch_complete",
+            genre=genre,
+            candidate_count=len(reports),
+            passing_count=sum(1 for report in reports if report.meets_threshold),
+            best_total=max(report.total for report in reports),
+            worker_processes=max_workers if use_pool else 0
+        )
+
+        return reports
+
+    def _resolve_scoring_config(
+        self,
+        genre: str,
+        blueprint_version: str
+    ) -> Tuple[Blueprint, Dict[str, float], Dict[str, float]]:
+        """Load the blueprint and resolve its weights and thresholds.
+
+        Args:
+            genre: Genre name
+            blueprint_version: Blueprint version
+
+        Returns:
+            Tuple of (blueprint, weights, thresholds)
+
+        Raises:
+            NotFoundError: If blueprint not found for genre
+        """
         blueprint = self.blueprint_service.get_or_load_blueprint(
             genre=genre,
             version=blueprint_version
@@ -1411,76 +1510,122 @@ class RubricScorer:
         # Precedence: A/B test > genre override > blueprint default
         weights = self._get_weights(genre, blueprint)
         thresholds = self._get_thresholds(genre, blueprint)
+        return blueprint, weights, thresholds
 
-        # Calculate all metrics
-        hook_density, hook_explanation, hook_details = self.calculate_hook_density(lyrics)
-        singability, sing_explanation, sing_details = self.calculate_singability(lyrics)
-        rhyme_tightness, rhyme_explanation, rhyme_details = self.calculate_rhyme_tightness(lyrics)
-        section_completeness, section_explanation, section_details = self.calculate_section_completeness(lyrics, blueprint)
-        profanity_score, profanity_explanation, profanity_details = self.calculate_profanity_score(lyrics, explicit_allowed)
-
-        # Calculate weighted total
-        total = (
-            hook_density * weights.get("hook_density", 0.25) +
-            singability * weights.get("singability", 0.20) +
-            rhyme_tightness * weights.get("rhyme_tightness", 0.15) +
-            section_completeness * weights.get("section_completeness", 0.20) +
-            profanity_score * weights.get("profanity_score", 0.20)
-        )
+    def _calculate_metrics(
+        self,
+        lyrics: Dict[str, Any],
+        blueprint: Blueprint,
+        explicit_allowed: bool
+    ) -> Dict[str, Tuple[float, str, Dict[str, Any]]]:
+        """Calculate all 5 metrics for one set of lyrics.
 
-        # Check threshold compliance
-        min_total = thresholds.get("min_total", 0.75)
-        meets_threshold = total >= min_total
-        margin = total - min_total
-
-        # Build explanations
-        explanations = {
-            "hook_density": hook_explanation,
-            "singability": sing_explanation,
-            "rhyme_tightness": rhyme_explanation,
-            "section_completeness": section_explanation,
-            "profanity_score": profanity_explanation
-        }
+        Args:
+            lyrics: Lyrics dictionary with sections
+            blueprint: Genre blueprint (for section requirements)
+            explicit_allowed: If True, explicit content is allowed
 
-        # Build metric details
-        metric_details = {
-            "hook_density": hook_details,
-            "singability": sing_details,
-            "rhyme_tightness": rhyme_details,
-            "section_completeness": section_details,
-            "profanity_score": profanity_details
+        Returns:
+            (score, explanation, details) per metric name, in METRIC_NAMES order
+        """
+        return {
+            "hook_density": self.calculate_hook_density(lyrics),
+            "singability": self.calculate_singability(lyrics),
+            "rhyme_tightness": self.calculate_rhyme_tightness(lyrics),
+            "section_completeness": self.calculate_section_completeness(lyrics, blueprint),
+            "profanity_score": self.calculate_profanity_score(lyrics, explicit_allowed),
         }
 
-        # Create score report
-        report = ScoreReport(
-            hook_density=hook_density,
-            singability=singability,
-            rhyme_tightness=rhyme_tightness,
-            section_completeness=section_completeness,
-            profanity_score=profanity_score,
-            total=total,
-            weights=weights,
-            thresholds=thresholds,
-            explanations=explanations,
-            meets_threshold=meets_threshold,
-            margin=margin,
-            metric_details=metric_details
-        )
+    def _calculate_metrics_in_pool(
+        self,
+        lyrics_batch: List[Dict[str, Any]],
+        blueprint: Blueprint,
+        explicit_allowed: bool,
+        max_workers: int
+    ) -> List[Dict[str, Tuple[float, str, Dict[str, Any]]]]:
+        """Calculate metrics for a batch across worker processes.
 
-        logger.info(
-            "rubric_scorer.score_artifacts_complete",
-            genre=genre,
-            total_score=total,
-            meets_threshold=meets_threshold,
-            margin=margin,
-            hook_density=hook_density,
-            singability=singability,
-            rhyme_tightness=rhyme_tightness,
-            section_completeness=section_completeness,
-            profanity_score=profanity_score
+        Chunks are scored by the shared pool (see _get_batch_pool()); each
+        worker keeps one scorer and scores a chunk with the copy of this
+        scorer's profanity filter sent along with it.
+
+        Args:
+            lyrics_batch: Lyrics dictionaries to score
+            blueprint: Genre blueprint (for section requirements)
+            explicit_allowed: If True, explicit content is allowed
+            max_workers: Number of worker processes
+
+        Returns:
+            Metrics per lyrics dictionary, in input order
+        """
+        # Detached copy of the fields the metrics read, so the ORM
+        # instance (and its session) never has to be pickled
+        rules_only = Blueprint(
+            genre=blueprint.genre,
+            version=blueprint.version,
+            rules=dict(blueprint.rules or {}),
+            eval_rubric=dict(blueprint.eval_rubric or {})
         )
+        chunk_size = -(-len(lyrics_batch) // max_workers)
+        chunks = [
+            (lyrics_batch[i:i + chunk_size], rules_only, explicit_allowed, self.profanity_filter)
+            for i in range(0, len(lyrics_batch), chunk_size)
+        ]
 
-        return report
+        executor = _get_batch_pool(max_workers)
+        try:
+            return [
+                metrics
+                for chunk_metrics in executor.map(_calculate_metrics_chunk, chunks)
+                for metrics in chunk_metrics
+            ]
+        except BrokenProcessPool:
+            # A worker died; the next batch starts a fresh pool
+            _discard_batch_pool(executor)
+            raise
+
+    def _build_reports(
+        self,
+        metrics_batch: List[Dict[str, Tuple[float, str, Dict[str, Any]]]],
+        weights: Dict[str, float],
+        thresholds: Dict[str, float]
+    ) -> List[ScoreReport]:
+        """Combine calculated metrics into score reports.
+
+        Args:
+            metrics_batch: Metrics per candidate (see _calculate_metrics)
+            weights: Metric weights
+            thresholds: Threshold configuration (uses "min_total")
+
+        Returns:
+            One ScoreReport per candidate
+        """
+        columns = [
+            [metrics[name][0] for metrics in metrics_batch]
+            for name in METRIC_NAMES
+        ]
+        totals = _weighted_totals(columns, weights)
+
+        # Check threshold compliance
+        min_total = thresholds.get("min_total", 0.75)
+
+        reports = []
+        for metrics, total in zip(metrics_batch, totals):
+            reports.append(ScoreReport(
+                hook_density=metrics["hook_density"][0],
+                singability=metrics["singability"][0],
+                rhyme_tightness=metrics["rhyme_tightness"][0],
+                section_completeness=metrics["section_completeness"][0],
+                profanity_score=metrics["profanity_score"][0],
+                total=total,
+                weights=dict(weights),
+                thresholds=dict(thresholds),
+                explanations={name: metrics[name][1] for name in METRIC_NAMES},
+                meets_threshold=total >= min_total,
+                margin=total - min_total,
+                metric_details={name: metrics[name][2] for name in METRIC_NAMES}
+            ))
+        return reports
 
     # =========================================================================
     # Threshold Validation
@@ -1786,3 +1931,100 @@ class RubricScorer:
                     })
 
         return sections
+
+
+def _weighted_totals(columns: List[List[float]], weights: Dict[str, float]) -> List[float]:
+    """Weighted total score of each candidate.
+
+    Terms are added in METRIC_NAMES order, so every total is bit-identical
+    to the one score_artifacts() computes for the candidate alone.
+
+    Args:
+        columns: Scores per metric (METRIC_NAMES order), one entry per candidate
+        weights: Metric weights (DEFAULT_METRIC_WEIGHTS for missing metrics)
+
+    Returns:
+        Total per candidate
+    """
+    metric_weights = [weights.get(name, DEFAULT_METRIC_WEIGHTS[name]) for name in METRIC_NAMES]
+
+    if np is not None:
+        scores = np.array(columns, dtype=np.float64)
+        totals = np.zeros(scores.shape[1], dtype=np.float64)
+        for column, weight in zip(scores, metric_weights):
+            totals += column * weight
+        return totals.tolist()
+
+    totals = [0.0] * len(columns[0])
+    for column, weight in zip(columns, metric_weights):
+        totals = [total + score * weight for total, score in zip(totals, column)]
+    return totals
+
+
+# Process pool shared by score_batch() calls: created on first use, grown
+# when a call asks for more workers, shut down by shutdown_batch_pool()
+_batch_pool: Optional[ProcessPoolExecutor] = None
+_batch_pool_size = 0
+_batch_pool_lock = threading.Lock()
+
+# Scorer of a score_batch() worker process, set up by _init_batch_worker()
+_batch_worker_scorer: Optional[RubricScorer] = None
+
+
+def _get_batch_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, with at least ``max_workers`` processes.
+
+    Workers are spawned rather than forked, so they never inherit the
+    parent's threads, locks or open connections.
+    """
+    global _batch_pool, _batch_pool_size
+    with _batch_pool_lock:
+        if _batch_pool is None or _batch_pool_size < max_workers:
+            previous = _batch_pool
+            _batch_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_batch_worker,
+            )
+            _batch_pool_size = max_workers
+            if previous is not None:
+                # Chunks already submitted to the old pool still complete
+                previous.shutdown(wait=False)
+        return _batch_pool
+
+
+def _discard_batch_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget ``pool`` if it is still the shared pool."""
+    global _batch_pool, _batch_pool_size
+    with _batch_pool_lock:
+        if _batch_pool is pool:
+            _batch_pool = None
+            _batch_pool_size = 0
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_batch_pool() -> None:
+    """Shut down the shared score_batch() worker pool (application shutdown)."""
+    global _batch_pool, _batch_pool_size
+    with _batch_pool_lock:
+        pool, _batch_pool, _batch_pool_size = _batch_pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _init_batch_worker() -> None:
+    """Create the worker process's scorer (process pool initializer)."""
+    global _batch_worker_scorer
+    _batch_worker_scorer = RubricScorer(blueprint_service=None)
+
+
+def _calculate_metrics_chunk(
+    chunk: Tuple[List[Dict[str, Any]], Blueprint, bool, ProfanityFilter]
+) -> List[Dict[str, Tuple[float, str, Dict[str, Any]]]]:
+    """Calculate metrics for a chunk of a batch in a worker process."""
+    lyrics_batch, blueprint, explicit_allowed, profanity_filter = chunk
+    _batch_worker_scorer.profanity_filter = profanity_filter
+    return [
+        _batch_worker_scorer._calculate_metrics(lyrics, blueprint, explicit_allowed)
+        for lyrics in lyrics_batch
+    ]
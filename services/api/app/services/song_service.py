@@ -158,7 +158,10 @@ class SongService:
     ) -> Optional[Dict[str, Any]]:
         """Get a song with all its artifacts (style, lyrics, producer notes, prompts).
 
-        Performs eager loading of all related entities for complete song view.
+        The song and its style are read through the repositories'
+        ``get_by_id``, which the request-scoped EntityLoader serves from its
+        identity map; each artifact collection is one guarded query, however
+        many versions the song has.
 
         Args:
             song_id: Song identifier
@@ -166,9 +169,8 @@ class SongService:
         Returns:
             Dictionary with song and all artifacts, or None if song not found
         """
-        # Get the song with eager loading
-        song = await self.song_repo.get_by_id_with_artifacts(song_id)
-        if not song:
+        song = self.song_repo.get_by_id(Song, song_id)
+        if not song or song.deleted_at is not None:
             return None
 
         # Build response dictionary
@@ -182,22 +184,19 @@ class SongService:
 
         # Load style if available
         if song.style_id and self.style_repo:
-            result["style"] = await self.style_repo.get_by_id(song.style_id)
+            result["style"] = self.style_repo.get_by_id(song.style_id)
 
         # Load lyrics if repository available
         if self.lyrics_repo:
-            lyrics_list = await self.lyrics_repo.get_by_song_id(song_id)
-            result["lyrics"] = lyrics_list
+            result["lyrics"] = self.lyrics_repo.get_by_song_id(song_id)
 
         # Load producer notes if repository available
         if self.producer_notes_repo:
-            notes_list = await self.producer_notes_repo.get_by_song_id(song_id)
-            result["producer_notes"] = notes_list
+            result["producer_notes"] = self.producer_notes_repo.get_by_song_id(song_id)
 
         # Load composed prompts if repository available
         if self.composed_prompt_repo:
-            prompts = await self.composed_prompt_repo.get_by_song_id(song_id)
-            result["composed_prompts"] = prompts
+            result["composed_prompts"] = self.composed_prompt_repo.get_by_song_id(song_id)
 
         logger.debug(
             "song.artifacts_loaded",
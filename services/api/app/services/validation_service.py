@@ -7,12 +7,20 @@ tag conflict validation using the ConflictDetector service.
 Extended with rubric scoring integration for VALIDATE and FIX workflow nodes.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Callable, Iterable, List, Tuple, Optional
 from pathlib import Path
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import structlog
 from jsonschema import validate, ValidationError, Draft7Validator
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT7
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
 
 from app.services.conflict_detector import ConflictDetector
 from app.services.policy_guards import (
@@ -25,6 +33,150 @@ from app.services.rubric_scorer import RubricScorer, ScoreReport, ThresholdDecis
 
 logger = structlog.get_logger(__name__)
 
+# Schema name -> file in the /schemas directory
+SCHEMA_FILES = {
+    "sds": "sds.schema.json",
+    "style": "style.schema.json",
+    "lyrics": "lyrics.schema.json",
+    "producer_notes": "producer_notes.schema.json",
+    "composed_prompt": "composed_prompt.schema.json",
+    "blueprint": "blueprint.schema.json",
+    "persona": "persona.schema.json",
+    "source": "source.schema.json",
+}
+
+
+class CompiledSchema:
+    """JSON schema compiled once for repeated validation.
+
+    Holds a Draft7Validator whose $refs, including references between the
+    schemas of the /schemas directory (e.g. "amcs://schemas/style-1.0.json"),
+    are resolved up front. When ``fastjsonschema`` is installed, the schema is
+    also compiled into generated Python code that decides pass/fail; error
+    messages always come from the Draft7Validator.
+
+    Args:
+        schema: Draft-07 schema
+        registry: Registry with the schemas it may reference
+    """
+
+    def __init__(self, schema: Dict[str, Any], registry: Registry):
+        self.schema = schema
+        self.validator = Draft7Validator(schema, registry=registry)
+        self._check = _compile_fast_check(schema, registry)
+
+    def passes_fast_check(self, data: Any) -> bool:
+        """Run the generated validation function.
+
+        Args:
+            data: Data to validate
+
+        Returns:
+            True if the generated function accepts the data; False if it
+            rejects it or is unavailable (the Draft7Validator then decides)
+        """
+        if self._check is None:
+            return False
+        try:
+            self._check(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
+
+    def is_valid(self, data: Any) -> bool:
+        """Check data against the schema, stopping at the first error.
+
+        Args:
+            data: Data to validate
+
+        Returns:
+            True if the data is valid
+        """
+        return self.passes_fast_check(data) or self.validator.is_valid(data)
+
+
+def _schema_registry(schemas: Iterable[Dict[str, Any]]) -> Registry:
+    """Registry of schemas by their $id, crawled so lookups need no resolution."""
+    return Registry().with_resources(
+        (schema["$id"], Resource.from_contents(schema, default_specification=DRAFT7))
+        for schema in schemas
+        if "$id" in schema
+    ).crawl()
+
+
+def _compile_fast_check(schema: Dict[str, Any], registry: Registry) -> Optional[Callable[[Any], Any]]:
+    """Generated validation function, or None if fastjsonschema is unavailable."""
+    if fastjsonschema is None:
+        return None
+
+    try:
+        # No defaults (they would be written into the data) and no format
+        # checks (Draft7Validator runs without a format checker)
+        return fastjsonschema.compile(
+            schema,
+            handlers={"amcs": registry.contents},
+            use_default=False,
+            use_formats=False,
+            detailed_exceptions=False,
+        )
+    except Exception as e:
+        logger.warning(
+            "validation.fast_validator_unavailable",
+            schema_id=schema.get("$id"),
+            error=str(e)
+        )
+        return None
+
+
+@lru_cache(maxsize=4)
+def _load_schema_dir(schema_dir: Path) -> Tuple[Dict[str, Any], Dict[str, CompiledSchema]]:
+    """Load and compile the schemas of a directory once per process.
+
+    Args:
+        schema_dir: Directory containing SCHEMA_FILES
+
+    Returns:
+        Tuple of (schemas, compiled schemas) by schema name; missing or
+        unreadable files are logged and left out
+    """
+    schemas: Dict[str, Any] = {}
+    for schema_key, filename in SCHEMA_FILES.items():
+        schema_path = schema_dir / filename
+        if schema_path.exists():
+            try:
+                with open(schema_path, 'r') as f:
+                    schemas[schema_key] = json.load(f)
+                logger.debug(
+                    "validation.schema_loaded",
+                    schema=schema_key,
+                    path=str(schema_path)
+                )
+            except Exception as e:
+                logger.error(
+                    "validation.schema_load_error",
+                    schema=schema_key,
+                    error=str(e)
+                )
+        else:
+            logger.warning(
+                "validation.schema_not_found",
+                schema=schema_key,
+                path=str(schema_path)
+            )
+
+    registry = _schema_registry(schemas.values())
+    compiled = {
+        schema_key: CompiledSchema(schema, registry)
+        for schema_key, schema in schemas.items()
+    }
+    logger.info(
+        "validation.schemas_compiled",
+        path=str(schema_dir),
+        schema_count=len(compiled),
+        fast_validators=fastjsonschema is not None
+    )
+    return schemas, compiled
+
 
 @dataclass
 class ActionableReport:
@@ -81,13 +233,15 @@ class ValidationService:
         Initializes ConflictDetector for tag validation.
         Initializes policy guards for content validation (profanity, PII, artist references).
         Initializes RubricScorer for rubric-based validation.
-        Schemas are cached in memory for performance.
+        Schemas are loaded and compiled once per process and shared by all
+        instances.
 
         Args:
             blueprint_service: Optional BlueprintService for rubric scoring.
                               If not provided, creates a new instance.
         """
         self.schemas: Dict[str, Any] = {}
+        self._compiled_schemas: Dict[str, CompiledSchema] = {}
         self._load_schemas()
 
         # Initialize conflict detector for tag validation
@@ -144,40 +298,44 @@ class ValidationService:
             )
             return
 
-        schema_files = {
-            "sds": "sds.schema.json",
-            "style": "style.schema.json",
-            "lyrics": "lyrics.schema.json",
-            "producer_notes": "producer_notes.schema.json",
-            "composed_prompt": "composed_prompt.schema.json",
-            "blueprint": "blueprint.schema.json",
-            "persona": "persona.schema.json",
-            "source": "source.schema.json",
-        }
+        schemas, compiled = _load_schema_dir(schema_dir)
+        self.schemas.update(schemas)
+        self._compiled_schemas.update(compiled)
 
-        for schema_key, filename in schema_files.items():
-            schema_path = schema_dir / filename
-            if schema_path.exists():
-                try:
-                    with open(schema_path, 'r') as f:
-                        self.schemas[schema_key] = json.load(f)
-                    logger.debug(
-                        "validation.schema_loaded",
-                        schema=schema_key,
-                        path=str(schema_path)
-                    )
-                except Exception as e:
-                    logger.error(
-                        "validation.schema_load_error",
-                        schema=schema_key,
-                        error=str(e)
-                    )
-            else:
-                logger.warning(
-                    "validation.schema_not_found",
-                    schema=schema_key,
-                    path=str(schema_path)
-                )
+    def _get_compiled_schema(self, schema_name: str) -> CompiledSchema:
+        """Get the compiled form of a loaded schema.
+
+        Args:
+            schema_name: Schema name (key of self.schemas)
+
+        Returns:
+            CompiledSchema, recompiled if the schema was replaced after loading
+        """
+        schema = self.schemas[schema_name]
+        compiled = self._compiled_schemas.get(schema_name)
+        if compiled is None or compiled.schema is not schema:
+            compiled = CompiledSchema(schema, _schema_registry(self.schemas.values()))
+            self._compiled_schemas[schema_name] = compiled
+        return compiled
+
+    def is_valid(self, schema_name: str, data: Dict[str, Any]) -> bool:
+        """Check data against a schema without collecting error messages.
+
+        Stops at the first error, so it is cheaper than the validate_*
+        methods when only pass/fail is needed.
+
+        Args:
+            schema_name: Schema name (e.g. "sds", "style")
+            data: Data to validate
+
+        Returns:
+            True if the data is valid, False if it is invalid or the schema
+            is not loaded
+        """
+        if schema_name not in self.schemas:
+            logger.error("validation.schema_missing", schema=schema_name)
+            return False
+        return self._get_compiled_schema(schema_name).is_valid(data)
 
     def _format_validation_errors(
         self,
@@ -233,8 +391,8 @@ class ValidationService:
             return False, ["SDS schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["sds"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("sds")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -265,8 +423,8 @@ class ValidationService:
             return False, ["Style schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["style"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("style")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -297,8 +455,8 @@ class ValidationService:
             return False, ["Lyrics schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["lyrics"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("lyrics")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -329,8 +487,8 @@ class ValidationService:
             return False, ["ProducerNotes schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["producer_notes"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("producer_notes")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -361,8 +519,8 @@ class ValidationService:
             return False, ["ComposedPrompt schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["composed_prompt"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("composed_prompt")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -393,8 +551,8 @@ class ValidationService:
             return False, ["Blueprint schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["blueprint"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("blueprint")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -425,8 +583,8 @@ class ValidationService:
             return False, ["Persona schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["persona"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("persona")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
@@ -457,8 +615,8 @@ class ValidationService:
             return False, ["Source schema not loaded"]
 
         try:
-            validator = Draft7Validator(self.schemas["source"])
-            errors = self._format_validation_errors(validator, data)
+            compiled = self._get_compiled_schema("source")
+            errors = [] if compiled.passes_fast_check(data) else self._format_validation_errors(compiled.validator, data)
 
             if errors:
                 logger.warning(
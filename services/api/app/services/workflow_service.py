@@ -6,6 +6,7 @@ and managing workflow runs with proper error handling and observability.
 
 from __future__ import annotations
 
+import copy
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
@@ -28,6 +29,7 @@ class WorkflowService:
 
     Provides high-level operations for:
     - Creating and starting workflow runs
+    - Creating and executing batches of runs that differ only in seed
     - Querying run status and outputs
     - Retrying failed runs or nodes
     - Cancelling in-progress runs
@@ -56,12 +58,17 @@ class WorkflowService:
         self.workflow_event_repo = workflow_event_repo
         self.event_publisher = event_publisher or get_event_publisher()
 
+        # Node records share the publisher's write-behind buffer so that a
+        # run's events and executions are flushed in order
+        self.write_behind = getattr(self.event_publisher, "write_behind", None)
+
         # Create orchestrator instance
         self.orchestrator = WorkflowOrchestrator(
             db_session=db,
             event_publisher=self.event_publisher,
             workflow_run_repo=workflow_run_repo,
             node_execution_repo=node_execution_repo,
+            write_behind=self.write_behind,
         )
 
     async def create_run(
@@ -71,6 +78,7 @@ class WorkflowService:
         seed: int,
         tenant_id: Optional[UUID] = None,
         owner_id: Optional[UUID] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None,
     ) -> WorkflowRun:
         """Create a new workflow run.
 
@@ -80,6 +88,8 @@ class WorkflowService:
             seed: Global seed for determinism
             tenant_id: Optional tenant identifier for multi-tenancy
             owner_id: Optional owner identifier for RLS
+            extra_metadata: Additional run metadata (e.g. a pre-compiled
+                ``sds`` or the ``batch_id``)
 
         Returns:
             Created WorkflowRun entity
@@ -92,6 +102,7 @@ class WorkflowService:
             song_id=song_id,
             status="pending",
             extra_metadata={
+                **(extra_metadata or {}),
                 "manifest": manifest,
                 "seed": seed,
             },
@@ -126,6 +137,52 @@ class WorkflowService:
 
         return workflow_run
 
+    def claim_run(self, run_id: UUID) -> bool:
+        """Atomically mark a pending run as queued for execution.
+
+        Of several concurrent requests to execute the same run, exactly one
+        claims it.
+
+        Args:
+            run_id: Workflow run identifier
+
+        Returns:
+            True if the run was pending and is now queued
+        """
+        claimed = self.workflow_run_repo.transition_status(run_id, "pending", "queued")
+        self.db.commit()
+        if claimed:
+            logger.info("workflow_run.claimed", run_id=str(run_id))
+        return claimed
+
+    def start_run(self, run_id: UUID) -> bool:
+        """Atomically mark a queued run as running before it executes.
+
+        Fails for runs cancelled while queued and for runs another worker
+        already started, so a job delivered twice executes once.
+
+        Args:
+            run_id: Workflow run identifier
+
+        Returns:
+            True if the run was queued and is now running
+        """
+        started = self.workflow_run_repo.transition_status(run_id, "queued", "running")
+        self.db.commit()
+        if started:
+            logger.info("workflow_run.started", run_id=str(run_id))
+        return started
+
+    def release_run(self, run_id: UUID) -> None:
+        """Return a queued run to pending when it could not be enqueued.
+
+        Args:
+            run_id: Workflow run identifier
+        """
+        self.workflow_run_repo.transition_status(run_id, "queued", "pending")
+        self.db.commit()
+        logger.info("workflow_run.released", run_id=str(run_id))
+
     async def execute_run(self, run_id: UUID) -> Dict[str, Any]:
         """Execute a workflow run.
 
@@ -195,6 +252,134 @@ class WorkflowService:
 
             raise
 
+        finally:
+            # Persist the closing events before reporting the outcome
+            if self.write_behind is not None:
+                await self.write_behind.flush(run_id)
+
+    async def create_batch(
+        self,
+        song_id: UUID,
+        manifest: Dict[str, Any],
+        seeds: List[int],
+        sds: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[UUID] = None,
+        owner_id: Optional[UUID] = None,
+    ) -> tuple[UUID, List[WorkflowRun]]:
+        """Create one workflow run per seed for the same song and manifest.
+
+        Args:
+            song_id: Song identifier
+            manifest: Workflow manifest shared by every run
+            seeds: Global seed of each run
+            sds: SDS compiled once for the whole batch (passed to PLAN)
+            tenant_id: Optional tenant identifier for multi-tenancy
+            owner_id: Optional owner identifier for RLS
+
+        Returns:
+            Tuple of (batch_id, created runs in seed order)
+        """
+        batch_id = uuid4()
+        extra_metadata: Dict[str, Any] = {"batch_id": str(batch_id)}
+        if sds is not None:
+            extra_metadata["sds"] = sds
+
+        runs = [
+            await self.create_run(
+                song_id=song_id,
+                manifest=manifest,
+                seed=seed,
+                tenant_id=tenant_id,
+                owner_id=owner_id,
+                extra_metadata=copy.deepcopy(extra_metadata),
+            )
+            for seed in seeds
+        ]
+
+        logger.info(
+            "workflow_batch.created",
+            batch_id=str(batch_id),
+            song_id=str(song_id),
+            runs=len(runs),
+            sds_shared=sds is not None,
+        )
+        return batch_id, runs
+
+    async def execute_batch(
+        self,
+        run_ids: List[UUID],
+        max_concurrent_runs: int = 8,
+        max_concurrent_llm_requests: Optional[int] = 10,
+    ) -> Dict[str, Any]:
+        """Execute a batch of workflow runs together.
+
+        Seed-independent work is shared across the runs and their LLM
+        requests go through one concurrency-limited pool (see
+        :meth:`WorkflowOrchestrator.execute_batch`).
+
+        Args:
+            run_ids: Pending workflow runs to execute
+            max_concurrent_runs: Runs executing at the same time
+            max_concurrent_llm_requests: In-flight LLM requests for the batch
+
+        Returns:
+            Dictionary with per-run results (``runs``) and aggregate
+            throughput statistics (``stats``)
+        """
+        logger.info("workflow_batch.execute.start", runs=len(run_ids))
+
+        for run_id in run_ids:
+            await self.event_publisher.publish_event(
+                run_id=run_id,
+                node_name=None,
+                phase="start",
+                data={"message": "Workflow execution started", "batch": True},
+                db_session=self.db,
+            )
+
+        try:
+            result = await self.orchestrator.execute_batch(
+                run_ids,
+                max_concurrent_runs=max_concurrent_runs,
+                max_concurrent_llm_requests=max_concurrent_llm_requests,
+            )
+
+            for run_result in result["runs"]:
+                if run_result["status"] == "completed":
+                    phase = "end"
+                    data = {
+                        "message": "Workflow execution completed",
+                        "duration_ms": run_result.get("duration_ms"),
+                        "fix_iterations": run_result.get("fix_iterations"),
+                    }
+                else:
+                    phase = "fail"
+                    data = {
+                        "message": "Workflow execution failed",
+                        "error": run_result.get("error"),
+                    }
+                await self.event_publisher.publish_event(
+                    run_id=run_result["run_id"],
+                    node_name=None,
+                    phase=phase,
+                    data=data,
+                    db_session=self.db,
+                )
+
+            logger.info(
+                "workflow_batch.execute.completed",
+                runs=len(run_ids),
+                completed=result["stats"]["completed"],
+                failed=result["stats"]["failed"],
+                duration_ms=result["stats"]["duration_ms"],
+            )
+            return result
+
+        finally:
+            if self.write_behind is not None:
+                for run_id in run_ids:
+                    await self.write_behind.flush(run_id)
+
     async def get_run_status(self, run_id: UUID) -> Optional[Dict[str, Any]]:
         """Get the current status and outputs of a workflow run.
 
@@ -249,7 +434,7 @@ class WorkflowService:
             True if cancelled, False if not found or already completed
         """
         run = self.workflow_run_repo.get_by_run_id(run_id)
-        if not run or run.status not in ["pending", "running"]:
+        if not run or run.status not in ["pending", "queued", "running"]:
             return False
 
         # Update status to cancelled
@@ -273,11 +458,17 @@ class WorkflowService:
 
         return True
 
-    async def retry_run(self, run_id: UUID) -> UUID:
+    async def retry_run(self, run_id: UUID, resume: bool = False) -> UUID:
         """Retry a failed workflow run by creating a new run with the same manifest.
 
+        With ``resume=True`` the new run restores the outputs of nodes that
+        completed in the failed run (after verifying their persisted hashes)
+        and restarts at the first failed node instead of PLAN.
+
         Args:
             run_id: Failed workflow run identifier
+            resume: Resume from the first failed node instead of re-running
+                the whole graph
 
         Returns:
             New run_id for the retry
@@ -304,10 +495,19 @@ class WorkflowService:
             owner_id=original_run.owner_id,
         )
 
+        if resume:
+            # The orchestrator restores completed nodes from this run
+            new_run.extra_metadata = {
+                **new_run.extra_metadata,
+                "resume_from_run_id": str(run_id),
+            }
+            self.db.commit()
+
         logger.info(
             "workflow_run.retried",
             original_run_id=str(run_id),
             new_run_id=str(new_run.run_id),
+            resume=resume,
         )
 
         return new_run.run_id
@@ -455,6 +455,7 @@ def _enforce_character_limits(
 @workflow_skill(
     name="amcs.compose.generate",
     deterministic=True,
+    cacheable=True,
 )
 async def compose_prompt(
     inputs: Dict[str, Any], context: WorkflowContext
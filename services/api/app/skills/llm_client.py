@@ -2,43 +2,370 @@
 
 Provides a simple wrapper around Anthropic's Claude API for deterministic
 text generation with seed control.
+
+Requests go through a pluggable async transport so that a completion never
+blocks the event loop:
+
+- ``AnthropicTransport``: ``AsyncAnthropic`` over a bounded httpx connection
+  pool, with a concurrency cap and per-call timeouts
+- ``StubTransport``: offline, deterministic provider for local runs and
+  benchmarks (``LLM_PROVIDER=stub``)
+
+Batch execution routes every request of its runs through a shared
+:class:`LLMRequestPool` (see :func:`use_request_pool`), which caps the batch's
+in-flight requests and coalesces identical concurrent requests.
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
 import os
-from typing import Any, Dict, Optional
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
 
 import structlog
 
+from app.core.config import LLMSettings, settings
+
 logger = structlog.get_logger(__name__)
 
 # Lazy import to allow tests to mock
 _anthropic_client = None
 
 
-def _get_anthropic_client():
-    """Get or create Anthropic client."""
+def _get_anthropic_client(llm_settings: Optional[LLMSettings] = None):
+    """Get or create the shared async Anthropic client with a bounded pool."""
     global _anthropic_client
     if _anthropic_client is None:
-        from anthropic import Anthropic
-        _anthropic_client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        _anthropic_client = _create_anthropic_client(
+            api_key=os.environ.get("ANTHROPIC_API_KEY"),
+            llm_settings=llm_settings or settings.LLM,
+        )
     return _anthropic_client
 
 
+def _create_anthropic_client(api_key: Optional[str], llm_settings: LLMSettings):
+    """Create an ``AsyncAnthropic`` client backed by a bounded httpx pool."""
+    import httpx
+    from anthropic import AsyncAnthropic
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=llm_settings.MAX_CONNECTIONS,
+            max_keepalive_connections=llm_settings.MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(
+            llm_settings.REQUEST_TIMEOUT, connect=llm_settings.CONNECT_TIMEOUT
+        ),
+    )
+    return AsyncAnthropic(
+        api_key=api_key,
+        http_client=http_client,
+        max_retries=llm_settings.MAX_RETRIES,
+    )
+
+
+class LLMTimeoutError(Exception):
+    """Raised when an LLM request exceeds its per-call timeout."""
+
+    pass
+
+
+@dataclass
+class LLMResponse:
+    """Text completion returned by an LLM transport.
+
+    Attributes:
+        text: Generated text
+        usage: Token usage reported by the provider
+    """
+
+    text: str
+    usage: Dict[str, Any] = field(default_factory=dict)
+
+
+class LLMTransport(ABC):
+    """Abstract async transport for LLM completion requests.
+
+    Implementations must never block the event loop and must release any
+    pooled resources when the awaiting task is cancelled.
+    """
+
+    @abstractmethod
+    async def create_message(
+        self, params: Dict[str, Any], timeout: float
+    ) -> LLMResponse:
+        """Send a Messages API request.
+
+        Args:
+            params: Anthropic Messages API parameters
+            timeout: Per-call timeout in seconds
+
+        Returns:
+            LLMResponse with generated text and usage
+
+        Raises:
+            LLMTimeoutError: If the call exceeds ``timeout``
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release pooled connections held by the transport."""
+        return None
+
+
+class AnthropicTransport(LLMTransport):
+    """Non-blocking transport over ``AsyncAnthropic``.
+
+    In-flight requests are capped by a semaphore (LLM_MAX_CONCURRENT_REQUESTS)
+    so that excess callers queue in the event loop instead of piling up
+    inside the httpx pool.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        llm_settings: Optional[LLMSettings] = None,
+        client: Optional[Any] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            api_key: Anthropic API key (defaults to the shared client using
+                the ANTHROPIC_API_KEY env var)
+            llm_settings: Pool, concurrency and timeout settings
+            client: Pre-built async client (mainly for tests)
+        """
+        self.settings = llm_settings or settings.LLM
+        self._api_key = api_key
+        self._client = client
+        self._owns_client = False
+        self._semaphore = asyncio.Semaphore(self.settings.MAX_CONCURRENT_REQUESTS)
+
+    @property
+    def client(self) -> Any:
+        """Lazily created async Anthropic client."""
+        if self._client is None:
+            if self._api_key:
+                self._client = _create_anthropic_client(self._api_key, self.settings)
+                self._owns_client = True
+            else:
+                self._client = _get_anthropic_client(self.settings)
+        return self._client
+
+    async def create_message(
+        self, params: Dict[str, Any], timeout: float
+    ) -> LLMResponse:
+        async with self._semaphore:
+            try:
+                async with asyncio.timeout(timeout):
+                    response = await self.client.messages.create(
+                        **params, timeout=timeout
+                    )
+            except TimeoutError as e:
+                raise LLMTimeoutError(
+                    f"LLM request timed out after {timeout:.1f}s"
+                ) from e
+
+        return LLMResponse(
+            text=response.content[0].text,
+            usage=response.usage.model_dump() if response.usage else {},
+        )
+
+    async def aclose(self) -> None:
+        # The shared client is closed by close_llm_client()
+        if self._client is not None and self._owns_client:
+            await self._client.close()
+        self._client = None
+        self._owns_client = False
+
+
+class StubTransport(LLMTransport):
+    """Offline deterministic provider for local runs and benchmarks.
+
+    Returns lyric-like lines derived from a hash of the request, so the same
+    prompt and seed always produce the same text. Simulated latency uses
+    ``asyncio.sleep`` and therefore never blocks the event loop.
+    """
+
+    _WORDS = (
+        "light", "night", "heart", "start", "fire", "higher",
+        "road", "home", "alone", "glow", "rain", "again",
+    )
+
+    def __init__(self, latency_ms: Optional[int] = None, lines: int = 4):
+        """Initialize the stub transport.
+
+        Args:
+            latency_ms: Simulated per-call latency (defaults to
+                LLM_STUB_LATENCY_MS)
+            lines: Number of lines to return per completion
+        """
+        self.latency_ms = (
+            settings.LLM.STUB_LATENCY_MS if latency_ms is None else latency_ms
+        )
+        self.lines = lines
+        self.calls = 0
+
+    async def create_message(
+        self, params: Dict[str, Any], timeout: float
+    ) -> LLMResponse:
+        self.calls += 1
+        try:
+            async with asyncio.timeout(timeout):
+                if self.latency_ms:
+                    await asyncio.sleep(self.latency_ms / 1000)
+        except TimeoutError as e:
+            raise LLMTimeoutError(
+                f"LLM request timed out after {timeout:.1f}s"
+            ) from e
+
+        digest = hashlib.sha256(
+            f"{params.get('system')}|{params['messages']}|{params.get('seed')}".encode()
+        ).digest()
+        lines = []
+        for i in range(self.lines):
+            word = self._WORDS[digest[i] % len(self._WORDS)]
+            lines.append(f"Line {i + 1} carries us into the {word}")
+        text = "\n".join(lines)
+        return LLMResponse(
+            text=text,
+            usage={"input_tokens": 0, "output_tokens": len(text.split())},
+        )
+
+
+def create_transport(llm_settings: Optional[LLMSettings] = None) -> LLMTransport:
+    """Create the transport selected by ``LLM_PROVIDER``."""
+    llm_settings = llm_settings or settings.LLM
+    if llm_settings.PROVIDER == "stub":
+        return StubTransport(latency_ms=llm_settings.STUB_LATENCY_MS)
+    return AnthropicTransport(llm_settings=llm_settings)
+
+
+class LLMRequestPool:
+    """Concurrency-limited pool shared by the LLM requests of several runs.
+
+    At most ``max_concurrent`` requests are sent at once. A request identical
+    to one already in flight (same model, prompts, sampling parameters and
+    seed) awaits that request's response instead of being sent again.
+    """
+
+    def __init__(self, max_concurrent: int = 10):
+        """Initialize the pool.
+
+        Args:
+            max_concurrent: Maximum in-flight requests
+        """
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._active = 0
+        self.requests = 0
+        self.coalesced = 0
+        self.peak_concurrency = 0
+
+    @staticmethod
+    def request_key(params: Dict[str, Any]) -> str:
+        """Key identifying interchangeable requests."""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def submit(
+        self, key: str, send: Callable[[], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """Send a request through the pool, coalescing identical requests.
+
+        Args:
+            key: Request key (see :meth:`request_key`)
+            send: Coroutine function that sends the request
+
+        Returns:
+            The (possibly shared) response
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            logger.debug("llm.pool.coalesced", key=key[:16])
+        else:
+            future = asyncio.ensure_future(self._send(send))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # One cancelled waiter must not cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def _send(self, send: Callable[[], Awaitable[LLMResponse]]) -> LLMResponse:
+        async with self._semaphore:
+            self.requests += 1
+            self._active += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._active)
+            try:
+                return await send()
+            finally:
+                self._active -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Request counters for throughput reporting."""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "max_concurrent": self.max_concurrent,
+            "peak_concurrency": self.peak_concurrency,
+        }
+
+
+_request_pool: ContextVar[Optional[LLMRequestPool]] = ContextVar(
+    "llm_request_pool", default=None
+)
+
+
+@contextmanager
+def use_request_pool(pool: LLMRequestPool) -> Iterator[LLMRequestPool]:
+    """Route LLM requests made in this context (and tasks it spawns) through a pool.
+
+    Args:
+        pool: Pool to use
+
+    Yields:
+        The pool
+    """
+    token = _request_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _request_pool.reset(token)
+
+
 class LLMClient:
     """Client for deterministic LLM generation."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        transport: Optional[LLMTransport] = None,
+        llm_settings: Optional[LLMSettings] = None,
+    ):
         """Initialize LLM client.
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            transport: Explicit transport (defaults to ``LLM_PROVIDER``)
+            llm_settings: Transport settings (defaults to ``settings.LLM``)
         """
-        if api_key:
-            from anthropic import Anthropic
-            self.client = Anthropic(api_key=api_key)
+        self.settings = llm_settings or settings.LLM
+        if transport is not None:
+            self.transport = transport
+        elif api_key:
+            self.transport = AnthropicTransport(
+                api_key=api_key, llm_settings=self.settings
+            )
         else:
-            self.client = None  # Will be lazy-loaded
-        self.model = "claude-sonnet-4-5-20250929"  # Latest Sonnet model
+            self.transport = create_transport(self.settings)
+        self.model = self.settings.MODEL
 
     async def generate(
         self,
@@ -48,6 +375,7 @@ class LLMClient:
         top_p: float = 0.9,
         max_tokens: int = 4000,
         seed: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> str:
         """Generate text with deterministic parameters.
 
@@ -58,15 +386,17 @@ class LLMClient:
             top_p: Nucleus sampling parameter
             max_tokens: Maximum tokens to generate
             seed: Random seed for determinism
+            timeout: Per-call timeout in seconds (defaults to
+                LLM_REQUEST_TIMEOUT)
 
         Returns:
             Generated text string
+
+        Raises:
+            LLMTimeoutError: If the request exceeds its timeout
+            asyncio.CancelledError: If the awaiting task is cancelled
         """
         try:
-            # Lazy-load client if not provided
-            if self.client is None:
-                self.client = _get_anthropic_client()
-
             # Build request params
             params: Dict[str, Any] = {
                 "model": self.model,
@@ -91,19 +421,31 @@ class LLMClient:
                 prompt_length=len(user_prompt),
             )
 
-            # Make synchronous API call (Anthropic SDK is sync)
-            response = self.client.messages.create(**params)
-
-            # Extract text from response
-            text = response.content[0].text
+            call_timeout = (
+                timeout if timeout is not None else self.settings.REQUEST_TIMEOUT
+            )
+            pool = _request_pool.get()
+            if pool is None:
+                response = await self.transport.create_message(
+                    params, timeout=call_timeout
+                )
+            else:
+                response = await pool.submit(
+                    LLMRequestPool.request_key(params),
+                    lambda: self.transport.create_message(params, timeout=call_timeout),
+                )
 
             logger.info(
                 "llm.generate.response",
-                response_length=len(text),
-                usage=response.usage.model_dump() if response.usage else {},
+                response_length=len(response.text),
+                usage=response.usage,
             )
 
-            return text
+            return response.text
+
+        except asyncio.CancelledError:
+            logger.info("llm.generate.cancelled", model=self.model, seed=seed)
+            raise
 
         except Exception as e:
             logger.error(
@@ -113,6 +455,10 @@ class LLMClient:
             )
             raise
 
+    async def aclose(self) -> None:
+        """Close the underlying transport and its connection pool."""
+        await self.transport.aclose()
+
 
 # Global client instance
 _llm_client: Optional[LLMClient] = None
@@ -124,3 +470,14 @@ def get_llm_client() -> LLMClient:
     if _llm_client is None:
         _llm_client = LLMClient()
     return _llm_client
+
+
+async def close_llm_client() -> None:
+    """Close the global LLM client, releasing pooled connections."""
+    global _llm_client, _anthropic_client
+    if _llm_client is not None:
+        await _llm_client.aclose()
+        _llm_client = None
+    if _anthropic_client is not None:
+        await _anthropic_client.close()
+        _anthropic_client = None
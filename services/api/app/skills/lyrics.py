@@ -7,18 +7,21 @@ hash-pinned retrieval.
 Contract: .claude/skills/workflow/lyrics/SKILL.md
 """
 
+import asyncio
 import hashlib
 import re
 from typing import Any, Dict, List, Optional
 
 import structlog
 
+from app.core.config import settings
 from app.services.mcp_client_service import (
     get_mcp_client_service,
     MCPServerNotFoundError,
     MCPToolNotSupportedError,
     MCPConnectionError,
 )
+from app.services.lyrics_analysis import analyze_line, words_rhyme
 from app.skills.llm_client import get_llm_client
 from app.workflows.skill import WorkflowContext, compute_hash, workflow_skill
 
@@ -84,7 +87,6 @@ ARTIST_INFLUENCE_MAP = {
     "default": "modern musical influences",
 }
 
-
 def _filter_profanity(text: str, explicit: bool) -> tuple[str, List[str]]:
     """Filter profanity from text if not explicit.
 
@@ -322,10 +324,7 @@ def apply_policy_guards(
 
 
 def _words_rhyme(word1: str, word2: str) -> bool:
-    """Check if two words rhyme using suffix matching.
-
-    For MVP, use simple 2-3 character suffix matching.
-    TODO: Integrate phonetic library (pronouncing, pyphonetic) for better accuracy
+    """Check if two words rhyme by their phonetic rhyming parts.
 
     Args:
         word1: First word
@@ -342,25 +341,7 @@ def _words_rhyme(word1: str, word2: str) -> bool:
         >>> _words_rhyme("cat", "cat")
         False  # Same word is not a rhyme
     """
-    # Normalize - remove punctuation and convert to lowercase
-    w1 = re.sub(r"[^\w]", "", word1.lower())
-    w2 = re.sub(r"[^\w]", "", word2.lower())
-
-    # Empty words don't rhyme
-    if not w1 or not w2:
-        return False
-
-    # Same word is not a rhyme
-    if w1 == w2:
-        return False
-
-    # Check 3-char suffix first (stronger rhyme), then 2-char
-    if len(w1) >= 3 and len(w2) >= 3 and w1[-3:] == w2[-3:]:
-        return True
-    if len(w1) >= 2 and len(w2) >= 2 and w1[-2:] == w2[-2:]:
-        return True
-
-    return False
+    return words_rhyme(word1, word2)
 
 
 def _parse_rhyme_scheme(scheme: str) -> List[tuple[int, int]]:
@@ -551,23 +532,7 @@ def _count_syllables(line: str) -> int:
     Simple heuristic: count vowel groups.
     This is a rough approximation for MVP.
     """
-    # Remove punctuation
-    line = re.sub(r"[^\w\s]", "", line.lower())
-
-    # Count vowel groups
-    vowels = "aeiouy"
-    syllable_count = 0
-    previous_was_vowel = False
-
-    for char in line:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
-
-    # Minimum 1 syllable per word
-    word_count = len(line.split())
-    return max(syllable_count, word_count)
+    return analyze_line(line).vowel_group_syllables
 
 
 def _calculate_rhyme_tightness(lyrics: str, rhyme_scheme: str) -> float:
@@ -580,8 +545,7 @@ def _calculate_rhyme_tightness(lyrics: str, rhyme_scheme: str) -> float:
     Returns:
         Score from 0.0 to 1.0
     """
-    # Simple implementation for MVP: just check if there are repeated end sounds
-    # TODO: Implement proper phonetic rhyme checking
+    # Simple implementation for MVP: check consecutive lines for matching end sounds
 
     sections = lyrics.split("\n\n")
     total_expected_rhymes = 0
@@ -593,19 +557,17 @@ def _calculate_rhyme_tightness(lyrics: str, rhyme_scheme: str) -> float:
         if len(lines) < 2:
             continue
 
-        # Extract last words
+        # Extract last words (without punctuation)
         last_words = []
         for line in lines:
-            words = line.split()
-            if words:
-                # Get last word without punctuation
-                last_word = re.sub(r"[^\w]", "", words[-1].lower())
-                last_words.append(last_word)
+            spans = analyze_line(line).spans
+            if spans:
+                last_words.append(spans[-1])
 
-        # Check for simple rhymes (last 2-3 characters match)
+        # Check for rhymes (same rhyming part)
         for i in range(len(last_words) - 1):
             total_expected_rhymes += 1
-            if last_words[i][-2:] == last_words[i + 1][-2:]:
+            if last_words[i].rhyme_key == last_words[i + 1].rhyme_key:
                 matching_rhymes += 1
 
     if total_expected_rhymes == 0:
@@ -1062,6 +1024,237 @@ async def retrieve_from_mcp_sources(
     return final_citations, chunk_hashes
 
 
+def _build_section_prompts(
+    section: str,
+    sds_lyrics: Dict[str, Any],
+    style: Dict[str, Any],
+    source_context: str,
+) -> tuple[str, str]:
+    """Build the system and user prompts for a single section.
+
+    Args:
+        section: Section name (e.g., "Verse", "Chorus")
+        sds_lyrics: Lyrics entity from SDS
+        style: Musical style for thematic alignment
+        source_context: Retrieved source material block (may be empty)
+
+    Returns:
+        Tuple of (system_prompt, user_prompt)
+    """
+    # Get section requirements
+    section_requirements = sds_lyrics["constraints"].get("section_requirements", {})
+    section_req = section_requirements.get(section, {})
+    min_lines = section_req.get("min_lines", 4)
+    max_lines = section_req.get("max_lines", 8)
+    must_end_with_hook = section_req.get("must_end_with_hook", False)
+
+    # Build system prompt
+    system_prompt = f"""You are a professional songwriter creating lyrics for a {style['genre_detail']['primary']} song.
+
+Generate lyrics for the {section} section following these requirements:
+- Rhyme scheme: {sds_lyrics.get('rhyme_scheme', 'AABB')}
+- Syllables per line: {sds_lyrics.get('syllables_per_line', 8)} (±2)
+- Point of view: {sds_lyrics.get('pov', '1st')}
+- Tense: {sds_lyrics.get('tense', 'present')}
+- Themes: {', '.join(sds_lyrics.get('themes', ['general']))}
+- Mood: {', '.join(style['mood'])}
+- Lines: {min_lines} to {max_lines}
+{"- MUST end with a memorable hook line" if must_end_with_hook else ""}
+
+Output ONLY the lyrics lines, no section headers or explanations."""
+
+    # Build user prompt
+    user_prompt = f"""Create lyrics for the {section} section.
+
+Song context:
+- Title: (from SDS)
+- Style: {style['genre_detail']['primary']}
+- Energy: {style.get('energy', 'medium')}
+- Themes: {', '.join(sds_lyrics.get('themes', []))}
+{source_context if source_context else ""}
+
+Generate {min_lines} to {max_lines} lines now."""
+
+    return system_prompt, user_prompt
+
+
+def _postprocess_section(
+    section: str,
+    section_idx: int,
+    section_lyrics: str,
+    sds_lyrics: Dict[str, Any],
+    style: Dict[str, Any],
+    section_seed: int,
+) -> tuple[str, List[Dict[str, Any]]]:
+    """Run the per-section pipeline stage: policy guards, then rhyme scheme.
+
+    Args:
+        section: Section name
+        section_idx: Position of the section in the plan
+        section_lyrics: Raw LLM output for the section
+        sds_lyrics: Lyrics entity from SDS
+        style: Musical style
+        section_seed: Deterministic seed for this section
+
+    Returns:
+        Tuple of (formatted_section, issues)
+    """
+    section_issues: List[Dict[str, Any]] = []
+
+    # Apply comprehensive policy guards (profanity, PII, artist normalization)
+    policy_constraints = {
+        "explicit": sds_lyrics["constraints"].get("explicit", False),
+        "language": sds_lyrics.get("language", "en"),
+        "allow_living_artists": sds_lyrics["constraints"].get(
+            "allow_living_artists", False
+        ),
+        "genre": style.get("genre_detail", {}).get("primary", "default"),
+    }
+
+    policy_cleaned_lyrics, policy_violations, policy_warnings = apply_policy_guards(
+        text=section_lyrics,
+        constraints=policy_constraints,
+    )
+
+    # Track policy violations for reporting
+    if policy_violations:
+        for violation in policy_violations:
+            section_issues.append(
+                {
+                    "section": section,
+                    "section_idx": section_idx,
+                    "issue_type": "policy_violation",
+                    "violation_type": violation["type"],
+                    "details": violation,
+                }
+            )
+
+        logger.warning(
+            "lyrics.policy.violations",
+            section=section,
+            violations=policy_violations,
+            warnings=policy_warnings,
+        )
+
+    # Apply rhyme scheme enforcement if specified
+    rhyme_scheme = sds_lyrics.get("rhyme_scheme", "AABB")
+    syllables_per_line = sds_lyrics.get("syllables_per_line", 8)
+
+    adjusted_lyrics, rhyme_issues = apply_rhyme_scheme(
+        text=policy_cleaned_lyrics,
+        rhyme_scheme=rhyme_scheme,
+        syllables_per_line=syllables_per_line,
+        seed=section_seed,
+    )
+
+    # Track issues for validation phase
+    if rhyme_issues:
+        # Add section context to issues
+        for issue in rhyme_issues:
+            issue["section"] = section
+            issue["section_idx"] = section_idx
+        section_issues.extend(rhyme_issues)
+
+        logger.info(
+            "lyrics.rhyme_scheme.issues",
+            section=section,
+            num_issues=len(rhyme_issues),
+            issue_types={
+                issue_type: len([i for i in rhyme_issues if i["issue_type"] == issue_type])
+                for issue_type in ["weak_rhyme", "syllable_mismatch"]
+            },
+        )
+
+    # Use adjusted lyrics if improvements were made (for now, always use original)
+    # In future, could selectively apply fixes based on issue severity
+    section_text = adjusted_lyrics
+
+    # Format section
+    formatted_section = f"[{section}]\n{section_text.strip()}"
+    return formatted_section, section_issues
+
+
+async def _generate_sections(
+    section_order: List[str],
+    sds_lyrics: Dict[str, Any],
+    style: Dict[str, Any],
+    source_context: str,
+    seed: int,
+    max_concurrent: int = 1,
+) -> List[tuple[str, List[Dict[str, Any]]]]:
+    """Generate and post-process every section, at most ``max_concurrent`` at once.
+
+    Each section uses its own seed (``seed + 2 + section_idx``) and is
+    post-processed as soon as its LLM call returns. Results are returned in
+    plan order regardless of completion order, so the stitched lyrics are
+    identical to sequential generation.
+
+    Args:
+        section_order: Sections from the plan, in order
+        sds_lyrics: Lyrics entity from SDS
+        style: Musical style
+        source_context: Retrieved source material block (may be empty)
+        seed: Node seed from the workflow context
+        max_concurrent: Maximum in-flight section generations (1 = sequential)
+
+    Returns:
+        List of (formatted_section, issues) tuples in plan order
+    """
+    llm_client = get_llm_client()
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: List[Optional[tuple[str, List[Dict[str, Any]]]]] = [None] * len(
+        section_order
+    )
+
+    async def generate_section(section_idx: int, section: str) -> None:
+        async with semaphore:
+            logger.info(
+                "lyrics.section.generate",
+                section=section,
+                section_index=section_idx,
+            )
+            system_prompt, user_prompt = _build_section_prompts(
+                section, sds_lyrics, style, source_context
+            )
+
+            # Generate with LLM
+            section_seed = seed + 2 + section_idx
+            section_lyrics = await llm_client.generate(
+                system=system_prompt,
+                user_prompt=user_prompt,
+                temperature=0.3,
+                top_p=0.85,
+                max_tokens=500,
+                seed=section_seed,
+            )
+
+        results[section_idx] = _postprocess_section(
+            section=section,
+            section_idx=section_idx,
+            section_lyrics=section_lyrics,
+            sds_lyrics=sds_lyrics,
+            style=style,
+            section_seed=section_seed,
+        )
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            for section_idx, section in enumerate(section_order):
+                task_group.create_task(generate_section(section_idx, section))
+    except ExceptionGroup as group:
+        # Surface the first section failure itself rather than the group
+        # wrapper, logging the others so they are not lost
+        for error in group.exceptions[1:]:
+            logger.error(
+                "lyrics.section.failed",
+                error=str(error),
+                error_type=type(error).__name__,
+            )
+        raise group.exceptions[0]
+
+    return results
+
+
 @workflow_skill(
     name="amcs.lyrics.generate",
     deterministic=True,
@@ -1151,135 +1344,25 @@ async def generate_lyrics(
             citations = []
             citation_hashes = []
 
-    # Step 2: Generate section-by-section
+    # Step 2: Generate sections (concurrently, up to
+    # WORKFLOW_LYRICS_MAX_CONCURRENT_SECTIONS) and reassemble them in plan
+    # order so the output hash is unchanged
     section_order = plan["section_order"]
+    max_concurrent_sections = max(1, settings.WORKFLOW.LYRICS_MAX_CONCURRENT_SECTIONS)
+    section_results = await _generate_sections(
+        section_order=section_order,
+        sds_lyrics=sds_lyrics,
+        style=style,
+        source_context=source_context,
+        seed=context.seed,
+        max_concurrent=max_concurrent_sections,
+    )
+
     all_sections = []
     all_issues = []  # Track rhyme/syllable issues across all sections
-    llm_client = get_llm_client()
-
-    for section_idx, section in enumerate(section_order):
-        logger.info(
-            "lyrics.section.generate",
-            section=section,
-            section_index=section_idx,
-        )
-
-        # Get section requirements
-        section_requirements = sds_lyrics["constraints"].get("section_requirements", {})
-        section_req = section_requirements.get(section, {})
-        min_lines = section_req.get("min_lines", 4)
-        max_lines = section_req.get("max_lines", 8)
-        must_end_with_hook = section_req.get("must_end_with_hook", False)
-
-        # Build system prompt
-        system_prompt = f"""You are a professional songwriter creating lyrics for a {style['genre_detail']['primary']} song.
-
-Generate lyrics for the {section} section following these requirements:
-- Rhyme scheme: {sds_lyrics.get('rhyme_scheme', 'AABB')}
-- Syllables per line: {sds_lyrics.get('syllables_per_line', 8)} (±2)
-- Point of view: {sds_lyrics.get('pov', '1st')}
-- Tense: {sds_lyrics.get('tense', 'present')}
-- Themes: {', '.join(sds_lyrics.get('themes', ['general']))}
-- Mood: {', '.join(style['mood'])}
-- Lines: {min_lines} to {max_lines}
-{"- MUST end with a memorable hook line" if must_end_with_hook else ""}
-
-Output ONLY the lyrics lines, no section headers or explanations."""
-
-        # Build user prompt
-        user_prompt = f"""Create lyrics for the {section} section.
-
-Song context:
-- Title: (from SDS)
-- Style: {style['genre_detail']['primary']}
-- Energy: {style.get('energy', 'medium')}
-- Themes: {', '.join(sds_lyrics.get('themes', []))}
-{source_context if source_context else ""}
-
-Generate {min_lines} to {max_lines} lines now."""
-
-        # Generate with LLM
-        section_seed = context.seed + 2 + section_idx
-        section_lyrics = await llm_client.generate(
-            system=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.3,
-            top_p=0.85,
-            max_tokens=500,
-            seed=section_seed,
-        )
-
-        # Apply comprehensive policy guards (profanity, PII, artist normalization)
-        policy_constraints = {
-            "explicit": sds_lyrics["constraints"].get("explicit", False),
-            "language": sds_lyrics.get("language", "en"),
-            "allow_living_artists": sds_lyrics["constraints"].get(
-                "allow_living_artists", False
-            ),
-            "genre": style.get("genre_detail", {}).get("primary", "default"),
-        }
-
-        policy_cleaned_lyrics, policy_violations, policy_warnings = apply_policy_guards(
-            text=section_lyrics,
-            constraints=policy_constraints,
-        )
-
-        # Track policy violations for reporting
-        if policy_violations:
-            for violation in policy_violations:
-                all_issues.append(
-                    {
-                        "section": section,
-                        "section_idx": section_idx,
-                        "issue_type": "policy_violation",
-                        "violation_type": violation["type"],
-                        "details": violation,
-                    }
-                )
-
-            logger.warning(
-                "lyrics.policy.violations",
-                section=section,
-                violations=policy_violations,
-                warnings=policy_warnings,
-            )
-
-        # Apply rhyme scheme enforcement if specified
-        rhyme_scheme = sds_lyrics.get("rhyme_scheme", "AABB")
-        syllables_per_line = sds_lyrics.get("syllables_per_line", 8)
-
-        adjusted_lyrics, rhyme_issues = apply_rhyme_scheme(
-            text=policy_cleaned_lyrics,
-            rhyme_scheme=rhyme_scheme,
-            syllables_per_line=syllables_per_line,
-            seed=section_seed,
-        )
-
-        # Track issues for validation phase
-        if rhyme_issues:
-            # Add section context to issues
-            for issue in rhyme_issues:
-                issue["section"] = section
-                issue["section_idx"] = section_idx
-            all_issues.extend(rhyme_issues)
-
-            logger.info(
-                "lyrics.rhyme_scheme.issues",
-                section=section,
-                num_issues=len(rhyme_issues),
-                issue_types={
-                    issue_type: len([i for i in rhyme_issues if i["issue_type"] == issue_type])
-                    for issue_type in ["weak_rhyme", "syllable_mismatch"]
-                },
-            )
-
-        # Use adjusted lyrics if improvements were made (for now, always use original)
-        # In future, could selectively apply fixes based on issue severity
-        section_text = adjusted_lyrics
-
-        # Format section
-        formatted_section = f"[{section}]\n{section_text.strip()}"
+    for formatted_section, section_issues in section_results:
         all_sections.append(formatted_section)
+        all_issues.extend(section_issues)
 
     # Step 3: Combine all sections
     complete_lyrics = "\n\n".join(all_sections)
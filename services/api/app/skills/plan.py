@@ -7,7 +7,7 @@ metrics, and produces ordered work objectives.
 Contract: .claude/skills/workflow/plan/SKILL.md
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 import structlog
@@ -67,9 +67,34 @@ def _load_blueprint(genre: str, context: WorkflowContext):
         return None
 
 
+def _blueprint_cache_key(genre: str, context: WorkflowContext) -> Optional[Dict[str, Any]]:
+    """Fingerprint the blueprint PLAN loads, for the skill result cache key.
+
+    Args:
+        genre: Genre name used to load the blueprint
+        context: Workflow context with database session
+
+    Returns:
+        Blueprint id, version and last update time, or None if not found
+    """
+    blueprint = _load_blueprint(genre, context)
+    if blueprint is None:
+        return None
+    return {
+        "id": str(blueprint.id),
+        "version": blueprint.version,
+        "updated_at": str(blueprint.updated_at),
+    }
+
+
 @workflow_skill(
     name="amcs.plan.generate",
     deterministic=True,
+    cacheable=True,
+    seed_sensitive=False,
+    cache_key_extra=lambda inputs, context: _blueprint_cache_key(
+        inputs["sds"]["blueprint_ref"].get("genre", "pop"), context
+    ),
 )
 async def generate_plan(inputs: Dict[str, Any], context: WorkflowContext) -> Dict[str, Any]:
     """Generate execution plan from SDS.
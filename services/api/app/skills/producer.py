@@ -273,6 +273,7 @@ def _place_hooks(
 @workflow_skill(
     name="amcs.producer.generate",
     deterministic=True,
+    cacheable=True,
     default_temperature=0.2,
 )
 async def generate_producer_notes(
@@ -7,7 +7,7 @@ constraints and resolving tag conflicts.
 Contract: .claude/skills/workflow/style/SKILL.md
 """
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
@@ -89,6 +89,26 @@ def _load_blueprint(genre: str, context: WorkflowContext):
         return None
 
 
+def _blueprint_cache_key(genre: str, context: WorkflowContext) -> Optional[Dict[str, Any]]:
+    """Fingerprint the blueprint STYLE loads, for the skill result cache key.
+
+    Args:
+        genre: Genre name used to load the blueprint
+        context: Workflow context with database session
+
+    Returns:
+        Blueprint id, version and last update time, or None if not found
+    """
+    blueprint = _load_blueprint(genre, context)
+    if blueprint is None:
+        return None
+    return {
+        "id": str(blueprint.id),
+        "version": blueprint.version,
+        "updated_at": str(blueprint.updated_at),
+    }
+
+
 def _check_tag_conflicts(tags: List[str], conflict_matrix: Dict = None) -> List[Tuple[str, str]]:
     """Check for conflicting tags using blueprint conflict matrix.
 
@@ -210,7 +230,11 @@ def _validate_energy_tempo_alignment(energy: str, tempo_bpm: Any) -> List[str]:
 @workflow_skill(
     name="amcs.style.generate",
     deterministic=True,
+    cacheable=True,
     default_temperature=0.2,
+    cache_key_extra=lambda inputs, context: _blueprint_cache_key(
+        inputs["sds_style"]["genre_detail"]["primary"], context
+    ),
 )
 async def generate_style(
     inputs: Dict[str, Any], context: WorkflowContext
@@ -15,6 +15,7 @@ from uuid import UUID
 import structlog
 
 from app.workflows.skill import WorkflowContext, compute_hash, workflow_skill
+from app.services.lyrics_analysis import analyze_line
 from app.repositories.blueprint_repo import BlueprintRepository
 from app.core.security import SecurityContext
 
@@ -77,32 +78,25 @@ def _load_blueprint_from_db(genre: str, context: WorkflowContext) -> Optional[Di
         return None
 
 
-def _count_syllables(word: str) -> int:
-    """Count syllables in a word using simple vowel-based heuristic.
+def _blueprint_cache_key(
+    inputs: Dict[str, Any], context: WorkflowContext
+) -> Optional[str]:
+    """Fingerprint the blueprint VALIDATE loads, for the skill result cache key.
+
+    A blueprint passed in ``inputs`` is already covered by the input hash.
 
     Args:
-        word: Input word
+        inputs: Skill inputs
+        context: Workflow context with database session
 
     Returns:
-        Estimated syllable count
+        Hash of the loaded blueprint, or None if none is loaded
     """
-    word = word.lower().strip()
-    vowels = "aeiouy"
-    syllable_count = 0
-    previous_was_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
-
-    # Adjust for silent 'e'
-    if word.endswith("e") and syllable_count > 1:
-        syllable_count -= 1
-
-    # Minimum of 1 syllable per word
-    return max(1, syllable_count)
+    if inputs.get("blueprint"):
+        return None
+    genre = inputs["style"].get("genre_detail", {}).get("primary", "pop")
+    blueprint = _load_blueprint_from_db(genre, context)
+    return compute_hash(blueprint) if blueprint else None
 
 
 def _extract_sections(lyrics: str) -> Dict[str, List[str]]:
@@ -140,6 +134,25 @@ def _extract_sections(lyrics: str) -> Dict[str, List[str]]:
     return sections
 
 
+def changed_sections(before: str, after: str) -> List[str]:
+    """Names of the lyric sections that differ between two versions.
+
+    Args:
+        before: Lyrics before the change
+        after: Lyrics after the change
+
+    Returns:
+        Sections whose lines changed, were added or were removed
+    """
+    old = _extract_sections(before)
+    new = _extract_sections(after)
+    return [
+        name
+        for name in list(new) + [name for name in old if name not in new]
+        if old.get(name) != new.get(name)
+    ]
+
+
 def _identify_hooks(chorus_lines: List[str], min_words: int = 3) -> Set[str]:
     """Identify hook phrases from chorus lines.
 
@@ -222,6 +235,63 @@ def _evaluate_hook_density(lyrics: str, sections: Dict[str, List[str]]) -> float
     return score
 
 
+def _score_section_singability(section_name: str, lines: List[str]) -> Optional[float]:
+    """Score syllable-count consistency for a single section.
+
+    Args:
+        section_name: Section name (for logging)
+        lines: Section lines
+
+    Returns:
+        Consistency score (0-1), or None if the section is not scored
+    """
+    if len(lines) < 2:
+        return None
+
+    # Count syllables per line
+    syllable_counts = [analyze_line(line).syllables for line in lines]
+
+    if not syllable_counts:
+        return None
+
+    # Compute consistency (inverse of coefficient of variation)
+    mean_syllables = sum(syllable_counts) / len(syllable_counts)
+    if mean_syllables == 0:
+        return None
+
+    variance = sum((x - mean_syllables) ** 2 for x in syllable_counts) / len(
+        syllable_counts
+    )
+    stddev = variance**0.5
+
+    # Score based on consistency
+    # Lower stddev = higher consistency = higher score
+    consistency = 1.0 - min(1.0, stddev / mean_syllables)
+
+    logger.debug(
+        "validate.singability.section",
+        section=section_name,
+        mean_syllables=mean_syllables,
+        stddev=stddev,
+        consistency=consistency,
+    )
+
+    return consistency
+
+
+def _aggregate_singability(section_scores: List[Optional[float]]) -> float:
+    """Average per-section singability scores, skipping unscored sections."""
+    scored = [score for score in section_scores if score is not None]
+    if not scored:
+        return 0.0
+
+    score = sum(scored) / len(scored)
+
+    logger.info("validate.singability", score=score, sections_evaluated=len(scored))
+
+    return score
+
+
 def _evaluate_singability(sections: Dict[str, List[str]]) -> float:
     """Evaluate singability score.
 
@@ -234,67 +304,98 @@ def _evaluate_singability(sections: Dict[str, List[str]]) -> float:
     Returns:
         Singability score (0-1)
     """
-    section_scores = []
+    return _aggregate_singability(
+        [_score_section_singability(name, lines) for name, lines in sections.items()]
+    )
 
-    for section_name, lines in sections.items():
-        if len(lines) < 2:
-            continue
 
-        # Count syllables per line
-        syllable_counts = []
-        for line in lines:
-            words = re.findall(r"\b\w+\b", line)
-            syllables = sum(_count_syllables(word) for word in words)
-            syllable_counts.append(syllables)
+def _score_section_rhyme_tightness(
+    section_name: str, lines: List[str], rhyme_scheme: str
+) -> Optional[float]:
+    """Score rhyme scheme adherence for a single section.
 
-        if not syllable_counts:
-            continue
+    Args:
+        section_name: Section name
+        lines: Section lines
+        rhyme_scheme: Expected rhyme scheme (e.g., "ABAB", "AABB")
+
+    Returns:
+        Fraction of matching rhyme pairs (0-1), or None if the section is
+        not scored
+    """
+    # Only check verse and chorus sections
+    if not any(keyword in section_name.lower() for keyword in ["verse", "chorus"]):
+        return None
+
+    scheme_pattern = list(rhyme_scheme)
+    scheme_length = len(scheme_pattern)
+
+    if len(lines) < scheme_length:
+        return None
+
+    # Extract end words
+    end_words = []
+    for line in lines[:scheme_length]:
+        end_word = analyze_line(line).end_word
+        if end_word:
+            end_words.append(end_word)
+
+    if len(end_words) != scheme_length:
+        return None
+
+    # Check rhymes according to scheme
+    rhyme_groups = {}
+    for i, letter in enumerate(scheme_pattern):
+        if letter not in rhyme_groups:
+            rhyme_groups[letter] = []
+        rhyme_groups[letter].append(end_words[i])
+
+    # Count matching rhymes
+    matching_pairs = 0
+    total_pairs = 0
 
-        # Compute consistency (inverse of coefficient of variation)
-        mean_syllables = sum(syllable_counts) / len(syllable_counts)
-        if mean_syllables == 0:
+    for group_words in rhyme_groups.values():
+        if len(group_words) < 2:
             continue
 
-        variance = sum((x - mean_syllables) ** 2 for x in syllable_counts) / len(
-            syllable_counts
-        )
-        stddev = variance**0.5
-
-        # Score based on consistency
-        # Lower stddev = higher consistency = higher score
-        consistency = 1.0 - min(1.0, stddev / mean_syllables)
-        section_scores.append(consistency)
-
-        logger.debug(
-            "validate.singability.section",
-            section=section_name,
-            mean_syllables=mean_syllables,
-            stddev=stddev,
-            consistency=consistency,
-        )
+        # Every pair of words sharing a rhyming part matches
+        key_counts = Counter(word.rhyme_key for word in group_words)
+        total_pairs += len(group_words) * (len(group_words) - 1) // 2
+        matching_pairs += sum(count * (count - 1) // 2 for count in key_counts.values())
 
-    if not section_scores:
-        return 0.0
+    if total_pairs == 0:
+        return None
 
-    score = sum(section_scores) / len(section_scores)
+    section_score = matching_pairs / total_pairs
 
-    logger.info("validate.singability", score=score, sections_evaluated=len(section_scores))
+    logger.debug(
+        "validate.rhyme_tightness.section",
+        section=section_name,
+        scheme=rhyme_scheme,
+        matching_pairs=matching_pairs,
+        total_pairs=total_pairs,
+        score=section_score,
+    )
 
-    return score
+    return section_score
 
 
-def _get_rhyme_suffix(word: str, suffix_len: int = 2) -> str:
-    """Extract rhyme suffix from word.
+def _aggregate_rhyme_tightness(section_scores: List[Optional[float]]) -> float:
+    """Average per-section rhyme scores, skipping unscored sections."""
+    scored = [score for score in section_scores if score is not None]
+    if not scored:
+        # No sections to evaluate, return neutral score
+        return 0.75
 
-    Args:
-        word: Input word
-        suffix_len: Length of suffix to extract
+    score = sum(scored) / len(scored)
 
-    Returns:
-        Lowercase suffix for rhyme matching
-    """
-    word = re.sub(r"[^\w]", "", word).lower()
-    return word[-suffix_len:] if len(word) >= suffix_len else word
+    logger.info(
+        "validate.rhyme_tightness",
+        score=score,
+        sections_evaluated=len(scored),
+    )
+
+    return score
 
 
 def _evaluate_rhyme_tightness(
@@ -316,81 +417,66 @@ def _evaluate_rhyme_tightness(
     if not rhyme_scheme:
         rhyme_scheme = "ABAB"
 
-    scheme_pattern = list(rhyme_scheme)
-    scheme_length = len(scheme_pattern)
+    return _aggregate_rhyme_tightness(
+        [
+            _score_section_rhyme_tightness(name, lines, rhyme_scheme)
+            for name, lines in sections.items()
+        ]
+    )
 
-    section_scores = []
 
-    for section_name, lines in sections.items():
-        # Only check verse and chorus sections
-        if not any(
-            keyword in section_name.lower() for keyword in ["verse", "chorus"]
-        ):
-            continue
+def _score_sections(
+    sections: Dict[str, List[str]],
+    rhyme_scheme: str,
+    previous_sections: Optional[Dict[str, Dict[str, Any]]] = None,
+    changed_sections: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """Score singability and rhyme tightness per section.
 
-        if len(lines) < scheme_length:
-            continue
+    Sections whose lines (and rhyme scheme) are unchanged since the previous
+    evaluation reuse that evaluation's scores instead of being re-scored.
+    When the caller lists the changed sections, every other section with a
+    previous score is reused without being hashed.
 
-        # Extract end words
-        end_words = []
-        for line in lines[:scheme_length]:
-            words = re.findall(r"\b\w+\b", line)
-            if words:
-                end_words.append(words[-1])
-
-        if len(end_words) != scheme_length:
-            continue
+    Args:
+        sections: Parsed sections dictionary
+        rhyme_scheme: Expected rhyme scheme
+        previous_sections: ``analysis["sections"]`` from a previous
+            evaluation, if any
+        changed_sections: Names of the sections changed since the previous
+            evaluation (None compares section digests instead)
 
-        # Check rhymes according to scheme
-        rhyme_groups = {}
-        for i, letter in enumerate(scheme_pattern):
-            if letter not in rhyme_groups:
-                rhyme_groups[letter] = []
-            rhyme_groups[letter].append(end_words[i])
-
-        # Count matching rhymes
-        matching_pairs = 0
-        total_pairs = 0
-
-        for group_words in rhyme_groups.values():
-            if len(group_words) < 2:
-                continue
-
-            # Check if words in group rhyme (simple suffix matching)
-            suffixes = [_get_rhyme_suffix(word) for word in group_words]
-
-            for i in range(len(suffixes)):
-                for j in range(i + 1, len(suffixes)):
-                    total_pairs += 1
-                    if suffixes[i] == suffixes[j]:
-                        matching_pairs += 1
-
-        if total_pairs > 0:
-            section_score = matching_pairs / total_pairs
-            section_scores.append(section_score)
-
-            logger.debug(
-                "validate.rhyme_tightness.section",
-                section=section_name,
-                scheme=rhyme_scheme,
-                matching_pairs=matching_pairs,
-                total_pairs=total_pairs,
-                score=section_score,
-            )
+    Returns:
+        Tuple of (per-section ``{"digest", "singability", "rhyme_tightness"}``
+        in section order, number of sections reused)
+    """
+    previous_sections = previous_sections or {}
+    changed = set(changed_sections) if changed_sections is not None else None
+    section_scores: Dict[str, Dict[str, Any]] = {}
+    reused = 0
 
-    if not section_scores:
-        # No sections to evaluate, return neutral score
-        return 0.75
+    for section_name, lines in sections.items():
+        previous = previous_sections.get(section_name)
+        if previous and changed is not None and section_name not in changed:
+            section_scores[section_name] = previous
+            reused += 1
+            continue
 
-    score = sum(section_scores) / len(section_scores)
+        digest = compute_hash({"lines": lines, "rhyme_scheme": rhyme_scheme})
+        if previous and previous.get("digest") == digest:
+            section_scores[section_name] = previous
+            reused += 1
+            continue
 
-    logger.info(
-        "validate.rhyme_tightness",
-        score=score,
-        sections_evaluated=len(section_scores),
-    )
+        section_scores[section_name] = {
+            "digest": digest,
+            "singability": _score_section_singability(section_name, lines),
+            "rhyme_tightness": _score_section_rhyme_tightness(
+                section_name, lines, rhyme_scheme
+            ),
+        }
 
-    return score
+    return section_scores, reused
 
 
 def _evaluate_section_completeness(
@@ -488,6 +574,8 @@ def _evaluate_profanity(
 @workflow_skill(
     name="amcs.validate.evaluate",
     deterministic=True,
+    cacheable=True,
+    cache_key_extra=_blueprint_cache_key,
 )
 async def evaluate_artifacts(
     inputs: Dict[str, Any], context: WorkflowContext
@@ -504,6 +592,11 @@ async def evaluate_artifacts(
             - producer_notes: Production arrangement and mix guidance
             - blueprint: Genre-specific rules and scoring rubric
             - sds: Original SDS for constraints
+            - previous_evaluation: Result of the previous evaluation
+              (optional, fix loop only); unchanged sections and lyrics
+              reuse the metric values in its ``analysis``
+            - changed_sections: Names of the sections FIX changed since the
+              previous evaluation (optional, fix loop only)
         context: Workflow context with seed and run metadata
 
     Returns:
@@ -511,6 +604,8 @@ async def evaluate_artifacts(
             - scores: Score breakdown (total, hook_density, singability, etc.)
             - issues: List of specific failures
             - pass: Boolean indicating if validation passed
+            - analysis: Per-section and whole-lyrics metric values used for
+              incremental re-evaluation
     """
     lyrics = inputs["lyrics"]
     style = inputs["style"]
@@ -578,26 +673,68 @@ async def evaluate_artifacts(
     # Parse lyrics into sections
     sections = _extract_sections(lyrics)
 
-    # Evaluate each metric
-    hook_density = _evaluate_hook_density(lyrics, sections)
-    singability = _evaluate_singability(sections)
-
-    # Get rhyme scheme from SDS
     rhyme_scheme = sds.get("lyrics", {}).get("constraints", {}).get("rhyme_scheme", "ABAB")
-    rhyme_tightness = _evaluate_rhyme_tightness(sections, rhyme_scheme)
-
-    # Get required sections from blueprint
     required_sections = blueprint.get("rules", {}).get("required_sections", [])
-    section_completeness, missing_sections = _evaluate_section_completeness(
-        sections, required_sections
-    )
-
-    # Check profanity
     banned_terms = blueprint.get("rules", {}).get("banned_terms", [])
     explicit_allowed = sds.get("constraints", {}).get("explicit", False)
-    profanity_score, found_terms = _evaluate_profanity(
-        lyrics, banned_terms, explicit_allowed
+
+    # Inside the fix loop the previous evaluation is passed along so that
+    # only the metrics affected by the patch are recomputed
+    previous = (inputs.get("previous_evaluation") or {}).get("analysis") or {}
+    lyrics_digest = compute_hash(
+        {
+            "lyrics": lyrics,
+            "required_sections": required_sections,
+            "banned_terms": banned_terms,
+            "explicit": explicit_allowed,
+        }
+    )
+    structure_digest = compute_hash(
+        {"sections": list(sections), "required_sections": required_sections}
+    )
+
+    # Singability and rhyme tightness are scored per section, so unchanged
+    # sections reuse their previous scores
+    section_scores, sections_reused = _score_sections(
+        sections,
+        rhyme_scheme or "ABAB",
+        previous.get("sections"),
+        inputs.get("changed_sections"),
+    )
+    singability = _aggregate_singability(
+        [scores["singability"] for scores in section_scores.values()]
     )
+    rhyme_tightness = _aggregate_rhyme_tightness(
+        [scores["rhyme_tightness"] for scores in section_scores.values()]
+    )
+
+    # Whole-lyrics metrics are only reused when the lyrics are unchanged;
+    # section completeness only depends on which sections are present
+    if previous.get("lyrics_digest") == lyrics_digest:
+        hook_density = previous["hook_density"]
+        profanity_score = previous["profanity_score"]
+        found_terms = previous["found_terms"]
+    else:
+        hook_density = _evaluate_hook_density(lyrics, sections)
+        profanity_score, found_terms = _evaluate_profanity(
+            lyrics, banned_terms, explicit_allowed
+        )
+    if previous.get("structure_digest") == structure_digest:
+        section_completeness = previous["section_completeness"]
+        missing_sections = previous["missing_sections"]
+    else:
+        section_completeness, missing_sections = _evaluate_section_completeness(
+            sections, required_sections
+        )
+
+    if previous:
+        logger.info(
+            "validate.evaluate.incremental",
+            run_id=str(context.run_id),
+            sections_reused=sections_reused,
+            sections_scored=len(section_scores) - sections_reused,
+            lyrics_unchanged=previous.get("lyrics_digest") == lyrics_digest,
+        )
 
     # Compute weighted total score
     total_score = (
@@ -650,5 +787,15 @@ async def evaluate_artifacts(
         "scores": scores,
         "issues": issues,
         "pass": pass_validation,
+        "analysis": {
+            "lyrics_digest": lyrics_digest,
+            "structure_digest": structure_digest,
+            "sections": section_scores,
+            "hook_density": hook_density,
+            "section_completeness": section_completeness,
+            "missing_sections": missing_sections,
+            "profanity_score": profanity_score,
+            "found_terms": found_terms,
+        },
         "_hash": scores_hash,
     }
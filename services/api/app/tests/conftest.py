@@ -30,6 +30,16 @@ os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_test")
 logger = structlog.get_logger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def isolate_skill_result_cache():
+    """Disable the global skill result cache so tests never share results."""
+    from app.workflows.result_cache import set_skill_result_cache
+
+    set_skill_result_cache(None)
+    yield
+    set_skill_result_cache(None)
+
+
 @pytest.fixture(scope="session")
 def test_engine() -> Generator[Engine, None, None]:
     """Create test database engine with RLS support."""
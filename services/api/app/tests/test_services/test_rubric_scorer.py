@@ -12,7 +12,8 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from typing import Dict, Any
 
-from app.services.rubric_scorer import RubricScorer, ScoreReport
+from app.services import rubric_scorer
+from app.services.rubric_scorer import RubricScorer, ScoreReport, shutdown_batch_pool
 from app.services.blueprint_service import BlueprintService
 from app.services.policy_guards import ProfanityFilter
 from app.models.blueprint import Blueprint
@@ -668,6 +669,98 @@ class TestScoreArtifacts:
         assert "metric_details" in report_dict
 
 
+class TestScoreBatch:
+    """Test batch scoring of candidate artifacts."""
+
+    def test_matches_score_artifacts(
+        self, scorer, mock_blueprint_service, mock_blueprint, simple_lyrics, rhyming_lyrics
+    ):
+        """Test that batch reports equal individually computed reports."""
+        mock_blueprint_service.get_or_load_blueprint.return_value = mock_blueprint
+        candidates = [
+            {"lyrics": simple_lyrics, "style": {}, "producer_notes": {}},
+            {"lyrics": rhyming_lyrics},
+            {"lyrics": {"sections": []}},
+        ]
+
+        reports = scorer.score_batch(candidates, genre="pop", explicit_allowed=False)
+
+        expected = [
+            scorer.score_artifacts(
+                lyrics=candidate["lyrics"],
+                style={},
+                producer_notes={},
+                genre="pop",
+                explicit_allowed=False
+            )
+            for candidate in candidates
+        ]
+        assert [report.to_dict() for report in reports] == [report.to_dict() for report in expected]
+
+    def test_resolves_blueprint_once(
+        self, scorer, mock_blueprint_service, mock_blueprint, simple_lyrics
+    ):
+        """Test that the blueprint is loaded once per batch."""
+        mock_blueprint_service.get_or_load_blueprint.return_value = mock_blueprint
+
+        reports = scorer.score_batch(
+            [{"lyrics": simple_lyrics}] * 5,
+            genre="pop",
+            explicit_allowed=False,
+            blueprint_version="2025.11"
+        )
+
+        assert len(reports) == 5
+        mock_blueprint_service.get_or_load_blueprint.assert_called_once_with(
+            genre="pop", version="2025.11"
+        )
+
+    def test_empty_batch(self, scorer, mock_blueprint_service):
+        """Test that an empty batch returns no reports."""
+        assert scorer.score_batch([], genre="pop", explicit_allowed=False) == []
+        mock_blueprint_service.get_or_load_blueprint.assert_not_called()
+
+    def test_process_pool(
+        self, mock_blueprint_service, mock_blueprint, simple_lyrics, rhyming_lyrics, monkeypatch
+    ):
+        """Test that worker processes produce the same reports."""
+        monkeypatch.setattr("app.services.rubric_scorer.BATCH_PROCESS_POOL_MIN_SIZE", 2)
+        mock_blueprint_service.get_or_load_blueprint.return_value = mock_blueprint
+        scorer = RubricScorer(
+            blueprint_service=mock_blueprint_service,
+            profanity_filter=ProfanityFilter()
+        )
+        candidates = [{"lyrics": simple_lyrics}, {"lyrics": rhyming_lyrics}] * 3
+
+        try:
+            pooled = scorer.score_batch(candidates, genre="pop", explicit_allowed=False, max_workers=2)
+        finally:
+            shutdown_batch_pool()
+        in_process = scorer.score_batch(candidates, genre="pop", explicit_allowed=False)
+
+        assert [report.to_dict() for report in pooled] == [report.to_dict() for report in in_process]
+
+    def test_process_pool_is_shared_across_batches(
+        self, mock_blueprint_service, mock_blueprint, simple_lyrics, monkeypatch
+    ):
+        """Test that batches reuse one worker pool until shutdown."""
+        monkeypatch.setattr("app.services.rubric_scorer.BATCH_PROCESS_POOL_MIN_SIZE", 2)
+        mock_blueprint_service.get_or_load_blueprint.return_value = mock_blueprint
+        scorer = RubricScorer(blueprint_service=mock_blueprint_service)
+        candidates = [{"lyrics": simple_lyrics}] * 4
+
+        try:
+            scorer.score_batch(candidates, genre="pop", explicit_allowed=False, max_workers=2)
+            pool = rubric_scorer._batch_pool
+            scorer.score_batch(candidates, genre="pop", explicit_allowed=True, max_workers=2)
+
+            assert pool is not None
+            assert rubric_scorer._batch_pool is pool
+        finally:
+            shutdown_batch_pool()
+        assert rubric_scorer._batch_pool is None
+
+
 # =============================================================================
 # Helper Method Tests
 # =============================================================================
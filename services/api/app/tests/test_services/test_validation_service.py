@@ -11,9 +11,11 @@ This test suite verifies:
 
 import pytest
 from pathlib import Path
+from unittest.mock import Mock
 import json
 
-from app.services.validation_service import ValidationService
+from app.services import validation_service
+from app.services.validation_service import CompiledSchema, ValidationService
 
 
 class TestValidationService:
@@ -395,6 +397,71 @@ class TestValidationService:
         assert any("'" in err for err in errors)  # Field names quoted
 
 
+class TestValidationServiceCompiledSchemas:
+    """Test schema compilation and the pass/fail fast path."""
+
+    @pytest.fixture
+    def service(self):
+        """ValidationService instance for testing."""
+        return ValidationService(blueprint_service=Mock())
+
+    @pytest.fixture
+    def valid_style(self):
+        """Style that satisfies the style schema."""
+        return {
+            "genre_detail": {"primary": "Pop"},
+            "tempo_bpm": 120,
+            "key": {"primary": "C major"},
+            "mood": ["upbeat"],
+            "tags": ["catchy"]
+        }
+
+    def test_schemas_compiled_once_per_process(self, service):
+        """Test that instances share compiled schemas."""
+        other = ValidationService(blueprint_service=Mock())
+
+        assert other._get_compiled_schema("sds") is service._get_compiled_schema("sds")
+
+    def test_is_valid_matches_validate(self, service, valid_style):
+        """Test that is_valid agrees with the validate_* methods."""
+        invalid_style = {**valid_style, "tempo_bpm": "fast"}
+
+        assert service.is_valid("style", valid_style) is True
+        assert service.validate_style(valid_style) == (True, [])
+        assert service.is_valid("style", invalid_style) is False
+        assert service.validate_style(invalid_style)[0] is False
+
+    def test_is_valid_unknown_schema(self, service):
+        """Test that an unknown schema never validates."""
+        assert service.is_valid("unknown", {}) is False
+
+    def test_cross_schema_refs_resolved(self, service, valid_style):
+        """Test that persona $refs to other schemas are resolved."""
+        persona = {"name": "Test Persona", "kind": "artist", "style_defaults": valid_style}
+
+        assert service.validate_persona(persona) == (True, [])
+
+        is_valid, errors = service.validate_persona({**persona, "style_defaults": {}})
+        assert is_valid is False
+        assert not any(error.startswith("Validation error") for error in errors)
+
+    def test_replaced_schema_recompiled(self, service, valid_style):
+        """Test that a schema replaced after loading is recompiled."""
+        service.schemas = {**service.schemas, "style": {"type": "array"}}
+
+        assert service.is_valid("style", valid_style) is False
+        assert service.is_valid("style", []) is True
+
+    def test_without_fast_validator(self, service, valid_style, monkeypatch):
+        """Test that validation works without fastjsonschema."""
+        monkeypatch.setattr(validation_service, "fastjsonschema", None)
+        schema = service.schemas["style"]
+        compiled = CompiledSchema(schema, validation_service._schema_registry([schema]))
+
+        assert compiled.is_valid(valid_style) is True
+        assert compiled.is_valid({}) is False
+
+
 class TestValidationServiceTagConflicts:
     """Test ValidationService tag conflict validation integration."""
 
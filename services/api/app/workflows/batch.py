@@ -0,0 +1,126 @@
+"""Shared state for executing a batch of workflow runs together.
+
+Variants of a song generated with different seeds repeat a lot of read-only
+work. When runs execute as a batch (:meth:`WorkflowOrchestrator.execute_batch`):
+
+- Nodes whose skill is marked ``seed_sensitive=False`` (e.g. PLAN) execute
+  once per distinct input; the other runs receive a copy of the result
+  through :class:`SharedNodeResults`
+- LLM requests of every run go through one
+  :class:`~app.skills.llm_client.LLMRequestPool`, which bounds the batch's
+  concurrency and coalesces identical in-flight requests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class SharedNodeResults:
+    """Single-flight results of seed-independent nodes across a batch.
+
+    The first run to reach a node with a given input hash executes it; runs
+    arriving while it executes (or afterwards) await the same result. Every
+    run, the executing one included, receives its own deep copy, so no run
+    can mutate another run's outputs (or their ``_metadata``). A failed
+    execution is forgotten so later runs can try again.
+    """
+
+    def __init__(self):
+        self._results: Dict[Tuple[str, str], Tuple[UUID, asyncio.Future]] = {}
+        self.hits: Counter[str] = Counter()
+        self._served: Dict[UUID, List[str]] = {}
+
+    async def get_or_run(
+        self,
+        node_id: str,
+        input_hash: str,
+        run_id: UUID,
+        execute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Tuple[Dict[str, Any], Optional[UUID]]:
+        """Return the node's shared result, executing it if this run is first.
+
+        Args:
+            node_id: Node name
+            input_hash: Hash of the node inputs
+            run_id: Run requesting the result
+            execute: Coroutine function executing the node for this run
+
+        Returns:
+            Tuple of (copy of the outputs, source run id); the source run id
+            is None when this run executed the node itself
+        """
+        key = (node_id, input_hash)
+        entry = self._results.get(key)
+        if entry is None:
+            future = asyncio.ensure_future(execute())
+            self._results[key] = (run_id, future)
+            future.add_done_callback(lambda done: self._forget_failure(key, done))
+            # Shielded so a cancelled leader run does not fail its followers
+            return copy.deepcopy(await asyncio.shield(future)), None
+
+        source_run_id, future = entry
+        outputs = await asyncio.shield(future)
+        self.hits[node_id] += 1
+        self._served.setdefault(run_id, []).append(node_id)
+        logger.debug(
+            "workflow.batch.node_shared",
+            node=node_id,
+            run_id=str(run_id),
+            source_run_id=str(source_run_id),
+        )
+        return copy.deepcopy(outputs), source_run_id
+
+    def served_to(self, run_id: UUID) -> List[str]:
+        """Nodes whose result a run received from another run."""
+        return list(self._served.get(run_id, []))
+
+    def _forget_failure(self, key: Tuple[str, str], future: asyncio.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            self._results.pop(key, None)
+
+
+def summarize_batch(
+    results: List[Dict[str, Any]],
+    duration_ms: float,
+    shared: SharedNodeResults,
+    llm_stats: Dict[str, int],
+) -> Dict[str, Any]:
+    """Aggregate throughput statistics for a finished batch.
+
+    Args:
+        results: Per-run results (each with ``status`` and ``duration_ms``)
+        duration_ms: Wall-clock duration of the batch
+        shared: Shared node results of the batch
+        llm_stats: Counters from the batch's LLM request pool
+
+    Returns:
+        Batch statistics dictionary
+    """
+    completed = sum(1 for r in results if r.get("status") == "completed")
+    run_durations = sorted(r.get("duration_ms") or 0 for r in results)
+    total_run_ms = sum(run_durations)
+    seconds = duration_ms / 1000.0
+
+    return {
+        "total_runs": len(results),
+        "completed": completed,
+        "failed": len(results) - completed,
+        "duration_ms": round(duration_ms, 1),
+        "runs_per_second": round(len(results) / seconds, 3) if seconds else 0.0,
+        "mean_run_ms": round(total_run_ms / len(results), 1) if results else 0.0,
+        "max_run_ms": run_durations[-1] if run_durations else 0,
+        # > 1 means runs overlapped; sequential execution would take this
+        # many times longer
+        "speedup": round(total_run_ms / duration_ms, 2) if duration_ms else 0.0,
+        "shared_nodes": dict(shared.hits),
+        "llm": llm_stats,
+    }
@@ -0,0 +1,187 @@
+"""Dependency graph and scheduling helpers for workflow manifests.
+
+This module turns the ``graph`` list of a run manifest into a dependency
+graph that the orchestrator can schedule concurrently while keeping node
+seeds independent of completion order.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class WorkflowGraphError(Exception):
+    """Raised when a workflow manifest graph is invalid (unknown inputs, cycles)."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class DAGNode:
+    """A single node in the workflow dependency graph.
+
+    Attributes:
+        node_id: Node name (PLAN, STYLE, LYRICS, etc.)
+        spec: Original node specification from the manifest
+        dependencies: Node ids that must complete before this node runs
+        node_index: Deterministic index used for seed derivation
+    """
+
+    node_id: str
+    spec: Dict[str, Any]
+    dependencies: Tuple[str, ...]
+    node_index: int
+
+
+@dataclass
+class NodeTiming:
+    """Wall-clock timing of a scheduled node, relative to run start.
+
+    Attributes:
+        start_ms: Offset from run start when the node began executing
+        end_ms: Offset from run start when the node finished
+        skipped: True when the node's condition evaluated to false
+        restored: True when the node's outputs were restored from a
+            checkpoint instead of being executed
+    """
+
+    start_ms: float = 0.0
+    end_ms: float = 0.0
+    skipped: bool = False
+    restored: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        """Node execution duration in milliseconds."""
+        return max(self.end_ms - self.start_ms, 0.0)
+
+
+@dataclass
+class WorkflowDAG:
+    """Dependency graph built from a run manifest.
+
+    Dependencies come from each node's ``inputs`` list. A node that does not
+    declare ``inputs`` depends on every node listed before it, which keeps
+    manifests written for sequential execution (e.g. ``VALIDATE``, ``FIX``,
+    conditional ``RENDER``) behaving exactly as before.
+
+    Node indexes (and therefore seeds) are assigned from a stable
+    topological order that breaks ties by manifest position, so they never
+    depend on which concurrent node finishes first.
+    """
+
+    nodes: Dict[str, DAGNode] = field(default_factory=dict)
+    order: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_manifest_graph(cls, graph: List[Dict[str, Any]]) -> "WorkflowDAG":
+        """Build and validate a DAG from a manifest ``graph`` list.
+
+        Args:
+            graph: List of node specs (``{"id": str, "inputs": [str], ...}``)
+
+        Returns:
+            WorkflowDAG with dependencies and deterministic node indexes
+
+        Raises:
+            WorkflowGraphError: On duplicate ids, unknown inputs or cycles
+        """
+        positions: Dict[str, int] = {}
+        for position, node_spec in enumerate(graph):
+            node_id = node_spec["id"]
+            if node_id in positions:
+                raise WorkflowGraphError(f"Duplicate node id in graph: {node_id}")
+            positions[node_id] = position
+
+        dependencies: Dict[str, Tuple[str, ...]] = {}
+        for position, node_spec in enumerate(graph):
+            node_id = node_spec["id"]
+            if "inputs" in node_spec:
+                inputs = tuple(node_spec.get("inputs") or [])
+                for input_node in inputs:
+                    if input_node not in positions:
+                        raise WorkflowGraphError(
+                            f"Node {node_id} depends on unknown node {input_node}"
+                        )
+                dependencies[node_id] = inputs
+            else:
+                dependencies[node_id] = tuple(n["id"] for n in graph[:position])
+
+        # Kahn's algorithm with manifest position as the tie-breaker
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in positions}
+        remaining = {node_id: len(set(deps)) for node_id, deps in dependencies.items()}
+        for node_id, deps in dependencies.items():
+            for dep in set(deps):
+                dependents[dep].append(node_id)
+
+        ready = [(positions[n], n) for n, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        order: List[str] = []
+        while ready:
+            _, node_id = heapq.heappop(ready)
+            order.append(node_id)
+            for dependent in dependents[node_id]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, (positions[dependent], dependent))
+
+        if len(order) != len(graph):
+            cyclic = sorted(set(positions) - set(order), key=positions.__getitem__)
+            raise WorkflowGraphError(f"Cycle detected in workflow graph: {cyclic}")
+
+        nodes = {
+            node_id: DAGNode(
+                node_id=node_id,
+                spec=graph[positions[node_id]],
+                dependencies=dependencies[node_id],
+                node_index=index,
+            )
+            for index, node_id in enumerate(order)
+        }
+        return cls(nodes=nodes, order=order)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+def compute_critical_path(
+    dag: WorkflowDAG, timings: Dict[str, NodeTiming]
+) -> Tuple[List[str], float]:
+    """Compute the longest dependency chain by measured node duration.
+
+    Args:
+        dag: Workflow dependency graph
+        timings: Measured timings per executed node
+
+    Returns:
+        Tuple of (node ids on the critical path in execution order,
+        critical path duration in milliseconds)
+    """
+    path_ms: Dict[str, float] = {}
+    predecessor: Dict[str, Optional[str]] = {}
+
+    for node_id in dag.order:
+        timing = timings.get(node_id)
+        if timing is None:
+            continue
+        best_dep: Optional[str] = None
+        best_ms = 0.0
+        for dep in dag.nodes[node_id].dependencies:
+            if dep in path_ms and path_ms[dep] > best_ms:
+                best_dep, best_ms = dep, path_ms[dep]
+        path_ms[node_id] = best_ms + timing.duration_ms
+        predecessor[node_id] = best_dep
+
+    if not path_ms:
+        return [], 0.0
+
+    tail = max(dag.order, key=lambda n: path_ms.get(n, -1.0))
+    path: List[str] = []
+    cursor: Optional[str] = tail
+    while cursor is not None:
+        path.append(cursor)
+        cursor = predecessor[cursor]
+    path.reverse()
+    return path, path_ms[tail]
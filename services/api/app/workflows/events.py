@@ -8,13 +8,16 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 from uuid import UUID, uuid4
 
 import structlog
 from fastapi import WebSocket
 from sqlalchemy.orm import Session
 
+if TYPE_CHECKING:
+    from app.workflows.persistence import WriteBehindWriter
+
 logger = structlog.get_logger(__name__)
 
 
@@ -27,8 +30,14 @@ class EventPublisher:
     Thread-safe for concurrent workflow executions and multiple WebSocket subscribers.
     """
 
-    def __init__(self):
-        """Initialize the event publisher."""
+    def __init__(self, write_behind: Optional["WriteBehindWriter"] = None):
+        """Initialize the event publisher.
+
+        Args:
+            write_behind: Buffer for event rows; when omitted events are
+                flushed on the caller's session as they are published
+        """
+        self.write_behind = write_behind
         # Map of run_id -> set of WebSocket connections
         self._subscribers: Dict[UUID, Set[WebSocket]] = {}
         # Lock for thread-safe subscriber management
@@ -121,18 +130,21 @@ class EventPublisher:
             try:
                 from app.models.workflow import WorkflowEvent
 
-                workflow_event = WorkflowEvent(
-                    event_id=event_id,
-                    run_id=run_id,
-                    timestamp=timestamp,
-                    node_name=node_name,
-                    phase=phase,
-                    metrics=data.get("metrics", {}),
-                    issues=data.get("issues", []),
-                    event_data=event["data"],
-                )
-                db_session.add(workflow_event)
-                db_session.flush()
+                event_row = {
+                    "event_id": event_id,
+                    "run_id": run_id,
+                    "timestamp": timestamp,
+                    "node_name": node_name,
+                    "phase": phase,
+                    "metrics": data.get("metrics", {}),
+                    "issues": data.get("issues", []),
+                    "event_data": event["data"],
+                }
+                if self.write_behind is not None:
+                    self.write_behind.insert(run_id, WorkflowEvent, event_row)
+                else:
+                    db_session.add(WorkflowEvent(**event_row))
+                    db_session.flush()
 
                 logger.debug(
                     "event.persisted",
@@ -306,5 +318,7 @@ def get_event_publisher() -> EventPublisher:
     """
     global _event_publisher
     if _event_publisher is None:
-        _event_publisher = EventPublisher()
+        from app.workflows.persistence import get_write_behind_writer
+
+        _event_publisher = EventPublisher(write_behind=get_write_behind_writer())
     return _event_publisher
@@ -0,0 +1,821 @@
+"""Background job queue and worker pool for workflow run execution.
+
+``POST /runs/{run_id}/execute`` enqueues a run job and returns immediately;
+a :class:`RunWorker` pulls jobs off the queue and executes them with a
+bounded number of concurrent runs. ``POST /runs/batch`` enqueues a single
+job for all runs of a batch, which the worker executes together. Two queue backends are available:
+
+- ``InProcessRunQueue``: ``asyncio.Queue`` inside the API process (default)
+- ``RedisRunQueue``: Redis list shared by API replicas and worker processes;
+  jobs are moved to a processing list while they run and acknowledged on
+  completion
+
+Both queues are bounded: enqueueing beyond ``WORKER_QUEUE_MAX_SIZE`` raises
+:class:`RunQueueFullError` so the API can push back with 503 + Retry-After.
+Progress is streamed through the :class:`EventPublisher` (queued, dequeued,
+plus the node events emitted by the orchestrator).
+
+Before executing, the worker atomically moves each run from ``queued`` to
+``running``; jobs whose runs were cancelled (or already started by another
+worker) are skipped. That makes redelivered jobs harmless, so on startup
+:func:`recover_run_queue` returns the jobs a previous worker left
+unacknowledged (Redis) or re-enqueues runs still marked ``queued`` in the
+database (in-process queue, whose jobs do not survive a restart).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+import structlog
+
+from app.core.config import WorkerSettings, settings
+from app.observability import metrics
+from app.workflows.events import EventPublisher, get_event_publisher
+
+logger = structlog.get_logger(__name__)
+
+
+class RunQueueFullError(Exception):
+    """Raised when a run job cannot be enqueued because the queue is full."""
+
+    def __init__(self, depth: int, max_size: int):
+        self.depth = depth
+        self.max_size = max_size
+        super().__init__(f"Run queue is full ({depth}/{max_size} jobs)")
+
+
+class RunNotQueuedError(Exception):
+    """Raised when none of a dequeued job's runs is still queued."""
+
+    def __init__(self, run_ids: Tuple[UUID, ...]):
+        self.run_ids = run_ids
+        super().__init__(
+            f"No queued run to execute in {', '.join(str(r) for r in run_ids)}"
+        )
+
+
+@dataclass(frozen=True)
+class RunJob:
+    """A queued request to execute a workflow run or a batch of runs.
+
+    Attributes:
+        run_id: Workflow run to execute (the first run of a batch)
+        job_id: Unique job identifier
+        enqueued_at: ISO-8601 enqueue timestamp
+        batch_id: Batch identifier when the job executes a batch
+        batch_run_ids: Every run of the batch, executed together
+        max_concurrent_runs: Runs of the batch executing at the same time
+        max_concurrent_llm_requests: In-flight LLM requests of the batch
+    """
+
+    run_id: UUID
+    job_id: UUID = field(default_factory=uuid4)
+    enqueued_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
+    batch_id: Optional[UUID] = None
+    batch_run_ids: Tuple[UUID, ...] = ()
+    max_concurrent_runs: Optional[int] = None
+    max_concurrent_llm_requests: Optional[int] = None
+
+    @property
+    def run_ids(self) -> Tuple[UUID, ...]:
+        """Runs executed by this job."""
+        return self.batch_run_ids or (self.run_id,)
+
+    def to_json(self) -> str:
+        """Serialize the job for a queue backend."""
+        data: Dict[str, Any] = {
+            "run_id": str(self.run_id),
+            "job_id": str(self.job_id),
+            "enqueued_at": self.enqueued_at,
+        }
+        if self.batch_id is not None:
+            data.update(
+                batch_id=str(self.batch_id),
+                batch_run_ids=[str(run_id) for run_id in self.batch_run_ids],
+                max_concurrent_runs=self.max_concurrent_runs,
+                max_concurrent_llm_requests=self.max_concurrent_llm_requests,
+            )
+        return json.dumps(data, sort_keys=True)
+
+    @classmethod
+    def from_json(cls, payload: str) -> "RunJob":
+        """Deserialize a job produced by :meth:`to_json`."""
+        data = json.loads(payload)
+        batch_id = data.get("batch_id")
+        return cls(
+            run_id=UUID(data["run_id"]),
+            job_id=UUID(data["job_id"]),
+            enqueued_at=data["enqueued_at"],
+            batch_id=UUID(batch_id) if batch_id else None,
+            batch_run_ids=tuple(UUID(run_id) for run_id in data.get("batch_run_ids", [])),
+            max_concurrent_runs=data.get("max_concurrent_runs"),
+            max_concurrent_llm_requests=data.get("max_concurrent_llm_requests"),
+        )
+
+
+class RunQueue(ABC):
+    """Abstract bounded FIFO queue of run jobs."""
+
+    name: str = "queue"
+    # Whether jobs survive a restart of the process that enqueued them
+    durable: bool = False
+
+    @abstractmethod
+    async def enqueue(self, job: RunJob) -> int:
+        """Add a job to the queue.
+
+        Args:
+            job: Job to enqueue
+
+        Returns:
+            Queue depth after the job was added
+
+        Raises:
+            RunQueueFullError: If the queue is at capacity
+        """
+        pass
+
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> Optional[RunJob]:
+        """Take the next job, waiting up to ``timeout`` seconds.
+
+        Returns:
+            The next job, or None if none arrived in time
+        """
+        pass
+
+    async def ack(self, job: RunJob) -> None:
+        """Acknowledge that a dequeued job finished (successfully or not)."""
+        return None
+
+    @abstractmethod
+    async def depth(self) -> int:
+        """Number of jobs waiting to be dequeued."""
+        pass
+
+    async def recover(self) -> int:
+        """Return jobs dequeued but never acknowledged to the queue.
+
+        Returns:
+            Number of jobs returned
+        """
+        return 0
+
+    async def aclose(self) -> None:
+        """Release resources held by the queue."""
+        return None
+
+
+class InProcessRunQueue(RunQueue):
+    """Queue backed by ``asyncio.Queue``; jobs live only in this process."""
+
+    name = "inprocess"
+
+    def __init__(self, max_size: int = 100):
+        """Initialize the queue.
+
+        Args:
+            max_size: Maximum number of waiting jobs
+        """
+        self.max_size = max_size
+        self._queue: "asyncio.Queue[RunJob]" = asyncio.Queue(maxsize=max_size)
+
+    async def enqueue(self, job: RunJob) -> int:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise RunQueueFullError(self._queue.qsize(), self.max_size) from None
+        return self._queue.qsize()
+
+    async def dequeue(self, timeout: float) -> Optional[RunJob]:
+        try:
+            async with asyncio.timeout(timeout):
+                return await self._queue.get()
+        except TimeoutError:
+            return None
+
+    async def depth(self) -> int:
+        return self._queue.qsize()
+
+
+class RedisRunQueue(RunQueue):
+    """Queue backed by a Redis list, shared across processes.
+
+    Dequeued jobs are atomically moved (``BLMOVE``) to a processing list and
+    removed from it on :meth:`ack`, so jobs held by a crashed worker remain
+    there until :meth:`recover` moves them back.
+    """
+
+    name = "redis"
+    durable = True
+
+    def __init__(self, client: Any, key: str, max_size: int = 100):
+        """Initialize the queue.
+
+        Args:
+            client: ``redis.asyncio.Redis`` client (``decode_responses=True``)
+            key: List key holding waiting jobs
+            max_size: Maximum number of waiting jobs
+        """
+        self.client = client
+        self.key = key
+        self.processing_key = f"{key}:processing"
+        self.max_size = max_size
+
+    @classmethod
+    def from_url(cls, url: str, key: str, max_size: int = 100) -> "RedisRunQueue":
+        """Create a queue with its own async Redis client."""
+        import redis.asyncio as aioredis
+
+        return cls(aioredis.from_url(url, decode_responses=True), key, max_size)
+
+    async def enqueue(self, job: RunJob) -> int:
+        payload = job.to_json()
+        depth = await self.client.rpush(self.key, payload)
+        if depth > self.max_size:
+            # Another producer may have filled the queue concurrently; take
+            # our own job back out rather than exceed the bound
+            await self.client.lrem(self.key, -1, payload)
+            raise RunQueueFullError(depth - 1, self.max_size)
+        return depth
+
+    async def dequeue(self, timeout: float) -> Optional[RunJob]:
+        payload = await self.client.blmove(
+            self.key, self.processing_key, timeout, "LEFT", "RIGHT"
+        )
+        if payload is None:
+            return None
+        return RunJob.from_json(payload)
+
+    async def ack(self, job: RunJob) -> None:
+        await self.client.lrem(self.processing_key, 1, job.to_json())
+
+    async def depth(self) -> int:
+        return await self.client.llen(self.key)
+
+    async def recover(self) -> int:
+        # Newest first onto the head, so recovered jobs keep their order
+        # and run before jobs enqueued since
+        recovered = 0
+        while await self.client.lmove(
+            self.processing_key, self.key, "RIGHT", "LEFT"
+        ) is not None:
+            recovered += 1
+        return recovered
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+RunExecutor = Callable[[UUID], Awaitable[Dict[str, Any]]]
+BatchExecutor = Callable[[RunJob], Awaitable[Dict[str, Any]]]
+
+
+def _create_workflow_service(db: Any) -> Any:
+    """Workflow service with registered skills for a worker session."""
+    from app.repositories.node_execution_repo import NodeExecutionRepository
+    from app.repositories.workflow_event_repo import WorkflowEventRepository
+    from app.repositories.workflow_run_repo import WorkflowRunRepository
+    from app.services.workflow_service import WorkflowService
+    from app.workflows.registry import register_all_skills
+
+    service = WorkflowService(
+        db=db,
+        workflow_run_repo=WorkflowRunRepository(db=db),
+        node_execution_repo=NodeExecutionRepository(db=db),
+        workflow_event_repo=WorkflowEventRepository(db=db),
+    )
+    register_all_skills(service.orchestrator)
+    return service
+
+
+def _start_runs(service: Any, run_ids: Tuple[UUID, ...]) -> List[UUID]:
+    """Move queued runs to running; returns the runs this worker started."""
+    started = [run_id for run_id in run_ids if service.start_run(run_id)]
+    if not started:
+        raise RunNotQueuedError(run_ids)
+    for run_id in set(run_ids) - set(started):
+        logger.info("run_worker.run.skipped", run_id=str(run_id))
+    return started
+
+
+async def execute_run_job(run_id: UUID) -> Dict[str, Any]:
+    """Execute a workflow run with its own database session.
+
+    Args:
+        run_id: Workflow run identifier
+
+    Returns:
+        Orchestrator execution result
+
+    Raises:
+        RunNotQueuedError: If the run is no longer queued (e.g. cancelled)
+    """
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        service = _create_workflow_service(db)
+        _start_runs(service, (run_id,))
+        return await service.execute_run(run_id)
+    finally:
+        db.close()
+
+
+async def execute_batch_job(job: RunJob) -> Dict[str, Any]:
+    """Execute the runs of a batch job together with their own database session.
+
+    Args:
+        job: Batch job (``batch_id`` is set)
+
+    Returns:
+        Batch execution result with per-run results and statistics
+
+    Raises:
+        RunNotQueuedError: If none of the batch's runs is still queued
+    """
+    from app.core.database import SessionLocal
+
+    batch_settings = settings.WORKFLOW
+    db = SessionLocal()
+    try:
+        service = _create_workflow_service(db)
+        # Runs cancelled while queued are left out of the batch
+        run_ids = _start_runs(service, job.batch_run_ids)
+        return await service.execute_batch(
+            run_ids,
+            max_concurrent_runs=(
+                job.max_concurrent_runs or batch_settings.BATCH_MAX_CONCURRENT_RUNS
+            ),
+            max_concurrent_llm_requests=(
+                job.max_concurrent_llm_requests
+                or batch_settings.BATCH_MAX_CONCURRENT_LLM_REQUESTS
+            ),
+        )
+    finally:
+        db.close()
+
+
+class RunWorker:
+    """Pulls run jobs from a queue and executes them concurrently.
+
+    At most ``max_concurrent_runs`` jobs execute at once; the worker only
+    dequeues when it has a free slot, so waiting jobs stay in the (shared)
+    queue where another worker can pick them up.
+    """
+
+    def __init__(
+        self,
+        queue: RunQueue,
+        executor: RunExecutor = execute_run_job,
+        max_concurrent_runs: int = 4,
+        batch_executor: BatchExecutor = execute_batch_job,
+        event_publisher: Optional[EventPublisher] = None,
+        poll_timeout: float = 1.0,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: Queue to consume
+            executor: Coroutine function that executes a run
+            max_concurrent_runs: Concurrent jobs on this worker (a batch
+                job takes one slot)
+            batch_executor: Coroutine function that executes a batch job
+            event_publisher: Publisher for job progress events
+            poll_timeout: Seconds to block on an empty queue per poll
+        """
+        self.queue = queue
+        self.executor = executor
+        self.batch_executor = batch_executor
+        self.max_concurrent_runs = max_concurrent_runs
+        self.event_publisher = event_publisher or get_event_publisher()
+        self.poll_timeout = poll_timeout
+        self._slots = asyncio.Semaphore(max_concurrent_runs)
+        self._in_flight: Set[asyncio.Task] = set()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the consume loop is active."""
+        return self._loop_task is not None and not self._loop_task.done()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of runs currently executing."""
+        return len(self._in_flight)
+
+    def start(self) -> None:
+        """Start consuming jobs in the background."""
+        if self.running:
+            return
+        self._loop_task = asyncio.create_task(
+            self._consume(), name="workflow.run_worker"
+        )
+        logger.info(
+            "run_worker.started",
+            backend=self.queue.name,
+            max_concurrent_runs=self.max_concurrent_runs,
+        )
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Stop consuming and wait for in-flight runs to finish.
+
+        Runs still executing after ``timeout`` seconds are cancelled.
+
+        Args:
+            timeout: Seconds to wait for in-flight runs
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+
+        if self._in_flight:
+            _, pending = await asyncio.wait(self._in_flight, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+        logger.info("run_worker.stopped", backend=self.queue.name)
+
+    async def _consume(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                job = await self.queue.dequeue(self.poll_timeout)
+            except asyncio.CancelledError:
+                self._slots.release()
+                raise
+            except Exception as e:
+                self._slots.release()
+                logger.error(
+                    "run_worker.dequeue_failed",
+                    backend=self.queue.name,
+                    error=str(e),
+                )
+                await asyncio.sleep(self.poll_timeout)
+                continue
+
+            metrics.run_queue_depth.labels(backend=self.queue.name).set(
+                await self._safe_depth()
+            )
+            if job is None:
+                self._slots.release()
+                continue
+
+            task = asyncio.create_task(
+                self._run_job(job), name=f"workflow.run.{job.run_id}"
+            )
+            self._in_flight.add(task)
+            task.add_done_callback(self._job_done)
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        self._slots.release()
+        metrics.run_jobs_in_flight.set(len(self._in_flight))
+
+    async def _run_job(self, job: RunJob) -> None:
+        metrics.run_jobs_in_flight.set(len(self._in_flight))
+        batch = {"batch_id": str(job.batch_id)} if job.batch_id else {}
+        logger.info(
+            "run_worker.job.start",
+            run_id=str(job.run_id),
+            job_id=str(job.job_id),
+            enqueued_at=job.enqueued_at,
+            runs=len(job.run_ids),
+            **batch,
+        )
+        for run_id in job.run_ids:
+            await self.event_publisher.publish_event(
+                run_id=run_id,
+                node_name=None,
+                phase="info",
+                data={"message": "Workflow run dequeued", "job_id": str(job.job_id)},
+            )
+
+        try:
+            if job.batch_id is not None:
+                stats = (await self.batch_executor(job))["stats"]
+                result = {
+                    "status": f"{stats['completed']}/{stats['total_runs']} completed",
+                    "duration_ms": stats["duration_ms"],
+                }
+            else:
+                result = await self.executor(job.run_id)
+        except asyncio.CancelledError:
+            logger.warning("run_worker.job.cancelled", run_id=str(job.run_id))
+            raise
+        except RunNotQueuedError:
+            # Cancelled while queued, or a redelivered job another worker
+            # already started
+            metrics.record_run_job(self.queue.name, "skipped")
+            logger.info(
+                "run_worker.job.skipped",
+                run_id=str(job.run_id),
+                job_id=str(job.job_id),
+                **batch,
+            )
+        except Exception as e:
+            # The orchestrator already marked the run failed and published
+            # the failure event
+            metrics.record_run_job(self.queue.name, "failed")
+            logger.error(
+                "run_worker.job.failed",
+                run_id=str(job.run_id),
+                job_id=str(job.job_id),
+                error=str(e),
+                error_type=type(e).__name__,
+                **batch,
+            )
+        else:
+            metrics.record_run_job(self.queue.name, "completed")
+            logger.info(
+                "run_worker.job.completed",
+                run_id=str(job.run_id),
+                job_id=str(job.job_id),
+                status=result.get("status"),
+                duration_ms=result.get("duration_ms"),
+                **batch,
+            )
+        finally:
+            try:
+                await self.queue.ack(job)
+            except Exception as e:
+                logger.warning(
+                    "run_worker.ack_failed", run_id=str(job.run_id), error=str(e)
+                )
+
+    async def _safe_depth(self) -> int:
+        try:
+            return await self.queue.depth()
+        except Exception:
+            return 0
+
+
+async def submit_run(
+    run_id: UUID,
+    queue: Optional[RunQueue] = None,
+    event_publisher: Optional[EventPublisher] = None,
+) -> RunJob:
+    """Enqueue a workflow run for background execution.
+
+    Args:
+        run_id: Workflow run identifier
+        queue: Queue to use (defaults to the global queue)
+        event_publisher: Publisher for the queued event
+
+    Returns:
+        The enqueued job
+
+    Raises:
+        RunQueueFullError: If the queue is at capacity
+    """
+    return await _enqueue_job(RunJob(run_id=run_id), queue, event_publisher)
+
+
+async def submit_batch(
+    batch_id: UUID,
+    run_ids: List[UUID],
+    max_concurrent_runs: Optional[int] = None,
+    max_concurrent_llm_requests: Optional[int] = None,
+    queue: Optional[RunQueue] = None,
+    event_publisher: Optional[EventPublisher] = None,
+) -> RunJob:
+    """Enqueue the runs of a batch as one job for background execution.
+
+    Args:
+        batch_id: Batch identifier
+        run_ids: Runs of the batch
+        max_concurrent_runs: Runs executing at the same time (None uses
+            ``WORKFLOW_BATCH_MAX_CONCURRENT_RUNS``)
+        max_concurrent_llm_requests: In-flight LLM requests of the batch
+            (None uses ``WORKFLOW_BATCH_MAX_CONCURRENT_LLM_REQUESTS``)
+        queue: Queue to use (defaults to the global queue)
+        event_publisher: Publisher for the queued events
+
+    Returns:
+        The enqueued job
+
+    Raises:
+        RunQueueFullError: If the queue is at capacity
+    """
+    job = RunJob(
+        run_id=run_ids[0],
+        batch_id=batch_id,
+        batch_run_ids=tuple(run_ids),
+        max_concurrent_runs=max_concurrent_runs,
+        max_concurrent_llm_requests=max_concurrent_llm_requests,
+    )
+    return await _enqueue_job(job, queue, event_publisher)
+
+
+async def _enqueue_job(
+    job: RunJob,
+    queue: Optional[RunQueue],
+    event_publisher: Optional[EventPublisher],
+) -> RunJob:
+    queue = queue or get_run_queue()
+    batch = {"batch_id": str(job.batch_id)} if job.batch_id else {}
+    try:
+        depth = await queue.enqueue(job)
+    except RunQueueFullError as e:
+        metrics.record_run_job(queue.name, "rejected")
+        logger.warning(
+            "run_queue.rejected",
+            run_id=str(job.run_id),
+            backend=queue.name,
+            depth=e.depth,
+            max_size=e.max_size,
+            **batch,
+        )
+        raise
+
+    metrics.record_run_job(queue.name, "enqueued")
+    metrics.run_queue_depth.labels(backend=queue.name).set(depth)
+    logger.info(
+        "run_queue.enqueued",
+        run_id=str(job.run_id),
+        job_id=str(job.job_id),
+        backend=queue.name,
+        depth=depth,
+        **batch,
+    )
+
+    publisher = event_publisher or get_event_publisher()
+    for run_id in job.run_ids:
+        await publisher.publish_event(
+            run_id=run_id,
+            node_name=None,
+            phase="info",
+            data={
+                "message": "Workflow run queued",
+                "job_id": str(job.job_id),
+                "queue_depth": depth,
+                **batch,
+            },
+        )
+    return job
+
+
+def create_run_queue(worker_settings: Optional[WorkerSettings] = None) -> RunQueue:
+    """Create the queue selected by ``WORKER_BACKEND``."""
+    worker_settings = worker_settings or settings.WORKER
+    if worker_settings.BACKEND == "redis":
+        return RedisRunQueue.from_url(
+            settings.REDIS_URL,
+            key=worker_settings.REDIS_QUEUE_KEY,
+            max_size=worker_settings.QUEUE_MAX_SIZE,
+        )
+    return InProcessRunQueue(max_size=worker_settings.QUEUE_MAX_SIZE)
+
+
+def _queued_run_jobs(session_factory: Callable[[], Any]) -> List[RunJob]:
+    """Jobs for the runs marked queued in the database, batches regrouped."""
+    from app.repositories.workflow_run_repo import WorkflowRunRepository
+
+    db = session_factory()
+    try:
+        # Newest first from the repository; requeue in the original order
+        runs = [
+            (run.run_id, (run.extra_metadata or {}).get("batch_id"))
+            for run in reversed(WorkflowRunRepository(db=db).get_by_status("queued"))
+        ]
+    finally:
+        db.close()
+
+    jobs: List[RunJob] = []
+    batches: Dict[str, List[UUID]] = {}
+    for run_id, batch_id in runs:
+        if batch_id:
+            batches.setdefault(batch_id, []).append(run_id)
+        else:
+            jobs.append(RunJob(run_id=run_id))
+    jobs.extend(
+        RunJob(run_id=run_ids[0], batch_id=UUID(batch_id), batch_run_ids=tuple(run_ids))
+        for batch_id, run_ids in batches.items()
+    )
+    return jobs
+
+
+async def requeue_queued_runs(
+    queue: RunQueue, session_factory: Optional[Callable[[], Any]] = None
+) -> int:
+    """Enqueue jobs for the runs the database still marks queued.
+
+    Args:
+        queue: Queue to fill
+        session_factory: Creates the session used to find the runs
+            (defaults to ``SessionLocal``)
+
+    Returns:
+        Number of jobs enqueued
+    """
+    if session_factory is None:
+        from app.core.database import SessionLocal
+
+        session_factory = SessionLocal
+
+    jobs = await asyncio.to_thread(_queued_run_jobs, session_factory)
+    requeued = 0
+    for job in jobs:
+        try:
+            await queue.enqueue(job)
+        except RunQueueFullError:
+            # The remaining runs stay queued for the next restart
+            logger.warning(
+                "run_queue.requeue_incomplete",
+                backend=queue.name,
+                requeued=requeued,
+                remaining=len(jobs) - requeued,
+            )
+            break
+        requeued += 1
+    return requeued
+
+
+async def recover_run_queue(queue: RunQueue) -> int:
+    """Recover the work a previous process left behind, before consuming.
+
+    Durable queues get back their unacknowledged jobs; the in-process queue
+    is refilled from the runs still marked queued in the database.
+
+    Args:
+        queue: Queue the starting worker consumes
+
+    Returns:
+        Number of jobs recovered
+    """
+    if queue.durable:
+        recovered = await queue.recover()
+    else:
+        recovered = await requeue_queued_runs(queue)
+    if recovered:
+        metrics.run_queue_depth.labels(backend=queue.name).set(await queue.depth())
+        logger.info("run_queue.recovered", backend=queue.name, jobs=recovered)
+    return recovered
+
+
+# Global queue and worker instances
+_run_queue: Optional[RunQueue] = None
+_run_worker: Optional[RunWorker] = None
+
+
+def get_run_queue() -> RunQueue:
+    """Get or create the global run queue."""
+    global _run_queue
+    if _run_queue is None:
+        _run_queue = create_run_queue()
+    return _run_queue
+
+
+def set_run_queue(queue: Optional[RunQueue]) -> None:
+    """Replace the global run queue (None recreates it from settings)."""
+    global _run_queue
+    _run_queue = queue
+
+
+async def start_run_worker() -> Optional[RunWorker]:
+    """Start the in-process worker if ``WORKER_ENABLED`` is set."""
+    global _run_worker
+    worker_settings = settings.WORKER
+    if not worker_settings.ENABLED:
+        return None
+    if _run_worker is None:
+        queue = get_run_queue()
+        try:
+            await recover_run_queue(queue)
+        except Exception as e:
+            logger.error(
+                "run_queue.recover_failed", backend=queue.name, error=str(e)
+            )
+        _run_worker = RunWorker(
+            queue,
+            max_concurrent_runs=worker_settings.MAX_CONCURRENT_RUNS,
+            poll_timeout=worker_settings.POLL_TIMEOUT,
+        )
+    _run_worker.start()
+    return _run_worker
+
+
+async def stop_run_worker() -> None:
+    """Drain and stop the in-process worker and close the queue."""
+    global _run_worker, _run_queue
+    if _run_worker is not None:
+        await _run_worker.stop(timeout=settings.WORKER.SHUTDOWN_TIMEOUT)
+        _run_worker = None
+    if _run_queue is not None:
+        await _run_queue.aclose()
+        _run_queue = None
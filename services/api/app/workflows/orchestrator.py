@@ -8,19 +8,32 @@ with determinism, parallelization, and error handling.
 from __future__ import annotations
 
 import asyncio
+import copy
+import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 
 import structlog
 from opentelemetry import trace
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm import Session
 
+from app.core.hashing import WORKFLOW_ENCODING, CanonicalDocument
+from app.models.song import WorkflowRun
 from app.models.workflow import NodeExecution
 from app.repositories.node_execution_repo import NodeExecutionRepository
 from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.workflows.batch import SharedNodeResults, summarize_batch
+from app.workflows.dag import (
+    NodeTiming,
+    WorkflowDAG,
+    compute_critical_path,
+)
 from app.workflows.events import EventPublisher
-from app.workflows.skill import WorkflowContext
+from app.workflows.persistence import WriteBehindWriter
+from app.workflows.skill import WorkflowContext, compute_hash
 from app.observability import metrics
 from app.observability.workflow_logger import WorkflowLogger
 
@@ -34,12 +47,21 @@ class WorkflowOrchestrationError(Exception):
     pass
 
 
+def _leaf_exceptions(exc: BaseException) -> List[BaseException]:
+    """Flatten (nested) exception groups into their leaf exceptions."""
+    if isinstance(exc, BaseExceptionGroup):
+        return [leaf for sub in exc.exceptions for leaf in _leaf_exceptions(sub)]
+    return [exc]
+
+
 class WorkflowOrchestrator:
     """Orchestrator for executing workflow graphs with determinism and parallelization.
 
     Implements the AMCS workflow DAG execution with:
-    - Seed propagation (node_seed = run_seed + node_index)
+    - Seed propagation (node_seed = run_seed + node_index), where node_index
+      comes from a stable topological order rather than completion order
     - Parallel execution of independent nodes (STYLE + LYRICS + PRODUCER)
+      under an ``asyncio.TaskGroup``, driven by each node's ``inputs``
     - Fix loop with max iterations (≤3)
     - Event publishing for observability
     - Error handling and recovery
@@ -54,6 +76,7 @@ class WorkflowOrchestrator:
         event_publisher: EventPublisher,
         workflow_run_repo: WorkflowRunRepository,
         node_execution_repo: NodeExecutionRepository,
+        write_behind: Optional[WriteBehindWriter] = None,
     ):
         """Initialize the workflow orchestrator.
 
@@ -62,15 +85,22 @@ class WorkflowOrchestrator:
             event_publisher: Event publisher for WebSocket streaming
             workflow_run_repo: Repository for workflow run access
             node_execution_repo: Repository for node execution tracking
+            write_behind: Buffer for node execution and progress writes;
+                when omitted every write is committed on ``db_session``
         """
         self.db = db_session
         self.event_publisher = event_publisher
         self.workflow_run_repo = workflow_run_repo
         self.node_execution_repo = node_execution_repo
+        self.write_behind = write_behind
 
         # Skill registry: maps node names to skill functions
         self._skills: Dict[str, Callable] = {}
 
+        # Canonical encodings of completed node outputs by run, reused as
+        # leaves when hashing downstream node inputs
+        self._documents: Dict[UUID, Dict[str, CanonicalDocument]] = {}
+
     def register_skill(self, node_name: str, skill_func: Callable) -> None:
         """Register a skill function for a workflow node.
 
@@ -81,7 +111,9 @@ class WorkflowOrchestrator:
         self._skills[node_name] = skill_func
         logger.info("skill.registered", node_name=node_name)
 
-    async def execute_run(self, run_id: UUID) -> Dict[str, Any]:
+    async def execute_run(
+        self, run_id: UUID, shared: Optional[SharedNodeResults] = None
+    ) -> Dict[str, Any]:
         """Execute a complete workflow run.
 
         This is the main entry point for workflow execution. It loads the
@@ -90,6 +122,8 @@ class WorkflowOrchestrator:
 
         Args:
             run_id: Workflow run identifier
+            shared: Results of seed-independent nodes shared with the other
+                runs of a batch (see :meth:`execute_batch`)
 
         Returns:
             Dictionary with final outputs and metadata:
@@ -99,8 +133,18 @@ class WorkflowOrchestrator:
                 "validation_scores": {...},
                 "fix_iterations": int,
                 "duration_ms": int,
+                "node_timings": {node: {start_ms, end_ms, duration_ms, skipped}},
+                "critical_path": [node, ...],
+                "critical_path_ms": float,
+                "restored_nodes": [node, ...],
+                "shared_nodes": [node, ...],
             }
 
+        Runs created by a resumed retry (``resume_from_run_id`` in the run
+        metadata) restore the verified outputs of the failed run's completed
+        nodes and only execute from the first failed node onwards. A
+        pre-compiled SDS in the run metadata (``sds``) is passed to PLAN.
+
         Raises:
             WorkflowOrchestrationError: If run not found or execution fails
         """
@@ -151,76 +195,54 @@ class WorkflowOrchestrator:
                     manifest=manifest,
                 )
 
-                # Execute workflow graph
-                outputs = {}
-                fix_iterations = 0
-
-                for node_spec in graph:
-                    node_id = node_spec["id"]
-
-                    # Check if this is a conditional node
-                    if "cond" in node_spec:
-                        # Evaluate condition (simple implementation for MVP)
-                        # Future: Support complex condition evaluation
-                        should_execute = self._evaluate_condition(
-                            node_spec["cond"], outputs, manifest.get("flags", {})
-                        )
-                        if not should_execute:
-                            logger.info(
-                                "workflow.node.skipped",
-                                run_id=str(run_id),
-                                node=node_id,
-                                condition=node_spec["cond"],
-                            )
-                            continue
-
-                    # Execute node based on type
-                    if node_id == "FIX":
-                        # FIX loop with max retries
-                        max_retries = node_spec.get("max_retries", 3)
-                        node_output = await self._execute_fix_loop(
-                            run_id=run_id,
-                            run=run,
-                            global_seed=global_seed,
-                            outputs=outputs,
-                            max_retries=max_retries,
-                        )
-                        if node_output:
-                            outputs[node_id] = node_output
-                            fix_iterations = node_output.get("iterations", 0)
-
-                    elif node_id in ["STYLE", "LYRICS", "PRODUCER"]:
-                        # Parallel execution candidate
-                        # For MVP, execute sequentially; future: parallel
-                        node_output = await self._execute_node(
-                            run_id=run_id,
-                            run=run,
-                            node_spec=node_spec,
-                            global_seed=global_seed,
-                            outputs=outputs,
-                        )
-                        outputs[node_id] = node_output
-
-                    else:
-                        # Sequential node execution
-                        node_output = await self._execute_node(
-                            run_id=run_id,
-                            run=run,
-                            node_spec=node_spec,
-                            global_seed=global_seed,
-                            outputs=outputs,
-                        )
-                        outputs[node_id] = node_output
+                # Build dependency graph and execute ready nodes concurrently
+                dag = WorkflowDAG.from_manifest_graph(graph)
+                outputs: Dict[str, Any] = {"_node_count": len(dag)}
+                timings: Dict[str, NodeTiming] = {}
+                if run.extra_metadata.get("sds"):
+                    # Runs of a batch may load the same SDS object; each run
+                    # owns its copy
+                    outputs["_sds"] = copy.deepcopy(run.extra_metadata["sds"])
+
+                self._documents[run_id] = {}
+
+                # Resumed retries reuse completed nodes of the failed run
+                resume_from = run.extra_metadata.get("resume_from_run_id")
+                checkpoint = (
+                    self._load_checkpoint(UUID(str(resume_from)), dag)
+                    if resume_from
+                    else {}
+                )
 
-                    # Update current node
-                    run.current_node = node_id
-                    self.db.commit()
+                await self._execute_graph(
+                    run_id=run_id,
+                    run=run,
+                    dag=dag,
+                    global_seed=global_seed,
+                    outputs=outputs,
+                    flags=manifest.get("flags", {}),
+                    timings=timings,
+                    checkpoint=checkpoint,
+                    shared=shared,
+                )
+                restored_nodes = [
+                    node_id
+                    for node_id in dag.order
+                    if node_id in timings and timings[node_id].restored
+                ]
+                fix_iterations = outputs.get("FIX", {}).get("iterations", 0)
+                critical_path, critical_path_ms = compute_critical_path(
+                    dag, timings
+                )
 
                 # Calculate total duration
                 end_time = datetime.now(timezone.utc)
                 duration_ms = int((end_time - start_time).total_seconds() * 1000)
                 duration_seconds = duration_ms / 1000.0
 
+                # Buffered node records must be durable before the run is
+                await self._flush_persistence(run_id)
+
                 # Mark run as completed
                 run.status = "completed"
                 run.fix_iterations = fix_iterations
@@ -232,6 +254,9 @@ class WorkflowOrchestrator:
                     run_id=str(run_id),
                     duration_ms=duration_ms,
                     fix_iterations=fix_iterations,
+                    critical_path=critical_path,
+                    critical_path_ms=round(critical_path_ms, 1),
+                    restored_nodes=restored_nodes,
                 )
 
                 # Record metrics and log completion
@@ -253,6 +278,8 @@ class WorkflowOrchestrator:
                 span.set_attribute("run.status", "completed")
                 span.set_attribute("run.duration_ms", duration_ms)
                 span.set_attribute("run.fix_iterations", fix_iterations)
+                span.set_attribute("run.critical_path", ",".join(critical_path))
+                span.set_attribute("run.critical_path_ms", critical_path_ms)
 
                 return {
                     "status": "completed",
@@ -260,27 +287,57 @@ class WorkflowOrchestrator:
                     "validation_scores": run.validation_scores,
                     "fix_iterations": fix_iterations,
                     "duration_ms": duration_ms,
+                    "node_timings": {
+                        node_id: {
+                            "start_ms": round(timing.start_ms, 1),
+                            "end_ms": round(timing.end_ms, 1),
+                            "duration_ms": round(timing.duration_ms, 1),
+                            "skipped": timing.skipped,
+                            "restored": timing.restored,
+                        }
+                        for node_id, timing in timings.items()
+                    },
+                    "critical_path": critical_path,
+                    "critical_path_ms": round(critical_path_ms, 1),
+                    "restored_nodes": restored_nodes,
+                    "shared_nodes": shared.served_to(run_id) if shared else [],
                 }
 
             except Exception as e:
+                # Concurrent nodes can fail together: report the first
+                # failure and keep the others alongside it
+                errors = _leaf_exceptions(e)
+                error = errors[0]
+
                 # Calculate duration for failed run
                 end_time = datetime.now(timezone.utc)
                 duration_seconds = (end_time - start_time).total_seconds()
 
+                await self._flush_persistence(run_id)
+
                 # Mark run as failed
                 run.status = "failed"
                 run.error = {
-                    "message": str(e),
+                    "message": str(error),
                     "node": run.current_node,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
+                if len(errors) > 1:
+                    run.error["errors"] = [
+                        {"message": str(err), "type": type(err).__name__}
+                        for err in errors
+                    ]
                 self.db.commit()
 
                 logger.error(
                     "workflow.run.failed",
                     run_id=str(run_id),
-                    error=str(e),
-                    error_type=type(e).__name__,
+                    error=str(error),
+                    error_type=type(error).__name__,
+                    error_count=len(errors),
+                    other_errors=[
+                        f"{type(err).__name__}: {err}" for err in errors[1:]
+                    ],
                     current_node=run.current_node,
                 )
 
@@ -294,17 +351,384 @@ class WorkflowOrchestrator:
                 # Log workflow error
                 if "workflow_logger" in locals():
                     workflow_logger.log_workflow_error(
-                        error=e,
+                        error=error,
                         current_node=run.current_node,
                     )
 
                 span.set_attribute("run.status", "failed")
-                span.set_attribute("run.error", str(e))
+                span.set_attribute("run.error", str(error))
+                span.set_attribute("run.error_count", len(errors))
 
                 raise WorkflowOrchestrationError(
-                    f"Workflow run {run_id} failed: {e}"
+                    f"Workflow run {run_id} failed: {error}"
                 ) from e
 
+            finally:
+                self._documents.pop(run_id, None)
+
+    async def execute_batch(
+        self,
+        run_ids: List[UUID],
+        max_concurrent_runs: int = 8,
+        max_concurrent_llm_requests: Optional[int] = 10,
+    ) -> Dict[str, Any]:
+        """Execute several workflow runs together, sharing read-only work.
+
+        Runs execute concurrently (at most ``max_concurrent_runs`` at once).
+        Seed-independent nodes execute once per distinct input and are
+        shared by every run of the batch, and all LLM requests go through a
+        single pool limited to ``max_concurrent_llm_requests`` in-flight
+        requests in which identical requests are coalesced. A failed run
+        does not stop the rest of the batch.
+
+        Args:
+            run_ids: Pending workflow runs to execute
+            max_concurrent_runs: Runs executing at the same time
+            max_concurrent_llm_requests: In-flight LLM requests shared by the
+                batch (None keeps the per-client limit only)
+
+        Returns:
+            Dictionary with per-run results and aggregate statistics:
+            {
+                "runs": [{"run_id", "status", "duration_ms", ...}, ...],
+                "stats": {"total_runs", "completed", "failed",
+                          "runs_per_second", "shared_nodes", "llm", ...},
+            }
+        """
+        # Imported here: app.skills imports services that import this module
+        from app.skills.llm_client import LLMRequestPool, use_request_pool
+
+        shared = SharedNodeResults()
+        llm_pool = (
+            LLMRequestPool(max_concurrent_llm_requests)
+            if max_concurrent_llm_requests
+            else None
+        )
+        slots = asyncio.Semaphore(max_concurrent_runs)
+        results: Dict[UUID, Dict[str, Any]] = {}
+        batch_started = time.perf_counter()
+
+        logger.info(
+            "workflow.batch.start",
+            runs=len(run_ids),
+            max_concurrent_runs=max_concurrent_runs,
+            max_concurrent_llm_requests=max_concurrent_llm_requests,
+        )
+
+        async def run_one(run_id: UUID) -> None:
+            async with slots:
+                run_started = time.perf_counter()
+                try:
+                    result = await self.execute_run(run_id, shared=shared)
+                except WorkflowOrchestrationError as e:
+                    result = {
+                        "status": "failed",
+                        "error": str(e),
+                        "duration_ms": int(
+                            (time.perf_counter() - run_started) * 1000
+                        ),
+                    }
+                results[run_id] = {"run_id": run_id, **result}
+
+        with use_request_pool(llm_pool) if llm_pool else nullcontext():
+            async with asyncio.TaskGroup() as task_group:
+                for run_id in run_ids:
+                    task_group.create_task(
+                        run_one(run_id), name=f"workflow.batch.{run_id}"
+                    )
+
+        ordered = [results[run_id] for run_id in run_ids]
+        llm_stats = llm_pool.stats() if llm_pool else {}
+        stats = summarize_batch(
+            ordered,
+            duration_ms=(time.perf_counter() - batch_started) * 1000,
+            shared=shared,
+            llm_stats=llm_stats,
+        )
+        metrics.record_batch_execution(
+            completed=stats["completed"],
+            failed=stats["failed"],
+            shared_nodes=stats["shared_nodes"],
+            coalesced_llm_requests=llm_stats.get("coalesced", 0),
+        )
+        logger.info("workflow.batch.completed", **stats)
+
+        return {"runs": ordered, "stats": stats}
+
+    async def _execute_graph(
+        self,
+        run_id: UUID,
+        run: Any,
+        dag: WorkflowDAG,
+        global_seed: int,
+        outputs: Dict[str, Any],
+        flags: Dict[str, bool],
+        timings: Dict[str, NodeTiming],
+        checkpoint: Optional[Dict[str, NodeExecution]] = None,
+        shared: Optional[SharedNodeResults] = None,
+    ) -> None:
+        """Execute all DAG nodes, running each as soon as its inputs complete.
+
+        Every node gets its own task inside a TaskGroup and waits on the
+        completion events of its dependencies, so independent nodes
+        (STYLE, LYRICS, PRODUCER) run concurrently. If any node fails the
+        remaining tasks are cancelled and every failure is re-raised in the
+        TaskGroup's ExceptionGroup; ``execute_run`` unwraps it.
+
+        Args:
+            run_id: Workflow run identifier
+            run: WorkflowRun ORM object
+            dag: Dependency graph built from the manifest
+            global_seed: Global run seed
+            outputs: Shared dictionary of node outputs (mutated in place)
+            flags: Manifest feature flags for conditional nodes
+            timings: Populated with per-node timing (mutated in place)
+            checkpoint: Completed executions of a failed run by node id; a
+                node is restored instead of executed when its dependencies
+                were restored and its persisted hashes verify
+            shared: Batch-wide results of seed-independent nodes
+        """
+        checkpoint = checkpoint or {}
+        restored: set[str] = set()
+        finished = {node_id: asyncio.Event() for node_id in dag.order}
+        run_started = time.perf_counter()
+
+        async def run_scheduled_node(node_id: str) -> None:
+            dag_node = dag.nodes[node_id]
+            for dep in dag_node.dependencies:
+                await finished[dep].wait()
+
+            node_spec = dag_node.spec
+            start_ms = (time.perf_counter() - run_started) * 1000
+
+            checkpoint_execution = checkpoint.get(node_id)
+            if (
+                checkpoint_execution is not None
+                and all(dep in restored for dep in dag_node.dependencies)
+                and self._restore_node(
+                    run_id, node_spec, checkpoint_execution, outputs
+                )
+            ):
+                restored.add(node_id)
+                timings[node_id] = NodeTiming(
+                    start_ms=start_ms, end_ms=start_ms, restored=True
+                )
+                finished[node_id].set()
+                return
+
+            # Check if this is a conditional node
+            if "cond" in node_spec and not self._evaluate_condition(
+                node_spec["cond"], outputs, flags
+            ):
+                logger.info(
+                    "workflow.node.skipped",
+                    run_id=str(run_id),
+                    node=node_id,
+                    condition=node_spec["cond"],
+                )
+                timings[node_id] = NodeTiming(
+                    start_ms=start_ms, end_ms=start_ms, skipped=True
+                )
+                finished[node_id].set()
+                return
+
+            try:
+                if node_id == "FIX":
+                    # FIX loop with max retries
+                    node_output = await self._execute_fix_loop(
+                        run_id=run_id,
+                        run=run,
+                        global_seed=global_seed,
+                        outputs=outputs,
+                        max_retries=node_spec.get("max_retries", 3),
+                    )
+                    if node_output:
+                        outputs[node_id] = node_output
+                else:
+                    outputs[node_id] = await self._execute_node(
+                        run_id=run_id,
+                        run=run,
+                        node_spec=node_spec,
+                        global_seed=global_seed,
+                        outputs=outputs,
+                        node_index=dag_node.node_index,
+                        shared=shared,
+                    )
+            except Exception:
+                run.current_node = node_id
+                raise
+
+            timings[node_id] = NodeTiming(
+                start_ms=start_ms,
+                end_ms=(time.perf_counter() - run_started) * 1000,
+            )
+
+            # Update current node
+            run.current_node = node_id
+            if self.write_behind is not None:
+                self.write_behind.update(
+                    run_id, WorkflowRun, "run_id", run_id, {"current_node": node_id}
+                )
+            else:
+                self.db.commit()
+            finished[node_id].set()
+
+        async with asyncio.TaskGroup() as task_group:
+            for node_id in dag.order:
+                task_group.create_task(
+                    run_scheduled_node(node_id), name=f"workflow.node.{node_id}"
+                )
+
+    def _persist_new_execution(self, node_execution: NodeExecution) -> None:
+        """Persist a new node execution record (buffered when write-behind is on)."""
+        if self.write_behind is None:
+            self.db.add(node_execution)
+            self.db.commit()
+            return
+
+        values = {
+            attr.key: getattr(node_execution, attr.key)
+            for attr in sa_inspect(NodeExecution).column_attrs
+            if getattr(node_execution, attr.key) is not None
+        }
+        self.write_behind.insert(
+            node_execution.run_id, NodeExecution, values, key_column="execution_id"
+        )
+
+    def _persist_execution_update(
+        self, node_execution: NodeExecution, *fields: str
+    ) -> None:
+        """Persist changed fields of a node execution record.
+
+        Args:
+            node_execution: Execution whose attributes were updated
+            *fields: Names of the changed attributes
+        """
+        if self.write_behind is None:
+            self.db.commit()
+            return
+
+        self.write_behind.update(
+            node_execution.run_id,
+            NodeExecution,
+            "execution_id",
+            node_execution.execution_id,
+            {field: getattr(node_execution, field) for field in fields},
+        )
+
+    async def _flush_persistence(self, run_id: UUID) -> None:
+        """Synchronously flush buffered writes of a finished run."""
+        if self.write_behind is not None:
+            await self.write_behind.flush(run_id)
+
+    def _load_checkpoint(
+        self, source_run_id: UUID, dag: WorkflowDAG
+    ) -> Dict[str, NodeExecution]:
+        """Load the completed main-graph executions of a previous run.
+
+        FIX-loop re-executions are allocated indexes past the graph and are
+        therefore never restored; the loop is replayed from VALIDATE.
+
+        Args:
+            source_run_id: Run whose executions are reused
+            dag: Dependency graph of the resumed run
+
+        Returns:
+            Completed executions keyed by node id
+        """
+        checkpoint: Dict[str, NodeExecution] = {}
+        for execution in self.node_execution_repo.get_by_run_id(source_run_id):
+            dag_node = dag.nodes.get(execution.node_name)
+            if (
+                dag_node is not None
+                and execution.status == "completed"
+                and execution.node_index == dag_node.node_index
+            ):
+                checkpoint[execution.node_name] = execution
+
+        logger.info(
+            "workflow.checkpoint.loaded",
+            source_run_id=str(source_run_id),
+            nodes=sorted(checkpoint, key=dag.order.index),
+        )
+        return checkpoint
+
+    def _restore_node(
+        self,
+        run_id: UUID,
+        node_spec: Dict[str, Any],
+        execution: NodeExecution,
+        outputs: Dict[str, Any],
+    ) -> bool:
+        """Restore a node's outputs from a persisted execution.
+
+        The persisted output hash must match the stored outputs, and the
+        input hash must match the inputs this run would pass to the node,
+        otherwise the node is re-executed.
+
+        Args:
+            run_id: Workflow run identifier of the resumed run
+            node_spec: Node specification from manifest
+            execution: Completed execution from the failed run
+            outputs: Dictionary of previous outputs (mutated on success)
+
+        Returns:
+            True if the node was restored, False if it must be executed
+        """
+        node_id = node_spec["id"]
+        node_inputs = self._collect_node_inputs(node_spec, outputs)
+        input_hash = self._hash_inputs(run_id, node_inputs)
+        output_hash = compute_hash(execution.outputs)
+
+        if not execution.output_hash or output_hash != execution.output_hash:
+            logger.warning(
+                "workflow.checkpoint.output_hash_mismatch",
+                run_id=str(run_id),
+                node=node_id,
+                execution_id=str(execution.execution_id),
+            )
+            return False
+        if input_hash != execution.input_hash:
+            logger.warning(
+                "workflow.checkpoint.input_hash_mismatch",
+                run_id=str(run_id),
+                node=node_id,
+                execution_id=str(execution.execution_id),
+            )
+            return False
+
+        outputs[node_id] = execution.outputs
+
+        # Copy the execution so the resumed run is itself resumable
+        now = datetime.now(timezone.utc)
+        self._persist_new_execution(
+            NodeExecution(
+                execution_id=uuid4(),
+                run_id=run_id,
+                node_name=node_id,
+                node_index=execution.node_index,
+                seed=execution.seed,
+                status="completed",
+                inputs=node_inputs,
+                outputs=execution.outputs,
+                input_hash=input_hash,
+                output_hash=output_hash,
+                model_params=execution.model_params,
+                started_at=now,
+                completed_at=now,
+                duration_ms=0,
+                extra_metadata={"restored_from": str(execution.execution_id)},
+            )
+        )
+
+        logger.info(
+            "workflow.node.restored",
+            run_id=str(run_id),
+            node=node_id,
+            source_execution_id=str(execution.execution_id),
+        )
+        return True
+
     async def _execute_node(
         self,
         run_id: UUID,
@@ -312,6 +736,8 @@ class WorkflowOrchestrator:
         node_spec: Dict[str, Any],
         global_seed: int,
         outputs: Dict[str, Any],
+        node_index: Optional[int] = None,
+        shared: Optional[SharedNodeResults] = None,
     ) -> Dict[str, Any]:
         """Execute a single workflow node.
 
@@ -321,6 +747,10 @@ class WorkflowOrchestrator:
             node_spec: Node specification from manifest
             global_seed: Global run seed
             outputs: Dictionary of previous node outputs
+            node_index: Deterministic node index from the DAG; when omitted
+                (FIX loop re-executions) the next free index is allocated
+            shared: Batch-wide results; seed-independent skills execute once
+                per distinct input across the batch
 
         Returns:
             Node output dictionary
@@ -329,8 +759,9 @@ class WorkflowOrchestrator:
             WorkflowOrchestrationError: If node execution fails
         """
         node_id = node_spec["id"]
-        node_index = outputs.get("_node_count", 0)
-        outputs["_node_count"] = node_index + 1
+        if node_index is None:
+            node_index = outputs.get("_node_count", 0)
+            outputs["_node_count"] = node_index + 1
 
         # Calculate node seed
         node_seed = global_seed + node_index
@@ -355,8 +786,8 @@ class WorkflowOrchestrator:
             inputs=self._collect_node_inputs(node_spec, outputs),
             started_at=datetime.now(timezone.utc),
         )
-        self.db.add(node_execution)
-        self.db.commit()
+        node_execution.input_hash = self._hash_inputs(run_id, node_execution.inputs)
+        self._persist_new_execution(node_execution)
 
         try:
             # Get skill function
@@ -375,15 +806,35 @@ class WorkflowOrchestrator:
                 node_name=node_id,
                 event_publisher=self.event_publisher,
                 db_session=self.db,
+                input_hash=node_execution.input_hash,
             )
 
             # Execute skill
             node_inputs = node_execution.inputs
-            node_outputs = await skill_func(node_inputs, context)
+            updated_fields = [
+                "status", "outputs", "output_hash", "completed_at", "duration_ms",
+            ]
+            if shared is not None and not getattr(skill_func, "seed_sensitive", True):
+                node_outputs, source_run_id = await shared.get_or_run(
+                    node_id,
+                    node_execution.input_hash,
+                    run_id,
+                    lambda: skill_func(node_inputs, context),
+                )
+                if source_run_id is not None:
+                    node_execution.extra_metadata = {
+                        "shared_from_run_id": str(source_run_id)
+                    }
+                    updated_fields.append("extra_metadata")
+            else:
+                node_outputs = await skill_func(node_inputs, context)
 
             # Update execution record
             node_execution.status = "completed"
             node_execution.outputs = node_outputs
+            node_execution.output_hash = self._hash_outputs(
+                run_id, node_id, node_outputs, context
+            )
             node_execution.completed_at = datetime.now(timezone.utc)
             node_execution.duration_ms = int(
                 (
@@ -391,7 +842,7 @@ class WorkflowOrchestrator:
                 ).total_seconds()
                 * 1000
             )
-            self.db.commit()
+            self._persist_execution_update(node_execution, *updated_fields)
 
             logger.info(
                 "workflow.node.completed",
@@ -416,7 +867,9 @@ class WorkflowOrchestrator:
                 ).total_seconds()
                 * 1000
             )
-            self.db.commit()
+            self._persist_execution_update(
+                node_execution, "status", "error", "completed_at", "duration_ms"
+            )
 
             logger.error(
                 "workflow.node.failed",
@@ -428,6 +881,40 @@ class WorkflowOrchestrator:
 
             raise
 
+    def _hash_inputs(self, run_id: UUID, node_inputs: Dict[str, Any]) -> str:
+        """Hash node inputs, splicing in the encodings of upstream outputs.
+
+        Produces the same digest as ``compute_hash(node_inputs)``.
+        """
+        documents = self._documents.get(run_id)
+        if documents:
+            try:
+                document = WORKFLOW_ENCODING.document(node_inputs, leaves=documents)
+            except Exception:
+                document = None
+            if document is not None:
+                return document.hexdigest()
+        return compute_hash(node_inputs)
+
+    def _hash_outputs(
+        self,
+        run_id: UUID,
+        node_id: str,
+        node_outputs: Dict[str, Any],
+        context: WorkflowContext,
+    ) -> str:
+        """Hash node outputs, reusing the encoding made by the skill wrapper.
+
+        Produces the same digest as ``compute_hash(node_outputs)``; the
+        encoding is kept for hashing downstream inputs.
+        """
+        document = context.result_document
+        if document is None or document.source is not node_outputs:
+            return compute_hash(node_outputs)
+        if run_id in self._documents:
+            self._documents[run_id][node_id] = document
+        return document.hexdigest()
+
     async def _execute_fix_loop(
         self,
         run_id: UUID,
@@ -438,6 +925,11 @@ class WorkflowOrchestrator:
     ) -> Optional[Dict[str, Any]]:
         """Execute the FIX → COMPOSE → VALIDATE loop.
 
+        Each iteration re-runs only what the patch invalidated: COMPOSE when
+        any artifact changed and VALIDATE when the lyrics changed. VALIDATE
+        receives the previous evaluation and the lyric sections FIX changed,
+        so the other sections keep their scores.
+
         Args:
             run_id: Workflow run identifier
             run: WorkflowRun ORM object
@@ -477,6 +969,10 @@ class WorkflowOrchestrator:
             )
 
             # Execute FIX node
+            before_artifacts = self._current_artifacts(outputs)
+            before = {
+                name: compute_hash(value) for name, value in before_artifacts.items()
+            }
             fix_spec = {"id": "FIX"}
             fix_output = await self._execute_node(
                 run_id=run_id,
@@ -487,31 +983,61 @@ class WorkflowOrchestrator:
             )
             outputs["FIX"] = fix_output
 
-            # Re-execute COMPOSE with fixed artifacts
-            compose_spec = {"id": "COMPOSE"}
-            compose_output = await self._execute_node(
-                run_id=run_id,
-                run=run,
-                node_spec=compose_spec,
-                global_seed=global_seed,
-                outputs=outputs,
+            # Only re-run the nodes downstream of artifacts FIX changed
+            dirty = sorted(
+                name
+                for name, value in self._current_artifacts(outputs).items()
+                if compute_hash(value) != before.get(name)
             )
-            outputs["COMPOSE"] = compose_output
-
-            # Re-execute VALIDATE
-            validate_spec = {"id": "VALIDATE"}
-            validate_output = await self._execute_node(
-                run_id=run_id,
-                run=run,
-                node_spec=validate_spec,
-                global_seed=global_seed,
-                outputs=outputs,
+            logger.info(
+                "workflow.fix_loop.dirty_artifacts",
+                run_id=str(run_id),
+                iteration=iterations,
+                dirty=dirty,
             )
-            outputs["VALIDATE"] = validate_output
+
+            # COMPOSE merges every artifact, so any change invalidates it
+            if dirty:
+                compose_spec = {"id": "COMPOSE"}
+                compose_output = await self._execute_node(
+                    run_id=run_id,
+                    run=run,
+                    node_spec=compose_spec,
+                    global_seed=global_seed,
+                    outputs=outputs,
+                )
+                outputs["COMPOSE"] = compose_output
+
+            # Rubric metrics are computed from lyrics only; otherwise the
+            # previous evaluation still holds
+            if "lyrics" in dirty:
+                # Imported here: app.skills imports services that import
+                # this module
+                from app.skills.validate import changed_sections
+
+                outputs["_changed_sections"] = changed_sections(
+                    before_artifacts.get("lyrics", ""),
+                    self._current_artifacts(outputs).get("lyrics", ""),
+                )
+                validate_spec = {"id": "VALIDATE"}
+                validate_output = await self._execute_node(
+                    run_id=run_id,
+                    run=run,
+                    node_spec=validate_spec,
+                    global_seed=global_seed,
+                    outputs=outputs,
+                )
+                outputs["VALIDATE"] = validate_output
+            else:
+                logger.info(
+                    "workflow.fix_loop.validation_reused",
+                    run_id=str(run_id),
+                    iteration=iterations,
+                )
 
             fix_outputs = {
                 "iterations": iterations,
-                "final_validation": validate_output,
+                "final_validation": outputs.get("VALIDATE", {}),
             }
 
         logger.info(
@@ -557,6 +1083,20 @@ class WorkflowOrchestrator:
                 # Get blueprint and sds from plan outputs if available
                 node_inputs["blueprint"] = outputs["PLAN"].get("blueprint", {})
                 node_inputs["sds"] = outputs["PLAN"].get("sds", {})
+
+            # Inside the fix loop, validate the patched artifacts and let the
+            # skill reuse metrics of the sections FIX left unchanged
+            if "FIX" in outputs:
+                node_inputs.update(self._current_artifacts(outputs))
+                if "VALIDATE" in outputs:
+                    # Private keys (_metadata, _hash) vary between runs
+                    node_inputs["previous_evaluation"] = {
+                        key: value
+                        for key, value in outputs["VALIDATE"].items()
+                        if not key.startswith("_")
+                    }
+                if "_changed_sections" in outputs:
+                    node_inputs["changed_sections"] = outputs["_changed_sections"]
             return node_inputs
 
         # Special handling for FIX node
@@ -579,16 +1119,14 @@ class WorkflowOrchestrator:
 
             # After FIX, update lyrics/style/producer with patched versions
             if "FIX" in outputs:
-                fix_output = outputs["FIX"]
-                if "patched_lyrics" in fix_output:
-                    node_inputs["lyrics"] = fix_output["patched_lyrics"]
-                if "patched_style" in fix_output:
-                    node_inputs["style"] = fix_output["patched_style"]
-                if "patched_producer_notes" in fix_output:
-                    node_inputs["producer_notes"] = fix_output["patched_producer_notes"]
+                node_inputs.update(self._current_artifacts(outputs))
 
             return node_inputs
 
+        # PLAN consumes the SDS compiled when the run was created
+        if node_id == "PLAN" and "_sds" in outputs:
+            node_inputs["sds"] = outputs["_sds"]
+
         # Default behavior: collect from input_nodes list
         input_nodes = node_spec.get("inputs", [])
         for input_node in input_nodes:
@@ -597,6 +1135,36 @@ class WorkflowOrchestrator:
 
         return node_inputs
 
+    def _current_artifacts(self, outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the latest lyrics, style and producer notes.
+
+        FIX patches take precedence over the original LYRICS/STYLE/PRODUCER
+        outputs.
+
+        Args:
+            outputs: Dictionary of all previous outputs
+
+        Returns:
+            Dictionary with whichever of ``lyrics``, ``style`` and
+            ``producer_notes`` are available
+        """
+        artifacts: Dict[str, Any] = {}
+        if "LYRICS" in outputs:
+            artifacts["lyrics"] = outputs["LYRICS"].get("lyrics", "")
+        if "STYLE" in outputs:
+            artifacts["style"] = outputs["STYLE"].get("style", {})
+        if "PRODUCER" in outputs:
+            artifacts["producer_notes"] = outputs["PRODUCER"].get("producer_notes", {})
+
+        fix_output = outputs.get("FIX", {})
+        if "patched_lyrics" in fix_output:
+            artifacts["lyrics"] = fix_output["patched_lyrics"]
+        if "patched_style" in fix_output:
+            artifacts["style"] = fix_output["patched_style"]
+        if "patched_producer_notes" in fix_output:
+            artifacts["producer_notes"] = fix_output["patched_producer_notes"]
+        return artifacts
+
     def _evaluate_condition(
         self, condition: str, outputs: Dict[str, Any], flags: Dict[str, bool]
     ) -> bool:
@@ -0,0 +1,320 @@
+"""Write-behind persistence for workflow execution records.
+
+Node execution records, workflow events and run progress updates used to be
+committed one row at a time on the request's synchronous session, blocking
+the event loop dozens of times per run. :class:`WriteBehindWriter` buffers
+those writes per run and flushes them in bulk from a worker thread with a
+dedicated session:
+
+- Writes for the same run are applied in the order they were recorded
+- Updates to a row that is still buffered are coalesced into that write
+  (a node's start and end usually become a single INSERT)
+- A flush is triggered when the buffer reaches ``max_batch_size`` writes,
+  every ``flush_interval`` seconds while writes are pending, and
+  synchronously via :meth:`WriteBehindWriter.flush` at run completion
+- The interval flush task is cancelled and awaited once a flush empties the
+  buffer, and by :meth:`WriteBehindWriter.aclose`, so it never outlives the
+  writes (or the event loop) it was started for
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import structlog
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.observability import metrics
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class PendingWrite:
+    """A buffered INSERT or UPDATE of a single row.
+
+    Attributes:
+        model: ORM model class
+        operation: "insert" or "update"
+        values: Column values (full row for inserts, changed columns for updates)
+        key_column: Column identifying the row for updates
+        key: Value of ``key_column``
+        attempts: Number of failed flushes that included this write
+    """
+
+    model: Any
+    operation: str
+    values: Dict[str, Any]
+    key_column: Optional[str] = None
+    key: Any = None
+    attempts: int = field(default=0, compare=False)
+
+
+class WriteBehindWriter:
+    """Buffers workflow persistence writes and flushes them in bulk."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        flush_interval: float = 0.25,
+        max_batch_size: int = 100,
+        max_flush_attempts: int = 3,
+    ):
+        """Initialize the writer.
+
+        Args:
+            session_factory: Creates the session used for flushes
+            flush_interval: Seconds between background flushes while writes
+                are pending
+            max_batch_size: Pending writes that trigger an immediate flush
+            max_flush_attempts: Flush failures after which a write is dropped
+        """
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_flush_attempts = max_flush_attempts
+
+        self._pending: Dict[UUID, List[PendingWrite]] = {}
+        self._by_key: Dict[Tuple[Any, Any], PendingWrite] = {}
+        self._pending_count = 0
+        self._flush_lock = asyncio.Lock()
+        self._ticker: Optional[asyncio.Task] = None
+        self._size_flush: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered writes."""
+        return self._pending_count
+
+    def insert(
+        self,
+        run_id: UUID,
+        model: Any,
+        values: Dict[str, Any],
+        key_column: Optional[str] = None,
+    ) -> None:
+        """Buffer a new row.
+
+        Args:
+            run_id: Run the row belongs to (ordering scope)
+            model: ORM model class
+            values: Column values
+            key_column: Column later updates will use to identify the row
+        """
+        key = values.get(key_column) if key_column else None
+        write = PendingWrite(model, "insert", dict(values), key_column, key)
+        self._append(run_id, write)
+
+    def update(
+        self,
+        run_id: UUID,
+        model: Any,
+        key_column: str,
+        key: Any,
+        values: Dict[str, Any],
+    ) -> None:
+        """Buffer an update, coalescing it into a pending write for the same row.
+
+        Args:
+            run_id: Run the row belongs to (ordering scope)
+            model: ORM model class
+            key_column: Column identifying the row
+            key: Value of ``key_column``
+            values: Changed column values
+        """
+        pending = self._by_key.get((model, key))
+        if pending is not None:
+            pending.values.update(values)
+            return
+        self._append(run_id, PendingWrite(model, "update", dict(values), key_column, key))
+
+    def _append(self, run_id: UUID, write: PendingWrite) -> None:
+        self._pending.setdefault(run_id, []).append(write)
+        if write.key is not None:
+            self._by_key[(write.model, write.key)] = write
+        self._pending_count += 1
+        self._schedule()
+
+    def _schedule(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (sync caller): writes wait for an explicit flush
+            return
+
+        if self._pending_count >= self.max_batch_size and (
+            self._size_flush is None or self._size_flush.done()
+        ):
+            self._size_flush = asyncio.create_task(self.flush())
+        if self._ticker is None or self._ticker.done():
+            self._ticker = asyncio.create_task(self._tick())
+
+    async def _tick(self) -> None:
+        # Checked after flushing: while another flush has the batch out of
+        # the buffer the count reads zero, but failed writes come back
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            if not self._pending_count:
+                return
+
+    async def flush(self, run_id: Optional[UUID] = None) -> int:
+        """Write buffered rows in a single transaction.
+
+        Args:
+            run_id: Only flush this run's writes (None flushes every run)
+
+        Returns:
+            Number of writes persisted
+        """
+        async with self._flush_lock:
+            try:
+                return await self._flush(run_id)
+            finally:
+                if not self._pending_count:
+                    await self._stop_ticker()
+
+    async def _flush(self, run_id: Optional[UUID]) -> int:
+        """Flush buffered rows (caller holds the flush lock)."""
+        batch = self._take(run_id)
+        if not batch:
+            return 0
+
+        count = sum(len(writes) for writes in batch.values())
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except Exception as e:
+            self._requeue(batch)
+            metrics.record_write_behind_flush(count, success=False)
+            logger.error(
+                "write_behind.flush_failed",
+                writes=count,
+                runs=len(batch),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return 0
+
+        metrics.record_write_behind_flush(count, success=True)
+        logger.debug("write_behind.flushed", writes=count, runs=len(batch))
+        return count
+
+    def _take(self, run_id: Optional[UUID]) -> Dict[UUID, List[PendingWrite]]:
+        if run_id is None:
+            batch, self._pending = self._pending, {}
+        elif run_id in self._pending:
+            batch = {run_id: self._pending.pop(run_id)}
+        else:
+            return {}
+
+        for writes in batch.values():
+            for write in writes:
+                if self._by_key.get((write.model, write.key)) is write:
+                    del self._by_key[(write.model, write.key)]
+            self._pending_count -= len(writes)
+        return batch
+
+    def _requeue(self, batch: Dict[UUID, List[PendingWrite]]) -> None:
+        for run_id, writes in batch.items():
+            retry = []
+            for write in writes:
+                write.attempts += 1
+                if write.attempts < self.max_flush_attempts:
+                    retry.append(write)
+                else:
+                    logger.error(
+                        "write_behind.write_dropped",
+                        run_id=str(run_id),
+                        model=write.model.__name__,
+                        operation=write.operation,
+                    )
+            # Failed writes go back in front of anything recorded since
+            self._pending[run_id] = retry + self._pending.get(run_id, [])
+            self._pending_count += len(retry)
+
+    def _write(self, batch: Dict[UUID, List[PendingWrite]]) -> None:
+        """Apply a batch in one transaction (runs in a worker thread)."""
+        session = self.session_factory()
+        try:
+            for writes in batch.values():
+                for write in writes:
+                    if write.operation == "insert":
+                        session.add(write.model(**write.values))
+                    else:
+                        session.query(write.model).filter(
+                            getattr(write.model, write.key_column) == write.key
+                        ).update(write.values, synchronize_session=False)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    async def _stop_ticker(self) -> None:
+        """Cancel the interval flush task and wait for it to finish.
+
+        Called with the flush lock held, so the task is either sleeping or
+        waiting for the lock and never cancelled in the middle of a write.
+        """
+        ticker = self._ticker
+        if ticker is None or ticker is asyncio.current_task():
+            # The ticker's own flush: its loop ends once nothing is pending
+            return
+        self._ticker = None
+        if not ticker.done():
+            ticker.cancel()
+            try:
+                await ticker
+            except asyncio.CancelledError:
+                pass
+
+    async def aclose(self) -> None:
+        """Flush everything and stop background flushing."""
+        await self.flush()
+        # Writes that failed to flush stay buffered, but nothing retries them
+        async with self._flush_lock:
+            await self._stop_ticker()
+        size_flush, self._size_flush = self._size_flush, None
+        if size_flush is not None:
+            await size_flush
+
+
+# Global writer instance (None when write-behind is disabled)
+_write_behind_writer: Optional[WriteBehindWriter] = None
+_write_behind_initialized = False
+
+
+def get_write_behind_writer() -> Optional[WriteBehindWriter]:
+    """Get the global write-behind writer, creating it from settings.
+
+    Returns:
+        WriteBehindWriter, or None if ``WORKFLOW_WRITE_BEHIND_ENABLED`` is false
+    """
+    global _write_behind_writer, _write_behind_initialized
+    if not _write_behind_initialized:
+        persistence_settings = settings.WORKFLOW
+        if persistence_settings.WRITE_BEHIND_ENABLED:
+            from app.core.database import SessionLocal
+
+            _write_behind_writer = WriteBehindWriter(
+                SessionLocal,
+                flush_interval=persistence_settings.WRITE_BEHIND_FLUSH_INTERVAL_MS / 1000,
+                max_batch_size=persistence_settings.WRITE_BEHIND_MAX_BATCH_SIZE,
+                max_flush_attempts=persistence_settings.WRITE_BEHIND_MAX_FLUSH_ATTEMPTS,
+            )
+        _write_behind_initialized = True
+    return _write_behind_writer
+
+
+async def close_write_behind_writer() -> None:
+    """Flush and close the global writer."""
+    global _write_behind_writer, _write_behind_initialized
+    if _write_behind_writer is not None:
+        await _write_behind_writer.aclose()
+    _write_behind_writer = None
+    _write_behind_initialized = False
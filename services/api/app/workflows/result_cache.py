@@ -0,0 +1,301 @@
+"""Content-addressed memoization of workflow skill results.
+
+Deterministic skills produce the same outputs for the same inputs, seed and
+model parameters, so their results can be reused across retries and re-runs
+of the same SDS + seed. Entries are keyed by
+``(skill name, skill version, input_hash, seed, model params)`` plus any
+state the skill reads outside its inputs (e.g. the genre blueprint), and stored in
+a bounded in-process LRU tier (L1) backed by an optional Redis tier (L2).
+Tiers are async so the Redis tier never blocks the event loop that runs the
+workflow skills.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from app.core.config import settings
+from app.observability import metrics
+
+logger = structlog.get_logger(__name__)
+
+SKILL_CACHE_NAMESPACE = "skill_results"
+
+
+def build_skill_cache_key(
+    skill_name: str,
+    skill_version: str,
+    input_hash: str,
+    seed: Optional[int],
+    model_params: Optional[Dict[str, Any]],
+    extra: Any = None,
+) -> str:
+    """Build the content-addressed cache key for a skill invocation.
+
+    Args:
+        skill_name: Fully qualified skill name (e.g., "amcs.plan.generate")
+        skill_version: Skill implementation version; bump to invalidate
+        input_hash: SHA-256 of the skill inputs
+        seed: Node seed (None for seed-independent skills)
+        model_params: Model parameters (temperature, top_p, seed) or None
+        extra: JSON-serializable fingerprint of state the skill reads outside
+            its inputs, such as the blueprint it loads (None if there is none)
+
+    Returns:
+        Cache key of the form ``{skill_name}:{skill_version}:{digest}``
+    """
+    params = json.dumps(model_params or {}, sort_keys=True, default=str)
+    material = f"{input_hash}:{seed}:{params}"
+    if extra is not None:
+        material += ":" + json.dumps(extra, sort_keys=True, default=str)
+    digest = hashlib.sha256(material.encode()).hexdigest()
+    return f"{skill_name}:{skill_version}:{digest}"
+
+
+class SkillCacheTier(ABC):
+    """A single storage tier for cached skill results."""
+
+    name: str = "tier"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key`` or None on a miss."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store ``entry`` under ``key``."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Drop every entry held by the tier."""
+        pass
+
+
+class InMemorySkillCacheTier(SkillCacheTier):
+    """Process-local LRU tier bounded by entry count and serialized size.
+
+    Entries are deep-copied on the way in and out so callers can mutate
+    returned outputs (e.g. attach ``_metadata``) without corrupting the cache.
+    """
+
+    name = "l1"
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize the LRU tier.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total size of cached results (JSON-encoded)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._bytes = 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(item[0])
+
+    async def set(self, key: str, entry: Dict[str, Any]) -> None:
+        size = len(json.dumps(entry, default=str).encode())
+        if size > self.max_bytes:
+            logger.debug("skill_cache.entry_too_large", key=key, size_bytes=size)
+            return
+
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (copy.deepcopy(entry), size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            metrics.record_skill_cache_eviction(tier=self.name)
+            logger.debug("skill_cache.evicted", key=evicted_key, size_bytes=evicted_size)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total JSON-encoded size of cached entries."""
+        return self._bytes
+
+
+class RedisSkillCacheTier(SkillCacheTier):
+    """Shared tier stored in Redis via :class:`~app.core.async_cache.AsyncRedisCache`.
+
+    Redis eviction (``maxmemory-policy``) and the entry TTL bound its size.
+    Errors degrade to cache misses; the AsyncRedisCache circuit breaker
+    protects the workflow from a slow or unavailable Redis. Entries are
+    tagged with ``SKILL_CACHE_NAMESPACE`` so :meth:`clear` can drop them.
+    """
+
+    name = "l2"
+
+    def __init__(self, cache: Any, ttl: int = 86400):
+        """Initialize the Redis tier.
+
+        Args:
+            cache: AsyncRedisCache instance
+            ttl: Entry time-to-live in seconds
+        """
+        self.cache = cache
+        self.ttl = ttl
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await self.cache.get(key, value_type=dict, namespace=SKILL_CACHE_NAMESPACE)
+
+    async def set(self, key: str, entry: Dict[str, Any]) -> None:
+        await self.cache.set(
+            key,
+            entry,
+            ttl=self.ttl,
+            namespace=SKILL_CACHE_NAMESPACE,
+            tags={SKILL_CACHE_NAMESPACE},
+        )
+
+    async def clear(self) -> None:
+        await self.cache.invalidate_by_tag(SKILL_CACHE_NAMESPACE)
+
+
+class SkillResultCache:
+    """Tiered skill result cache with hit/miss accounting.
+
+    Lookups go through tiers in order; a hit in a lower tier is promoted
+    into the tiers above it.
+    """
+
+    def __init__(self, tiers: List[SkillCacheTier]):
+        """Initialize the cache.
+
+        Args:
+            tiers: Storage tiers, fastest first
+        """
+        self.tiers = tiers
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    async def get(self, skill_name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result.
+
+        Args:
+            skill_name: Skill name (for metrics)
+            key: Key from :func:`build_skill_cache_key`
+
+        Returns:
+            Cached entry ``{"outputs": {...}, "output_hash": str}`` or None
+        """
+        for index, tier in enumerate(self.tiers):
+            try:
+                entry = await tier.get(key)
+            except Exception as e:
+                logger.warning("skill_cache.get_failed", tier=tier.name, error=str(e))
+                continue
+            if entry is None:
+                continue
+
+            for upper in self.tiers[:index]:
+                try:
+                    await upper.set(key, entry)
+                except Exception as e:
+                    logger.warning(
+                        "skill_cache.promote_failed", tier=upper.name, error=str(e)
+                    )
+
+            self.stats["hits"] += 1
+            metrics.record_skill_cache_lookup(skill_name, hit=True, tier=tier.name)
+            return entry
+
+        self.stats["misses"] += 1
+        metrics.record_skill_cache_lookup(skill_name, hit=False)
+        return None
+
+    async def set(self, skill_name: str, key: str, entry: Dict[str, Any]) -> None:
+        """Store a result in every tier.
+
+        Args:
+            skill_name: Skill name (for logging)
+            key: Key from :func:`build_skill_cache_key`
+            entry: ``{"outputs": {...}, "output_hash": str}``
+        """
+        for tier in self.tiers:
+            try:
+                await tier.set(key, entry)
+            except Exception as e:
+                logger.warning(
+                    "skill_cache.set_failed",
+                    skill_name=skill_name,
+                    tier=tier.name,
+                    error=str(e),
+                )
+        self.stats["stores"] += 1
+
+    async def clear(self) -> None:
+        """Clear every tier."""
+        for tier in self.tiers:
+            await tier.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the hit ratio."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_ratio": self.stats["hits"] / lookups if lookups else 0.0,
+        }
+
+
+# Global cache instance (None when disabled)
+_skill_result_cache: Optional[SkillResultCache] = None
+_skill_result_cache_initialized = False
+
+
+def get_skill_result_cache() -> Optional[SkillResultCache]:
+    """Get the global skill result cache, creating it from settings.
+
+    Returns:
+        SkillResultCache, or None if ``CACHE_SKILL_RESULTS_ENABLED`` is false
+    """
+    global _skill_result_cache, _skill_result_cache_initialized
+    if not _skill_result_cache_initialized:
+        cache_settings = settings.CACHE
+        if cache_settings.ENABLED and cache_settings.SKILL_RESULTS_ENABLED:
+            tiers: List[SkillCacheTier] = [
+                InMemorySkillCacheTier(
+                    max_entries=cache_settings.SKILL_RESULTS_L1_MAX_ENTRIES,
+                    max_bytes=cache_settings.SKILL_RESULTS_L1_MAX_BYTES,
+                )
+            ]
+            if cache_settings.L2_ENABLED and cache_settings.SKILL_RESULTS_L2_ENABLED:
+                from app.core.async_cache import get_async_cache
+
+                tiers.append(
+                    RedisSkillCacheTier(
+                        get_async_cache(), ttl=cache_settings.SKILL_RESULTS_TTL
+                    )
+                )
+            _skill_result_cache = SkillResultCache(tiers)
+        _skill_result_cache_initialized = True
+    return _skill_result_cache
+
+
+def set_skill_result_cache(cache: Optional[SkillResultCache]) -> None:
+    """Replace the global skill result cache (None disables caching)."""
+    global _skill_result_cache, _skill_result_cache_initialized
+    _skill_result_cache = cache
+    _skill_result_cache_initialized = True
@@ -7,8 +7,6 @@ error handling, and determinism enforcement.
 
 from __future__ import annotations
 
-import hashlib
-import json
 import time
 import traceback
 from dataclasses import dataclass
@@ -20,7 +18,9 @@ import structlog
 from opentelemetry import trace
 from pydantic import BaseModel, ValidationError
 
+from app.core.hashing import WORKFLOW_ENCODING, CanonicalDocument
 from app.observability import metrics
+from app.workflows.result_cache import build_skill_cache_key, get_skill_result_cache
 
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -45,6 +45,10 @@ class WorkflowContext:
         db_session: Optional database session for artifact persistence
         security_context: Security context for RLS enforcement
         extra_context: Additional context data
+        input_hash: Hash of the inputs, when the caller already computed it
+        result_document: Set by the skill wrapper to the canonical encoding
+            of the returned outputs (including ``_metadata``) so the caller
+            can hash them without serializing them again
     """
 
     run_id: UUID
@@ -56,6 +60,8 @@ class WorkflowContext:
     db_session: Optional[Any] = None  # Session
     security_context: Optional[Any] = None  # SecurityContext
     extra_context: Optional[Dict[str, Any]] = None
+    input_hash: Optional[str] = None
+    result_document: Optional[CanonicalDocument] = None
 
 
 class SkillValidationError(Exception):
@@ -81,13 +87,22 @@ def compute_hash(data: Any) -> str:
     """
     try:
         # Sort keys for deterministic JSON serialization
-        json_str = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        return WORKFLOW_ENCODING.hexdigest(data)
     except Exception as e:
         logger.warning("hash_computation_failed", error=str(e))
         return ""
 
 
+def _encode_outputs(outputs: Any) -> Optional[CanonicalDocument]:
+    """Encode skill outputs for hashing, or None if they must be hashed whole."""
+    if not isinstance(outputs, dict):
+        return None
+    try:
+        return WORKFLOW_ENCODING.document(outputs)
+    except Exception:
+        return None
+
+
 def workflow_skill(
     name: str,
     inputs_schema: Optional[type[BaseModel]] = None,
@@ -95,6 +110,12 @@ def workflow_skill(
     deterministic: bool = True,
     default_temperature: float = 0.2,
     default_top_p: float = 0.9,
+    version: str = "1",
+    cacheable: bool = False,
+    seed_sensitive: bool = True,
+    cache_key_extra: Optional[
+        Callable[[Dict[str, Any], "WorkflowContext"], Any]
+    ] = None,
 ) -> Callable:
     """Decorator for workflow skill functions.
 
@@ -105,6 +126,11 @@ def workflow_skill(
     - Event emission (start/end/fail)
     - Error handling and logging
     - Hash computation for reproducibility
+    - Optional result memoization keyed by (name, version, input_hash, seed,
+      model params, extra key material) for skills with no LLM calls or side
+      effects
+    - Seed-independence marking, so batch execution can share one result
+      across runs that differ only in seed
 
     Example:
         ```python
@@ -131,6 +157,15 @@ def workflow_skill(
         deterministic: Whether this skill should be deterministic
         default_temperature: Default LLM temperature for this skill
         default_top_p: Default LLM top_p for this skill
+        version: Skill implementation version; bump it whenever the skill's
+            outputs change for the same inputs so cached results are not reused
+        cacheable: Whether results may be served from the skill result cache
+        seed_sensitive: Whether outputs depend on the node seed; when False the
+            seed is left out of the cache key and batch runs share the result
+        cache_key_extra: Called with the validated inputs and context to
+            fingerprint state the skill reads outside its inputs (e.g. the
+            genre blueprint it loads from the database); the result is added
+            to the cache key so changes to that state miss the cache
 
     Returns:
         Decorated async function
@@ -144,7 +179,7 @@ def workflow_skill(
             """Wrapped skill execution with validation and telemetry."""
 
             start_time = time.time()
-            input_hash = compute_hash(inputs)
+            input_hash = context.input_hash or compute_hash(inputs)
 
             # Create OpenTelemetry span
             with tracer.start_as_current_span(f"skill.{name}") as span:
@@ -201,21 +236,64 @@ def workflow_skill(
                         span.set_attribute("skill.temperature", model_params["temperature"])
                         span.set_attribute("skill.top_p", model_params["top_p"])
 
-                    # Execute the skill function
-                    outputs = await func(inputs, context, **kwargs)
+                    # Serve from the skill result cache when possible
+                    result_cache = get_skill_result_cache() if cacheable else None
+                    cache_key = None
+                    cached = None
+                    if result_cache is not None:
+                        cache_params = model_params
+                        if not seed_sensitive and model_params:
+                            cache_params = {
+                                k: v for k, v in model_params.items() if k != "seed"
+                            }
+                        cache_key = build_skill_cache_key(
+                            name,
+                            version,
+                            input_hash,
+                            context.seed if seed_sensitive else None,
+                            cache_params,
+                            cache_key_extra(inputs, context)
+                            if cache_key_extra
+                            else None,
+                        )
+                        cached = await result_cache.get(name, cache_key)
+                    cache_hit = cached is not None
+                    span.set_attribute("skill.cache_hit", cache_hit)
+
+                    output_document = None
+                    if cache_hit:
+                        outputs = cached["outputs"]
+                        output_hash = cached["output_hash"]
+                    else:
+                        # Execute the skill function
+                        outputs = await func(inputs, context, **kwargs)
+
+                        # Validate outputs
+                        if outputs_schema:
+                            try:
+                                validated_outputs = outputs_schema(**outputs)
+                                outputs = validated_outputs.model_dump()
+                            except ValidationError as e:
+                                raise SkillValidationError(
+                                    f"Output validation failed for {name}: {e}"
+                                ) from e
+
+                        # Compute output hash, keeping the per-key encoding
+                        # so adding _metadata below needs no re-serialization
+                        output_document = _encode_outputs(outputs)
+                        output_hash = (
+                            output_document.hexdigest()
+                            if output_document is not None
+                            else compute_hash(outputs)
+                        )
 
-                    # Validate outputs
-                    if outputs_schema:
-                        try:
-                            validated_outputs = outputs_schema(**outputs)
-                            outputs = validated_outputs.model_dump()
-                        except ValidationError as e:
-                            raise SkillValidationError(
-                                f"Output validation failed for {name}: {e}"
-                            ) from e
+                        if result_cache is not None:
+                            await result_cache.set(
+                                name,
+                                cache_key,
+                                {"outputs": outputs, "output_hash": output_hash},
+                            )
 
-                    # Compute output hash
-                    output_hash = compute_hash(outputs)
                     span.set_attribute("skill.output_hash", output_hash)
 
                     # Calculate duration
@@ -230,6 +308,7 @@ def workflow_skill(
                         node_index=context.node_index,
                         duration_ms=duration_ms,
                         output_hash=output_hash,
+                        cache_hit=cache_hit,
                     )
 
                     # Record skill execution metrics
@@ -250,18 +329,25 @@ def workflow_skill(
                                 "duration_ms": duration_ms,
                                 "output_hash": output_hash,
                                 "model_params": model_params,
+                                "cache_hit": cache_hit,
                             },
                         )
 
                     # Add execution metadata to outputs
-                    outputs["_metadata"] = {
+                    execution_metadata = {
                         "skill_name": name,
                         "duration_ms": duration_ms,
                         "input_hash": input_hash,
                         "output_hash": output_hash,
                         "seed": context.seed,
                         "model_params": model_params,
+                        "cache_hit": cache_hit,
                     }
+                    outputs["_metadata"] = execution_metadata
+                    if output_document is not None:
+                        context.result_document = output_document.with_values(
+                            {"_metadata": execution_metadata}, source=outputs
+                        )
 
                     return outputs
 
@@ -350,6 +436,7 @@ def workflow_skill(
                         f"Skill {name} execution failed: {e}"
                     ) from e
 
+        wrapper.seed_sensitive = seed_sensitive
         return wrapper
 
     return decorator
@@ -13,9 +13,15 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.core.async_cache import close_async_cache, start_tag_index_compactor
+from app.core.cache_manager import close_cache_manager, start_cache_manager
 from app.core.config import settings
 from app.core.database import engine
 from app.observability.tracing import init_tracing
+from app.services.rubric_scorer import shutdown_batch_pool
+from app.skills.llm_client import close_llm_client
+from app.workflows.jobs import start_run_worker, stop_run_worker
+from app.workflows.persistence import close_write_behind_writer
 from app.middleware.correlation import CorrelationMiddleware
 from app.middleware.request_logger import RequestLoggerMiddleware
 
@@ -35,10 +41,20 @@ async def lifespan(app: FastAPI):
         },
     )
 
+    await start_cache_manager()
+    await start_tag_index_compactor()
+    await start_run_worker()
+
     yield
 
     # Shutdown
     logger.info("Shutting down MeatyMusic AMCS API")
+    await stop_run_worker()
+    await close_write_behind_writer()
+    await close_llm_client()
+    await close_cache_manager()
+    await close_async_cache()
+    shutdown_batch_pool()
     engine.dispose()
 
 
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Async Cache Benchmark
+
+Compares the blocking ``RedisCache`` and the asyncio-native ``AsyncRedisCache``
+when called from concurrent async request handlers, against a fakeredis
+server with a simulated network round-trip per command:
+
+- sync: each handler calls RedisCache directly, blocking the event loop for
+  every round-trip, so handlers run one command at a time
+- async: each handler awaits AsyncRedisCache, so round-trips overlap
+
+Reported per variant: wall time, cache operations per second and the worst
+event-loop stall seen by a 1 ms heartbeat task.
+
+Usage:
+    python scripts/benchmark_async_cache.py
+
+    # More concurrent handlers, slower network
+    python scripts/benchmark_async_cache.py --requests 500 --latency-ms 2
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+# Simulated latency must not trip the latency circuit breaker
+os.environ.setdefault("CACHE_CIRCUIT_BREAKER_LATENCY_THRESHOLD_MS", "1000")
+
+import fakeredis  # noqa: E402
+
+from app.core.async_cache import AsyncRedisCache  # noqa: E402
+from app.core.cache import RedisCache  # noqa: E402
+
+
+def slow_clients(server: "fakeredis.FakeServer", latency_s: float):
+    """fakeredis clients that wait ``latency_s`` per command."""
+
+    class SlowRedis(fakeredis.FakeRedis):
+        def execute_command(self, *args, **options):
+            time.sleep(latency_s)
+            return super().execute_command(*args, **options)
+
+    class SlowAsyncRedis(fakeredis.FakeAsyncRedis):
+        async def execute_command(self, *args, **options):
+            await asyncio.sleep(latency_s)
+            return await super().execute_command(*args, **options)
+
+    return (
+        SlowRedis(server=server),
+        SlowAsyncRedis(server=server),
+    )
+
+
+async def run_variant(
+    handler: Callable[[int], Awaitable[None]], requests: int
+) -> Dict[str, float]:
+    """Run ``requests`` concurrent handlers while measuring event-loop stalls."""
+    max_stall = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_stall
+        interval = 0.001
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_stall = max(max_stall, time.perf_counter() - start - interval)
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*[handler(i) for i in range(requests)])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+
+    return {
+        "seconds": elapsed,
+        "ops_per_second": requests * 3 / elapsed,
+        "max_stall_ms": max_stall * 1000,
+    }
+
+
+async def benchmark(requests: int, latency_ms: float) -> Dict[str, Dict[str, float]]:
+    sync_client, async_client = slow_clients(fakeredis.FakeServer(), latency_ms / 1000)
+    sync_cache = RedisCache(client=sync_client)
+    async_cache = AsyncRedisCache(client=async_client)
+    payload: Dict[str, Any] = {"title": "Neon Nights", "sections": ["Verse", "Chorus"] * 8}
+
+    async def sync_handler(i: int) -> None:
+        key = f"sync:{i}"
+        sync_cache.get(key, value_type=dict, namespace="bench")
+        sync_cache.set(key, payload, ttl=60, namespace="bench")
+        sync_cache.get(key, value_type=dict, namespace="bench")
+
+    async def async_handler(i: int) -> None:
+        key = f"async:{i}"
+        await async_cache.get(key, value_type=dict, namespace="bench")
+        await async_cache.set(key, payload, ttl=60, namespace="bench")
+        await async_cache.get(key, value_type=dict, namespace="bench")
+
+    results = {
+        "sync": await run_variant(sync_handler, requests),
+        "async": await run_variant(async_handler, requests),
+    }
+    await async_cache.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args.requests, args.latency_ms))
+
+    print(f"{args.requests} concurrent handlers x 3 cache ops, {args.latency_ms} ms per round-trip")
+    print(f"{'variant':>8} {'seconds':>9} {'ops/s':>10} {'max stall ms':>13}")
+    for name, stats in results.items():
+        print(
+            f"{name:>8} {stats['seconds']:>9.3f} {stats['ops_per_second']:>10.0f} "
+            f"{stats['max_stall_ms']:>13.1f}"
+        )
+    print(f"Speedup: {results['sync']['seconds'] / results['async']['seconds']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
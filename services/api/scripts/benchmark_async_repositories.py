@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Async Repository Load Test
+
+Compares the blocking ``SongRepository`` (sync ``Session``) and the
+``AsyncSongRepository`` (``AsyncSession`` on aiosqlite) when called from
+concurrent async request handlers against a seeded SQLite database:
+
+- sync: each handler runs its queries on a sync session, blocking the event
+  loop for every statement, so requests are served one at a time
+- async: each handler awaits its queries, so the loop keeps serving other
+  requests while the driver works
+
+In-process SQLite has no network round-trip, so ``--latency-ms`` adds one
+per statement, spent in the thread that runs the statement (the event loop
+for the sync driver, aiosqlite's worker thread for the async one).
+
+Each simulated request does what the songs endpoints do: a ``GET /songs``
+page (``list_paginated``) and a ``GET /songs/{id}`` (``get_by_id``).
+Reported per variant: wall time, requests per second, p95 request latency
+and the worst event-loop stall seen by a 1 ms heartbeat task.
+
+Usage:
+    python scripts/benchmark_async_repositories.py
+
+    # More concurrent requests, bigger table
+    python scripts/benchmark_async_repositories.py --requests 500 --songs 5000
+
+    # Pure in-process SQLite (no simulated round-trip)
+    python scripts/benchmark_async_repositories.py --latency-ms 0
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.security import create_user_context  # noqa: E402
+from app.models.song import Song  # noqa: E402
+from app.repositories import AsyncSongRepository, SongRepository  # noqa: E402
+
+
+def seed(url: str, songs: int, owners: List) -> List:
+    """Create the songs table and ``songs`` rows spread over ``owners``."""
+    engine = create_engine(url)
+    Song.__table__.create(bind=engine)
+    ids = []
+    with sessionmaker(bind=engine)() as session:
+        for i in range(songs):
+            song = Song(
+                tenant_id=uuid4(),
+                owner_id=owners[i % len(owners)],
+                title=f"Song {i}",
+                sds_version="1.0.0",
+                global_seed=i,
+                blueprint_id=uuid4(),
+                status="draft",
+                feature_flags={},
+            )
+            session.add(song)
+            ids.append((song.owner_id, song))
+        session.commit()
+        ids = [(owner, song.id) for owner, song in ids]
+    engine.dispose()
+    return ids
+
+
+def add_round_trip(engine, latency_s: float, is_async: bool) -> None:
+    """Sleep ``latency_s`` per statement in the thread executing it."""
+    if latency_s <= 0:
+        return
+
+    def round_trip(_statement: str) -> None:
+        time.sleep(latency_s)
+
+    @event.listens_for(engine.sync_engine if is_async else engine, "connect")
+    def _on_connect(dbapi_connection, _record):
+        if is_async:
+            # Install the callback from aiosqlite's worker thread, which owns
+            # the sqlite3 connection
+            async def install(driver_connection):
+                await driver_connection._execute(
+                    driver_connection._conn.set_trace_callback, round_trip
+                )
+
+            dbapi_connection.run_async(install)
+        else:
+            dbapi_connection.set_trace_callback(round_trip)
+
+
+async def run_variant(
+    handler: Callable[[int], Awaitable[None]], requests: int
+) -> Dict[str, float]:
+    """Run ``requests`` concurrent handlers while measuring event-loop stalls."""
+    max_stall = 0.0
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal max_stall
+        interval = 0.001
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_stall = max(max_stall, time.perf_counter() - start - interval)
+
+    # All requests arrive at once: latency includes time spent queued
+    # behind other requests
+    async def timed(i: int) -> None:
+        await handler(i)
+        latencies.append(time.perf_counter() - start)
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*[timed(i) for i in range(requests)])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+
+    latencies.sort()
+    return {
+        "seconds": elapsed,
+        "requests_per_second": requests / elapsed,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_stall_ms": max_stall * 1000,
+    }
+
+
+async def benchmark(
+    requests: int, songs: int, page_size: int, latency_ms: float
+) -> Dict[str, Dict[str, float]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "load_test.db"
+        owners = [uuid4() for _ in range(10)]
+        rows = seed(f"sqlite:///{path}", songs, owners)
+
+        sync_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+        SyncSession = sessionmaker(bind=sync_engine)
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        AsyncSession = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+        add_round_trip(sync_engine, latency_ms / 1000, is_async=False)
+        add_round_trip(async_engine, latency_ms / 1000, is_async=True)
+
+        async def sync_handler(i: int) -> None:
+            owner_id, song_id = rows[i % len(rows)]
+            with SyncSession() as db:
+                repo = SongRepository(db=db, security_context=create_user_context(owner_id))
+                repo.list_paginated(Song, limit=page_size, sort_field="created_at")
+                repo.get_by_id(Song, song_id)
+
+        async def async_handler(i: int) -> None:
+            owner_id, song_id = rows[i % len(rows)]
+            async with AsyncSession() as db:
+                repo = AsyncSongRepository(db=db, security_context=create_user_context(owner_id))
+                await repo.list_paginated(Song, limit=page_size, sort_field="created_at")
+                await repo.get_by_id(Song, song_id)
+
+        results = {
+            "sync": await run_variant(sync_handler, requests),
+            "async": await run_variant(async_handler, requests),
+        }
+        sync_engine.dispose()
+        await async_engine.dispose()
+        return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--songs", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # Per-query debug/slow-query logging would dominate the measurement
+    logging.disable(logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    results = asyncio.run(benchmark(args.requests, args.songs, args.page_size, args.latency_ms))
+
+    print(
+        f"{args.requests} concurrent requests (list page + get by id), {args.songs} songs, "
+        f"{args.latency_ms} ms per statement"
+    )
+    print(f"{'variant':>8} {'seconds':>9} {'req/s':>8} {'p95 ms':>8} {'max stall ms':>13}")
+    for name, stats in results.items():
+        print(
+            f"{name:>8} {stats['seconds']:>9.3f} {stats['requests_per_second']:>8.0f} "
+            f"{stats['p95_ms']:>8.1f} {stats['max_stall_ms']:>13.1f}"
+        )
+    print(f"Speedup: {results['sync']['seconds'] / results['async']['seconds']:.1f}x")
+    print(
+        f"Worst event-loop stall: sync {results['sync']['max_stall_ms']:.1f} ms, "
+        f"async {results['async']['max_stall_ms']:.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Cache Codec Benchmark
+
+Compares the binary cache codec with the previous text encoding of
+``RedisCache`` values on SDS + blueprint payloads of the size cached in
+production (tens of KB):
+
+- legacy: JSON text, zlib-compressed and smuggled back into a ``str`` via
+  latin-1 behind a ``"__compressed__"`` prefix; encoded to bytes on write and
+  decoded to ``str`` on read (``decode_responses=True``)
+- codec: versioned header + MessagePack/JSON bytes, fast compression,
+  decoded from a memoryview of the stored bytes
+
+Also checks that values written by the legacy encoding still decode.
+
+Usage:
+    python scripts/benchmark_cache_codec.py
+
+    # Larger payloads
+    python scripts/benchmark_cache_codec.py --copies 8 --iterations 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import cache_codec  # noqa: E402
+from app.core.cache_codec import decode_value, encode_value  # noqa: E402
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def legacy_encode(value: Any) -> bytes:
+    """``RedisCache._serialize_value`` before the codec, plus redis-py's encode."""
+    serialized = json.dumps(value, default=str)
+    if len(serialized.encode()) > cache_codec.COMPRESSION_THRESHOLD:
+        serialized = "__compressed__" + zlib.compress(serialized.encode()).decode("latin-1")
+    return serialized.encode()
+
+
+def legacy_decode(raw: bytes) -> Any:
+    """redis-py's response decoding plus ``_deserialize_value`` before the codec."""
+    value = raw.decode()
+    if value.startswith("__compressed__"):
+        value = zlib.decompress(value[14:].encode("latin-1")).decode()
+    return json.loads(value)
+
+
+def build_payload(copies: int) -> Dict[str, Any]:
+    """An SDS with its blueprint and rendered sections, ``copies`` times over."""
+    sds = json.loads((FIXTURES / "sample_sds.json").read_text())[0]
+    blueprint = json.loads((FIXTURES / "sample_blueprints" / "pop_blueprint.json").read_text())
+    return {
+        f"song_{i}": {
+            "sds": sds,
+            "blueprint": blueprint,
+            "sections": [
+                {"name": f"Verse {n}", "lines": [f"Line {n}.{j}: neon lights tonight" for j in range(8)]}
+                for n in range(6)
+            ],
+        }
+        for i in range(copies)
+    }
+
+
+def timed(func: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--copies", type=int, default=4)
+    args = parser.parse_args()
+
+    payload = build_payload(args.copies)
+    legacy_raw = legacy_encode(payload)
+    codec_raw = encode_value(payload)
+
+    # Legacy entries must keep decoding, and the codec must round-trip
+    if decode_value(legacy_raw, dict) != payload or decode_value(codec_raw, dict) != payload:
+        print("Round-trip mismatch")
+        return 1
+
+    print(f"Payload: {len(json.dumps(payload)) / 1024:.1f} KiB JSON")
+    print(
+        f"Serializer: {'msgpack' if cache_codec.msgpack else 'json'}, "
+        f"compressor: {'lz4' if cache_codec.lz4_frame else 'zlib'}"
+    )
+    print(f"{'variant':>8} {'stored KiB':>11} {'write us':>10} {'read us':>10}")
+    results = {}
+    for name, encode, decode, raw in (
+        ("legacy", legacy_encode, legacy_decode, legacy_raw),
+        ("codec", encode_value, lambda r: decode_value(r, dict), codec_raw),
+    ):
+        write_us = timed(lambda encode=encode: encode(payload), args.iterations)
+        read_us = timed(lambda decode=decode, raw=raw: decode(raw), args.iterations)
+        results[name] = (write_us, read_us)
+        print(f"{name:>8} {len(raw) / 1024:>11.1f} {write_us:>10.1f} {read_us:>10.1f}")
+
+    print(
+        f"Speedup: write {results['legacy'][0] / results['codec'][0]:.2f}x, "
+        f"read {results['legacy'][1] / results['codec'][1]:.2f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Canonical Hashing Benchmark
+
+Checks that the canonical hashing engine produces byte-identical digests to
+the previous ``json.dumps(sort_keys=True)`` + SHA-256 implementations of
+``compute_hash`` and ``hash_artifact``, then times the hashing done for a
+PLAN → STYLE/LYRICS/PRODUCER → COMPOSE → VALIDATE run:
+
+- legacy: every input and output hashed from scratch (the orchestrator and
+  the skill wrapper each hash the inputs, and both hash the outputs)
+- engine: inputs hashed once with upstream outputs spliced in as leaves,
+  outputs encoded once and extended with ``_metadata``
+
+Usage:
+    python scripts/benchmark_hashing.py
+
+    # More iterations, larger lyrics payloads
+    python scripts/benchmark_hashing.py --iterations 2000 --lyrics-lines 200
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+from app.core.determinism import hash_artifact  # noqa: E402
+from app.core.hashing import WORKFLOW_ENCODING  # noqa: E402
+from app.workflows.skill import compute_hash  # noqa: E402
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+
+def legacy_compute_hash(data: Any) -> str:
+    """``compute_hash`` before the hashing engine."""
+    json_str = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(json_str.encode()).hexdigest()
+
+
+def legacy_hash_artifact(artifact: Any) -> str:
+    """``hash_artifact`` (dict inputs) before the hashing engine."""
+    content = json.dumps(artifact, sort_keys=True, ensure_ascii=False)
+    return f"sha256:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
+
+def load_corpus() -> List[Any]:
+    """JSON fixtures plus edge cases (unicode, non-JSON types, int keys)."""
+    from datetime import datetime
+    from uuid import UUID
+
+    corpus: List[Any] = []
+    for path in sorted(FIXTURES.rglob("*.json")):
+        corpus.append(json.loads(path.read_text()))
+    corpus += [
+        {},
+        {"lyrics": "Café ☕ — “quoted” \\ back\\slash \n new line", "n": 1.5e-7},
+        {"id": UUID(int=7), "at": datetime(2025, 1, 1), "nested": [{"b": 1, "a": None}]},
+        {1: "int key", 2: ["x"]},
+        "plain string",
+        [3, 2, 1],
+    ]
+    return corpus
+
+
+def build_run(
+    sds: Dict[str, Any], blueprint: Dict[str, Any], lyrics_lines: int
+) -> List[Tuple[str, List[str], Dict[str, Any]]]:
+    """Node outputs of a representative run: (node, dependencies, outputs)."""
+    lyrics = "\n".join(
+        f"Line {i}: neon lights are calling out my name tonight" for i in range(lyrics_lines)
+    )
+    meta = {"skill_name": "bench", "duration_ms": 12, "seed": 42, "cache_hit": False}
+    return [
+        ("PLAN", [], {"plan": {"constraints": sds.get("constraints", {})}, "sds": sds,
+                      "blueprint": blueprint, "_metadata": meta}),
+        ("STYLE", ["PLAN"], {"style": sds.get("style", {}), "_metadata": meta}),
+        ("LYRICS", ["PLAN"], {"lyrics": lyrics, "citations": [], "_metadata": meta}),
+        ("PRODUCER", ["PLAN"], {"producer_notes": sds.get("persona", {}), "_metadata": meta}),
+        ("COMPOSE", ["STYLE", "LYRICS", "PRODUCER"],
+         {"composed_prompt": {"text": lyrics}, "_metadata": meta}),
+        ("VALIDATE", ["COMPOSE", "PLAN"], {"scores": {"total": 0.8}, "pass": True, "_metadata": meta}),
+    ]
+
+
+def hash_run_legacy(run) -> List[str]:
+    """Hash a run the way the orchestrator and skill wrapper used to."""
+    outputs: Dict[str, Any] = {}
+    digests = []
+    for node, deps, node_outputs in run:
+        inputs = {dep: outputs[dep] for dep in deps}
+        digests.append(legacy_compute_hash(inputs))  # orchestrator
+        legacy_compute_hash(inputs)  # skill wrapper
+        body = {k: v for k, v in node_outputs.items() if k != "_metadata"}
+        legacy_compute_hash(body)  # skill wrapper output hash
+        digests.append(legacy_compute_hash(node_outputs))  # orchestrator
+        outputs[node] = node_outputs
+    return digests
+
+
+def hash_run_engine(run) -> List[str]:
+    """Hash a run with leaf reuse, as the orchestrator does now."""
+    outputs: Dict[str, Any] = {}
+    documents: Dict[str, Any] = {}
+    digests = []
+    for node, deps, node_outputs in run:
+        inputs = {dep: outputs[dep] for dep in deps}
+        digests.append(WORKFLOW_ENCODING.document(inputs, leaves=documents).hexdigest())
+        body = {k: v for k, v in node_outputs.items() if k != "_metadata"}
+        document = WORKFLOW_ENCODING.document(body)
+        document.hexdigest()
+        full = document.with_values({"_metadata": node_outputs["_metadata"]}, source=node_outputs)
+        digests.append(full.hexdigest())
+        outputs[node] = node_outputs
+        documents[node] = full
+    return digests
+
+
+def timed(func: Callable[[], Any], iterations: int) -> float:
+    """Mean microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--lyrics-lines", type=int, default=80)
+    args = parser.parse_args()
+
+    # 1. Byte-identical digests
+    corpus = load_corpus()
+    mismatches = 0
+    for item in corpus:
+        if compute_hash(item) != legacy_compute_hash(item):
+            mismatches += 1
+        if isinstance(item, dict) and all(isinstance(k, str) for k in item):
+            try:
+                legacy = legacy_hash_artifact(item)
+            except TypeError:
+                continue  # not JSON-serializable without default=str
+            if hash_artifact(item) != legacy:
+                mismatches += 1
+
+    sds = json.loads((FIXTURES / "sample_sds.json").read_text())[0]
+    blueprint = json.loads((FIXTURES / "sample_blueprints" / "pop_blueprint.json").read_text())
+    run = build_run(sds, blueprint, args.lyrics_lines)
+    legacy_digests = hash_run_legacy(run)
+    engine_digests = hash_run_engine(run)
+    if legacy_digests != engine_digests:
+        mismatches += 1
+
+    print(f"Corpus: {len(corpus)} payloads + {len(legacy_digests)} run digests")
+    print(f"Digest mismatches: {mismatches}")
+    if mismatches:
+        return 1
+
+    # 2. Throughput
+    payload_bytes = len(json.dumps({node: out for node, _, out in run}))
+    print(f"Run payload: {payload_bytes / 1024:.1f} KiB across {len(run)} nodes")
+    print(f"{'variant':>10} {'us/run':>10}")
+    legacy_us = timed(lambda: hash_run_legacy(run), args.iterations)
+    engine_us = timed(lambda: hash_run_engine(run), args.iterations)
+    print(f"{'legacy':>10} {legacy_us:>10.1f}")
+    print(f"{'engine':>10} {engine_us:>10.1f}")
+    print(f"Speedup: {legacy_us / engine_us:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+LLM Event-Loop Latency Benchmark
+
+Runs N concurrent generations against the offline stub provider and samples
+event-loop lag with a heartbeat task. With the async transport the lag stays
+flat as N grows; the ``--blocking`` mode reproduces the old behaviour (a
+synchronous call inside ``async def``) for comparison.
+
+Usage:
+    # Async stub transport, 1/10/50 concurrent generations, 200ms latency
+    python scripts/benchmark_llm_event_loop.py
+
+    # Custom concurrency levels and latency
+    python scripts/benchmark_llm_event_loop.py --concurrency 1 25 100 --latency-ms 100
+
+    # Compare with a blocking transport
+    python scripts/benchmark_llm_event_loop.py --blocking
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+
+from app.skills.llm_client import LLMClient, LLMResponse, StubTransport  # noqa: E402
+
+# Keep per-request log lines out of the report
+structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+class BlockingStubTransport(StubTransport):
+    """Stub that sleeps synchronously, like the old sync SDK call."""
+
+    async def create_message(self, params: Dict[str, Any], timeout: float) -> LLMResponse:
+        time.sleep(self.latency_ms / 1000)
+        return await StubTransport(latency_ms=0).create_message(params, timeout)
+
+
+async def _heartbeat(interval: float, lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late each heartbeat wakes up (event-loop lag)."""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - expected, 0.0) * 1000)
+
+
+async def run_level(concurrency: int, latency_ms: int, blocking: bool) -> Dict[str, float]:
+    """Run one concurrency level and return lag/throughput stats."""
+    transport_cls = BlockingStubTransport if blocking else StubTransport
+    client = LLMClient(transport=transport_cls(latency_ms=latency_ms))
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    heartbeat = asyncio.create_task(_heartbeat(0.005, lags, stop))
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client.generate(system="bench", user_prompt=f"section {i}", seed=i)
+            for i in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+
+    lags = lags or [0.0]
+    return {
+        "concurrency": concurrency,
+        "wall_s": elapsed,
+        "lag_p50_ms": statistics.median(lags),
+        "lag_max_ms": max(lags),
+    }
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency-ms", type=int, default=200)
+    parser.add_argument("--blocking", action="store_true", help="Use a blocking transport")
+    args = parser.parse_args()
+
+    mode = "blocking" if args.blocking else "async"
+    print(f"Transport: {mode} stub, latency={args.latency_ms}ms")
+    print(f"{'N':>5} {'wall (s)':>10} {'lag p50 (ms)':>14} {'lag max (ms)':>14}")
+    for level in args.concurrency:
+        stats = await run_level(level, args.latency_ms, args.blocking)
+        print(
+            f"{stats['concurrency']:>5} {stats['wall_s']:>10.3f} "
+            f"{stats['lag_p50_ms']:>14.2f} {stats['lag_max_ms']:>14.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Profanity Matcher Benchmark
+
+Compares ``ProfanityFilter.detect_profanity`` with its single-pass
+MultiPatternMatcher against the previous per-pattern scan (one ``finditer``
+over the text for every word pattern and every leetspeak variation
+pattern) on synthetic taxonomies of increasing size:
+
+- checks that both return identical violations (terms, positions,
+  severities, contexts, forms) and threshold decisions
+- times one detection over a lyrics-sized text for each taxonomy size
+
+Synthetic taxonomies keep the real leetspeak patterns and whitelist and
+add random pronounceable terms; the text mixes plain, masked, spaced and
+leetspeak occurrences of some of them.
+
+Usage:
+    python scripts/benchmark_profanity_matcher.py
+
+    # Other taxonomy sizes, longer texts
+    python scripts/benchmark_profanity_matcher.py --sizes 100 1000 10000 --lines 120
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+
+from app.services.policy_guards import ProfanityFilter, ProfanityViolation  # noqa: E402
+
+TAXONOMY = Path(__file__).parent.parent.parent.parent / "taxonomies" / "profanity_list.json"
+SEVERITIES = ["mild", "moderate", "strong", "extreme"]
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiou"
+
+
+def legacy_detect(profanity_filter: ProfanityFilter, text: str, mode: str = "clean") -> Tuple[bool, List[Dict[str, Any]]]:
+    """``detect_profanity`` before the single-pass matcher."""
+    if not text:
+        return False, []
+    normalized_text = profanity_filter._normalize_text(text)
+    violations: List[ProfanityViolation] = []
+    detected_positions: Set[int] = set()
+
+    def category_of(term: str) -> Any:
+        term_lower = term.lower()
+        for category, terms in profanity_filter.categories.items():
+            if term_lower in [t.lower() for t in terms]:
+                return category
+        return None
+
+    for term, pattern in profanity_filter._word_boundary_patterns.items():
+        for match in pattern.finditer(text):
+            position = match.start()
+            if position in detected_positions:
+                continue
+            if profanity_filter._is_whitelisted(text, position, len(match.group())):
+                continue
+            category = category_of(term)
+            if category is None:
+                continue
+            violations.append(ProfanityViolation(
+                term=term, position=position, severity=category,
+                context=profanity_filter._get_context(text, position, len(match.group())),
+                normalized_form=term, original_form=match.group(),
+            ))
+            detected_positions.add(position)
+
+    for base_term, pattern in profanity_filter._variation_patterns:
+        for match in pattern.finditer(normalized_text):
+            position = match.start()
+            if position in detected_positions:
+                continue
+            if position < len(text) and profanity_filter._is_whitelisted(text, position, len(match.group())):
+                continue
+            category = category_of(base_term)
+            if category is None:
+                continue
+            original_form = text[position:position + len(match.group())] if position < len(text) else match.group()
+            violations.append(ProfanityViolation(
+                term=base_term, position=position, severity=category,
+                context=profanity_filter._get_context(text, position, len(match.group())),
+                normalized_form=match.group(), original_form=original_form,
+            ))
+            detected_positions.add(position)
+
+    has_violations = profanity_filter._check_violations_against_threshold(violations, mode)
+    return has_violations, [v.to_dict() for v in violations]
+
+
+def synthetic_taxonomy(size: int, rng: random.Random) -> Dict[str, Any]:
+    """Real taxonomy settings with ``size`` terms spread over the severities."""
+    taxonomy = json.loads(TAXONOMY.read_text())
+    real_terms = [term for terms in taxonomy["categories"].values() for term in terms]
+    terms = set(real_terms[:size])
+    while len(terms) < size:
+        syllables = rng.randint(1, 3)
+        terms.add("".join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables)) + rng.choice(CONSONANTS))
+    ordered = sorted(terms)
+    taxonomy["categories"] = {severity: ordered[i::len(SEVERITIES)] for i, severity in enumerate(SEVERITIES)}
+    return taxonomy
+
+
+def leetspeak(term: str, patterns: Dict[str, List[str]], rng: random.Random) -> str:
+    """Substitute one leetspeak-able character of ``term``."""
+    positions = [i for i, char in enumerate(term) if char in patterns]
+    if not positions:
+        return term
+    i = rng.choice(positions)
+    return term[:i] + rng.choice(patterns[term[i]][:2]) + term[i + 1:]
+
+
+def synthetic_lyrics(taxonomy: Dict[str, Any], lines: int, rng: random.Random) -> str:
+    """Lyrics-like text with plain, masked, spaced and leetspeak terms."""
+    terms = [term for group in taxonomy["categories"].values() for term in group]
+    patterns = taxonomy["variations"]["leetspeak_patterns"]
+    filler = "neon lights are calling out my name tonight in the classic city glow".split()
+    out = []
+    for _ in range(lines):
+        words = rng.sample(filler, 8)
+        if rng.random() < 0.3:
+            term = rng.choice(terms)
+            form = rng.choice(["plain", "upper", "masked", "spaced", "leet"])
+            if form == "upper":
+                term = term.upper()
+            elif form == "masked" and len(term) > 2:
+                term = term[0] + "*" * (len(term) - 2) + term[-1]
+            elif form == "spaced" and len(term) in (3, 4):
+                term = " ".join(term)
+            elif form == "leet":
+                term = leetspeak(term, patterns, rng)
+            words.insert(rng.randrange(len(words)), term)
+        out.append(" ".join(words))
+    return "\n".join(out)
+
+
+def timed(func: Callable[[], Any], iterations: int) -> float:
+    """Mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--lines", type=int, default=60)
+    parser.add_argument("--texts", type=int, default=10, help="Texts compared per taxonomy")
+    args = parser.parse_args()
+
+    # Detection logs every violation; keep the timings about matching
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    rng = random.Random(42)
+    print(f"{'terms':>7} {'patterns':>9} {'init s':>7} {'legacy ms':>10} {'single ms':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            taxonomy = synthetic_taxonomy(size, rng)
+            path = Path(tmp) / f"profanity_{size}.json"
+            path.write_text(json.dumps(taxonomy))
+
+            start = time.perf_counter()
+            profanity_filter = ProfanityFilter(taxonomy_path=path)
+            init_s = time.perf_counter() - start
+
+            texts = [synthetic_lyrics(taxonomy, args.lines, rng) for _ in range(args.texts)]
+            for text in texts:
+                if profanity_filter.detect_profanity(text) != legacy_detect(profanity_filter, text):
+                    print(f"Violation mismatch for {size} terms")
+                    return 1
+
+            iterations = max(1, 2000 // size)
+            text = texts[0]
+            legacy_ms = timed(lambda f=profanity_filter, t=text: legacy_detect(f, t), iterations)
+            single_ms = timed(lambda f=profanity_filter, t=text: f.detect_profanity(t), iterations * 5)
+            patterns = len(profanity_filter._word_boundary_patterns) + len(profanity_filter._variation_patterns)
+            print(f"{size:>7} {patterns:>9} {init_s:>7.1f} {legacy_ms:>10.2f} {single_ms:>10.2f} {legacy_ms / single_ms:>7.1f}x")
+
+    print(f"Violations identical on {args.texts} texts per taxonomy")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
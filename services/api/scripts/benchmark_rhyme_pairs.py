@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Rhyme Pair Detection Benchmark
+
+Compares ``RubricScorer._detect_rhyme_pairs`` (one grouped pass over
+phonetic rhyme keys) with the previous detection (2-character suffix
+comparison, duplicate check scanning the growing pair list) on synthetic
+songs of increasing length, both with cold caches and with lines already
+analysed by another metric of the same scoring pass, and reports the cost
+of opening the packaged rhyme table.
+
+Usage:
+    python scripts/benchmark_rhyme_pairs.py
+
+    # Other song lengths
+    python scripts/benchmark_rhyme_pairs.py --lines 50 500 2000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+
+from app.services.lyrics_analysis import analyze_line, word_features  # noqa: E402
+from app.services.rhyme_index import RHYME_TABLE_PATH, RhymeTable, rhyme_key  # noqa: E402
+from app.services.rubric_scorer import RubricScorer  # noqa: E402
+
+END_WORDS = "night light bright fire desire higher day away stay say heart apart start true blue through".split()
+FILLER = "we keep on running through the city under neon skies and".split()
+
+
+def legacy_detect(lines: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """``_detect_rhyme_pairs`` before the rhyme index."""
+    def rhyme(word1: str, word2: str) -> bool:
+        return word1 != word2 and len(word1) >= 2 and len(word2) >= 2 and word1[-2:] == word2[-2:]
+
+    rhyme_pairs = []
+    endings = []
+    for line_text, _ in lines:
+        words = re.findall(r"\b\w+\b", line_text)
+        if words:
+            endings.append((words[-1].lower(), line_text))
+    for i in range(0, len(endings) - 1, 2):
+        if rhyme(endings[i][0], endings[i + 1][0]):
+            rhyme_pairs.append((endings[i][1], endings[i + 1][1]))
+    for i in range(len(endings) - 3):
+        if rhyme(endings[i][0], endings[i + 2][0]):
+            pair = (endings[i][1], endings[i + 2][1])
+            if pair not in rhyme_pairs and pair[::-1] not in rhyme_pairs:
+                rhyme_pairs.append(pair)
+    return rhyme_pairs
+
+
+def synthetic_song(lines: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """Distinct lines ending in a small set of rhyming words."""
+    return [
+        (f"{' '.join(rng.sample(FILLER, 6))} {i} {rng.choice(END_WORDS)}", "verse")
+        for i in range(lines)
+    ]
+
+
+def timed(func: Callable[[], Any], iterations: int) -> float:
+    """Mean milliseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lines", type=int, nargs="+", default=[100, 1000, 4000])
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    start = time.perf_counter()
+    table = RhymeTable(RHYME_TABLE_PATH)
+    open_ms = (time.perf_counter() - start) * 1e3
+    lookup_us = timed(lambda: table.lookup("desire"), 10000) * 1e3
+    print(f"Rhyme table: {len(table)} words, opened in {open_ms:.2f} ms, {lookup_us:.1f} us per lookup")
+
+    scorer = RubricScorer.__new__(RubricScorer)
+    rng = random.Random(42)
+
+    def cold(song: List[Tuple[str, str]]) -> None:
+        word_features.cache_clear()
+        rhyme_key.cache_clear()
+        analyze_line.cache_clear()
+        scorer._detect_rhyme_pairs(song)
+
+    print(f"{'lines':>7} {'legacy pairs':>13} {'pairs':>7} {'legacy ms':>10} {'cold ms':>9} {'warm ms':>9}")
+    for count in args.lines:
+        song = synthetic_song(count, rng)
+        iterations = max(1, 2000 // count)
+        legacy_ms = timed(lambda song=song: legacy_detect(song), iterations)
+        cold_ms = timed(lambda song=song: cold(song), iterations)
+        # Lines already analysed by another metric of the same pass
+        warm_ms = timed(lambda song=song: scorer._detect_rhyme_pairs(song), iterations)
+        print(f"{count:>7} {len(legacy_detect(song)):>13} {len(scorer._detect_rhyme_pairs(song)):>7} "
+              f"{legacy_ms:>10.2f} {cold_ms:>9.2f} {warm_ms:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Rubric Batch Scoring Benchmark
+
+Ranks synthetic seed variants of one song (shared chorus, varied verses)
+with ``RubricScorer.score_artifacts`` called per candidate and with
+``RubricScorer.score_batch``, in-process and with worker processes, and
+checks that all three produce the same reports.
+
+Usage:
+    python scripts/benchmark_rubric_batch.py
+
+    # Other batch sizes and worker counts
+    python scripts/benchmark_rubric_batch.py --candidates 50 500 --workers 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+
+from app.models.blueprint import Blueprint  # noqa: E402
+from app.services.lyrics_analysis import analyze_line, word_features  # noqa: E402
+from app.services.rubric_scorer import RubricScorer, shutdown_batch_pool  # noqa: E402
+
+END_WORDS = "night light bright fire desire higher day away stay say heart apart start true blue through".split()
+FILLER = "we keep on running through the city under neon skies and".split()
+CHORUS = ["We ride into the night", "Our future burning bright", "We ride into the night", "Never lose the light"]
+
+
+class StaticBlueprintService:
+    """Blueprint service returning one in-memory blueprint."""
+
+    def __init__(self) -> None:
+        self.blueprint = Blueprint(
+            genre="pop",
+            version="benchmark",
+            rules={"required_sections": ["Verse", "Chorus"]},
+            eval_rubric={"thresholds": {"min_total": 0.75}},
+        )
+
+    def get_or_load_blueprint(self, genre: str, version: str = "latest") -> Blueprint:
+        return self.blueprint
+
+
+def seed_variant(rng: random.Random) -> Dict[str, Any]:
+    """Candidate lyrics: varied verses around a shared chorus."""
+    def verse() -> List[str]:
+        return [f"{' '.join(rng.sample(FILLER, 6))} {rng.choice(END_WORDS)}" for _ in range(8)]
+
+    return {"lyrics": {"sections": [
+        {"name": "Verse", "lines": verse()},
+        {"name": "Chorus", "lines": CHORUS},
+        {"name": "Verse", "lines": verse()},
+        {"name": "Chorus", "lines": CHORUS},
+    ]}}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--candidates", type=int, nargs="+", default=[20, 50, 1000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+    scorer = RubricScorer(StaticBlueprintService())
+    rng = random.Random(42)
+
+    print(f"{'candidates':>10} {'per-call ms':>12} {'batch ms':>9} {'pool ms':>8} {'same':>5}")
+    for count in args.candidates:
+        candidates = [seed_variant(rng) for _ in range(count)]
+        timings = []
+        results = []
+        for score in (
+            lambda candidates=candidates: [
+                scorer.score_artifacts(c["lyrics"], {}, {}, genre="pop", explicit_allowed=False)
+                for c in candidates
+            ],
+            lambda candidates=candidates: scorer.score_batch(
+                candidates, genre="pop", explicit_allowed=False
+            ),
+            lambda candidates=candidates: scorer.score_batch(
+                candidates, genre="pop", explicit_allowed=False, max_workers=args.workers
+            ),
+        ):
+            word_features.cache_clear()
+            analyze_line.cache_clear()
+            start = time.perf_counter()
+            reports = score()
+            timings.append((time.perf_counter() - start) * 1e3)
+            results.append([report.to_dict() for report in reports])
+
+        same = results[0] == results[1] == results[2]
+        print(f"{count:>10} {timings[0]:>12.1f} {timings[1]:>9.1f} {timings[2]:>8.1f} {str(same):>5}")
+    shutdown_batch_pool()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Schema Validation Benchmark
+
+Validates the SDS, style, lyrics and producer notes of the songs in
+``tests/fixtures/test_songs`` with:
+
+- a fresh ``Draft7Validator`` per call (validation before compiled schemas)
+- ``ValidationService.validate_*`` (compiled schemas, messages on failure)
+- ``ValidationService.is_valid`` (pass/fail only)
+
+and checks that all three agree. Install ``fastjsonschema`` to include the
+code-generated validators.
+
+Usage:
+    python scripts/benchmark_schema_validation.py
+
+    # More passes over the fixtures
+    python scripts/benchmark_schema_validation.py --rounds 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal settings so the app config can be imported offline
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL_TEST", "sqlite:///:memory:")
+os.environ.setdefault("CLERK_WEBHOOK_SECRET", "whsec_benchmark")
+os.environ.setdefault("CLERK_JWKS_URL", "https://benchmark.invalid/jwks.json")
+os.environ.setdefault("CLERK_JWT_ISSUER", "https://benchmark.invalid")
+
+import structlog  # noqa: E402
+from jsonschema import Draft7Validator  # noqa: E402
+
+from app.services import validation_service  # noqa: E402
+from app.services.validation_service import ValidationService  # noqa: E402
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures" / "test_songs"
+ENTITIES = ("style", "lyrics", "producer_notes")
+
+
+def load_documents() -> List[Tuple[str, Any]]:
+    """(schema name, document) for every fixture SDS and its entities."""
+    documents = []
+    for path in sorted(FIXTURES.glob("*.json")):
+        sds = json.loads(path.read_text())
+        documents.append(("sds", sds))
+        documents.extend((name, sds[name]) for name in ENTITIES if name in sds)
+    return documents
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    """Total milliseconds for ``rounds`` calls."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(40))
+
+    start = time.perf_counter()
+    service = ValidationService(blueprint_service=Mock())
+    first_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    ValidationService(blueprint_service=Mock())
+    next_ms = (time.perf_counter() - start) * 1e3
+
+    documents = load_documents()
+    validate = {name: getattr(service, f"validate_{name}") for name in ("sds",) + ENTITIES}
+
+    def legacy(batch: List[Tuple[str, Any]]) -> List[bool]:
+        return [
+            not service._format_validation_errors(Draft7Validator(service.schemas[name]), document)
+            for name, document in batch
+        ]
+
+    def messages(batch: List[Tuple[str, Any]]) -> List[bool]:
+        return [validate[name](document)[0] for name, document in batch]
+
+    def pass_fail(batch: List[Tuple[str, Any]]) -> List[bool]:
+        return [service.is_valid(name, document) for name, document in batch]
+
+    results = legacy(documents)
+    if not results == messages(documents) == pass_fail(documents):
+        print("Validation results differ")
+        return 1
+
+    print(f"fastjsonschema: {'yes' if validation_service.fastjsonschema is not None else 'no'}")
+    print(f"Service construction: {first_ms:.1f} ms first (loads and compiles schemas), {next_ms:.1f} ms after")
+    print(f"{'us/doc':>30} {'valid':>9} {'invalid':>9}")
+    valid = [document for document, ok in zip(documents, results) if ok]
+    invalid = [document for document, ok in zip(documents, results) if not ok]
+    for label, func in (
+        ("fresh Draft7Validator", legacy),
+        ("validate_*", messages),
+        ("is_valid", pass_fail),
+    ):
+        timings = [
+            timed(lambda func=func, batch=batch: func(batch), args.rounds)
+            * 1e3 / (len(batch) * args.rounds)
+            for batch in (valid, invalid)
+        ]
+        print(f"{label:>30} {timings[0]:>9.1f} {timings[1]:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Rhyme Table Builder
+
+Builds ``app/data/rhyme_keys.bin`` (see ``app.services.rhyme_index``) from
+the CMU Pronouncing Dictionary:
+
+- keeps the first pronunciation of every entry
+- normalizes words like the lyrics analysis does (lowercase, punctuation
+  removed, so "don't" is stored as "dont"); an exact spelling wins over a
+  normalized one
+- stores the rhyming part of each pronunciation (last stressed vowel to
+  the end, without stress marks)
+
+The dictionary is read from the ``cmudict`` package when it is installed,
+or from a ``cmudict.dict`` file. Its license is reproduced in
+``app/data/CMUDICT_LICENSE``.
+
+Usage:
+    pip install cmudict
+    python scripts/build_rhyme_table.py
+
+    # From a local copy of the dictionary
+    python scripts/build_rhyme_table.py --dict path/to/cmudict.dict
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rhyme_index import RHYME_TABLE_PATH, RhymeTable, rhyming_part, write_rhyme_table  # noqa: E402
+
+NON_WORD = re.compile(r"[^\w]")
+ALTERNATE = re.compile(r"\(\d+\)$")
+
+
+def dictionary_lines(path: Path = None) -> Iterable[str]:
+    """Lines of cmudict.dict, from ``path`` or the ``cmudict`` package."""
+    if path is None:
+        import cmudict
+
+        return cmudict.dict_stream().read().decode("utf-8").splitlines()
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def rhyme_entries(lines: Iterable[str]) -> Dict[str, str]:
+    """Rhyming part per normalized word."""
+    entries: Dict[str, str] = {}
+    exact = set()
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        spelling, *phones = line.split()
+        if ALTERNATE.search(spelling):
+            continue
+        word = NON_WORD.sub("", spelling.lower())
+        key = rhyming_part(phones)
+        if not word or key is None or word in exact:
+            continue
+        if spelling == word:
+            exact.add(word)
+            entries[word] = key
+        else:
+            entries.setdefault(word, key)
+    return entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--dict", type=Path, help="cmudict.dict file (default: cmudict package)")
+    parser.add_argument("--output", type=Path, default=RHYME_TABLE_PATH)
+    args = parser.parse_args()
+
+    entries = rhyme_entries(dictionary_lines(args.dict))
+    write_rhyme_table(entries, args.output)
+
+    table = RhymeTable(args.output)
+    mismatches = [word for word, key in entries.items() if table.lookup(word) != key]
+    if mismatches:
+        print(f"Table does not round-trip: {mismatches[:10]}")
+        return 1
+
+    print(f"Wrote {len(entries)} words, {len(set(entries.values()))} rhyming parts, "
+          f"{args.output.stat().st_size / 1e6:.1f} MB to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Workflow Run Worker
+
+Consumes workflow run jobs from the Redis run queue and executes them with
+a bounded number of concurrent runs. Use this to scale run execution
+separately from the API (set ``WORKER_BACKEND=redis`` on both, and
+``WORKER_ENABLED=false`` on API replicas that should not execute runs).
+
+Usage:
+    WORKER_BACKEND=redis python scripts/run_worker.py
+
+    # Override per-worker concurrency
+    WORKER_BACKEND=redis python scripts/run_worker.py --max-concurrent-runs 8
+"""
+
+import argparse
+import asyncio
+import signal
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import structlog  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.skills.llm_client import close_llm_client  # noqa: E402
+from app.workflows.jobs import RunWorker, create_run_queue  # noqa: E402
+
+logger = structlog.get_logger(__name__)
+
+
+async def main() -> int:
+    """Run the worker until SIGINT/SIGTERM."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--max-concurrent-runs", type=int, default=settings.WORKER.MAX_CONCURRENT_RUNS
+    )
+    args = parser.parse_args()
+
+    if settings.WORKER.BACKEND != "redis":
+        print("WORKER_BACKEND must be 'redis' for a standalone worker", file=sys.stderr)
+        return 1
+
+    queue = create_run_queue()
+    worker = RunWorker(
+        queue,
+        max_concurrent_runs=args.max_concurrent_runs,
+        poll_timeout=settings.WORKER.POLL_TIMEOUT,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    worker.start()
+    await stop.wait()
+
+    logger.info("run_worker.shutdown_requested", in_flight=worker.in_flight)
+    await worker.stop(timeout=settings.WORKER.SHUTDOWN_TIMEOUT)
+    await queue.aclose()
+    await close_llm_client()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
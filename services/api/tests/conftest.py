@@ -50,6 +50,20 @@ def test_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def isolate_skill_result_cache():
+    """Disable the global skill result cache so tests never share results.
+
+    Tests that exercise memoization install their own cache via
+    ``set_skill_result_cache``.
+    """
+    from app.workflows.result_cache import set_skill_result_cache
+
+    set_skill_result_cache(None)
+    yield
+    set_skill_result_cache(None)
+
+
 # =============================================================================
 # AMCS Workflow Skill Test Fixtures
 # =============================================================================
@@ -0,0 +1,192 @@
+"""Unit tests for the asyncio Redis cache client."""
+
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.core.async_cache import AsyncRedisCache, TagIndexCompactor
+from app.core.cache import RedisCache
+from app.repositories.cache_aware_base import CacheAwareRepository, cache_get, cache_invalidate
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def cache(server):
+    return AsyncRedisCache(client=fakeredis.FakeAsyncRedis(server=server))
+
+
+class TestAsyncRedisCache:
+    """Test the RedisCache API on redis.asyncio."""
+
+    @pytest.mark.asyncio
+    async def test_values_round_trip(self, cache):
+        large = {"lyrics": "la " * 1000}  # compressed on write
+
+        assert await cache.set("a", {"id": 1}, ttl=60, namespace="songs")
+        assert await cache.set("big", large, namespace="songs")
+
+        assert await cache.get("a", value_type=dict, namespace="songs") == {"id": 1}
+        assert await cache.get("big", value_type=dict, namespace="songs") == large
+        assert await cache.get("missing", namespace="songs") is None
+        assert 0 < await cache.ttl("a", namespace="songs") <= 60
+
+    @pytest.mark.asyncio
+    async def test_batch_operations_and_tags(self, cache):
+        pytest.importorskip("lupa")  # invalidate_by_tag runs a Lua script
+        mapping = {f"k{i}": {"i": i} for i in range(20)}
+        assert await cache.mset(mapping, ttl=60, namespace="songs", tags={"song"})
+
+        values = await cache.mget(list(mapping) + ["nope"], value_type=dict, namespace="songs")
+        assert values["k7"] == {"i": 7}
+        assert values["nope"] is None
+
+        assert await cache.invalidate_by_tag("song") == 20
+        assert await cache.get("k7", namespace="songs") is None
+
+    @pytest.mark.asyncio
+    async def test_shares_data_with_sync_client(self, server, cache):
+        sync_cache = RedisCache(client=fakeredis.FakeRedis(server=server))
+        sync_cache.set("shared", {"v": 1}, namespace="songs")
+
+        assert await cache.get("shared", value_type=dict, namespace="songs") == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_on_errors(self):
+        client = fakeredis.FakeAsyncRedis()
+        cache = AsyncRedisCache(client=client)
+        client.get = MagicMock(side_effect=RuntimeError("boom"))
+
+        for _ in range(cache._circuit_breaker.failure_threshold):
+            assert await cache.get("k") is None
+
+        assert cache.circuit_breaker_state == "open"
+        assert await cache.get("k") is None
+        assert cache.get_performance_metrics()["circuit_breaker_blocks"] == 1
+
+
+class TestTagIndex:
+    """Test scripted tag invalidation and tag index compaction."""
+
+    @pytest.fixture(autouse=True)
+    def _require_lua(self):
+        pytest.importorskip("lupa")
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_tag_runs_in_batches(self, cache):
+        mapping = {f"k{i}": i for i in range(25)}
+        await cache.mset(mapping, namespace="songs", tags={"genre:pop"})
+        await cache._client.delete(cache._serialize_key("k0", "songs"))  # expired
+
+        assert await cache.invalidate_by_tag("genre:pop", batch_size=4) == 24
+        assert await cache.get("k7", namespace="songs") is None
+        assert await cache.get_tag_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_compaction_removes_dead_members(self, cache):
+        await cache.mset({f"k{i}": i for i in range(30)}, namespace="songs", tags={"genre:pop"})
+        await cache.set("other", 1, namespace="songs", tags={"genre:rock"})
+        await cache.mdel([f"k{i}" for i in range(20)], namespace="songs")
+
+        assert await cache.get_tag_stats() == {"genre:pop": 30, "genre:rock": 1}
+        assert await cache.compact_tag_index(scan_count=7) == {"tags": 2, "removed": 20}
+        assert await cache.get_tag_stats() == {"genre:pop": 10, "genre:rock": 1}
+        assert await cache.get("k25", value_type=int, namespace="songs") == 25
+
+    @pytest.mark.asyncio
+    async def test_background_compactor(self, cache):
+        await cache.mset({"a": 1, "b": 2}, namespace="songs", tags={"genre:pop"})
+        await cache.delete("a", namespace="songs")
+        compactor = TagIndexCompactor(cache, interval=0.01)
+
+        compactor.start()
+        await asyncio.sleep(0.1)
+        await compactor.stop()
+
+        assert not compactor.running
+        assert await cache.get_tag_stats() == {"genre:pop": 1}
+
+    def test_sync_client_shares_scripts(self, server):
+        sync_cache = RedisCache(client=fakeredis.FakeRedis(server=server))
+        sync_cache.mset({"a": 1, "b": 2}, namespace="songs", tags={"genre:pop"})
+        sync_cache.delete("a", namespace="songs")
+
+        assert sync_cache.compact_tag("genre:pop") == 1
+        assert sync_cache.get_tag_stats() == {"genre:pop": 1}
+        assert sync_cache.invalidate_by_tag("genre:pop") == 1
+        assert sync_cache.get("b", namespace="songs") is None
+
+
+class _SongRepository(CacheAwareRepository):
+    def __init__(self, async_cache, redis_cache=None):
+        super().__init__(
+            db=MagicMock(),
+            cache_manager=MagicMock(),
+            async_cache=async_cache,
+            redis_cache=redis_cache,
+        )
+        self.loads = 0
+
+    @cache_get(config_name="model_data")
+    async def get_summary(self, song_id):
+        self.loads += 1
+        return {"id": str(song_id), "title": "Neon"}
+
+    # cache_get tags summaries with their type name
+    @cache_invalidate(tags=["dict"])
+    async def rename(self, song_id):
+        return None
+
+    @cache_invalidate(tags=["dict"])
+    def rename_sync(self, song_id):
+        return None
+
+
+class TestCacheAwareRepositoryAsync:
+    """Test async cached repository operations."""
+
+    @pytest.mark.asyncio
+    async def test_async_get_is_cached(self, cache):
+        repo = _SongRepository(cache)
+        song_id = uuid4()
+
+        first = await repo.get_summary(song_id)
+        second = await repo.get_summary(song_id)
+
+        assert first == second == {"id": str(song_id), "title": "Neon"}
+        assert repo.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_async_write_invalidates_async_entries(self, cache):
+        pytest.importorskip("lupa")  # invalidate_by_tag runs a Lua script
+        repo = _SongRepository(cache)
+        song_id = uuid4()
+        await repo.get_summary(song_id)
+
+        await repo.rename(song_id)
+        await repo.get_summary(song_id)
+
+        assert repo.loads == 2
+        repo._cache_manager.invalidate_by_tag.assert_called_with("dict")
+
+    @pytest.mark.asyncio
+    async def test_sync_write_invalidates_async_entries(self, server, cache):
+        pytest.importorskip("lupa")  # invalidate_by_tag runs a Lua script
+        repo = _SongRepository(
+            cache, redis_cache=RedisCache(client=fakeredis.FakeRedis(server=server))
+        )
+        song_id = uuid4()
+        await repo.get_summary(song_id)
+
+        repo.rename_sync(song_id)
+        await repo.get_summary(song_id)
+
+        assert repo.loads == 2
+        repo._cache_manager.invalidate_by_tag.assert_called_with("dict")
@@ -0,0 +1,84 @@
+"""Unit tests for the binary cache value codec."""
+
+import json
+import zlib
+from uuid import uuid4
+
+import pytest
+
+from app.core import cache_codec
+from app.core.cache_codec import CacheCodecError, decode_value, encode_value
+
+
+class TestCacheCodec:
+    """Test encoding, compression and legacy compatibility."""
+
+    @pytest.mark.parametrize("value,value_type", [
+        ("plain text", str),
+        ({"id": 1, "tags": ["pop", "rock"], "nested": {"bpm": 120.5}}, dict),
+        ([1, 2, 3], list),
+        (42, int),
+        (True, bool),
+        (b"\x00\xffraw", bytes),
+    ])
+    def test_round_trip(self, value, value_type):
+        raw = encode_value(value)
+
+        assert isinstance(raw, bytes)
+        assert raw[0] == cache_codec.MAGIC
+        assert decode_value(raw, value_type) == value
+
+    def test_uuid_round_trip(self):
+        value = uuid4()
+
+        assert decode_value(encode_value(value), type(value)) == value
+
+    def test_large_values_are_compressed(self):
+        value = {"lyrics": "la " * 5000}
+
+        raw = encode_value(value)
+
+        assert raw[3] != cache_codec.COMPRESSION_NONE
+        assert len(raw) < len(json.dumps(value))
+        assert decode_value(raw, dict) == value
+
+    def test_compression_can_be_disabled(self):
+        raw = encode_value({"lyrics": "la " * 5000}, compress=False)
+
+        assert raw[3] == cache_codec.COMPRESSION_NONE
+
+    @pytest.mark.parametrize("raw,value_type,expected", [
+        ("hello", str, "hello"),
+        ('{"a": 1}', dict, {"a": 1}),
+        ("7", int, 7),
+    ])
+    def test_reads_legacy_text_values(self, raw, value_type, expected):
+        assert decode_value(raw, value_type) == expected
+        assert decode_value(raw.encode(), value_type) == expected
+
+    def test_reads_legacy_compressed_values(self):
+        value = {"lyrics": "la " * 1000}
+        text = json.dumps(value)
+        legacy = "__compressed__" + zlib.compress(text.encode()).decode("latin-1")
+
+        assert decode_value(legacy.encode(), dict) == value
+
+    def test_rejects_unknown_version(self):
+        raw = bytearray(encode_value("x"))
+        raw[1] = 99
+
+        with pytest.raises(CacheCodecError):
+            decode_value(bytes(raw))
+
+    def test_fallback_warns_once(self, monkeypatch, caplog):
+        monkeypatch.setattr(cache_codec, "msgpack", None)
+        monkeypatch.setattr(cache_codec, "lz4_frame", None)
+        monkeypatch.setattr(cache_codec, "_fallback_warned", False)
+
+        with caplog.at_level("WARNING", logger=cache_codec.__name__):
+            encode_value({"lyrics": "la " * 5000})
+            encode_value({"lyrics": "la " * 5000})
+
+        warnings = [r for r in caplog.records if "cache-fast" in r.getMessage()]
+        assert len(warnings) == 1
+        assert "msgpack, lz4" in warnings[0].getMessage()
@@ -0,0 +1,132 @@
+"""Unit tests for the multi-tier cache manager."""
+
+import asyncio
+
+import pytest
+
+from app.core.async_cache import AsyncRedisCache
+from app.core.cache import RedisCache
+from app.core.cache_manager import CacheManager, L1Cache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestL1Cache:
+    """Test TTL, LRU and byte budget of the L1 tier."""
+
+    def test_entries_expire_after_ttl(self):
+        clock = _Clock()
+        cache = L1Cache(default_ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl=60)
+
+        clock.now = 11
+        assert "a" not in cache
+        assert "b" in cache
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = L1Cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+
+    def test_byte_budget_is_enforced(self):
+        cache = L1Cache(max_bytes=100)
+        cache.set("a", "x" * 60)
+        cache.set("b", "y" * 60)
+        cache.set("huge", "z" * 200)
+
+        assert "a" not in cache
+        assert "b" in cache
+        assert "huge" not in cache
+        assert cache.size_bytes == 60
+
+
+class TestCacheManager:
+    """Test cross-worker L1 invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_other_workers_l1(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        writer = CacheManager(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        reader = CacheManager(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        await reader.start_invalidation_listener()
+        try:
+            await writer.set("song:1", "v1")
+            assert await reader.get("song:1") == b"v1"
+            await asyncio.sleep(0.05)  # let the reader subscribe
+
+            await writer.set("song:1", "v2")
+            for _ in range(50):
+                if "song:1" not in reader._l1_cache:
+                    break
+                await asyncio.sleep(0.02)
+
+            assert await reader.get("song:1") == b"v2"
+        finally:
+            await reader.stop_invalidation_listener()
+
+    async def _cached_by_reader(self, reader, redis_key):
+        """Read ``redis_key`` into the reader's L1 and let its listener subscribe."""
+        assert await reader.get(redis_key) is not None
+        assert redis_key in reader._l1_cache
+        await asyncio.sleep(0.05)
+
+    async def _wait_until_dropped(self, reader, redis_key):
+        for _ in range(50):
+            if redis_key not in reader._l1_cache:
+                return
+            await asyncio.sleep(0.02)
+
+    @pytest.mark.asyncio
+    async def test_tag_invalidation_drops_l1_entries(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")  # invalidate_by_tag runs a Lua script
+        server = fakeredis.FakeServer()
+        reader = CacheManager(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        sync_cache = RedisCache(client=fakeredis.FakeRedis(server=server))
+        async_cache = AsyncRedisCache(client=fakeredis.FakeAsyncRedis(server=server))
+        await reader.start_invalidation_listener()
+        try:
+            sync_cache.set("song:1", "v1", tags={"songs"})
+            await self._cached_by_reader(reader, "mp:alias:song:1")
+            sync_cache.invalidate_by_tag("songs")
+            await self._wait_until_dropped(reader, "mp:alias:song:1")
+            assert "mp:alias:song:1" not in reader._l1_cache
+
+            await async_cache.set("song:2", "v2", tags={"songs"})
+            await self._cached_by_reader(reader, "mp:alias:song:2")
+            await async_cache.invalidate_by_tag("songs")
+            await self._wait_until_dropped(reader, "mp:alias:song:2")
+            assert "mp:alias:song:2" not in reader._l1_cache
+        finally:
+            await reader.stop_invalidation_listener()
+
+    @pytest.mark.asyncio
+    async def test_pattern_delete_drops_l1_entries(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        reader = CacheManager(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        cache = RedisCache(client=fakeredis.FakeRedis(server=server))
+        await reader.start_invalidation_listener()
+        try:
+            cache.set("song:1", "v1")
+            await self._cached_by_reader(reader, "mp:alias:song:1")
+
+            assert cache.delete_pattern("song:*") == 1
+            await self._wait_until_dropped(reader, "mp:alias:song:1")
+
+            assert "mp:alias:song:1" not in reader._l1_cache
+        finally:
+            await reader.stop_invalidation_listener()
@@ -0,0 +1,89 @@
+"""Unit tests for connection pool settings and saturation metrics."""
+
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, exc, text
+
+from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_options
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, {"pool": "sync", **labels}) or 0
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    monkeypatch.setattr(settings.DB, "POOL_SIZE", 1)
+    monkeypatch.setattr(settings.DB, "MAX_OVERFLOW", 1)
+    monkeypatch.setattr(settings.DB, "POOL_TIMEOUT", 0.05)
+    return settings.DB
+
+
+class TestPoolOptions:
+    """Test engine pool options built from settings.DB."""
+
+    def test_server_databases_use_configured_pool(self, pool_settings):
+        options = pool_options("postgresql://db/app")
+
+        assert options["pool_size"] == 1
+        assert options["max_overflow"] == 1
+        assert options["pool_timeout"] == 0.05
+        assert options["pool_recycle"] == pool_settings.POOL_RECYCLE
+        assert options["poolclass"] is InstrumentedQueuePool
+        assert pool_options("postgresql+asyncpg://db/app", is_async=True)["poolclass"] is InstrumentedAsyncQueuePool
+
+    def test_sqlite_skips_pool_sizing(self):
+        assert pool_options("sqlite:///:memory:") == {"pool_pre_ping": settings.DB.POOL_PRE_PING}
+
+    def test_metrics_can_be_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings.DB, "POOL_METRICS_ENABLED", False)
+
+        assert "poolclass" not in pool_options("postgresql://db/app")
+
+
+class TestPoolMetrics:
+    """Test checkout wait, in-use, overflow and timeout metrics."""
+
+    def test_checkouts_record_saturation(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.05,
+        )
+        checkouts = _sample("db_pool_checkout_wait_seconds_count")
+        overflow = _sample("db_pool_overflow_in_use_sum")
+        timeouts = _sample("db_pool_checkout_timeouts_total")
+
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert _sample("db_pool_checkout_wait_seconds_count") == checkouts + 2
+        assert _sample("db_pool_overflow_in_use_sum") == overflow + 1
+        assert _sample("db_pool_checkout_timeouts_total") == timeouts + 1
+        engine.dispose()
+
+    def test_wait_time_covers_blocked_checkouts(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=5,
+        )
+        waited = _sample("db_pool_checkout_wait_seconds_sum")
+
+        held = engine.connect()
+        threading.Timer(0.2, held.close).start()
+        with engine.connect():
+            pass
+
+        assert _sample("db_pool_checkout_wait_seconds_sum") - waited >= 0.15
+        engine.dispose()
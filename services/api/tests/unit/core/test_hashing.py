@@ -0,0 +1,101 @@
+"""Unit tests for the canonical hashing engine."""
+
+import hashlib
+import json
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.core.determinism import hash_artifact
+from app.core.hashing import ARTIFACT_ENCODING, WORKFLOW_ENCODING
+from app.workflows.skill import WorkflowContext, compute_hash, workflow_skill
+
+
+def _legacy_compute_hash(data):
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+PAYLOADS = [
+    {},
+    {"b": 1, "a": [1, 2.5, None, True], "c": {"z": "ü", "y": "☕ \"q\" \\ \n"}},
+    {"id": UUID(int=1), "at": datetime(2025, 1, 1, 12, 0)},
+    {1: "int keys", 2: "sort numerically"},
+    "plain string",
+    [{"b": 2, "a": 1}],
+]
+
+
+class TestCompatibility:
+    """Digests must match the previous json.dumps-based implementations."""
+
+    @pytest.mark.parametrize("payload", PAYLOADS)
+    def test_compute_hash_matches_legacy(self, payload):
+        assert compute_hash(payload) == _legacy_compute_hash(payload)
+
+    def test_hash_artifact_matches_legacy(self):
+        artifact = {"lyrics": "Café — naïve", "n": 3}
+        content = json.dumps(artifact, sort_keys=True, ensure_ascii=False)
+        expected = f"sha256:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
+        assert hash_artifact(artifact) == expected
+        assert ARTIFACT_ENCODING.encode(artifact) == content
+
+
+class TestCanonicalDocument:
+    """Test fragment reuse."""
+
+    def test_document_matches_whole_encoding(self):
+        payload = {"b": {"x": 1}, "a": "é", "_metadata": {"seed": 1}}
+        document = WORKFLOW_ENCODING.document(payload)
+
+        assert document.text == json.dumps(payload, sort_keys=True, default=str)
+        assert document.hexdigest() == compute_hash(payload)
+
+    def test_non_string_keys_are_not_split(self):
+        assert WORKFLOW_ENCODING.document({1: "a"}) is None
+
+    def test_with_values_adds_keys(self):
+        body = {"style": {"genre": "pop"}}
+        outputs = {**body, "_metadata": {"cache_hit": False}}
+
+        document = WORKFLOW_ENCODING.document(body).with_values(
+            {"_metadata": outputs["_metadata"]}, source=outputs
+        )
+
+        assert document.hexdigest() == compute_hash(outputs)
+
+    def test_leaf_is_used_only_for_the_same_object(self):
+        upstream = {"plan": {"sections": ["Verse"]}}
+        leaf = WORKFLOW_ENCODING.document(upstream)
+        # A stale leaf for a different object must not be spliced in
+        replaced = {"plan": {"sections": ["Chorus"]}}
+
+        same = WORKFLOW_ENCODING.document({"PLAN": upstream}, leaves={"PLAN": leaf})
+        other = WORKFLOW_ENCODING.document({"PLAN": replaced}, leaves={"PLAN": leaf})
+
+        assert same.fragments["PLAN"] is leaf.text
+        assert same.hexdigest() == compute_hash({"PLAN": upstream})
+        assert other.hexdigest() == compute_hash({"PLAN": replaced})
+
+
+class TestSkillWrapperHashing:
+    """Test the hashes the skill wrapper hands back to the orchestrator."""
+
+    @pytest.mark.asyncio
+    async def test_result_document_hashes_outputs_with_metadata(self):
+        @workflow_skill(name="test.hashing")
+        async def skill(inputs, context):
+            return {"lyrics": "la la", "sections": ["Verse"]}
+
+        context = WorkflowContext(
+            run_id=uuid4(), song_id=uuid4(), seed=1, node_index=0, node_name="LYRICS",
+            input_hash="precomputed",
+        )
+        outputs = await skill({"PLAN": {}}, context)
+
+        assert outputs["_metadata"]["input_hash"] == "precomputed"
+        assert context.result_document.source is outputs
+        assert context.result_document.hexdigest() == compute_hash(outputs)
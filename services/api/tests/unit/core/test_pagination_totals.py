@@ -0,0 +1,183 @@
+"""Unit tests for keyset pagination and its total-count modes."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import pagination
+from app.core.cache import RedisCache
+from app.core.pagination import CursorPagination, TotalCountMode, count_cache_key, keyset_index
+from app.core.security import create_user_context
+from app.models.base import BaseModel
+from app.models.song import Song
+from app.repositories import SongRepository
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def session():
+    # Songs and their cascade children only: other entity tables use
+    # PostgreSQL-only types
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+    tables = ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]
+    BaseModel.metadata.create_all(bind=engine, tables=[BaseModel.metadata.tables[t] for t in tables])
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RedisCache(client=fakeredis.FakeRedis())
+    monkeypatch.setattr("app.core.cache.get_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def owner_id():
+    return uuid4()
+
+
+@pytest.fixture
+def repo(session, cache, owner_id):
+    return SongRepository(db=session, security_context=create_user_context(owner_id))
+
+
+def _song_data(title, global_seed=42):
+    return {
+        "tenant_id": uuid4(),
+        "title": title,
+        "sds_version": "1.0.0",
+        "global_seed": global_seed,
+        "blueprint_id": uuid4(),
+        "status": "draft",
+        "feature_flags": {},
+    }
+
+
+def _seed(repo, count):
+    for i in range(count):
+        repo.create(Song, _song_data(f"Song {i}", global_seed=i))
+
+
+def _page(repo, mode, cursor=None, limit=2):
+    return repo.list_paginated_with_info(
+        Song, limit=limit, cursor=cursor, sort_field="global_seed", total_mode=mode
+    )["pageInfo"]
+
+
+class TestKeysetPagination:
+    """Test the row-value keyset predicate and the totals it reports."""
+
+    def test_deep_pages_report_the_full_total(self, repo):
+        _seed(repo, 5)
+
+        first = _page(repo, TotalCountMode.EXACT)
+        second = _page(repo, TotalCountMode.EXACT, cursor=first["nextCursor"])
+
+        assert first["totalCount"] == second["totalCount"] == 5
+        assert second["hasNextPage"] is True
+
+    def test_keyset_walk_visits_every_row_once(self, repo):
+        _seed(repo, 5)
+
+        seeds, cursor = [], None
+        while True:
+            items, cursor = repo.list_paginated(Song, limit=2, cursor=cursor, sort_field="global_seed")
+            seeds += [song.global_seed for song in items]
+            if cursor is None:
+                break
+
+        assert seeds == [4, 3, 2, 1, 0]
+
+    def test_none_mode_skips_the_count(self, repo):
+        _seed(repo, 3)
+
+        info = _page(repo, TotalCountMode.NONE)
+
+        assert info["totalCount"] is None
+        assert info["hasNextPage"] is True
+
+    def test_cached_total_is_invalidated_by_writes(self, repo, session, owner_id):
+        _seed(repo, 3)
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 3
+
+        # Writes behind the repository's back are served from cache...
+        session.add(Song(owner_id=owner_id, **_song_data("Raw")))
+        session.flush()
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 3
+
+        # ...until a committed repository write bumps the generation
+        repo.create(Song, _song_data("Neon"))
+        session.commit()
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 5
+
+    def test_generation_is_bumped_after_commit(self, repo, session, cache):
+        _seed(repo, 2)
+        session.commit()
+        generation_key = pagination._count_generation_key(Song)
+
+        repo.create(Song, _song_data("Neon"))
+        # A reader counting before the commit caches under the old generation
+        assert cache.get(generation_key, int, namespace=pagination.COUNT_CACHE_NAMESPACE) == 1
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 3
+
+        session.commit()
+        assert cache.get(generation_key, int, namespace=pagination.COUNT_CACHE_NAMESPACE) == 2
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 3
+
+    def test_rolled_back_write_keeps_cached_totals(self, repo, session, cache):
+        _seed(repo, 2)
+        session.commit()
+        generation_key = pagination._count_generation_key(Song)
+
+        repo.create(Song, _song_data("Neon"))
+        session.rollback()
+        session.commit()
+
+        assert cache.get(generation_key, int, namespace=pagination.COUNT_CACHE_NAMESPACE) == 1
+
+    def test_cached_totals_are_scoped_per_user(self, repo, session):
+        _seed(repo, 2)
+        other = SongRepository(db=session, security_context=create_user_context(uuid4()))
+
+        assert _page(repo, TotalCountMode.CACHED)["totalCount"] == 2
+        assert _page(other, TotalCountMode.CACHED)["totalCount"] == 0
+
+    def test_estimated_total_is_exact_below_the_cap(self, repo, monkeypatch):
+        monkeypatch.setattr(pagination, "ESTIMATE_EXACT_CAP", 3)
+        _seed(repo, 3)
+        info = _page(repo, TotalCountMode.ESTIMATED)
+        assert (info["totalCount"], info["totalCountIsEstimate"]) == (3, False)
+
+        repo.create(Song, _song_data("Overflow"))
+        info = _page(repo, TotalCountMode.ESTIMATED)
+        assert (info["totalCount"], info["totalCountIsEstimate"]) == (4, True)
+
+
+class TestPaginationHelpers:
+    """Test the count cache key and keyset index lookup."""
+
+    def test_count_cache_key_depends_on_filters_and_scope(self):
+        alice, bob = create_user_context(uuid4()), create_user_context(uuid4())
+        drafts = select(Song).filter(Song.status == "draft")
+        done = select(Song).filter(Song.status == "validated")
+
+        assert count_cache_key(Song, drafts, alice) == count_cache_key(Song, drafts, alice)
+        assert count_cache_key(Song, drafts, alice) != count_cache_key(Song, done, alice)
+        assert count_cache_key(Song, drafts, alice) != count_cache_key(Song, drafts, bob)
+
+    def test_keyset_index_lookup(self):
+        assert keyset_index(Song, "created_at") == "ix_songs_owner_created_at_id"
+        assert keyset_index(Song, "global_seed") is None
+
+    def test_page_dataclass_defaults_to_exact_totals(self):
+        assert CursorPagination(items=[]).total_is_estimate is False
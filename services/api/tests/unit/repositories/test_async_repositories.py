@@ -0,0 +1,158 @@
+"""Unit tests for the AsyncSession repositories."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+
+from app.core import pagination
+from app.core.security import create_user_context
+from app.errors import ForbiddenError, NotFoundError
+from app.models.base import BaseModel
+from app.models.song import Song
+from app.repositories import AsyncSongRepository, AsyncWorkflowRunRepository
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+@pytest.fixture
+async def session():
+    # Songs and their cascade children only: other entity tables use
+    # PostgreSQL-only types
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    event.listen(
+        engine.sync_engine, "connect",
+        lambda conn, _: conn.create_function("char_length", 1, len)
+    )
+    tables = [
+        BaseModel.metadata.tables[t]
+        for t in ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: BaseModel.metadata.create_all(sync_conn, tables=tables))
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def owner_id():
+    return uuid4()
+
+
+@pytest.fixture
+def repo(session, owner_id):
+    return AsyncSongRepository(db=session, security_context=create_user_context(owner_id))
+
+
+def _song_data(title, status="draft", global_seed=42):
+    return {
+        "tenant_id": uuid4(),
+        "title": title,
+        "sds_version": "1.0.0",
+        "global_seed": global_seed,
+        "blueprint_id": uuid4(),
+        "status": status,
+        "feature_flags": {},
+    }
+
+
+class TestAsyncBaseRepository:
+    """Test async CRUD with UnifiedRowGuard filtering."""
+
+    @pytest.mark.asyncio
+    async def test_create_assigns_owner_and_reads_back(self, repo, owner_id):
+        song = await repo.create(Song, _song_data("Neon"))
+
+        assert song.owner_id == owner_id
+        assert (await repo.get_by_id(Song, song.id)).title == "Neon"
+
+    @pytest.mark.asyncio
+    async def test_rows_of_other_owners_are_hidden(self, repo, session):
+        song = await repo.create(Song, _song_data("Private"))
+        other = AsyncSongRepository(db=session, security_context=create_user_context(uuid4()))
+
+        assert await other.get_by_id(Song, song.id) is None
+        assert await other.list() == []
+        with pytest.raises(NotFoundError):
+            await other.update(Song, song.id, {"title": "Stolen"})
+        assert await other.delete(Song, song.id) is False
+
+    @pytest.mark.asyncio
+    async def test_requires_security_context(self, session):
+        with pytest.raises(ForbiddenError):
+            await AsyncSongRepository(db=session).get_by_id(Song, uuid4())
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete(self, repo):
+        song = await repo.create(Song, _song_data("Neon"))
+
+        updated = await repo.update(Song, song.id, {"title": "Neon (Remix)"})
+        assert updated.title == "Neon (Remix)"
+
+        assert await repo.delete(Song, song.id) is True
+        assert await repo.get_by_id(Song, song.id) is None
+
+    @pytest.mark.asyncio
+    async def test_list_uses_id_offset(self, repo):
+        ids = sorted([(await repo.create(Song, _song_data(f"Song {i}"))).id for i in range(5)])
+
+        first = await repo.list(limit=2)
+        rest = await repo.list(limit=10, offset=first[-1].id)
+
+        assert [s.id for s in first + rest] == ids
+
+    @pytest.mark.asyncio
+    async def test_list_paginated_follows_cursor(self, repo):
+        for i in range(5):
+            await repo.create(Song, _song_data(f"Song {i}", global_seed=i))
+
+        page, cursor = await repo.list_paginated(Song, limit=3, sort_field="global_seed")
+        rest, end = await repo.list_paginated(Song, limit=3, cursor=cursor, sort_field="global_seed")
+
+        assert [s.global_seed for s in page] == [4, 3, 2]
+        assert [s.global_seed for s in rest] == [1, 0]
+        assert end is None
+
+    @pytest.mark.asyncio
+    async def test_entity_queries(self, repo, session, owner_id):
+        song = await repo.create(Song, _song_data("Neon", status="validated"))
+        await repo.create(Song, _song_data("Draft"))
+        runs = AsyncWorkflowRunRepository(db=session, security_context=create_user_context(owner_id))
+        run = await runs.create({"tenant_id": uuid4(), "song_id": song.id, "run_id": uuid4(), "status": "running"})
+
+        assert [s.title for s in await repo.get_by_status("validated")] == ["Neon"]
+        assert [r.id for r in await runs.get_by_song_id(song.id)] == [run.id]
+        assert (await runs.get_by_run_id(run.run_id)).id == run.id
+        assert [r.id for r in await runs.get_active_runs()] == [run.id]
+
+
+class TestAsyncTotalCountInvalidation:
+    """Test that async writes invalidate cached totals when they commit."""
+
+    @pytest.mark.asyncio
+    async def test_generation_is_bumped_after_commit(self, repo, session, monkeypatch):
+        bumped = []
+
+        async def invalidate(model_class):
+            bumped.append(model_class)
+
+        monkeypatch.setattr(pagination, "invalidate_total_counts_async", invalidate)
+
+        await repo.create(Song, _song_data("Neon"))
+        await asyncio.sleep(0)
+        assert bumped == []
+
+        await session.commit()
+        await asyncio.gather(*pagination._invalidation_tasks)
+        assert bumped == [Song]
+
+        await repo.create(Song, _song_data("Dusk"))
+        await session.rollback()
+        await session.commit()
+        await asyncio.sleep(0)
+        assert bumped == [Song]
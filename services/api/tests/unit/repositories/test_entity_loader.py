@@ -0,0 +1,336 @@
+"""Unit tests for the request-scoped EntityLoader and N+1 query budgets."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel as Schema, ConfigDict
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.security import create_user_context
+from app.models.base import BaseModel
+from app.api.v1.endpoints import songs as songs_endpoints
+from app.models.blueprint import Blueprint
+from app.models.composed_prompt import ComposedPrompt
+from app.models.lyrics import Lyrics
+from app.models.persona import Persona
+from app.models.producer_notes import ProducerNotes
+from app.models.song import Song, WorkflowRun
+from app.models.style import Style
+from app.repositories import (
+    AsyncSongRepository,
+    ComposedPromptRepository,
+    EntityLoader,
+    LyricsRepository,
+    ProducerNotesRepository,
+    SongRepository,
+    StyleRepository,
+    WorkflowRunRepository,
+)
+from app.repositories.cache_aware_base import CacheAwareRepository
+from app.services.common import load_nested_entities
+from app.services.sds_compiler_service import SDSCompilerService
+from app.services.song_service import SongService
+
+
+class SongSummary(Schema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+
+
+@contextmanager
+def assert_max_queries(engine, limit):
+    """Fail if more than ``limit`` SELECTs run on ``engine`` in the block."""
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert len(statements) <= limit, f"{len(statements)} queries, budget {limit}:\n" + "\n".join(statements)
+
+
+@pytest.fixture
+def engine():
+    # Songs and their cascade children only: other entity tables use
+    # PostgreSQL-only types
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+    tables = ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]
+    BaseModel.metadata.create_all(bind=engine, tables=[BaseModel.metadata.tables[t] for t in tables])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def context():
+    return create_user_context(uuid4())
+
+
+@pytest.fixture
+def loader(session, context):
+    return EntityLoader(db=session, security_context=context)
+
+
+@pytest.fixture
+def repo(session, context, loader):
+    return SongRepository(db=session, security_context=context, loader=loader)
+
+
+def _create_songs(repo, count):
+    return [
+        repo.create(Song, {
+            "tenant_id": uuid4(),
+            "title": f"Song {i}",
+            "sds_version": "1.0.0",
+            "global_seed": i,
+            "blueprint_id": uuid4(),
+            "status": "draft",
+            "feature_flags": {},
+        }).id
+        for i in range(count)
+    ]
+
+
+class TestIdentityMap:
+    """Test that repeated lookups within a request cost no queries."""
+
+    def test_repositories_of_a_request_share_loaded_entities(self, repo, session, context, loader, engine):
+        ids = _create_songs(repo, 2)
+        loader.clear()
+        other = SongRepository(db=session, security_context=context, loader=loader)
+
+        with assert_max_queries(engine, 1):
+            first = repo.get_by_id(Song, ids[0])
+            assert other.get_by_id(Song, ids[0]) is first
+            assert repo.get_by_id(Song, ids[0]) is first
+
+    def test_misses_and_inaccessible_rows_are_remembered(self, repo, session, engine):
+        foreign = SongRepository(db=session, security_context=create_user_context(uuid4()))
+        foreign_id = _create_songs(foreign, 1)[0]
+
+        with assert_max_queries(engine, 1):
+            assert repo.get_by_id(Song, foreign_id) is None
+            assert repo.get_by_id(Song, foreign_id) is None
+
+    def test_get_many_issues_one_guarded_query(self, repo, session, loader, engine):
+        ids = _create_songs(repo, 5)
+        foreign_id = _create_songs(SongRepository(db=session, security_context=create_user_context(uuid4())), 1)[0]
+        loader.clear()
+
+        with assert_max_queries(engine, 1):
+            found = loader.get_many(Song, ids + [foreign_id, uuid4()])
+
+        assert [found[song_id].global_seed for song_id in ids] == [0, 1, 2, 3, 4]
+        assert found[foreign_id] is None
+
+    def test_writes_keep_the_identity_map_current(self, repo, loader):
+        song_id = _create_songs(repo, 1)[0]
+        assert loader.peek(Song, song_id) is not None
+
+        repo.update(Song, song_id, {"title": "Renamed"})
+        assert repo.get_by_id(Song, song_id).title == "Renamed"
+
+        assert repo.delete(Song, song_id) is True
+        assert repo.get_by_id(Song, song_id) is None
+
+    @pytest.mark.parametrize("returning", [True, False])
+    @pytest.mark.parametrize("cache_aware", [False, True])
+    def test_delete_many_forgets_deleted_entities(self, repo, session, context, loader, monkeypatch, returning, cache_aware):
+        ids = _create_songs(repo, 3)
+        monkeypatch.setattr(session.get_bind().dialect, "delete_returning", returning)
+        if cache_aware:
+            repo = CacheAwareRepository(
+                session, security_context=context, cache_manager=MagicMock(), cache_enabled=False, loader=loader
+            )
+        assert all(loader.peek(Song, song_id) is not None for song_id in ids)
+
+        deleted, missing = repo.delete_many(Song, ids[:2] + [uuid4()])
+
+        assert deleted == ids[:2] and len(missing) == 1
+        assert set(loader._identity[Song]) == {ids[2]}
+        assert [repo.get_by_id(Song, song_id) for song_id in ids[:2]] == [None, None]
+
+    def test_other_security_contexts_bypass_the_loader(self, repo, loader):
+        song_id = _create_songs(repo, 1)[0]
+
+        assert repo.with_user_context(uuid4()).get_by_id(Song, song_id) is None
+        assert loader.peek(Song, song_id).id == song_id
+
+
+class TestBatchedLoading:
+    """Test that loads issued within one tick become one query per model."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_batched(self, repo, loader, engine):
+        ids = _create_songs(repo, 4)
+        loader.clear()
+
+        with assert_max_queries(engine, 1):
+            songs = await loader.load_many(Song, ids + ids[:1] + [uuid4()])
+
+        assert [song.id for song in songs[:5]] == ids + ids[:1]
+        assert songs[5] is None
+
+    @pytest.mark.asyncio
+    async def test_nested_relations_are_loaded_without_n_plus_one(self, repo, session, context, loader, engine):
+        ids = _create_songs(repo, 3)
+        runs_repo = WorkflowRunRepository(db=session, security_context=context)
+        for song_id in ids * 2:
+            runs_repo.create(WorkflowRun, {"tenant_id": uuid4(), "song_id": song_id, "run_id": uuid4(), "status": "running"})
+        session.expunge_all()
+        loader.clear()
+        runs = session.query(WorkflowRun).all()
+
+        with assert_max_queries(engine, 1):
+            nested = await asyncio.gather(*(
+                load_nested_entities(run, {"song": ("song", SongSummary)}, session, loader=loader)
+                for run in runs
+            ))
+
+        assert sorted(item["song"].title for item in nested) == ["Song 0", "Song 0", "Song 1", "Song 1", "Song 2", "Song 2"]
+
+    @pytest.mark.asyncio
+    async def test_async_repository_batches_concurrent_get_by_id(self, context):
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+        event.listen(engine.sync_engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+        tables = [BaseModel.metadata.tables[t] for t in ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]]
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: BaseModel.metadata.create_all(sync_conn, tables=tables))
+        try:
+            async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+                loader = EntityLoader(db=session, security_context=context)
+                repo = AsyncSongRepository(db=session, security_context=context, loader=loader)
+                songs = [
+                    await repo.create(Song, {
+                        "tenant_id": uuid4(), "title": f"Song {i}", "sds_version": "1.0.0", "global_seed": i,
+                        "blueprint_id": uuid4(), "status": "draft", "feature_flags": {},
+                    })
+                    for i in range(3)
+                ]
+                loader.clear()
+
+                with assert_max_queries(engine.sync_engine, 1):
+                    found = await asyncio.gather(*(repo.get_by_id(Song, song.id) for song in songs))
+                    assert await repo.get_by_id(Song, songs[0].id) is found[0]
+
+                assert [song.title for song in found] == ["Song 0", "Song 1", "Song 2"]
+        finally:
+            await engine.dispose()
+
+
+@pytest.fixture
+def song_graph(engine, repo, loader):
+    """A song with style, persona, blueprint and three versions of every artifact."""
+    with engine.begin() as conn:
+        # Untyped columns: these models use PostgreSQL-only types
+        for model in (Style, Persona, Blueprint):
+            columns = ", ".join(column.name for column in model.__table__.columns)
+            conn.execute(text(f"CREATE TABLE {model.__tablename__} ({columns})"))
+
+    style = repo.create(Style, {"tenant_id": uuid4(), "name": "Pop Style", "genre": "Pop"})
+    persona = repo.create(Persona, {"tenant_id": uuid4(), "name": "Singer", "kind": "artist"})
+    blueprint = repo.create(Blueprint, {"tenant_id": uuid4(), "genre": "Pop", "version": "2025.11"})
+    song = repo.create(Song, {
+        "tenant_id": uuid4(), "title": "Song", "sds_version": "1.0.0", "global_seed": 7, "status": "draft",
+        "feature_flags": {}, "style_id": style.id, "persona_id": persona.id, "blueprint_id": blueprint.id,
+    })
+    for version in range(3):
+        repo.create(Lyrics, {
+            "tenant_id": uuid4(), "song_id": song.id, "sections": [{"type": "Chorus"}],
+            "section_order": ["Chorus"] * (version + 1),
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(days=version),
+        })
+        repo.create(ProducerNotes, {"tenant_id": uuid4(), "song_id": song.id, "structure": "Chorus"})
+        repo.create(ComposedPrompt, {"tenant_id": uuid4(), "song_id": song.id, "text": "prompt", "meta": {}})
+    song_id = song.id
+    repo.db.commit()
+    repo.db.expunge_all()
+    loader.clear()
+    return song_id
+
+
+class TestEndpointQueryBudgets:
+    """Test that the song artifact and SDS endpoints cost a fixed number of queries."""
+
+    def _repositories(self, session, context, loader):
+        return {
+            name: cls(db=session, security_context=context, loader=loader)
+            for name, cls in {
+                "song_repo": SongRepository,
+                "style_repo": StyleRepository,
+                "lyrics_repo": LyricsRepository,
+                "producer_notes_repo": ProducerNotesRepository,
+                "composed_prompt_repo": ComposedPromptRepository,
+            }.items()
+        }
+
+    @pytest.mark.asyncio
+    async def test_song_with_artifacts(self, song_graph, session, context, loader, engine):
+        service = SongService(**self._repositories(session, context, loader), validation_service=MagicMock())
+
+        # Song, style, and one query per artifact collection
+        with assert_max_queries(engine, 5):
+            response = await songs_endpoints.get_song_with_artifacts(song_graph, service=service)
+        assert response.id == song_graph
+
+        # Song and style now come from the identity map
+        with assert_max_queries(engine, 3):
+            result = await service.get_song_with_artifacts(song_graph)
+        assert result["style"].name == "Pop Style"
+        assert [len(result[key]) for key in ("lyrics", "producer_notes", "composed_prompts")] == [3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_song_sds(self, song_graph, session, context, loader, engine):
+        repositories = self._repositories(session, context, loader)
+        blueprint_reader = MagicMock()
+        blueprint_reader.read_blueprint.return_value = {"genre": "Pop"}
+        validation_service = MagicMock()
+        validation_service.validate_sds.return_value = (True, [])
+        compiler = SDSCompilerService(
+            song_repo=repositories["song_repo"],
+            style_repo=repositories["style_repo"],
+            lyrics_repo=repositories["lyrics_repo"],
+            producer_notes_repo=repositories["producer_notes_repo"],
+            persona_repo=MagicMock(),
+            blueprint_repo=MagicMock(),
+            source_repo=MagicMock(),
+            validation_service=validation_service,
+            blueprint_reader=blueprint_reader,
+        )
+
+        # The endpoint's song read is reused by the compiler; style, persona
+        # and blueprint are one query each, latest lyrics and notes one each
+        with assert_max_queries(engine, 6):
+            sds = await songs_endpoints.get_song_sds(
+                song_graph, use_defaults=False, recompile=True,
+                repo=repositories["song_repo"], sds_compiler=compiler,
+            )
+
+        assert sds["title"] == "Song"
+        assert sds["lyrics"]["section_order"] == ["Chorus"] * 3
+        assert sds["persona_id"] is not None
@@ -0,0 +1,133 @@
+"""Unit tests for set-based bulk delete and streaming bulk export."""
+
+import io
+import json
+import zipfile
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel as Schema, ConfigDict
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.security import create_user_context
+from app.models.base import BaseModel
+from app.models.song import Song
+from app.repositories import SongRepository
+from app.services import bulk_operations_service
+from app.services.bulk_operations_service import BulkOperationsService
+
+
+class SongExport(Schema):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    title: str
+
+
+@pytest.fixture
+def engine():
+    # Songs and their cascade children only: other entity tables use
+    # PostgreSQL-only types
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+    tables = ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]
+    BaseModel.metadata.create_all(bind=engine, tables=[BaseModel.metadata.tables[t] for t in tables])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def repo(session):
+    return SongRepository(db=session, security_context=create_user_context(uuid4()))
+
+
+@pytest.fixture
+def service(session):
+    return BulkOperationsService(session=session)
+
+
+def _create_songs(repo, count):
+    songs = [
+        repo.create(Song, {
+            "tenant_id": uuid4(),
+            "title": f"Song {i}",
+            "sds_version": "1.0.0",
+            "global_seed": i,
+            "blueprint_id": uuid4(),
+            "status": "draft",
+            "feature_flags": {},
+        })
+        for i in range(count)
+    ]
+    return [song.id for song in songs]
+
+
+class TestBulkDelete:
+    """Test set-based bulk delete."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_one_statement_and_reports_missing(self, service, repo, session, engine):
+        ids = _create_songs(repo, 3)
+        other = SongRepository(db=session, security_context=create_user_context(uuid4()))
+        foreign_id = _create_songs(other, 1)[0]
+        unknown_id = uuid4()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        result = await service.bulk_delete_entities(Song, repo, ids + [foreign_id, unknown_id], "song")
+
+        assert result["deleted_count"] == 3
+        assert result["failed_ids"] == [foreign_id, unknown_id]
+        assert len(result["errors"]) == 2
+        assert sum(statement.lstrip().upper().startswith("DELETE FROM SONGS") for statement in statements) == 1
+        assert repo.get_by_id(Song, ids[0]) is None
+        assert other.get_by_id(Song, foreign_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_id_lists(self, repo):
+        ids = _create_songs(repo, 5)
+
+        deleted, missing = repo.delete_many(Song, ids + ids[:2], chunk_size=2)
+
+        assert deleted == ids
+        assert missing == []
+
+
+class TestBulkExport:
+    """Test chunked, streamed ZIP export."""
+
+    @pytest.mark.asyncio
+    async def test_streams_a_valid_archive(self, service, repo, session, monkeypatch):
+        monkeypatch.setattr(bulk_operations_service, "STREAM_CHUNK_BYTES", 1)
+        ids = _create_songs(repo, 4)
+        session.expunge_all()
+
+        stream = await service.bulk_export_entities_zip(Song, repo, ids + [uuid4()], "song", SongExport)
+        # A sync iterator, which StreamingResponse runs off the event loop
+        assert not hasattr(stream, "__aiter__")
+        chunks = list(stream)
+
+        assert len(chunks) > 1
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            names = archive.namelist()
+            exported = [json.loads(archive.read(name)) for name in names]
+        assert names[0] == f"song-song-0-{str(ids[0])[:8]}.json"
+        assert [entry["title"] for entry in exported] == [f"Song {i}" for i in range(4)]
+        # Exported rows are released from the session chunk by chunk
+        assert len(session.identity_map) == 0
+
+    @pytest.mark.asyncio
+    async def test_raises_before_streaming_when_nothing_is_exportable(self, service, repo):
+        with pytest.raises(ValueError):
+            await service.bulk_export_entities_zip(Song, repo, [uuid4()], "song", SongExport)
@@ -0,0 +1,92 @@
+"""Unit tests for the shared lyrics text-analysis core."""
+
+import pytest
+
+from app.services import lyrics_analysis
+from app.services.common import check_rhyme_similarity, count_syllables
+from app.services.lyrics_analysis import analyze_line, word_features, words_rhyme
+from app.services.rubric_scorer import RubricScorer
+from app.skills.lyrics import _count_syllables as lyrics_count_syllables
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    word_features.cache_clear()
+    analyze_line.cache_clear()
+    yield
+
+
+class TestWordFeatures:
+    """Test per-word features and their syllable variants."""
+
+    @pytest.mark.parametrize("token,syllables,meter,letters", [
+        ("cat", 1, 1, 1),
+        ("Little", 1, 2, 1),
+        ("beautiful", 3, 3, 3),
+        ("fire!", 1, 1, 1),
+        ("a", 1, 1, 1),
+        ("x1a2", 1, 1, 1),
+        ("42", 1, 1, 0),
+    ])
+    def test_syllable_variants(self, token, syllables, meter, letters):
+        features = word_features(token)
+        assert features.syllables == syllables
+        assert features.meter_syllables == meter
+        assert features.letter_syllables == letters
+
+    def test_words_rhyme(self):
+        assert words_rhyme("Night", "bite") is True
+        assert words_rhyme("through", "blue") is True
+        assert words_rhyme("night", "night") is False
+        assert words_rhyme("cat", "dog") is False
+        assert words_rhyme("", "") is False
+
+
+class TestLineFeatures:
+    """Test the per-line feature table."""
+
+    def test_line_table(self):
+        line = analyze_line("Don't stop the little light, tonight!")
+
+        assert [word.word for word in line.words] == ["don", "t", "stop", "the", "little", "light", "tonight"]
+        assert [span.word for span in line.spans] == ["dont", "stop", "the", "little", "light", "tonight"]
+        assert line.end_word.word == "tonight"
+        assert line.rhyme_key == "AY T"
+        assert line.syllables == sum(word.syllables for word in line.words)
+        assert line.meter_syllables == line.syllables + 1
+
+    def test_empty_line(self):
+        line = analyze_line("  ...  ")
+        assert line.words == ()
+        assert line.end_word is None
+        assert line.rhyme_key == ""
+        assert line.vowel_group_syllables == 0
+
+    def test_callers_read_the_shared_table(self):
+        assert count_syllables("The cat in the hat") == analyze_line("The cat in the hat").meter_syllables
+        assert lyrics_count_syllables("hello beautiful world") == analyze_line("hello beautiful world").vowel_group_syllables
+        assert check_rhyme_similarity("Same", "same") == 1.0
+        assert check_rhyme_similarity("love", "dove") == 1.0
+
+
+class TestCaching:
+    """Test that lines are tokenized once across metrics."""
+
+    def test_rubric_metrics_share_tokenization(self):
+        scorer = RubricScorer.__new__(RubricScorer)
+        lyrics = {"sections": [
+            {"name": "verse", "lines": ["Walking through the night", "Shining in the light"]},
+            {"name": "chorus", "lines": ["Hold on to the light", "Hold on to the light"]},
+        ]}
+
+        scorer.calculate_hook_density(lyrics)
+        scorer.calculate_singability(lyrics)
+        scorer.calculate_rhyme_tightness(lyrics)
+
+        # One analysis per distinct line, every other lookup is a cache hit
+        assert analyze_line.cache_info().misses == 3
+        assert analyze_line.cache_info().hits == 9
+
+    def test_caches_are_bounded(self):
+        assert word_features.cache_info().maxsize == lyrics_analysis.WORD_CACHE_SIZE
+        assert analyze_line.cache_info().maxsize == lyrics_analysis.LINE_CACHE_SIZE
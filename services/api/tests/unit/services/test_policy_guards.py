@@ -801,6 +801,68 @@ class TestDeterminism:
             assert terms == sorted(terms), f"Category {category} is not sorted"
 
 
+class TestSinglePassMatcher:
+    """Test that the single-pass matchers return exactly per-pattern finditer results."""
+
+    TEXTS = [
+        "This damn shit is fucking terrible. DAMN! Damn-it, d4mn, d@mn, sh1t, $h!t",
+        "f**k this, f u c k that, sh-t happens, bullshit and bull shit, motherfucker",
+        "A classic assessment of the bass in Scunthorpe; moby dick, cockpit, peacock",
+        "a$$hole 455 @ss a55 ∆ss fvck fµck, pi55, bi7ch b!tch, (0ck <0ck ©ock",
+        "ſhit KILL İ HELL ßhit hеll ǅamn",  # long s, Kelvin sign, dotted I, Cyrillic e
+        "",
+        "   ",
+        "shitshit shit_shit shit'shit 'shit' shit.",
+    ]
+
+    @staticmethod
+    def _finditer_all(patterns, text):
+        return [(pattern_id, match.span()) for pattern_id, pattern in enumerate(patterns) for match in pattern.finditer(text)]
+
+    @staticmethod
+    def _scan(matcher, text):
+        return [(pattern_id, match.span()) for pattern_id, match in matcher.scan(text)]
+
+    def _assert_equivalent(self, filter_instance, texts):
+        word_patterns = list(filter_instance._word_boundary_patterns.values())
+        variation_patterns = [pattern for _, pattern in filter_instance._variation_patterns]
+        for text in texts:
+            normalized = filter_instance._normalize_text(text)
+            assert self._scan(filter_instance._word_matcher, text) == self._finditer_all(word_patterns, text)
+            assert self._scan(filter_instance._variation_matcher, normalized) == self._finditer_all(variation_patterns, normalized)
+
+    def test_default_taxonomy(self):
+        self._assert_equivalent(ProfanityFilter(), self.TEXTS)
+
+    def test_overlapping_and_multi_character_patterns(self, tmp_path):
+        import json
+
+        taxonomy_file = tmp_path / "profanity.json"
+        taxonomy_file.write_text(json.dumps({
+            "categories": {"mild": ["a a", "bull shit", "Shit", "shit", "f*ck", ""], "strong": ["fuck"]},
+            "thresholds": {"clean": {"max_score": 0.0}},
+            "whitelist": {"terms": []},
+            "variations": {"leetspeak_patterns": {"f": ["ph", "|="], "a": ["4", "^"], "s": [], "u": ["v"]}},
+        }))
+        filter_instance = ProfanityFilter(taxonomy_path=taxonomy_file)
+
+        self._assert_equivalent(filter_instance, [
+            "a a a a", "bull shit", "phuck |=uck ph|=vck f*ck 4 ^ a", "SHIT Shit shit", "", "x",
+        ])
+        # Empty terms cannot be indexed and still match like \b\b
+        assert filter_instance._word_matcher.scan("a b")
+
+    def test_randomized_texts(self):
+        import random
+
+        filter_instance = ProfanityFilter()
+        rng = random.Random(7)
+        alphabet = "dDamnshitfuck4@31!|0$5 -*_'.\nſK"
+        texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 80))) for _ in range(300)]
+
+        self._assert_equivalent(filter_instance, texts)
+
+
 # ============================================================================
 # Artist Normalization Tests
 # ============================================================================
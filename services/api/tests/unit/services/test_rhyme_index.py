@@ -0,0 +1,94 @@
+"""Unit tests for the memory-mapped phonetic rhyme index."""
+
+import pytest
+
+from app.services import rhyme_index
+from app.services.rhyme_index import RhymeTable, get_rhyme_table, rhyme_key, rhyming_part, write_rhyme_table
+from app.services.rubric_scorer import RubricScorer
+
+
+@pytest.fixture
+def small_table(tmp_path, monkeypatch):
+    """Point the index at a small table written for the test."""
+    path = tmp_path / "rhyme_keys.bin"
+    write_rhyme_table({"night": "AY T", "bite": "AY T", "vin": "IH N", "café": "EY"}, path)
+    monkeypatch.setattr(rhyme_index, "RHYME_TABLE_PATH", path)
+    get_rhyme_table.cache_clear()
+    rhyme_key.cache_clear()
+    yield path
+    get_rhyme_table.cache_clear()
+    rhyme_key.cache_clear()
+
+
+class TestRhymeTable:
+    """Test the table format and key derivation."""
+
+    def test_round_trip(self, small_table):
+        table = RhymeTable(small_table)
+
+        assert len(table) == 4
+        assert table.lookup("night") == "AY T"
+        assert table.lookup("café") == "EY"
+        assert table.lookup("nigh") is None
+        assert table.lookup("nights") is None
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a rhyme table at all")
+
+        with pytest.raises(ValueError):
+            RhymeTable(path)
+
+    @pytest.mark.parametrize("phones,expected", [
+        (["N", "AY1", "T"], "AY T"),
+        (["W", "AO1", "K", "IH0", "NG"], "AO K IH NG"),
+        (["DH", "AH0"], "AH"),
+        (["HH", "M"], None),
+    ])
+    def test_rhyming_part(self, phones, expected):
+        assert rhyming_part(phones) == expected
+
+
+class TestRhymeKey:
+    """Test dictionary lookups and fallbacks."""
+
+    def test_dictionary_then_suffix_then_graphemes(self, small_table):
+        assert rhyme_key("bite") == "AY T"
+        assert rhyme_key("lovin") == "IH N"  # ends with "vin"
+        assert rhyme_key("zzqat") == "at"
+        assert rhyme_key("") == ""
+
+    def test_missing_table_falls_back_to_graphemes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(rhyme_index, "RHYME_TABLE_PATH", tmp_path / "missing.bin")
+        get_rhyme_table.cache_clear()
+        rhyme_key.cache_clear()
+        try:
+            assert get_rhyme_table() is None
+            assert rhyme_key("night") == "ight"
+        finally:
+            get_rhyme_table.cache_clear()
+            rhyme_key.cache_clear()
+
+    def test_packaged_table(self):
+        assert rhyme_key("desire") == rhyme_key("fire")
+        assert rhyme_key("through") == rhyme_key("blue")
+        assert rhyme_key("love") != rhyme_key("move")
+
+
+class TestRhymePairs:
+    """Test song-wide rhyme pair detection."""
+
+    def test_couplets_and_alternates(self):
+        scorer = RubricScorer.__new__(RubricScorer)
+        lines = [(text, "verse") for text in [
+            "We ride into the night", "Another endless day",
+            "Our future burning bright", "We never lose our way",
+            "We ride into the night", "Our future burning bright",
+        ]]
+
+        pairs = scorer._detect_rhyme_pairs(lines)
+
+        assert pairs == [
+            ("We ride into the night", "Our future burning bright"),  # couplet 5-6 (alternate 1-3 repeats it)
+            ("Another endless day", "We never lose our way"),  # alternate 2-4
+        ]
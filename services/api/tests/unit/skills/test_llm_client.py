@@ -0,0 +1,122 @@
+"""Unit tests for the async LLM client and transports."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import LLMSettings
+from app.skills.llm_client import (
+    AnthropicTransport,
+    LLMClient,
+    LLMTimeoutError,
+    StubTransport,
+    create_transport,
+)
+
+
+class FakeMessages:
+    """Fake ``AsyncAnthropic.messages`` recording concurrency."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+
+    async def create(self, **params):
+        self.calls.append(params)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"seed={params.get('seed')}")],
+            usage=None,
+        )
+
+
+def _anthropic_transport(messages: FakeMessages, max_concurrent: int = 2):
+    llm_settings = LLMSettings(MAX_CONCURRENT_REQUESTS=max_concurrent)
+    client = SimpleNamespace(messages=messages)
+    return AnthropicTransport(llm_settings=llm_settings, client=client)
+
+
+@pytest.mark.asyncio
+async def test_stub_transport_is_deterministic():
+    client = LLMClient(transport=StubTransport(latency_ms=0))
+
+    first = await client.generate(system="s", user_prompt="verse", seed=7)
+    second = await client.generate(system="s", user_prompt="verse", seed=7)
+    other = await client.generate(system="s", user_prompt="verse", seed=8)
+
+    assert first == second
+    assert first != other
+    assert len(first.splitlines()) == 4
+
+
+def test_create_transport_honours_provider_setting():
+    assert isinstance(create_transport(LLMSettings(PROVIDER="stub")), StubTransport)
+    assert isinstance(
+        create_transport(LLMSettings(PROVIDER="anthropic")), AnthropicTransport
+    )
+
+
+@pytest.mark.asyncio
+async def test_anthropic_transport_bounds_concurrency():
+    messages = FakeMessages()
+    client = LLMClient(transport=_anthropic_transport(messages, max_concurrent=2))
+
+    results = await asyncio.gather(
+        *(client.generate(system="s", user_prompt="p", seed=i) for i in range(6))
+    )
+
+    assert results == [f"seed={i}" for i in range(6)]
+    assert messages.peak == 2
+    assert all(call["timeout"] == client.settings.REQUEST_TIMEOUT for call in messages.calls)
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout_raises():
+    client = LLMClient(transport=_anthropic_transport(FakeMessages(delay=1.0)))
+
+    with pytest.raises(LLMTimeoutError):
+        await client.generate(system="s", user_prompt="p", timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_cancellation_releases_slot():
+    messages = FakeMessages(delay=1.0)
+    transport = _anthropic_transport(messages, max_concurrent=1)
+    client = LLMClient(transport=transport)
+
+    task = asyncio.create_task(client.generate(system="s", user_prompt="p"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    messages.delay = 0
+    assert await client.generate(system="s", user_prompt="p", seed=3) == "seed=3"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_generations_do_not_block_event_loop():
+    client = LLMClient(transport=StubTransport(latency_ms=50))
+    lags = []
+
+    async def heartbeat():
+        for _ in range(8):
+            expected = time.perf_counter() + 0.005
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - expected)
+
+    await asyncio.gather(
+        heartbeat(),
+        *(client.generate(system="s", user_prompt=str(i)) for i in range(20)),
+    )
+
+    assert max(lags) < 0.04
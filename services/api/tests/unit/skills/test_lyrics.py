@@ -1,11 +1,15 @@
 """Tests for LYRICS skill with pinned retrieval."""
 
+import asyncio
 import hashlib
 import json
 from typing import Any, Dict, List
+from unittest.mock import patch
+from uuid import uuid4
 
 import pytest
 
+from app.core.config import settings
 from app.skills.lyrics import (
     _calculate_hook_density,
     _calculate_rhyme_tightness,
@@ -18,8 +22,10 @@ from app.skills.lyrics import (
     _words_rhyme,
     apply_policy_guards,
     apply_rhyme_scheme,
+    generate_lyrics,
     pinned_retrieve,
 )
+from app.workflows.skill import SkillExecutionError, WorkflowContext
 
 
 class TestProfanityFilter:
@@ -1156,6 +1162,94 @@ class TestPinnedRetrieveEdgeCases:
         assert chunks[0]["weight"] == 0.5
 
 
+class _SlowFirstLLM:
+    """Fake LLM client whose earlier sections finish last."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.completed_seeds = []
+
+    async def generate(self, system, user_prompt, seed=None, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.002 * (60 - seed % 50))
+        self.in_flight -= 1
+        self.completed_seeds.append(seed)
+        return f"Seed {seed} shines so bright\nHolding on to the night"
+
+
+class TestConcurrentSectionGeneration:
+    """Test concurrent per-section generation and deterministic stitching."""
+
+    SECTIONS = ["Intro", "Verse", "Chorus", "Verse", "Chorus", "Bridge", "Chorus", "Outro"]
+
+    def _inputs(self) -> Dict[str, Any]:
+        return {
+            "sds_lyrics": {
+                "rhyme_scheme": "AABB",
+                "syllables_per_line": 6,
+                "themes": ["night"],
+                "constraints": {"explicit": False},
+            },
+            "plan": {"section_order": self.SECTIONS},
+            "style": {"genre_detail": {"primary": "Pop"}, "mood": ["upbeat"]},
+        }
+
+    async def _generate(self, max_concurrent_sections: int):
+        llm = _SlowFirstLLM()
+        context = WorkflowContext(
+            run_id=uuid4(), song_id=uuid4(), seed=42, node_index=2, node_name="LYRICS"
+        )
+        with patch("app.skills.lyrics.get_llm_client", return_value=llm), patch.object(
+            settings.WORKFLOW, "LYRICS_MAX_CONCURRENT_SECTIONS", max_concurrent_sections
+        ):
+            result = await generate_lyrics(self._inputs(), context)
+        return result, llm
+
+    @pytest.mark.asyncio
+    async def test_concurrent_output_matches_sequential(self):
+        sequential, _ = await self._generate(1)
+        concurrent, llm = await self._generate(4)
+
+        assert concurrent["lyrics"] == sequential["lyrics"]
+        assert concurrent["_hash"] == sequential["_hash"]
+        assert concurrent["issues"] == sequential["issues"]
+        # Sections completed out of order but were stitched in plan order
+        assert llm.completed_seeds != sorted(llm.completed_seeds)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_respected(self):
+        _, sequential_llm = await self._generate(1)
+        _, capped_llm = await self._generate(3)
+
+        assert sequential_llm.peak == 1
+        assert capped_llm.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_section_failures_are_logged(self):
+        class _FailingLLM:
+            async def generate(self, system, user_prompt, seed=None, **kwargs):
+                await asyncio.sleep(0)
+                raise RuntimeError(f"section {seed} failed")
+
+        context = WorkflowContext(
+            run_id=uuid4(), song_id=uuid4(), seed=42, node_index=2, node_name="LYRICS"
+        )
+        with patch("app.skills.lyrics.get_llm_client", return_value=_FailingLLM()), patch.object(
+            settings.WORKFLOW, "LYRICS_MAX_CONCURRENT_SECTIONS", 4
+        ), patch("app.skills.lyrics.logger") as mock_logger:
+            with pytest.raises(SkillExecutionError, match="section 44 failed"):
+                await generate_lyrics(self._inputs(), context)
+
+        failed = [
+            call.kwargs["error"]
+            for call in mock_logger.error.call_args_list
+            if call.args == ("lyrics.section.failed",)
+        ]
+        assert failed == ["section 45 failed", "section 46 failed", "section 47 failed"]
+
+
 # Integration test placeholder (will be fleshed out when full workflow is ready)
 class TestLyricsIntegration:
     """Integration tests for lyrics generation workflow."""
@@ -1,9 +1,16 @@
 """Unit tests for PLAN skill."""
 
 import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
 from uuid import uuid4
 
 from app.skills.plan import generate_plan
+from app.workflows.result_cache import (
+    InMemorySkillCacheTier,
+    SkillResultCache,
+    set_skill_result_cache,
+)
 from app.workflows.skill import WorkflowContext
 
 
@@ -172,3 +179,31 @@ async def test_plan_determinism(mock_sds, mock_context):
     # Plans should be identical
     assert result1["plan"]["section_order"] == result2["plan"]["section_order"]
     assert result1["plan"]["target_word_counts"] == result2["plan"]["target_word_counts"]
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_misses_when_blueprint_changes(mock_sds, mock_context):
+    """Test that a cached plan is not reused after its blueprint is updated."""
+    set_skill_result_cache(SkillResultCache([InMemorySkillCacheTier()]))
+    blueprint_id = uuid4()
+
+    def blueprint(min_total, updated_at):
+        return SimpleNamespace(
+            id=blueprint_id,
+            genre="Christmas Pop",
+            version="2025.11",
+            updated_at=updated_at,
+            rules={"eval_rubric": {"thresholds": {"min_total": min_total}}},
+        )
+
+    inputs = {"sds": {**mock_sds, "render": {"engine": "suno"}}}
+    with patch("app.skills.plan._load_blueprint", return_value=blueprint(0.75, "t1")):
+        first = await generate_plan(inputs, mock_context)
+        cached = await generate_plan(inputs, mock_context)
+    with patch("app.skills.plan._load_blueprint", return_value=blueprint(0.9, "t2")):
+        updated = await generate_plan(inputs, mock_context)
+
+    assert cached["_metadata"]["cache_hit"] is True
+    assert updated["_metadata"]["cache_hit"] is False
+    assert first["plan"]["evaluation_targets"]["total"] == 0.75
+    assert updated["plan"]["evaluation_targets"]["total"] == 0.9
@@ -3,7 +3,7 @@
 import pytest
 from uuid import uuid4
 
-from app.skills.validate import evaluate_artifacts
+from app.skills.validate import changed_sections, evaluate_artifacts
 from app.workflows.skill import WorkflowContext
 
 
@@ -389,3 +389,92 @@ Bridge line two"""
 
     # Allow small floating point error
     assert abs(scores["total"] - expected_total) < 0.001
+
+
+@pytest.mark.asyncio
+async def test_incremental_evaluation_matches_full_evaluation(
+    mock_context, good_lyrics, sample_style, sample_producer_notes, sample_blueprint,
+    monkeypatch,
+):
+    """Test that re-evaluation with a previous analysis only re-scores changed sections."""
+    from app.skills import validate
+
+    inputs = {
+        "lyrics": good_lyrics,
+        "style": sample_style,
+        "producer_notes": sample_producer_notes,
+        "blueprint": sample_blueprint,
+        "sds": {"constraints": {"explicit": False}},
+    }
+    previous = await evaluate_artifacts(inputs, mock_context)
+
+    patched_lyrics = good_lyrics.replace("[Bridge]", "[Bridge]\nA brand new line appears")
+    full = await evaluate_artifacts({**inputs, "lyrics": patched_lyrics}, mock_context)
+
+    scored_sections = []
+    original = validate._score_section_singability
+
+    def spy(section_name, lines):
+        scored_sections.append(section_name)
+        return original(section_name, lines)
+
+    monkeypatch.setattr(validate, "_score_section_singability", spy)
+    incremental = await evaluate_artifacts(
+        {
+            **inputs,
+            "lyrics": patched_lyrics,
+            "previous_evaluation": previous,
+        },
+        mock_context,
+    )
+
+    assert scored_sections == ["Bridge"]
+    assert incremental["scores"] == full["scores"]
+    assert incremental["issues"] == full["issues"]
+    assert incremental["analysis"] == full["analysis"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_lyrics_reuse_previous_metrics(
+    mock_context, good_lyrics, sample_style, sample_producer_notes, sample_blueprint,
+    monkeypatch,
+):
+    """Test that unchanged lyrics skip every metric computation."""
+    from app.skills import validate
+
+    inputs = {
+        "lyrics": good_lyrics,
+        "style": sample_style,
+        "producer_notes": sample_producer_notes,
+        "blueprint": sample_blueprint,
+        "sds": {"constraints": {"explicit": False}},
+    }
+    previous = await evaluate_artifacts(inputs, mock_context)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("metric should have been reused")
+
+    for name in (
+        "_evaluate_hook_density",
+        "_evaluate_profanity",
+        "_evaluate_section_completeness",
+        "_score_section_singability",
+        "_score_section_rhyme_tightness",
+    ):
+        monkeypatch.setattr(validate, name, fail)
+
+    result = await evaluate_artifacts(
+        {**inputs, "previous_evaluation": previous}, mock_context
+    )
+
+    assert result["scores"] == previous["scores"]
+    assert result["issues"] == previous["issues"]
+
+
+def test_changed_sections():
+    """Test that only sections whose lines differ are reported."""
+    before = "[Verse]\nline one\n\n[Chorus]\nhook\n\n[Bridge]\nbridge"
+    after = "[Verse]\nline one\n\n[Chorus]\nhook, fixed\n\n[Outro]\nend"
+
+    assert changed_sections(before, after) == ["Chorus", "Outro", "Bridge"]
+    assert changed_sections(before, before) == []
@@ -0,0 +1,250 @@
+"""Unit tests for batch execution of workflow runs."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.skills.llm_client import LLMClient, LLMRequestPool, LLMResponse, LLMTransport
+from app.workflows.batch import SharedNodeResults
+from app.workflows.orchestrator import WorkflowOrchestrator
+from app.workflows.result_cache import (
+    InMemorySkillCacheTier,
+    SkillResultCache,
+    set_skill_result_cache,
+)
+from app.workflows.skill import WorkflowContext, workflow_skill
+
+
+GRAPH = [
+    {"id": "PLAN"},
+    {"id": "LYRICS", "inputs": ["PLAN"]},
+]
+
+
+def _orchestrator(seeds, sds=None):
+    runs = {}
+    for seed in seeds:
+        run = MagicMock()
+        run.run_id = uuid4()
+        run.song_id = uuid4()
+        run.extra_metadata = {"seed": seed, "manifest": {"graph": GRAPH, "flags": {}}}
+        if sds is not None:
+            run.extra_metadata["sds"] = sds
+        runs[run.run_id] = run
+
+    run_repo = MagicMock(spec=WorkflowRunRepository)
+    run_repo.get_by_run_id = MagicMock(side_effect=runs.get)
+    publisher = AsyncMock()
+    publisher.publish_event = AsyncMock()
+
+    orchestrator = WorkflowOrchestrator(
+        db_session=MagicMock(),
+        event_publisher=publisher,
+        workflow_run_repo=run_repo,
+        node_execution_repo=MagicMock(spec=NodeExecutionRepository),
+    )
+    return orchestrator, list(runs)
+
+
+class _CountingTransport(LLMTransport):
+    """Transport that records request concurrency."""
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def create_message(self, params, timeout):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return LLMResponse(text=f"lyrics for seed {params.get('seed')}")
+
+
+class TestExecuteBatch:
+    """Test sharing of seed-independent work across runs."""
+
+    @pytest.mark.asyncio
+    async def test_seed_independent_node_executes_once(self):
+        orchestrator, run_ids = _orchestrator(seeds=[1, 2, 3], sds={"title": "x"})
+        plan_calls = []
+
+        @workflow_skill(name="test.plan", seed_sensitive=False)
+        async def plan(inputs, context):
+            plan_calls.append(context.run_id)
+            await asyncio.sleep(0.01)
+            return {"plan": {"title": inputs["sds"]["title"]}}
+
+        @workflow_skill(name="test.lyrics")
+        async def lyrics(inputs, context):
+            return {"lyrics": f"{inputs['PLAN']['plan']['title']}-{context.seed}"}
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("LYRICS", lyrics)
+
+        result = await orchestrator.execute_batch(run_ids, max_concurrent_runs=3)
+
+        assert len(plan_calls) == 1
+        assert result["stats"]["completed"] == 3
+        assert result["stats"]["shared_nodes"] == {"PLAN": 2}
+        assert [r["run_id"] for r in result["runs"]] == run_ids
+        # Seed-dependent nodes still run per seed (node_index 1)
+        assert [r["outputs"]["LYRICS"]["lyrics"] for r in result["runs"]] == [
+            "x-2", "x-3", "x-4",
+        ]
+        assert sorted(len(r["shared_nodes"]) for r in result["runs"]) == [0, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_run_does_not_stop_batch(self):
+        orchestrator, run_ids = _orchestrator(seeds=[1, 2])
+
+        async def plan(inputs, context):
+            return {"plan": {}}
+
+        async def lyrics(inputs, context):
+            if context.seed == 2:
+                raise RuntimeError("model unavailable")
+            return {"lyrics": "ok"}
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("LYRICS", lyrics)
+
+        result = await orchestrator.execute_batch(run_ids)
+
+        assert [r["status"] for r in result["runs"]] == ["failed", "completed"]
+        assert "model unavailable" in result["runs"][0]["error"]
+        assert result["stats"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_requests_share_bounded_pool(self):
+        orchestrator, run_ids = _orchestrator(seeds=[10, 20, 30, 40])
+        transport = _CountingTransport()
+        client = LLMClient(transport=transport)
+
+        async def plan(inputs, context):
+            return {"plan": {}}
+
+        async def lyrics(inputs, context):
+            # Two identical requests per run are coalesced in the pool
+            texts = await asyncio.gather(
+                *[
+                    client.generate("system", "write", seed=context.seed)
+                    for _ in range(2)
+                ]
+            )
+            return {"lyrics": texts[0]}
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("LYRICS", lyrics)
+
+        result = await orchestrator.execute_batch(
+            run_ids, max_concurrent_runs=4, max_concurrent_llm_requests=2
+        )
+
+        assert transport.calls == 4
+        assert transport.peak <= 2
+        assert result["stats"]["llm"]["requests"] == 4
+        assert result["stats"]["llm"]["coalesced"] == 4
+
+
+class TestSharedNodeResults:
+    """Test single-flight sharing of node results."""
+
+    @pytest.mark.asyncio
+    async def test_runs_receive_independent_copies(self):
+        shared = SharedNodeResults()
+        release = asyncio.Event()
+
+        async def execute():
+            await release.wait()
+            return {"plan": {"sections": ["Verse"]}, "_metadata": {"seed": 1}}
+
+        leader = asyncio.create_task(shared.get_or_run("PLAN", "h", uuid4(), execute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(shared.get_or_run("PLAN", "h", uuid4(), execute))
+        release.set()
+        (leader_outputs, _), (follower_outputs, source) = await asyncio.gather(
+            leader, follower
+        )
+
+        # The leader mutating its outputs leaves every other run's copy intact
+        leader_outputs["_metadata"]["seed"] = 99
+        leader_outputs["plan"]["sections"].append("Chorus")
+        late_outputs, _ = await shared.get_or_run("PLAN", "h", uuid4(), execute)
+
+        expected = {"plan": {"sections": ["Verse"]}, "_metadata": {"seed": 1}}
+        assert follower_outputs == late_outputs == expected
+        assert source is not None
+
+    @pytest.mark.asyncio
+    async def test_runs_do_not_share_sds(self):
+        sds = {"title": "x"}
+        orchestrator, run_ids = _orchestrator(seeds=[1, 2], sds=sds)
+
+        @workflow_skill(name="test.plan_sds", seed_sensitive=False)
+        async def plan(inputs, context):
+            return {"plan": {"title": inputs["sds"]["title"]}}
+
+        async def lyrics(inputs, context):
+            return {"lyrics": "ok"}
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("LYRICS", lyrics)
+
+        result = await orchestrator.execute_batch(run_ids)
+
+        first, second = (r["outputs"] for r in result["runs"])
+        assert first["_sds"] == second["_sds"] == sds
+        assert first["_sds"] is not second["_sds"] and first["_sds"] is not sds
+        assert first["PLAN"] is not second["PLAN"]
+        assert first["PLAN"]["_metadata"] is not second["PLAN"]["_metadata"]
+
+
+class TestSeedSensitivity:
+    """Test the seed_sensitive skill flag."""
+
+    @pytest.mark.asyncio
+    async def test_result_cache_ignores_seed_for_seed_independent_skills(self):
+        set_skill_result_cache(SkillResultCache([InMemorySkillCacheTier()]))
+        calls = []
+
+        @workflow_skill(name="test.seedless", cacheable=True, seed_sensitive=False)
+        async def seedless(inputs, context):
+            calls.append(context.seed)
+            return {"value": inputs["x"]}
+
+        for seed in (1, 2):
+            context = WorkflowContext(
+                run_id=uuid4(), song_id=uuid4(), seed=seed, node_index=0, node_name="PLAN"
+            )
+            await seedless({"x": "batch-cache-probe"}, context)
+
+        assert calls == [1]
+        assert seedless.seed_sensitive is False
+
+
+class TestLLMRequestPool:
+    """Test coalescing of identical in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_sent_once(self):
+        pool = LLMRequestPool(max_concurrent=1)
+        sent = []
+
+        async def send():
+            sent.append(1)
+            await asyncio.sleep(0.01)
+            return LLMResponse(text="hi")
+
+        key = LLMRequestPool.request_key({"prompt": "a", "seed": 1})
+        responses = await asyncio.gather(*[pool.submit(key, send) for _ in range(3)])
+
+        assert [r.text for r in responses] == ["hi"] * 3
+        assert sent == [1]
+        assert pool.stats()["coalesced"] == 2
@@ -0,0 +1,134 @@
+"""Unit tests for resuming failed workflow runs from node checkpoints."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.workflow import NodeExecution
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.workflows.events import EventPublisher
+from app.workflows.orchestrator import WorkflowOrchestrator, WorkflowOrchestrationError
+
+
+GRAPH = [
+    {"id": "PLAN"},
+    {"id": "STYLE", "inputs": ["PLAN"]},
+    {"id": "LYRICS", "inputs": ["PLAN"]},
+    {"id": "COMPOSE", "inputs": ["STYLE", "LYRICS"]},
+]
+
+
+class _Pipeline:
+    """Registers counting skills; COMPOSE fails until ``compose_fails`` is cleared."""
+
+    def __init__(self):
+        self.calls = {node["id"]: 0 for node in GRAPH}
+        self.compose_fails = True
+
+    def register(self, orchestrator):
+        def make_skill(node_id):
+            async def skill(inputs, context):
+                self.calls[node_id] += 1
+                if node_id == "COMPOSE" and self.compose_fails:
+                    raise RuntimeError("render backend unavailable")
+                return {"node": node_id, "seed": context.seed}
+
+            return skill
+
+        for node in GRAPH:
+            orchestrator.register_skill(node["id"], make_skill(node["id"]))
+
+
+def _make_orchestrator(previous_executions=None, resume_from=None):
+    run = MagicMock()
+    run.run_id = uuid4()
+    run.song_id = uuid4()
+    run.extra_metadata = {"seed": 10, "manifest": {"graph": GRAPH, "flags": {}}}
+    if resume_from:
+        run.extra_metadata["resume_from_run_id"] = str(resume_from)
+
+    run_repo = MagicMock(spec=WorkflowRunRepository)
+    run_repo.get_by_run_id = MagicMock(return_value=run)
+    execution_repo = MagicMock(spec=NodeExecutionRepository)
+    execution_repo.get_by_run_id = MagicMock(return_value=previous_executions or [])
+
+    db = MagicMock()
+    orchestrator = WorkflowOrchestrator(
+        db_session=db,
+        event_publisher=EventPublisher(),
+        workflow_run_repo=run_repo,
+        node_execution_repo=execution_repo,
+    )
+    return orchestrator, run, db
+
+
+def _persisted_executions(db):
+    return [
+        call.args[0]
+        for call in db.add.call_args_list
+        if isinstance(call.args[0], NodeExecution)
+    ]
+
+
+async def _failed_run(pipeline):
+    orchestrator, run, db = _make_orchestrator()
+    pipeline.register(orchestrator)
+    with pytest.raises(WorkflowOrchestrationError):
+        await orchestrator.execute_run(run.run_id)
+    return run, _persisted_executions(db)
+
+
+class TestResumeFromCheckpoint:
+    """Test restoring completed nodes of a failed run."""
+
+    @pytest.mark.asyncio
+    async def test_resume_restarts_at_failed_node(self):
+        pipeline = _Pipeline()
+        failed_run, executions = await _failed_run(pipeline)
+
+        pipeline.compose_fails = False
+        orchestrator, run, db = _make_orchestrator(executions, failed_run.run_id)
+        pipeline.register(orchestrator)
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["status"] == "completed"
+        assert result["restored_nodes"] == ["PLAN", "STYLE", "LYRICS"]
+        assert pipeline.calls == {"PLAN": 1, "STYLE": 1, "LYRICS": 1, "COMPOSE": 2}
+        assert result["outputs"]["COMPOSE"]["seed"] == 13
+
+        # Restored nodes are copied so the new run can itself be resumed
+        copied = _persisted_executions(db)
+        assert {e.node_name for e in copied if e.extra_metadata} == {
+            "PLAN", "STYLE", "LYRICS",
+        }
+        assert all(e.output_hash for e in copied if e.status == "completed")
+
+    @pytest.mark.asyncio
+    async def test_tampered_output_is_re_executed_with_dependents(self):
+        pipeline = _Pipeline()
+        failed_run, executions = await _failed_run(pipeline)
+        plan = next(e for e in executions if e.node_name == "PLAN")
+        plan.outputs = {**plan.outputs, "node": "tampered"}
+
+        pipeline.compose_fails = False
+        orchestrator, run, _ = _make_orchestrator(executions, failed_run.run_id)
+        pipeline.register(orchestrator)
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["restored_nodes"] == []
+        assert pipeline.calls == {"PLAN": 2, "STYLE": 2, "LYRICS": 2, "COMPOSE": 2}
+
+    @pytest.mark.asyncio
+    async def test_run_without_resume_ignores_previous_executions(self):
+        pipeline = _Pipeline()
+        _, executions = await _failed_run(pipeline)
+
+        pipeline.compose_fails = False
+        orchestrator, run, _ = _make_orchestrator(executions)
+        pipeline.register(orchestrator)
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["restored_nodes"] == []
+        assert pipeline.calls["PLAN"] == 2
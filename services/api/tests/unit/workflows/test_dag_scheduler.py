@@ -0,0 +1,245 @@
+"""Unit tests for the workflow DAG scheduler."""
+
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.workflows.dag import (
+    NodeTiming,
+    WorkflowDAG,
+    WorkflowGraphError,
+    compute_critical_path,
+)
+from app.workflows.events import EventPublisher
+from app.workflows.orchestrator import (
+    WorkflowOrchestrationError,
+    WorkflowOrchestrator,
+)
+
+
+PRD_GRAPH = [
+    {"id": "PLAN"},
+    {"id": "STYLE", "inputs": ["PLAN"]},
+    {"id": "LYRICS", "inputs": ["PLAN"]},
+    {"id": "PRODUCER", "inputs": ["PLAN"]},
+    {"id": "COMPOSE", "inputs": ["STYLE", "LYRICS", "PRODUCER"]},
+    {"id": "VALIDATE"},
+    {"id": "FIX", "on": "fail", "max_retries": 3},
+    {"id": "RENDER", "cond": "pass && flags.render"},
+]
+
+
+class TestWorkflowDAG:
+    """Test DAG construction from manifest graphs."""
+
+    def test_declared_inputs_become_dependencies(self):
+        dag = WorkflowDAG.from_manifest_graph(PRD_GRAPH)
+
+        assert dag.nodes["STYLE"].dependencies == ("PLAN",)
+        assert dag.nodes["COMPOSE"].dependencies == ("STYLE", "LYRICS", "PRODUCER")
+
+    def test_nodes_without_inputs_depend_on_all_preceding(self):
+        dag = WorkflowDAG.from_manifest_graph(PRD_GRAPH)
+
+        assert dag.nodes["PLAN"].dependencies == ()
+        assert dag.nodes["VALIDATE"].dependencies == (
+            "PLAN", "STYLE", "LYRICS", "PRODUCER", "COMPOSE",
+        )
+
+    def test_node_indexes_follow_manifest_order(self):
+        dag = WorkflowDAG.from_manifest_graph(PRD_GRAPH)
+
+        assert [dag.nodes[n].node_index for n in dag.order] == list(range(8))
+        assert dag.order == [n["id"] for n in PRD_GRAPH]
+
+    def test_unordered_manifest_is_sorted_topologically(self):
+        graph = [
+            {"id": "COMPOSE", "inputs": ["STYLE", "PLAN"]},
+            {"id": "STYLE", "inputs": ["PLAN"]},
+            {"id": "PLAN", "inputs": []},
+        ]
+        dag = WorkflowDAG.from_manifest_graph(graph)
+
+        assert dag.order == ["PLAN", "STYLE", "COMPOSE"]
+        assert dag.nodes["COMPOSE"].node_index == 2
+
+    def test_unknown_input_rejected(self):
+        with pytest.raises(WorkflowGraphError, match="unknown node"):
+            WorkflowDAG.from_manifest_graph([{"id": "STYLE", "inputs": ["PLAN"]}])
+
+    def test_cycle_rejected(self):
+        graph = [
+            {"id": "A", "inputs": ["B"]},
+            {"id": "B", "inputs": ["A"]},
+        ]
+        with pytest.raises(WorkflowGraphError, match="Cycle"):
+            WorkflowDAG.from_manifest_graph(graph)
+
+    def test_critical_path_follows_slowest_branch(self):
+        dag = WorkflowDAG.from_manifest_graph(PRD_GRAPH[:5])
+        timings = {
+            "PLAN": NodeTiming(0, 10),
+            "STYLE": NodeTiming(10, 20),
+            "LYRICS": NodeTiming(10, 110),
+            "PRODUCER": NodeTiming(10, 30),
+            "COMPOSE": NodeTiming(110, 115),
+        }
+
+        path, total_ms = compute_critical_path(dag, timings)
+
+        assert path == ["PLAN", "LYRICS", "COMPOSE"]
+        assert total_ms == pytest.approx(115)
+
+
+def _make_orchestrator(graph):
+    run = MagicMock()
+    run.run_id = uuid4()
+    run.song_id = uuid4()
+    run.extra_metadata = {"seed": 100, "manifest": {"graph": graph, "flags": {}}}
+    run_repo = MagicMock(spec=WorkflowRunRepository)
+    run_repo.get_by_run_id = MagicMock(return_value=run)
+
+    orchestrator = WorkflowOrchestrator(
+        db_session=MagicMock(),
+        event_publisher=EventPublisher(),
+        workflow_run_repo=run_repo,
+        node_execution_repo=MagicMock(spec=NodeExecutionRepository),
+    )
+    return orchestrator, run
+
+
+class TestParallelExecution:
+    """Test concurrent execution of independent nodes."""
+
+    @pytest.mark.asyncio
+    async def test_independent_nodes_run_concurrently(self):
+        orchestrator, run = _make_orchestrator(PRD_GRAPH[:5])
+        in_flight = 0
+        peak = 0
+
+        async def plan(inputs, context):
+            return {"plan": {}}
+
+        def make_branch(delay):
+            async def branch(inputs, context):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(delay)
+                in_flight -= 1
+                return {"seed": context.seed}
+
+            return branch
+
+        async def compose(inputs, context):
+            assert set(inputs) == {"STYLE", "LYRICS", "PRODUCER"}
+            return {"composed_prompt": {}}
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("STYLE", make_branch(0.03))
+        orchestrator.register_skill("LYRICS", make_branch(0.01))
+        orchestrator.register_skill("PRODUCER", make_branch(0.02))
+        orchestrator.register_skill("COMPOSE", compose)
+
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert peak == 3
+        assert result["status"] == "completed"
+        assert result["critical_path"] == ["PLAN", "STYLE", "COMPOSE"]
+        assert set(result["node_timings"]) == {n["id"] for n in PRD_GRAPH[:5]}
+
+    @pytest.mark.asyncio
+    async def test_seeds_independent_of_completion_order(self):
+        seeds = []
+        for delays in ((0.03, 0.01, 0.02), (0.01, 0.03, 0.02)):
+            orchestrator, run = _make_orchestrator(PRD_GRAPH[:4])
+
+            async def plan(inputs, context):
+                return {}
+
+            def make_branch(delay):
+                async def branch(inputs, context):
+                    await asyncio.sleep(delay)
+                    return {"seed": context.seed}
+
+                return branch
+
+            orchestrator.register_skill("PLAN", plan)
+            for node_id, delay in zip(("STYLE", "LYRICS", "PRODUCER"), delays):
+                orchestrator.register_skill(node_id, make_branch(delay))
+
+            result = await orchestrator.execute_run(run.run_id)
+            seeds.append(
+                {n: result["outputs"][n]["seed"] for n in ("STYLE", "LYRICS", "PRODUCER")}
+            )
+
+        assert seeds[0] == seeds[1] == {"STYLE": 101, "LYRICS": 102, "PRODUCER": 103}
+
+    @pytest.mark.asyncio
+    async def test_node_failure_cancels_siblings_and_fails_run(self):
+        orchestrator, run = _make_orchestrator(PRD_GRAPH[:4])
+        cancelled = asyncio.Event()
+
+        async def plan(inputs, context):
+            return {}
+
+        async def slow(inputs, context):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return {}
+
+        async def broken(inputs, context):
+            raise RuntimeError("lyrics exploded")
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("STYLE", slow)
+        orchestrator.register_skill("LYRICS", broken)
+        orchestrator.register_skill("PRODUCER", slow)
+
+        with pytest.raises(Exception, match="lyrics exploded"):
+            await orchestrator.execute_run(run.run_id)
+
+        assert cancelled.is_set()
+        assert run.status == "failed"
+        assert run.error["node"] == "LYRICS"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_node_failures_are_all_reported(self):
+        orchestrator, run = _make_orchestrator(PRD_GRAPH[:4])
+        both_started = asyncio.Barrier(2)
+
+        async def plan(inputs, context):
+            return {}
+
+        async def idle(inputs, context):
+            return {}
+
+        def make_broken(message):
+            async def broken(inputs, context):
+                await both_started.wait()
+                raise RuntimeError(message)
+
+            return broken
+
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("STYLE", make_broken("style exploded"))
+        orchestrator.register_skill("LYRICS", make_broken("lyrics exploded"))
+        orchestrator.register_skill("PRODUCER", idle)
+
+        with pytest.raises(WorkflowOrchestrationError, match="exploded") as exc_info:
+            await orchestrator.execute_run(run.run_id)
+
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+        assert run.status == "failed"
+        assert run.error["message"] in {"style exploded", "lyrics exploded"}
+        assert sorted(err["message"] for err in run.error["errors"]) == [
+            "lyrics exploded",
+            "style exploded",
+        ]
@@ -0,0 +1,192 @@
+"""Unit tests for dirty-tracking in the FIX → COMPOSE → VALIDATE loop."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.workflows.events import EventPublisher
+from app.workflows.orchestrator import WorkflowOrchestrator
+
+
+GRAPH = [
+    {"id": "PLAN"},
+    {"id": "STYLE", "inputs": ["PLAN"]},
+    {"id": "LYRICS", "inputs": ["PLAN"]},
+    {"id": "PRODUCER", "inputs": ["PLAN"]},
+    {"id": "COMPOSE", "inputs": ["STYLE", "LYRICS", "PRODUCER"]},
+    {"id": "VALIDATE"},
+    {"id": "FIX", "on": "fail", "max_retries": 2},
+]
+
+
+def _make_orchestrator(fix):
+    run = MagicMock()
+    run.run_id = uuid4()
+    run.song_id = uuid4()
+    run.extra_metadata = {"seed": 7, "manifest": {"graph": GRAPH, "flags": {}}}
+    run_repo = MagicMock(spec=WorkflowRunRepository)
+    run_repo.get_by_run_id = MagicMock(return_value=run)
+
+    orchestrator = WorkflowOrchestrator(
+        db_session=MagicMock(),
+        event_publisher=EventPublisher(),
+        workflow_run_repo=run_repo,
+        node_execution_repo=MagicMock(spec=NodeExecutionRepository),
+    )
+    calls = {"COMPOSE": 0, "VALIDATE": []}
+
+    async def plan(inputs, context):
+        return {"blueprint": {}, "sds": {}}
+
+    async def style(inputs, context):
+        return {"style": {"tags": ["pop"]}}
+
+    async def lyrics(inputs, context):
+        return {"lyrics": "[Verse]\nline one"}
+
+    async def producer(inputs, context):
+        return {"producer_notes": {"hooks": 1}}
+
+    async def compose(inputs, context):
+        calls["COMPOSE"] += 1
+        return {"composed_prompt": {}}
+
+    async def validate(inputs, context):
+        calls["VALIDATE"].append(inputs)
+        passed = inputs.get("lyrics") == "[Verse]\nline one, fixed"
+        return {"pass": passed, "issues": [], "scores": {}, "analysis": {"n": 1}}
+
+    for node_id, skill in (
+        ("PLAN", plan),
+        ("STYLE", style),
+        ("LYRICS", lyrics),
+        ("PRODUCER", producer),
+        ("COMPOSE", compose),
+        ("VALIDATE", validate),
+        ("FIX", fix),
+    ):
+        orchestrator.register_skill(node_id, skill)
+    return orchestrator, run, calls
+
+
+class TestIncrementalFixLoop:
+    """Test that the fix loop re-runs only nodes affected by the patch."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_artifacts_skip_compose_and_validate(self):
+        async def fix(inputs, context):
+            return {
+                "patched_lyrics": inputs["lyrics"],
+                "patched_style": inputs["style"],
+                "patched_producer_notes": inputs["producer_notes"],
+            }
+
+        orchestrator, run, calls = _make_orchestrator(fix)
+
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["fix_iterations"] == 2
+        assert calls["COMPOSE"] == 1
+        assert len(calls["VALIDATE"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_style_patch_recomposes_without_revalidating(self):
+        async def fix(inputs, context):
+            return {
+                "patched_lyrics": inputs["lyrics"],
+                "patched_style": {"tags": ["pop", f"fix-{context.seed}"]},
+                "patched_producer_notes": inputs["producer_notes"],
+            }
+
+        orchestrator, run, calls = _make_orchestrator(fix)
+
+        await orchestrator.execute_run(run.run_id)
+
+        assert calls["COMPOSE"] == 3
+        assert len(calls["VALIDATE"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_lyrics_patch_revalidates_patched_lyrics(self):
+        async def fix(inputs, context):
+            return {
+                "patched_lyrics": inputs["lyrics"] + ", fixed",
+                "patched_style": inputs["style"],
+                "patched_producer_notes": inputs["producer_notes"],
+            }
+
+        orchestrator, run, calls = _make_orchestrator(fix)
+
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["fix_iterations"] == 1
+        assert calls["COMPOSE"] == 2
+        first, second = calls["VALIDATE"]
+        assert "previous_evaluation" not in first
+        assert second["lyrics"] == "[Verse]\nline one, fixed"
+        assert second["previous_evaluation"] == {
+            "pass": False, "issues": [], "scores": {}, "analysis": {"n": 1}
+        }
+        assert second["changed_sections"] == ["Verse"]
+        assert result["outputs"]["FIX"]["final_validation"]["pass"] is True
+
+    @pytest.mark.asyncio
+    async def test_validate_rescores_only_sections_fix_changed(self, monkeypatch):
+        from app.skills import validate
+
+        async def plan(inputs, context):
+            return {
+                "blueprint": {
+                    "rules": {"required_sections": ["Verse", "Chorus"]},
+                    "eval_rubric": {"thresholds": {"min_total": 0.99}},
+                },
+                "sds": {},
+            }
+
+        async def lyrics(inputs, context):
+            return {
+                "lyrics": (
+                    "[Verse]\nWalking down the empty street tonight\n"
+                    "Counting every window full of light\n\n"
+                    "[Chorus]\nHold on, hold on to me\n"
+                    "Hold on, hold on and see"
+                )
+            }
+
+        async def fix(inputs, context):
+            return {
+                "patched_lyrics": inputs["lyrics"] + f"\nHold on, take {context.seed}",
+                "patched_style": inputs["style"],
+                "patched_producer_notes": inputs["producer_notes"],
+            }
+
+        scored_sections = []
+        completeness_calls = []
+        score_section = validate._score_section_singability
+        evaluate_completeness = validate._evaluate_section_completeness
+
+        def score_spy(section_name, lines):
+            scored_sections.append(section_name)
+            return score_section(section_name, lines)
+
+        def completeness_spy(*args):
+            completeness_calls.append(args)
+            return evaluate_completeness(*args)
+
+        monkeypatch.setattr(validate, "_score_section_singability", score_spy)
+        monkeypatch.setattr(
+            validate, "_evaluate_section_completeness", completeness_spy
+        )
+
+        orchestrator, run, _ = _make_orchestrator(fix)
+        orchestrator.register_skill("PLAN", plan)
+        orchestrator.register_skill("LYRICS", lyrics)
+        orchestrator.register_skill("VALIDATE", validate.evaluate_artifacts)
+
+        result = await orchestrator.execute_run(run.run_id)
+
+        assert result["fix_iterations"] == 2
+        assert scored_sections == ["Verse", "Chorus", "Chorus", "Chorus"]
+        assert len(completeness_calls) == 1
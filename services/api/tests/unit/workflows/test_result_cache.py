@@ -0,0 +1,201 @@
+"""Unit tests for the content-addressed skill result cache."""
+
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.workflows.result_cache import (
+    InMemorySkillCacheTier,
+    SKILL_CACHE_NAMESPACE,
+    RedisSkillCacheTier,
+    SkillResultCache,
+    build_skill_cache_key,
+    set_skill_result_cache,
+)
+from app.workflows.skill import WorkflowContext, workflow_skill
+
+
+def _context(seed: int = 42) -> WorkflowContext:
+    return WorkflowContext(
+        run_id=uuid4(), song_id=uuid4(), seed=seed, node_index=0, node_name="PLAN"
+    )
+
+
+class TestCacheKey:
+    """Test cache key derivation."""
+
+    def test_key_changes_with_each_component(self):
+        base = build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, {"top_p": 0.9})
+
+        assert base == build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, {"top_p": 0.9})
+        assert base != build_skill_cache_key("amcs.plan.generate", "2", "abc", 42, {"top_p": 0.9})
+        assert base != build_skill_cache_key("amcs.plan.generate", "1", "abd", 42, {"top_p": 0.9})
+        assert base != build_skill_cache_key("amcs.plan.generate", "1", "abc", 43, {"top_p": 0.9})
+        assert base != build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, {"top_p": 0.8})
+
+    def test_extra_key_material(self):
+        base = build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, None)
+
+        assert base == build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, None, None)
+        v1 = build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, None, {"version": "1"})
+        v2 = build_skill_cache_key("amcs.plan.generate", "1", "abc", 42, None, {"version": "2"})
+        assert len({base, v1, v2}) == 3
+
+
+class TestInMemoryTier:
+    """Test the bounded LRU tier."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entry_count(self):
+        tier = InMemorySkillCacheTier(max_entries=2)
+        await tier.set("a", {"outputs": {"v": 1}})
+        await tier.set("b", {"outputs": {"v": 2}})
+        await tier.get("a")  # a becomes most recently used
+        await tier.set("c", {"outputs": {"v": 3}})
+
+        assert await tier.get("b") is None
+        assert await tier.get("a") == {"outputs": {"v": 1}}
+        assert len(tier) == 2
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_size_budget(self):
+        tier = InMemorySkillCacheTier(max_entries=100, max_bytes=200)
+        for i in range(10):
+            await tier.set(str(i), {"outputs": {"text": "x" * 50}})
+
+        assert tier.size_bytes <= 200
+        assert await tier.get("9") is not None
+        assert await tier.get("0") is None
+
+    @pytest.mark.asyncio
+    async def test_entries_are_isolated_from_callers(self):
+        tier = InMemorySkillCacheTier()
+        entry = {"outputs": {"plan": {"sections": ["Verse"]}}}
+        await tier.set("k", entry)
+        entry["outputs"]["plan"]["sections"].append("Chorus")
+
+        cached = await tier.get("k")
+        cached["outputs"]["_metadata"] = {}
+
+        assert await tier.get("k") == {"outputs": {"plan": {"sections": ["Verse"]}}}
+
+
+class TestTieredCache:
+    """Test multi-tier lookups and promotion."""
+
+    @pytest.mark.asyncio
+    async def test_l2_hit_promotes_to_l1(self):
+        redis_cache = AsyncMock()
+        redis_cache.get.return_value = {"outputs": {"v": 1}, "output_hash": "h"}
+        l1 = InMemorySkillCacheTier()
+        cache = SkillResultCache([l1, RedisSkillCacheTier(redis_cache)])
+
+        assert await cache.get("skill", "k") == {"outputs": {"v": 1}, "output_hash": "h"}
+        assert await l1.get("k") is not None
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tier_errors_degrade_to_miss(self):
+        redis_cache = AsyncMock()
+        redis_cache.get.side_effect = RuntimeError("redis down")
+        cache = SkillResultCache([RedisSkillCacheTier(redis_cache)])
+
+        assert await cache.get("skill", "k") is None
+        assert cache.get_stats() == {"hits": 0, "misses": 1, "stores": 0, "hit_ratio": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_l2_uses_the_async_cache(self):
+        redis_cache = AsyncMock()
+        redis_cache.get.return_value = None
+        tier = RedisSkillCacheTier(redis_cache, ttl=60)
+        cache = SkillResultCache([InMemorySkillCacheTier(), tier])
+
+        await cache.set("skill", "k", {"outputs": {}, "output_hash": "h"})
+        await cache.get("skill", "missing")
+        await cache.clear()
+
+        redis_cache.set.assert_awaited_once_with(
+            "k", {"outputs": {}, "output_hash": "h"},
+            ttl=60, namespace=SKILL_CACHE_NAMESPACE, tags={SKILL_CACHE_NAMESPACE},
+        )
+        redis_cache.get.assert_awaited_once_with(
+            "missing", value_type=dict, namespace=SKILL_CACHE_NAMESPACE
+        )
+        redis_cache.invalidate_by_tag.assert_awaited_once_with(SKILL_CACHE_NAMESPACE)
+
+
+class TestWorkflowSkillMemoization:
+    """Test memoization through the @workflow_skill decorator."""
+
+    @pytest.fixture
+    def result_cache(self):
+        cache = SkillResultCache([InMemorySkillCacheTier()])
+        set_skill_result_cache(cache)
+        return cache
+
+    def _counting_skill(self, cacheable: bool):
+        calls = []
+
+        @workflow_skill(name="test.counting", cacheable=cacheable)
+        async def counting_skill(inputs, context):
+            calls.append(context.seed)
+            return {"value": inputs["x"] * 2}
+
+        return counting_skill, calls
+
+    @pytest.mark.asyncio
+    async def test_repeat_invocation_served_from_cache(self, result_cache):
+        skill, calls = self._counting_skill(cacheable=True)
+
+        first = await skill({"x": 2}, _context())
+        second = await skill({"x": 2}, _context())
+
+        assert calls == [42]
+        assert second["value"] == first["value"] == 4
+        assert second["_metadata"]["output_hash"] == first["_metadata"]["output_hash"]
+        assert first["_metadata"]["cache_hit"] is False
+        assert second["_metadata"]["cache_hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_different_seed_or_inputs_miss(self, result_cache):
+        skill, calls = self._counting_skill(cacheable=True)
+
+        await skill({"x": 2}, _context(seed=1))
+        await skill({"x": 2}, _context(seed=2))
+        await skill({"x": 3}, _context(seed=2))
+
+        assert calls == [1, 2, 2]
+        assert result_cache.get_stats()["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_extra_key_material_change_misses(self, result_cache):
+        calls = []
+        blueprint = {"version": "1"}
+
+        @workflow_skill(
+            name="test.blueprint",
+            cacheable=True,
+            cache_key_extra=lambda inputs, context: dict(blueprint),
+        )
+        async def blueprint_skill(inputs, context):
+            calls.append(blueprint["version"])
+            return {"value": inputs["x"]}
+
+        await blueprint_skill({"x": 1}, _context())
+        await blueprint_skill({"x": 1}, _context())
+        blueprint["version"] = "2"
+        await blueprint_skill({"x": 1}, _context())
+
+        assert calls == ["1", "2"]
+        assert result_cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_cacheable_skill_always_executes(self, result_cache):
+        skill, calls = self._counting_skill(cacheable=False)
+
+        await skill({"x": 2}, _context())
+        await skill({"x": 2}, _context())
+
+        assert calls == [42, 42]
+        assert result_cache.get_stats()["hits"] == 0
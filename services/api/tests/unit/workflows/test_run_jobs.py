@@ -0,0 +1,496 @@
+"""Unit tests for the background workflow run queue and worker."""
+
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import runs as runs_endpoints
+from app.models.base import BaseModel
+from app.models.song import Song, WorkflowRun
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_event_repo import WorkflowEventRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.services.workflow_service import WorkflowService
+from app.workflows import jobs
+from app.workflows.jobs import (
+    InProcessRunQueue,
+    RedisRunQueue,
+    RunJob,
+    RunNotQueuedError,
+    RunQueueFullError,
+    RunWorker,
+    execute_batch_job,
+    execute_run_job,
+    recover_run_queue,
+    submit_batch,
+    submit_run,
+)
+
+
+def _publisher():
+    publisher = AsyncMock()
+    publisher.publish_event = AsyncMock()
+    return publisher
+
+
+class TestInProcessRunQueue:
+    """Test the asyncio-backed queue."""
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self):
+        queue = InProcessRunQueue(max_size=5)
+        jobs = [RunJob(run_id=uuid4()) for _ in range(3)]
+        for job in jobs:
+            await queue.enqueue(job)
+
+        assert await queue.depth() == 3
+        assert [await queue.dequeue(0.1) for _ in jobs] == jobs
+        assert await queue.dequeue(0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_backpressure(self):
+        queue = InProcessRunQueue(max_size=2)
+        publisher = _publisher()
+        await submit_run(uuid4(), queue=queue, event_publisher=publisher)
+        await submit_run(uuid4(), queue=queue, event_publisher=publisher)
+
+        with pytest.raises(RunQueueFullError) as exc_info:
+            await submit_run(uuid4(), queue=queue, event_publisher=publisher)
+
+        assert exc_info.value.max_size == 2
+        assert await queue.depth() == 2
+        assert publisher.publish_event.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_submit_publishes_queued_event(self):
+        queue = InProcessRunQueue()
+        publisher = _publisher()
+        run_id = uuid4()
+
+        job = await submit_run(run_id, queue=queue, event_publisher=publisher)
+
+        kwargs = publisher.publish_event.await_args.kwargs
+        assert kwargs["run_id"] == run_id
+        assert kwargs["data"]["message"] == "Workflow run queued"
+        assert kwargs["data"]["job_id"] == str(job.job_id)
+
+
+class TestBatchJobs:
+    """Test queueing a batch of runs as one job."""
+
+    def test_batch_job_round_trips_through_json(self):
+        run_ids = (uuid4(), uuid4())
+        job = RunJob(
+            run_id=run_ids[0],
+            batch_id=uuid4(),
+            batch_run_ids=run_ids,
+            max_concurrent_runs=2,
+        )
+
+        restored = RunJob.from_json(job.to_json())
+
+        assert restored == job
+        assert restored.run_ids == run_ids
+        assert RunJob.from_json(RunJob(run_id=run_ids[0]).to_json()).run_ids == run_ids[:1]
+
+    @pytest.mark.asyncio
+    async def test_worker_executes_batch_job_together(self):
+        queue = InProcessRunQueue()
+        publisher = _publisher()
+        batch_jobs = []
+        done = asyncio.Event()
+
+        async def batch_executor(job):
+            batch_jobs.append(job)
+            done.set()
+            return {"runs": [], "stats": {"completed": 3, "total_runs": 3, "duration_ms": 1.0}}
+
+        run_ids = [uuid4() for _ in range(3)]
+        job = await submit_batch(uuid4(), run_ids, queue=queue, event_publisher=publisher)
+        executor = AsyncMock()
+        worker = RunWorker(
+            queue,
+            executor=executor,
+            batch_executor=batch_executor,
+            event_publisher=publisher,
+            poll_timeout=0.01,
+        )
+        worker.start()
+        await asyncio.wait_for(done.wait(), 1)
+        await worker.stop()
+
+        assert batch_jobs == [job]
+        executor.assert_not_awaited()
+        messages = [
+            (call.kwargs["run_id"], call.kwargs["data"]["message"])
+            for call in publisher.publish_event.await_args_list
+        ]
+        assert messages == [(run_id, "Workflow run queued") for run_id in run_ids] + [
+            (run_id, "Workflow run dequeued") for run_id in run_ids
+        ]
+
+
+class TestRunWorker:
+    """Test bounded concurrent execution of queued runs."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        queue = InProcessRunQueue()
+        in_flight = 0
+        peak = 0
+        done = []
+        all_done = asyncio.Event()
+
+        async def executor(run_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            done.append(run_id)
+            if len(done) == 6:
+                all_done.set()
+            return {"status": "completed"}
+
+        worker = RunWorker(
+            queue,
+            executor=executor,
+            max_concurrent_runs=2,
+            event_publisher=_publisher(),
+            poll_timeout=0.01,
+        )
+        for _ in range(6):
+            await queue.enqueue(RunJob(run_id=uuid4()))
+
+        worker.start()
+        await asyncio.wait_for(all_done.wait(), 2)
+        await worker.stop()
+
+        assert peak == 2
+        assert not worker.running
+
+    @pytest.mark.asyncio
+    async def test_failed_run_does_not_stop_worker(self):
+        queue = InProcessRunQueue()
+        done = []
+        second_done = asyncio.Event()
+
+        async def executor(run_id):
+            if not done:
+                done.append(None)
+                raise RuntimeError("node exploded")
+            done.append(run_id)
+            second_done.set()
+            return {"status": "completed"}
+
+        worker = RunWorker(
+            queue, executor=executor, event_publisher=_publisher(), poll_timeout=0.01
+        )
+        worker.start()
+        await queue.enqueue(RunJob(run_id=uuid4()))
+        second = RunJob(run_id=uuid4())
+        await queue.enqueue(second)
+
+        await asyncio.wait_for(second_done.wait(), 2)
+        await worker.stop()
+
+        assert done[1] == second.run_id
+
+    @pytest.mark.asyncio
+    async def test_job_for_run_no_longer_queued_is_skipped_and_acked(self):
+        queue = InProcessRunQueue()
+        queue.ack = AsyncMock()
+        cancelled, second = RunJob(run_id=uuid4()), RunJob(run_id=uuid4())
+        done = asyncio.Event()
+
+        async def executor(run_id):
+            if run_id == cancelled.run_id:
+                raise RunNotQueuedError((run_id,))
+            done.set()
+            return {"status": "completed"}
+
+        worker = RunWorker(
+            queue, executor=executor, event_publisher=_publisher(), poll_timeout=0.01
+        )
+        await queue.enqueue(cancelled)
+        await queue.enqueue(second)
+        worker.start()
+        await asyncio.wait_for(done.wait(), 2)
+        await worker.stop()
+
+        assert [call.args[0] for call in queue.ack.await_args_list] == [cancelled, second]
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_in_flight_runs(self):
+        queue = InProcessRunQueue()
+        finished = asyncio.Event()
+        started = asyncio.Event()
+
+        async def executor(run_id):
+            started.set()
+            await asyncio.sleep(0.05)
+            finished.set()
+            return {"status": "completed"}
+
+        worker = RunWorker(
+            queue, executor=executor, event_publisher=_publisher(), poll_timeout=0.01
+        )
+        worker.start()
+        await queue.enqueue(RunJob(run_id=uuid4()))
+        await asyncio.wait_for(started.wait(), 1)
+
+        await worker.stop(timeout=1)
+
+        assert finished.is_set()
+        assert worker.in_flight == 0
+
+
+class TestRedisRunQueue:
+    """Test the Redis-backed queue against fakeredis."""
+
+    @pytest.fixture
+    def redis_client(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    @pytest.mark.asyncio
+    async def test_dequeue_moves_job_to_processing_until_ack(self, redis_client):
+        queue = RedisRunQueue(redis_client, key="test:runs", max_size=5)
+        job = RunJob(run_id=uuid4())
+        await queue.enqueue(job)
+
+        dequeued = await queue.dequeue(0.1)
+
+        assert dequeued == job
+        assert await queue.depth() == 0
+        assert await redis_client.llen("test:runs:processing") == 1
+        await queue.ack(dequeued)
+        assert await redis_client.llen("test:runs:processing") == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_and_keeps_bound(self, redis_client):
+        queue = RedisRunQueue(redis_client, key="test:runs", max_size=1)
+        await queue.enqueue(RunJob(run_id=uuid4()))
+
+        with pytest.raises(RunQueueFullError):
+            await queue.enqueue(RunJob(run_id=uuid4()))
+
+        assert await queue.depth() == 1
+
+    @pytest.mark.asyncio
+    async def test_recover_returns_unacked_jobs_in_order(self, redis_client):
+        queue = RedisRunQueue(redis_client, key="test:runs", max_size=5)
+        first, second, waiting = (RunJob(run_id=uuid4()) for _ in range(3))
+        for job in (first, second, waiting):
+            await queue.enqueue(job)
+        await queue.dequeue(0.1)
+        await queue.dequeue(0.1)
+
+        # A worker restarting after a crash
+        assert await recover_run_queue(RedisRunQueue(redis_client, key="test:runs")) == 2
+
+        assert await redis_client.llen("test:runs:processing") == 0
+        assert [await queue.dequeue(0.1) for _ in range(3)] == [first, second, waiting]
+
+
+@pytest.fixture
+def run_service():
+    """WorkflowService over SQLite with one pending run."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", lambda conn, _: conn.create_function("char_length", 1, len))
+    tables = ["songs", "workflow_runs", "lyrics", "producer_notes", "composed_prompts"]
+    BaseModel.metadata.create_all(bind=engine, tables=[BaseModel.metadata.tables[t] for t in tables])
+    db = sessionmaker(bind=engine)()
+    tenant_id, owner_id = uuid4(), uuid4()
+    song = Song(
+        tenant_id=tenant_id, owner_id=owner_id, title="Neon", sds_version="1.0.0",
+        global_seed=42, blueprint_id=uuid4(), status="draft", feature_flags={},
+    )
+    db.add(song)
+    db.flush()
+    run = WorkflowRun(
+        tenant_id=tenant_id, owner_id=owner_id, song_id=song.id, run_id=uuid4(),
+        status="pending", extra_metadata={},
+    )
+    db.add(run)
+    db.commit()
+
+    service = WorkflowService(
+        db=db,
+        workflow_run_repo=WorkflowRunRepository(db=db),
+        node_execution_repo=NodeExecutionRepository(db=db),
+        workflow_event_repo=WorkflowEventRepository(db=db),
+        event_publisher=_publisher(),
+    )
+    try:
+        yield service, run.run_id
+    finally:
+        db.close()
+        engine.dispose()
+
+
+class TestExecuteRunEndpoint:
+    """Test that POST /runs/{run_id}/execute claims the run exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_second_execute_conflicts(self, run_service, monkeypatch):
+        service, run_id = run_service
+        submit = AsyncMock(return_value=RunJob(run_id=run_id))
+        monkeypatch.setattr(runs_endpoints, "submit_run", submit)
+
+        response = await runs_endpoints.execute_run(run_id, service)
+        with pytest.raises(HTTPException) as exc_info:
+            await runs_endpoints.execute_run(run_id, service)
+
+        assert response.status == "queued"
+        assert exc_info.value.status_code == 409
+        assert submit.await_count == 1
+        assert service.workflow_run_repo.get_by_run_id(run_id).status == "queued"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_releases_claim(self, run_service, monkeypatch):
+        service, run_id = run_service
+        monkeypatch.setattr(
+            runs_endpoints, "submit_run", AsyncMock(side_effect=RunQueueFullError(2, 2))
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await runs_endpoints.execute_run(run_id, service)
+
+        assert exc_info.value.status_code == 503
+        assert service.workflow_run_repo.get_by_run_id(run_id).status == "pending"
+
+
+class TestExecuteBatchEndpoint:
+    """Test that POST /runs/batch queues the batch instead of running it inline."""
+
+    def _request(self, service, run_id):
+        run = service.workflow_run_repo.get_by_run_id(run_id)
+        # Tenant and owner come from the security context in the API
+        service.create_batch = partial(
+            service.create_batch, tenant_id=run.tenant_id, owner_id=run.owner_id
+        )
+        return runs_endpoints.CreateBatchRequest(
+            song_id=run.song_id, manifest={"graph": []}, count=2, compile_sds=False
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_is_queued(self, run_service, monkeypatch):
+        service, run_id = run_service
+        submit = AsyncMock(side_effect=lambda batch_id, run_ids, **_: RunJob(
+            run_id=run_ids[0], batch_id=batch_id, batch_run_ids=tuple(run_ids)
+        ))
+        monkeypatch.setattr(runs_endpoints, "submit_batch", submit)
+        service.orchestrator.execute_batch = AsyncMock()
+
+        response = await runs_endpoints.execute_batch(
+            self._request(service, run_id), service, sds_compiler=None
+        )
+
+        assert response.status == "queued"
+        assert [run.seed for run in response.runs] == [42, 43]
+        assert submit.await_args.args == (
+            response.batch_id, [run.run_id for run in response.runs]
+        )
+        service.orchestrator.execute_batch.assert_not_awaited()
+        for run in response.runs:
+            assert service.workflow_run_repo.get_by_run_id(run.run_id).status == "queued"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_releases_batch(self, run_service, monkeypatch):
+        service, run_id = run_service
+        monkeypatch.setattr(
+            runs_endpoints, "submit_batch", AsyncMock(side_effect=RunQueueFullError(2, 2))
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await runs_endpoints.execute_batch(
+                self._request(service, run_id), service, sds_compiler=None
+            )
+
+        assert exc_info.value.status_code == 503
+        runs = service.workflow_run_repo.db.query(WorkflowRun).all()
+        assert [run.status for run in runs] == ["pending"] * 3
+
+
+class TestRunJobStart:
+    """Test that workers only execute runs that are still queued."""
+
+    @pytest.fixture
+    def worker_service(self, run_service, monkeypatch):
+        service, run_id = run_service
+        monkeypatch.setattr("app.core.database.SessionLocal", lambda: service.db)
+        monkeypatch.setattr(jobs, "_create_workflow_service", lambda db: service)
+        service.orchestrator.execute_run = AsyncMock(return_value={"status": "completed"})
+        return service, run_id
+
+    @pytest.mark.asyncio
+    async def test_queued_run_is_started_before_executing(self, worker_service):
+        service, run_id = worker_service
+        statuses = []
+
+        async def execute(run_id):
+            statuses.append(service.workflow_run_repo.get_by_run_id(run_id).status)
+            return {"status": "completed"}
+
+        service.orchestrator.execute_run = execute
+        assert service.claim_run(run_id)
+
+        await execute_run_job(run_id)
+
+        assert statuses == ["running"]
+
+    @pytest.mark.asyncio
+    async def test_run_cancelled_while_queued_is_not_executed(self, worker_service):
+        service, run_id = worker_service
+        assert service.claim_run(run_id)
+        assert await service.cancel_run(run_id)
+
+        with pytest.raises(RunNotQueuedError):
+            await execute_run_job(run_id)
+
+        service.orchestrator.execute_run.assert_not_awaited()
+        assert service.workflow_run_repo.get_by_run_id(run_id).status == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_batch_leaves_out_cancelled_runs(self, worker_service):
+        service, run_id = worker_service
+        run = service.workflow_run_repo.get_by_run_id(run_id)
+        batch_id, runs = await service.create_batch(
+            song_id=run.song_id, manifest={"graph": []}, seeds=[1, 2],
+            tenant_id=run.tenant_id, owner_id=run.owner_id,
+        )
+        run_ids = [batch_run.run_id for batch_run in runs]
+        for batch_run_id in run_ids:
+            assert service.claim_run(batch_run_id)
+        assert await service.cancel_run(run_ids[0])
+        service.execute_batch = AsyncMock(return_value={"runs": [], "stats": {}})
+
+        await execute_batch_job(
+            RunJob(run_id=run_ids[0], batch_id=batch_id, batch_run_ids=tuple(run_ids))
+        )
+
+        assert service.execute_batch.await_args.args == ([run_ids[1]],)
+
+    @pytest.mark.asyncio
+    async def test_in_process_queue_is_refilled_from_queued_runs(self, worker_service):
+        service, run_id = worker_service
+        assert service.claim_run(run_id)
+        queue = InProcessRunQueue()
+
+        assert await recover_run_queue(queue) == 1
+
+        job = await queue.dequeue(0.1)
+        assert job.run_id == run_id
+        assert job.batch_id is None
@@ -0,0 +1,214 @@
+"""Unit tests for write-behind persistence of workflow records."""
+
+import asyncio
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.models.workflow import NodeExecution, WorkflowEvent
+from app.repositories.node_execution_repo import NodeExecutionRepository
+from app.repositories.workflow_run_repo import WorkflowRunRepository
+from app.workflows.events import EventPublisher
+from app.workflows.orchestrator import WorkflowOrchestrator
+from app.workflows.persistence import WriteBehindWriter
+
+
+class _SessionFactory:
+    """Hands out mock sessions and remembers every committed batch."""
+
+    def __init__(self, fail_times: int = 0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    def __call__(self):
+        session = MagicMock()
+        added = []
+        session.add.side_effect = added.append
+
+        def commit():
+            if self.fail_times:
+                self.fail_times -= 1
+                raise RuntimeError("database unavailable")
+            self.batches.append(list(added))
+
+        session.commit.side_effect = commit
+        return session
+
+
+def _event(run_id, phase):
+    return {"event_id": uuid4(), "run_id": run_id, "phase": phase}
+
+
+class TestWriteBehindWriter:
+    """Test buffering, coalescing and flush triggers."""
+
+    @pytest.mark.asyncio
+    async def test_update_coalesces_into_pending_insert(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=10)
+        run_id, execution_id = uuid4(), uuid4()
+
+        writer.insert(
+            run_id,
+            NodeExecution,
+            {"execution_id": execution_id, "run_id": run_id, "status": "running"},
+            key_column="execution_id",
+        )
+        writer.update(
+            run_id, NodeExecution, "execution_id", execution_id, {"status": "completed"}
+        )
+
+        assert writer.pending == 1
+        assert await writer.flush(run_id) == 1
+        (batch,) = sessions.batches
+        assert batch[0].status == "completed"
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_per_run_order(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=10)
+        run_a, run_b = uuid4(), uuid4()
+        for phase in ("start", "info", "end"):
+            writer.insert(run_a, WorkflowEvent, _event(run_a, phase))
+            writer.insert(run_b, WorkflowEvent, _event(run_b, phase))
+
+        await writer.flush()
+
+        (batch,) = sessions.batches
+        assert [e.phase for e in batch if e.run_id == run_a] == ["start", "info", "end"]
+        assert [e.phase for e in batch if e.run_id == run_b] == ["start", "info", "end"]
+
+    @pytest.mark.asyncio
+    async def test_flush_for_run_leaves_other_runs_buffered(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=10)
+        run_a, run_b = uuid4(), uuid4()
+        writer.insert(run_a, WorkflowEvent, _event(run_a, "end"))
+        writer.insert(run_b, WorkflowEvent, _event(run_b, "start"))
+
+        await writer.flush(run_a)
+
+        assert writer.pending == 1
+        assert [e.run_id for e in sessions.batches[0]] == [run_a]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_size_threshold_triggers_flush(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=10, max_batch_size=3)
+        run_id = uuid4()
+        for _ in range(3):
+            writer.insert(run_id, WorkflowEvent, _event(run_id, "info"))
+
+        await asyncio.sleep(0.05)
+
+        assert [len(batch) for batch in sessions.batches] == [3]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_interval_flush(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=0.01)
+        run_id = uuid4()
+        writer.insert(run_id, WorkflowEvent, _event(run_id, "info"))
+
+        await asyncio.sleep(0.1)
+
+        assert writer.pending == 0
+        assert len(sessions.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried_then_dropped(self):
+        sessions = _SessionFactory(fail_times=5)
+        writer = WriteBehindWriter(sessions, flush_interval=10, max_flush_attempts=2)
+        run_id = uuid4()
+        writer.insert(run_id, WorkflowEvent, _event(run_id, "info"))
+
+        assert await writer.flush() == 0
+        assert writer.pending == 1
+        assert await writer.flush() == 0
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_final_flush_stops_ticker(self):
+        writer = WriteBehindWriter(_SessionFactory(), flush_interval=10)
+        run_a, run_b = uuid4(), uuid4()
+        writer.insert(run_a, WorkflowEvent, _event(run_a, "end"))
+        writer.insert(run_b, WorkflowEvent, _event(run_b, "end"))
+        ticker = writer._ticker
+
+        await writer.flush(run_a)
+        assert not ticker.done()
+
+        await writer.flush(run_b)
+        assert ticker.cancelled()
+        assert writer._ticker is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_ticker_with_writes_pending(self):
+        writer = WriteBehindWriter(
+            _SessionFactory(fail_times=2), flush_interval=10, max_flush_attempts=3
+        )
+        run_id = uuid4()
+        writer.insert(run_id, WorkflowEvent, _event(run_id, "info"))
+        assert await writer.flush() == 0
+        ticker = writer._ticker
+        assert not ticker.done()
+
+        await writer.aclose()
+
+        assert writer.pending == 1
+        assert ticker.cancelled()
+        assert writer._ticker is None
+
+
+class TestOrchestratorWriteBehind:
+    """Test that node execution records go through the buffer."""
+
+    @pytest.mark.asyncio
+    async def test_run_flushes_node_records_in_one_batch(self):
+        sessions = _SessionFactory()
+        writer = WriteBehindWriter(sessions, flush_interval=10)
+
+        run = MagicMock()
+        run.run_id = uuid4()
+        run.song_id = uuid4()
+        graph = [{"id": "PLAN"}, {"id": "STYLE", "inputs": ["PLAN"]}]
+        run.extra_metadata = {"seed": 1, "manifest": {"graph": graph, "flags": {}}}
+        run_repo = MagicMock(spec=WorkflowRunRepository)
+        run_repo.get_by_run_id = MagicMock(return_value=run)
+        db = MagicMock()
+
+        orchestrator = WorkflowOrchestrator(
+            db_session=db,
+            event_publisher=EventPublisher(write_behind=writer),
+            workflow_run_repo=run_repo,
+            node_execution_repo=MagicMock(spec=NodeExecutionRepository),
+            write_behind=writer,
+        )
+
+        async def skill(inputs, context):
+            return {"seed": context.seed}
+
+        orchestrator.register_skill("PLAN", skill)
+        orchestrator.register_skill("STYLE", skill)
+
+        await orchestrator.execute_run(run.run_id)
+
+        assert writer.pending == 0
+        assert writer._ticker is None
+        db.add.assert_not_called()
+        # Only the run status transitions commit on the request session
+        assert db.commit.call_count == 2
+
+        executions = [
+            row for batch in sessions.batches for row in batch
+            if isinstance(row, NodeExecution)
+        ]
+        assert [(e.node_name, e.status) for e in executions] == [
+            ("PLAN", "completed"),
+            ("STYLE", "completed"),
+        ]
+        assert all(e.output_hash for e in executions)